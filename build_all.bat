@@ -1,7 +1,10 @@
 @echo off
 REM Скрипт для сборки всех Python приложений в EXE
 REM Использует виртуальное окружение из .\env
-REM Собирает все файлы из папок lab**/main.py
+REM По умолчанию собирает ОДИН лаунчер (main.py) в режиме --onedir,
+REM все лабораторные lab**/main.py подключаются как скрытые импорты.
+REM   build_all.bat            — лаунчер со всеми работами
+REM   build_all.bat --per-lab  — старый режим: отдельный exe на каждую работу
 
 setlocal enabledelayedexpansion
 
@@ -22,6 +25,38 @@ echo.
 REM Создаём директорию для сборок если её нет
 if not exist dist mkdir dist
 
+if /I "%~1"=="--per-lab" goto per_lab
+
+REM Модули лабораторных импортируются лениво, перечисляем их для PyInstaller
+set HIDDEN=
+for /d %%L in (lab*) do (
+    if exist "%%L\main.py" set HIDDEN=!HIDDEN! --hidden-import=%%L.main
+)
+
+echo 🔨 building launcher...
+pyinstaller ^
+    --onedir ^
+    --windowed ^
+    --noconfirm ^
+    --name "physlab" ^
+    --paths "." ^
+    --distpath ".\dist" ^
+    --workpath ".\build\physlab" ^
+    --specpath ".\specs" ^
+    --noupx ^
+    !HIDDEN! ^
+    main.py 2>&1 | find "completed successfully"
+
+if !errorlevel! equ 0 (
+    echo ✅ launcher building success: .\dist\physlab\physlab.exe
+) else (
+    echo ❌ launcher building unsuccessfully
+)
+echo.
+pause
+exit /b
+
+:per_lab
 REM Счётчик успешных сборок
 set BUILT=0
 set FAILED=0
@@ -39,6 +74,7 @@ for /d %%L in (lab*) do (
             --onefile ^
             --windowed ^
             --name "!LAB_NAME!" ^
+            --paths "." ^
             --distpath ".\dist" ^
             --workpath ".\build\!LAB_NAME!" ^
             --specpath ".\specs" ^
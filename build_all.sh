@@ -2,7 +2,13 @@
 
 # Скрипт для сборки всех Python приложений в EXE
 # Использует виртуальное окружение из ./env
-# Собирает все файлы из папок lab**/main.py
+#
+# По умолчанию собирает ОДИН лаунчер (main.py) в режиме --onedir:
+# Qt распаковывается один раз, а все лабораторные lab**/main.py
+# подключаются как скрытые импорты и загружаются по требованию.
+#
+#   ./build_all.sh            — лаунчер со всеми работами
+#   ./build_all.sh --per-lab  — старый режим: отдельный exe на каждую работу
 
 set +e  # Не выходим при ошибке одного файла
 
@@ -25,6 +31,39 @@ mkdir -p dist
 mkdir -p build
 mkdir -p specs
 
+if [ "$1" != "--per-lab" ]; then
+    # Модули лабораторных импортируются лениво (importlib), поэтому
+    # PyInstaller не увидит их сам — перечисляем явно
+    HIDDEN=()
+    for main_file in lab*/main.py; do
+        lab_name=$(basename "$(dirname "$main_file")")
+        HIDDEN+=(--hidden-import "$lab_name.main")
+    done
+
+    echo "🔨 Собираю лаунчер (работ: $(( ${#HIDDEN[@]} / 2 )))..."
+    pyinstaller \
+        --onedir \
+        --windowed \
+        --noconfirm \
+        --name "physlab" \
+        --paths "." \
+        --distpath "./dist" \
+        --workpath "./build/physlab" \
+        --specpath "./specs" \
+        --noupx \
+        "${HIDDEN[@]}" \
+        main.py > /dev/null 2>&1
+
+    STATUS=$?
+    if [ $STATUS -eq 0 ]; then
+        echo "   ✅ Успешно! Запуск: ./dist/physlab/physlab"
+        echo "   📁 Размер: $(du -sh ./dist/physlab 2>/dev/null | cut -f1)"
+    else
+        echo "   ❌ Ошибка (код: $STATUS)"
+    fi
+    exit $STATUS
+fi
+
 # Счётчик успешных сборок
 BUILT=0
 FAILED=0
@@ -44,6 +83,7 @@ for main_file in lab*/main.py; do
             --onefile \
             --windowed \
             --name "$lab_name" \
+            --paths "." \
             --distpath "./dist" \
             --workpath "./build/$lab_name" \
             --specpath "./specs" \
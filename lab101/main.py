@@ -1,70 +1,47 @@
 import sys
-import math
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QSlider, QSpinBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
+
+from physlab.core import Animated
+from physlab.models import CoilInductionModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Катушка + Магнит
 # ==========================================
-class InductionWidget(QFrame):
+class InductionWidget(QFrame, Animated):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 350)
         self.setStyleSheet("background-color: #f8f9fa; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.N = 100          
-        self.speed = 0        
-        self.magnet_x = 50    
-        self.is_running = False
-        
-        self.current_voltage = 0.0
-        self.max_voltage_measured = 0.0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(16) 
+        self.model = CoilInductionModel(speed=0)
 
     def start_experiment(self, n_turns, speed_val):
-        self.N = n_turns
-        self.speed = speed_val
-        self.magnet_x = 50
-        self.is_running = True
-        self.max_voltage_measured = 0.0
+        self.model.set_params(N=n_turns, speed=speed_val)
+        self.model.start()
+        self.wake()
         self.update()
 
     def pause_experiment(self):
         # Пауза / Продолжить
-        self.is_running = not self.is_running
+        self.model.pause()
+        if self.model.is_running: self.wake()
         self.update()
 
-    def animate(self):
-        if not self.is_running:
+    def animate(self, dt):
+        if not self.model.is_running:
+            self.settle()
             return
 
-        self.magnet_x += self.speed * 0.5
-        
-        coil_center = self.width() / 2
-        dist = (self.magnet_x - coil_center) / 100.0 
-        
-        field_change = -2 * dist * math.exp(-(dist**2))
-        raw_emf = -self.N * (self.speed / 10.0) * field_change
-        
-        self.current_voltage = raw_emf
-        
-        if abs(self.current_voltage) > self.max_voltage_measured:
-            self.max_voltage_measured = abs(self.current_voltage)
-
-        if self.magnet_x > self.width() + 100:
-            self.is_running = False
-            self.magnet_x = self.width() + 100
-            self.current_voltage = 0
-            
+        # Катушка — по центру виджета, магнит улетает за правый край
+        self.model.coil_x = self.width() / 2
+        self.model.end_x = self.width() + 100
+        self.model.step(dt)
         self.update()
 
     def paintEvent(self, event):
@@ -82,7 +59,7 @@ class InductionWidget(QFrame):
         painter.drawRect(cx - coil_w//2, cy - coil_h//2, coil_w, coil_h)
         
         painter.setPen(QPen(QColor(184, 115, 51), 2))
-        lines = min(20, self.N // 10)
+        lines = min(20, self.model.N // 10)
         step = coil_w / lines
         for i in range(lines):
             x = cx - coil_w//2 + i * step
@@ -95,15 +72,15 @@ class InductionWidget(QFrame):
         
         painter.setBrush(QColor(220, 50, 50))
         painter.setPen(Qt.black)
-        painter.drawRect(int(self.magnet_x), int(mag_y), mag_w//2, mag_h)
+        painter.drawRect(int(self.model.magnet_x), int(mag_y), mag_w//2, mag_h)
         painter.setPen(Qt.white)
-        painter.drawText(int(self.magnet_x + 5), int(mag_y + 25), "N")
+        painter.drawText(int(self.model.magnet_x + 5), int(mag_y + 25), "N")
         
         painter.setBrush(QColor(50, 50, 220))
         painter.setPen(Qt.black)
-        painter.drawRect(int(self.magnet_x - mag_w//2), int(mag_y), mag_w//2, mag_h)
+        painter.drawRect(int(self.model.magnet_x - mag_w//2), int(mag_y), mag_w//2, mag_h)
         painter.setPen(Qt.white)
-        painter.drawText(int(self.magnet_x - 30), int(mag_y + 25), "S")
+        painter.drawText(int(self.model.magnet_x - 30), int(mag_y + 25), "S")
 
         # 3. Гальванометр
         g_r = 60
@@ -116,7 +93,7 @@ class InductionWidget(QFrame):
         
         painter.drawText(g_x - 10, g_y + 30, "mV")
         
-        angle = (self.current_voltage / 500.0) * 90 
+        angle = (self.model.voltage / 500.0) * 90 
         if angle > 90: angle = 90
         if angle < -90: angle = -90
         
@@ -129,7 +106,7 @@ class InductionWidget(QFrame):
         
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 10, QFont.Bold))
-        painter.drawText(g_x - 20, g_y + 80, f"{self.current_voltage:.1f}")
+        painter.drawText(g_x - 20, g_y + 80, f"{self.model.voltage:.1f}")
 
 # ==========================================
 # ГЛАВНОЕ ОКНО
@@ -237,13 +214,14 @@ class LabInductionApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        real_u = self.ind_widget.max_voltage_measured
+        model = self.ind_widget.model
+        real_u = model.true_value()
         
         if real_u == 0:
             QMessageBox.warning(self, "Ошибка", "Сначала запустите эксперимент!")
             return
 
-        if abs(u_user - real_u) <= real_u * 0.15:
+        if model.check({"value": u_user})["value"]:
             QMessageBox.information(self, "Верно", "✅ Значение считано верно! Добавлено в таблицу.")
             row = self.table.rowCount()
             self.table.insertRow(row)
@@ -1,18 +1,24 @@
 import sys
 import math
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox,
     QSlider, QCheckBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF, Signal
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal
+
+from physlab.core import Animated, LayerCache, ease, frame_clock
+from physlab.models import EmfModel
 
 # ==========================================
 # ПРИБОР СО СТРЕЛКОЙ
 # ==========================================
-class AnalogMeter(QFrame):
+class AnalogMeter(QFrame, Animated):
+    frame_interval = 30
+    start_angle = 225   # положение нуля шкалы, градусы
+    span_angle = -90
+
     def __init__(self, title, units, max_val, parent=None):
         super().__init__(parent)
         self.setMinimumSize(140, 140)
@@ -21,33 +27,39 @@ class AnalogMeter(QFrame):
         self.max_val = max_val
         self.value = 0.0
         self.target_value = 0.0
+        self._dial = LayerCache(self, self.paint_dial)
 
     def set_value(self, val):
         self.target_value = val
+        if abs(self.target_value - self.value) > 1e-3:
+            self.wake()
 
-    def update_needle(self):
+    def animate(self, dt):
+        # Стрелка доплыла до показания — кадры больше не нужны
         diff = self.target_value - self.value
-        self.value += diff * 0.15
+        if abs(diff) > 1e-3:
+            self.value += diff * ease(dt, 0.185)
+        else:
+            self.value = self.target_value
+            self.settle()
         self.update()
 
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
+    def dial_geometry(self):
         w, h = self.width(), self.height()
-        cx, cy = w / 2, h / 2 + 10
-        r = min(w, h) / 2 - 10
+        return w / 2, h / 2 + 10, min(w, h) / 2 - 10
 
+    def paint_dial(self, p):
+        # Корпус, деления и подпись прибора — статичный слой
+        cx, cy, r = self.dial_geometry()
         p.setBrush(QColor(245, 245, 245))
         p.setPen(QPen(Qt.black, 2))
         p.drawEllipse(QPointF(cx, cy - 10), r, r)
 
         p.setPen(QPen(Qt.black, 1))
-        start_angle = 225
-        span_angle = -90 
         
         for i in range(11):
             val_norm = i / 10.0
-            angle_deg = start_angle + val_norm * span_angle
+            angle_deg = self.start_angle + val_norm * self.span_angle
             angle_rad = math.radians(angle_deg)
             p1 = QPointF(cx + (r-15)*math.cos(angle_rad), (cy-10) - (r-15)*math.sin(angle_rad))
             p2 = QPointF(cx + (r-5)*math.cos(angle_rad), (cy-10) - (r-5)*math.sin(angle_rad))
@@ -55,6 +67,12 @@ class AnalogMeter(QFrame):
 
         p.setFont(QFont("Arial", 10, QFont.Bold))
         p.drawText(QRectF(cx - 30, cy + 10, 60, 20), Qt.AlignCenter, self.title)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        self._dial.draw(p)
+        cx, cy, r = self.dial_geometry()
         
         p.setFont(QFont("Arial", 12))
         p.setPen(QPen(QColor(0, 50, 150)))
@@ -62,7 +80,7 @@ class AnalogMeter(QFrame):
 
         val_clamped = max(0, min(self.value, self.max_val))
         ratio = val_clamped / self.max_val if self.max_val > 0 else 0
-        needle_angle = start_angle + ratio * span_angle
+        needle_angle = self.start_angle + ratio * self.span_angle
         
         p.save()
         p.translate(cx, cy - 10)
@@ -80,20 +98,13 @@ class RealCircuitWidget(QFrame):
     loadChanged = Signal(float)
     switchToggled = Signal(bool)
 
-    def __init__(self, parent=None):
+    def __init__(self, model, parent=None):
         super().__init__(parent)
         self.setMinimumSize(600, 400)
         self.setStyleSheet("background-color: #eef2f5; border: 1px solid #aaa; border-radius: 10px;")
         
-        self.emf = 4.5
-        self.r_int = 1.0
-        self.r_load = 10.0
-        self.is_closed = False
+        self.model = model   # EmfModel: ключ и положение реостата
         self.is_dragging = False
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(30)
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -139,7 +150,7 @@ class RealCircuitWidget(QFrame):
         for i in range(0, int(res_h), 4):
             p.drawLine(res_x - 15, batt_y - 80 + i, res_x + 15, batt_y - 80 + i)
             
-        slider_ratio = (self.r_load - 1.0) / 19.0
+        slider_ratio = (self.model.r_load - 1.0) / 19.0
         slider_y = (batt_y - 80) + slider_ratio * res_h
         
         self.slider_rect = QRectF(res_x - 25, slider_y - 10, 50, 20)
@@ -147,7 +158,7 @@ class RealCircuitWidget(QFrame):
         p.setPen(Qt.black)
         p.drawRoundedRect(self.slider_rect, 5, 5)
         p.setPen(Qt.white)
-        p.drawText(self.slider_rect, Qt.AlignCenter, f"{self.r_load:.1f}Ω")
+        p.drawText(self.slider_rect, Qt.AlignCenter, f"{self.model.r_load:.1f}Ω")
 
         # 4. КЛЮЧ
         sw_x = 300
@@ -160,7 +171,7 @@ class RealCircuitWidget(QFrame):
         p.drawEllipse(sw_x + 20, sw_y - 5, 10, 10)
         
         p.setPen(QPen(QColor(80, 80, 80), 6))
-        if self.is_closed:
+        if self.model.is_closed:
             p.drawLine(sw_x - 30, sw_y, sw_x + 20, sw_y)
             status = "Замкнут"
             col = QColor(0, 150, 0)
@@ -174,8 +185,8 @@ class RealCircuitWidget(QFrame):
 
     def mousePressEvent(self, event):
         if self.switch_rect.contains(event.position()):
-            self.is_closed = not self.is_closed
-            self.switchToggled.emit(self.is_closed)
+            self.model.is_closed = not self.model.is_closed
+            self.switchToggled.emit(self.model.is_closed)
             self.update()
         elif self.slider_rect.contains(event.position()):
             self.is_dragging = True
@@ -188,7 +199,7 @@ class RealCircuitWidget(QFrame):
             y = max(top, min(bottom, y))
             ratio = (y - top) / (bottom - top)
             new_r = 1.0 + ratio * 19.0
-            self.r_load = new_r
+            self.model.r_load = new_r
             self.loadChanged.emit(new_r)
             self.update()
 
@@ -200,6 +211,7 @@ class Lab17App(QWidget):
         super().__init__()
         self.setWindowTitle("Лабораторная работа №17: ЭДС и Внутреннее сопротивление")
         self.resize(1100, 700)
+        self.model = EmfModel()
         self.setup_ui()
         self.new_experiment()
 
@@ -215,9 +227,10 @@ class Lab17App(QWidget):
         meters.addWidget(self.voltmeter)
         left_layout.addLayout(meters)
         
-        self.circuit = RealCircuitWidget()
-        self.circuit.loadChanged.connect(self.calc_physics)
-        self.circuit.switchToggled.connect(self.calc_physics)
+        self.circuit = RealCircuitWidget(self.model)
+        # Ползунок шлёт событие на каждое движение мыши — пересчёт раз в кадр
+        self.circuit.loadChanged.connect(self.request_physics)
+        self.circuit.switchToggled.connect(self.request_physics)
         left_layout.addWidget(self.circuit)
         
         main.addLayout(left_layout, 2)
@@ -264,45 +277,30 @@ class Lab17App(QWidget):
         
         right_panel.addStretch(1)
         main.addLayout(right_panel, 1)
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_meters)
-        self.timer.start(30)
 
     def new_experiment(self):
-        self.emf = random.choice([4.5, 6.0, 9.0])
-        self.r_int = random.uniform(0.5, 2.0)
-        self.circuit.emf = self.emf
-        self.circuit.r_int = self.r_int
-        
-        self.circuit.is_closed = False
-        self.circuit.r_load = 10.0
+        self.model.randomize()
+        self.circuit.update()
         self.in_E.clear(); self.in_U.clear(); self.in_I.clear(); self.in_r.clear()
         self.calc_physics()
-        
+
+    def request_physics(self, *_):
+        frame_clock().request(self, self.calc_physics)
+
     def calc_physics(self):
-        if not self.circuit.is_closed:
-            self.current_I = 0.0
-            self.current_U = self.emf
-        else:
-            total_r = self.circuit.r_load + self.r_int
-            self.current_I = self.emf / total_r
-            self.current_U = self.current_I * self.circuit.r_load
+        m = self.model
+        self.current_I, self.current_U = m.readings()
             
-        self.lbl_formula_I.setText(f"I = {self.emf:.1f} / ({self.circuit.r_load:.1f} + {self.r_int:.1f}) = {self.current_I:.2f} A")
-        self.lbl_formula_U.setText(f"U = {self.emf:.1f} - {self.current_I:.2f} * {self.r_int:.1f} = {self.current_U:.2f} V")
-
-    def update_meters(self):
+        self.lbl_formula_I.setText(f"I = {m.emf:.1f} / ({m.r_load:.1f} + {m.r_int:.1f}) = {self.current_I:.2f} A")
+        self.lbl_formula_U.setText(f"U = {m.emf:.1f} - {self.current_I:.2f} * {m.r_int:.1f} = {self.current_U:.2f} V")
         self.ammeter.set_value(self.current_I)
-        self.ammeter.update_needle()
         self.voltmeter.set_value(self.current_U)
-        self.voltmeter.update_needle()
 
     def check_res(self):
         try:
             val = float(self.in_r.text())
-            if abs(val - self.r_int) < 0.1:
-                QMessageBox.information(self, "Верно", f"✅ r = {self.r_int:.2f} Ом")
+            if self.model.check({"value": val})["value"]:
+                QMessageBox.information(self, "Верно", f"✅ r = {self.model.r_int:.2f} Ом")
             else:
                 QMessageBox.warning(self, "Ошибка", "❌ Неверно.")
         except:
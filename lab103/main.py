@@ -1,86 +1,42 @@
 import sys
-import random
-import math
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import Animated
+from physlab.models import SurfaceTensionModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Бюретка + Капля + Весы
 # ==========================================
-class SurfaceTensionWidget(QFrame):
+class SurfaceTensionWidget(QFrame, Animated):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 450)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.sigma = 0.073  
-        self.d = 0.002      
-        self.g = 9.81
-        
-        self.drops_count = 0
-        self.total_mass = 0.0 
-        self.drop_radius = 0
-        self.drop_y = 50
-        
-        self.is_dripping = False
-        self.is_finished = False
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
+        # Капля описана пошагово (шаг 30 мс) — в модели
+        self.model = SurfaceTensionModel()
 
     def toggle_dripping(self):
-        if self.is_finished: return
-        self.is_dripping = not self.is_dripping
-        if self.is_dripping and self.drop_radius == 0:
-            self.drop_radius = 2
-            self.drop_y = 50
-
-    def animate(self):
-        if not self.is_dripping: return
-        
-        if self.drop_y == 50:
-            if self.drop_radius < 8:
-                self.drop_radius += 0.2
-            else:
-                self.drop_y += 5 
-        else:
-            self.drop_y += 10
-            if self.drop_y > 300: 
-                self.add_drop()
-                if not self.is_finished:
-                    self.drop_radius = 2
-                    self.drop_y = 50
-                else:
-                    self.is_dripping = False
-                    self.drop_radius = 0
-                
-        self.update()
-
-    def add_drop(self):
-        if self.is_finished: return
+        self.model.toggle()
+        if self.model.dripping: self.wake()
 
-        self.drops_count += 1
-        m_drop = (math.pi * self.d * self.sigma) / self.g
-        m_drop *= random.uniform(0.98, 1.02)
-        self.total_mass += m_drop
-        
-        if self.drops_count >= 50:
-            self.is_finished = True
-            self.is_dripping = False
+    def animate(self, dt):
+        if not self.model.dripping:
+            self.settle()
+            return
+        was_finished = self.model.finished
+        self.model.step(dt)
+        if self.model.finished and not was_finished:
             self.parent().parent().experiment_finished()
+        self.update()
 
     def reset(self):
-        self.drops_count = 0
-        self.total_mass = 0.0
-        self.is_dripping = False
-        self.is_finished = False
-        self.drop_radius = 0
-        self.drop_y = 50
+        self.model.reset()
         self.update()
 
     def paintEvent(self, event):
@@ -88,6 +44,7 @@ class SurfaceTensionWidget(QFrame):
         painter.setRenderHint(QPainter.Antialiasing)
         w, h = self.width(), self.height()
         cx = w // 2
+        m = self.model
 
         # 1. Бюретка
         painter.setBrush(QColor(220, 220, 255))
@@ -95,10 +52,10 @@ class SurfaceTensionWidget(QFrame):
         painter.drawRect(cx - 10, 0, 20, 50)
         
         # 2. Капля
-        if (self.is_dripping or self.drop_radius > 0) and not self.is_finished:
+        if (m.dripping or m.drop_radius > 0) and not m.finished:
             painter.setBrush(QColor(100, 150, 255))
             painter.setPen(Qt.NoPen)
-            painter.drawEllipse(QPointF(cx, self.drop_y), self.drop_radius, self.drop_radius * 1.2)
+            painter.drawEllipse(QPointF(cx, m.drop_y), m.drop_radius, m.drop_radius * 1.2)
 
         # 3. Стакан
         beaker_y = 300
@@ -108,8 +65,8 @@ class SurfaceTensionWidget(QFrame):
         painter.setPen(Qt.black)
         painter.drawRect(cx - beaker_w//2, beaker_y, beaker_w, beaker_h)
         
-        if self.drops_count > 0:
-            level = min(beaker_h - 5, self.drops_count)
+        if m.drops_count > 0:
+            level = min(beaker_h - 5, m.drops_count)
             painter.setBrush(QColor(100, 150, 255, 180))
             painter.setPen(Qt.NoPen)
             painter.drawRect(cx - beaker_w//2 + 2, beaker_y + beaker_h - level, beaker_w - 4, level)
@@ -121,13 +78,13 @@ class SurfaceTensionWidget(QFrame):
         painter.setBrush(QColor(200, 255, 200))
         painter.drawRect(cx - 40, scale_y + 10, 80, 20)
         
-        mass_g = self.total_mass * 1000
+        mass_g = m.total_mass * 1000
         painter.setPen(Qt.black)
         painter.setFont(QFont("Courier", 12, QFont.Bold))
         painter.drawText(cx - 35, scale_y + 25, f"{mass_g:.3f} g")
         
         painter.setFont(QFont("Arial", 10))
-        painter.drawText(cx + 70, beaker_y + 30, f"n = {self.drops_count}")
+        painter.drawText(cx + 70, beaker_y + 30, f"n = {m.drops_count}")
 
 # ==========================================
 # ГЛАВНОЕ ОКНО
@@ -215,11 +172,8 @@ class LabSurfaceTensionApp(QWidget):
         right_panel.addStretch(1)
 
     def new_experiment(self):
-        liquids = [("Вода", 0.073), ("Спирт", 0.022), ("Глицерин", 0.063), ("Ацетон", 0.024)]
-        name, sigma = random.choice(liquids)
-        self.true_sigma = sigma
-        self.stand.sigma = sigma
-        self.stand.reset()
+        self.stand.model.randomize()
+        self.stand.update()
         
         self.in_M.clear(); self.in_n.clear(); self.in_sigma.clear()
         self.btn_start.setEnabled(True)
@@ -230,7 +184,7 @@ class LabSurfaceTensionApp(QWidget):
 
     def toggle_drops(self):
         self.stand.toggle_dripping()
-        if self.stand.is_dripping:
+        if self.stand.model.dripping:
             self.btn_start.setText("Стоп (Пауза)")
             self.btn_start.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold;")
         else:
@@ -250,10 +204,11 @@ class LabSurfaceTensionApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        if abs(val - self.true_sigma) < 0.005:
-            QMessageBox.information(self, "Верно", f"✅ Отлично! σ = {self.true_sigma} Н/м")
+        model = self.stand.model
+        if model.check({"value": val})["value"]:
+            QMessageBox.information(self, "Верно", f"✅ Отлично! σ = {model.sigma} Н/м")
         else:
-            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. σ = {self.true_sigma} Н/м")
+            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. σ = {model.sigma} Н/м")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
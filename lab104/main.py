@@ -1,63 +1,59 @@
 import sys
-import random
 import math
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import Animated, ease
+from physlab.models import TempCoeffModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Калориметр + Омметр
 # ==========================================
-class ResistanceWidget(QFrame):
+class ResistanceWidget(QFrame, Animated):
+    frame_interval = 30
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 400)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.R0 = 10.0  
-        self.T0 = 20.0  
-        self.alpha = 0.004 
-        
-        self.current_T = 20.0
-        self.target_T = 20.0
+        self.model = TempCoeffModel()
         
         self.needle_angle = -45.0 
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
+        self.wake()
 
     def set_params(self, R0, alpha):
-        self.R0 = R0
-        self.alpha = alpha
-        self.current_T = 20.0
-        self.target_T = 20.0
+        self.model.set_params(R0=R0, alpha=alpha)
+        self.model.reset()
+        self.wake()
         self.update()
 
     def heat_up(self):
-        self.target_T = random.uniform(80, 95)
+        self.model.heat_up()
+        self.wake()
 
     def get_resistance(self):
-        return self.R0 * (1 + self.alpha * (self.current_T - 20))
+        return self.model.resistance()
+
+    def animate(self, dt):
+        m = self.model
+        m.step(dt)
 
-    def animate(self):
-        diff = self.target_T - self.current_T
-        if abs(diff) > 0.1:
-            self.current_T += diff * 0.02
-        else:
-            self.current_T = self.target_T
-            
         current_R = self.get_resistance()
-        min_R = self.R0 * 0.9
-        max_R = self.R0 * 1.5
+        min_R = m.R0 * 0.9
+        max_R = m.R0 * 1.5
         
         ratio = (current_R - min_R) / (max_R - min_R)
         target_angle = -45 + ratio * 90
         
-        self.needle_angle += (target_angle - self.needle_angle) * 0.1
+        self.needle_angle += (target_angle - self.needle_angle) * ease(dt, 0.285)
+        if m.T == m.target_T and abs(target_angle - self.needle_angle) < 0.05:
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
@@ -72,7 +68,7 @@ class ResistanceWidget(QFrame):
         cal_w = 140
         cal_h = 180
         
-        temp_ratio = (self.current_T - 20) / 80
+        temp_ratio = (self.model.T - 20) / 80
         if temp_ratio > 1: temp_ratio = 1
         r = int(100 + 155 * temp_ratio)
         b = int(255 - 155 * temp_ratio)
@@ -97,7 +93,7 @@ class ResistanceWidget(QFrame):
         painter.drawRect(th_x, th_y, 15, th_h)
         painter.drawEllipse(th_x - 5, th_y + th_h - 10, 25, 25)
         
-        merc_h = (self.current_T / 100) * (th_h - 20)
+        merc_h = (self.model.T / 100) * (th_h - 20)
         painter.setBrush(Qt.red)
         painter.setPen(Qt.NoPen)
         painter.drawRect(th_x + 2, th_y + th_h - 10 - merc_h, 11, merc_h + 10)
@@ -105,7 +101,7 @@ class ResistanceWidget(QFrame):
         
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 10, QFont.Bold))
-        painter.drawText(th_x + 25, th_y + th_h - merc_h, f"{self.current_T:.1f}°C")
+        painter.drawText(th_x + 25, th_y + th_h - merc_h, f"{self.model.T:.1f}°C")
 
         # 3. Омметр
         om_x = cx + 100
@@ -217,24 +213,16 @@ class LabTempCoeffApp(QWidget):
         right_panel.addStretch(1)
 
     def new_experiment(self):
-        materials = [
-            ("Медь", 0.0043),
-            ("Алюминий", 0.0042),
-            ("Железо", 0.006),
-            ("Вольфрам", 0.0045)
-        ]
-        name, alpha = random.choice(materials)
-        self.true_alpha = alpha
-        
-        R0 = random.uniform(5.0, 20.0)
-        self.res_widget.set_params(R0, alpha)
+        model = self.res_widget.model
+        model.randomize()
+        self.res_widget.set_params(model.R0, model.alpha)
         
         self.in_R0.clear()
         self.in_R.clear()
         self.in_T.clear()
         self.in_alpha.clear()
         
-        QMessageBox.information(self, "Задание", f"Дана новая проволока ({name}).")
+        QMessageBox.information(self, "Задание", f"Дана новая проволока ({model.material}).")
 
     def check_answer(self):
         try:
@@ -243,10 +231,11 @@ class LabTempCoeffApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        if abs(val - self.true_alpha) < 0.0005:
-            QMessageBox.information(self, "Верно", f"✅ Отлично! α = {self.true_alpha}")
+        model = self.res_widget.model
+        if model.check({"value": val})["value"]:
+            QMessageBox.information(self, "Верно", f"✅ Отлично! α = {model.alpha}")
         else:
-            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. α = {self.true_alpha}")
+            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. α = {model.alpha}")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
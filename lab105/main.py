@@ -2,158 +2,63 @@ import sys
 import math
 import random
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView, QSlider
+    QApplication, QLabel, QFrame, QDoubleSpinBox, QSlider
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QRectF, QPointF
-
-# --- КОНСТАНТЫ ---
-C_LIGHT = 299792458       # м/с
-E_CHARGE = 1.60218e-19    # Кл
-H_PLANCK_TRUE = 6.626e-34 # Дж*с
-WORK_FUNCTION_EV = 2.2    # Работа выхода (например, Калий), эВ
-WORK_FUNCTION_J = WORK_FUNCTION_EV * E_CHARGE
-
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1100, 700)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # Левая панель
-        control_panel = QFrame(); control_panel.setFixedWidth(340)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
-        ctrl_layout.addWidget(formula_lbl)
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Управление установкой")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        ans_box = QGroupBox("Результат")
-        ans_layout = QVBoxLayout(ans_box)
-        ans_layout.addWidget(QLabel("Рассчитайте h (Дж·с):"))
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Например: 6.63e-34")
-        ans_layout.addWidget(self.answer_input)
-        
-        self.btn_check = QPushButton("Проверить ответ")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # Правая панель
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=3)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["λ (нм), U (В)", "Ваш h", "Эталон", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=1)
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
-
-    def create_visualizer(self): return QFrame()
-    def get_true_value(self): return 0.0
-    def get_params_str(self): return ""
-    def setup_inputs(self): pass
-
-    def check_answer(self):
-        try:
-            val_text = self.answer_input.text().replace(',', '.')
-            user_val = float(val_text)
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Введите число (можно в формате 6.6e-34).")
-            return
-            
-        true_val = H_PLANCK_TRUE
-        # Допуск 10% (так как эксперимент сложный)
-        is_correct = abs(user_val - true_val) <= 0.1 * true_val
-        
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(self.get_params_str()))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{user_val:.2e}"))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{true_val:.2e}"))
-        
-        status_item = QTableWidgetItem("✅ Верно" if is_correct else "❌ Ошибка")
-        status_item.setForeground(QBrush(QColor("green") if is_correct else QColor("red")))
-        self.table.setItem(row, 3, status_item)
-        
-        if is_correct:
-            QMessageBox.information(self, "Успех", "Блестяще! Вы определили фундаментальную константу.")
-        else:
-            QMessageBox.warning(self, "Ошибка", f"Неверно.\nh ≈ {true_val:.3e}")
+from PySide6.QtCore import Qt, QRectF, QPointF
 
+from physlab.core import Animated, BaseLabWindow, ParticlePool, TickAccumulator, wavelength_color
+from physlab.models import PhotoEffectModel
 
 # --- ВИЗУАЛИЗАТОР ФОТОЭФФЕКТА ---
-class PhotoEffectVisualizer(QFrame):
-    def __init__(self):
+class PhotoEffectVisualizer(QFrame, Animated):
+    def __init__(self, model):
         super().__init__()
         self.setStyleSheet("background-color: #222; border: 1px solid #555;")
         
-        self.wavelength_nm = 500.0 # нм
-        self.voltage = 0.0         # В (отрицательное - задерживающее)
-        self.intensity = 50        # %
+        self.model = model   # PhotoEffectModel: λ, U, интенсивность и работа выхода
         
         # Физика электронов
-        self.electrons = [] # [x, y, vx, vy, color]
+        self.electrons = ParticlePool()  # x, y, vx, vy в массивах numpy
         self.photocurrent = 0.0
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
+        # Модель электронов написана на шаг 30 мс
+        self.ticks = TickAccumulator(0.03)
+        self.wake()
 
-    def update_params(self, nm, u, inten):
-        self.wavelength_nm = nm
-        self.voltage = u
-        self.intensity = inten
+    def refresh(self):
+        # Окно поменяло параметры модели
         # Очищаем электроны при резкой смене параметров, чтобы не было артефактов
         # self.electrons.clear() 
+        self.wake()
+        self.update()
 
-    def nm_to_rgb(self, nm):
-        # Приближенный перевод длины волны в цвет
-        r, g, b = 0, 0, 0
-        if 380 <= nm < 440:
-            r = -(nm - 440) / (440 - 380); b = 1.0
-        elif 440 <= nm < 490:
-            g = (nm - 440) / (490 - 440); b = 1.0
-        elif 490 <= nm < 510:
-            g = 1.0; b = -(nm - 510) / (510 - 490)
-        elif 510 <= nm < 580:
-            r = (nm - 510) / (580 - 510); g = 1.0
-        elif 580 <= nm < 645:
-            r = 1.0; g = -(nm - 645) / (645 - 580)
-        elif 645 <= nm <= 780:
-            r = 1.0
-        return QColor(int(r * 255), int(g * 255), int(b * 255))
+    def animate(self, dt):
+        n = self.ticks.steps(dt)
+        if n == 0:
+            return
+        for _ in range(n):
+            self.step_electrons()
+        # Электронов нет и новые не рождаются — сцена застыла
+        if not self.electrons and self.photocurrent < 0.01 and not self.model.is_emitting():
+            self.photocurrent = 0.0
+            self.settle()
+        self.update()
+
+    def debug_counts(self):
+        return {"электроны": len(self.electrons)}
 
-    def animate(self):
+    def step_electrons(self):
         w = self.width()
         
-        # 1. Расчет энергии фотона и макс. кин. энергии
-        # E_ph = h * c / lambda
-        E_ph_J = (H_PLANCK_TRUE * C_LIGHT) / (self.wavelength_nm * 1e-9)
-        E_k_max_J = E_ph_J - WORK_FUNCTION_J
+        # 1. Макс. кин. энергия: E_k = h * c / lambda - A
+        E_k_max_J = self.model.max_kinetic_energy()
         
         # 2. Рождение электронов
         # Если энергия фотона больше работы выхода
-        if E_k_max_J > 0 and self.intensity > 0:
+        if self.model.is_emitting():
             # Вероятность рождения пропорциональна интенсивности
-            if random.randint(0, 100) < (self.intensity / 5):
+            if random.randint(0, 100) < (self.model.intensity / 5):
                 # Начальная скорость v = sqrt(2Ek/m).
                 # Для визуализации масштабируем скорость
                 # V_max пропорциональна корню из Ek
@@ -161,50 +66,30 @@ class PhotoEffectVisualizer(QFrame):
                 # Электроны имеют разную скорость (от 0 до v_max)
                 v_real = v_scale * random.uniform(0.5, 1.0)
                 
-                self.electrons.append({
-                    'x': 60, # На катоде
-                    'y': random.randint(100, 300),
-                    'vx': v_real,
-                    'vy': random.uniform(-1, 1)
-                })
+                self.electrons.emit(60, random.randint(100, 300), v_real, random.uniform(-1, 1))  # На катоде
 
         # 3. Движение электронов
         # Ускорение a = F/m = (e * U / d) / m
         # Если U < 0 (задерживающее), ускорение отрицательное (торможение)
         # Визуальный коэффициент ускорения
-        acc = self.voltage * 0.8 
+        acc = self.model.voltage * 0.8 
         
         anode_x = w - 60
-        reached_anode = 0
         
-        survived_electrons = []
-        for e in self.electrons:
-            e['vx'] += acc # Изменяем скорость
-            e['x'] += e['vx']
-            e['y'] += e['vy']
-            
-            # Если электрон полетел назад (отразился полем)
-            if e['vx'] < 0 and e['x'] < 60:
-                continue # Поглощен катодом обратно
-            
-            # Если долетел до анода
-            if e['x'] > anode_x:
-                reached_anode += 1
-                continue # Поглощен анодом (ток)
-            
-            # Если вылетел за пределы Y
-            if not (50 < e['y'] < 350):
-                continue
-                
-            survived_electrons.append(e)
-            
-        self.electrons = survived_electrons
+        # Все электроны разом: сначала скорость, потом координата
+        self.electrons.step(ax=acc)
+        x, y = self.electrons.positions()
+        vx = self.electrons.vx[:len(self.electrons)]
+        
+        back = (vx < 0) & (x < 60)      # отразился полем — поглощен катодом обратно
+        at_anode = x > anode_x           # долетел до анода (ток)
+        outside = (y <= 50) | (y >= 350) # вылетел за пределы Y
+        reached_anode = int(at_anode.sum())
+        self.electrons.remove(back | at_anode | outside)
         
         # Сглаживание показаний амперметра
         target_current = reached_anode * 10 # Условные единицы
         self.photocurrent = self.photocurrent * 0.9 + target_current * 0.1
-        
-        self.update()
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -212,11 +97,11 @@ class PhotoEffectVisualizer(QFrame):
         w, h = self.width(), self.height()
         
         # 1. Лампа и Свет
-        light_color = self.nm_to_rgb(self.wavelength_nm)
+        light_color = wavelength_color(self.model.wavelength_nm)
         p.setPen(QPen(light_color, 2))
         
         # Лучи света
-        opacity = int(self.intensity * 2.55)
+        opacity = int(self.model.intensity * 2.55)
         beam_color = QColor(light_color)
         beam_color.setAlpha(opacity)
         p.setBrush(QBrush(beam_color))
@@ -240,10 +125,11 @@ class PhotoEffectVisualizer(QFrame):
         p.drawText(anode_x, 70, "A")
         
         # 3. Электроны
-        p.setBrush(Qt.cyan)
-        p.setPen(Qt.NoPen)
-        for e in self.electrons:
-            p.drawEllipse(QPointF(e['x'], e['y']), 3, 3)
+        # Точки без сглаживания: тысячи электронов рисуются за один вызов
+        p.setRenderHint(QPainter.Antialiasing, False)
+        p.setPen(QPen(Qt.cyan, 6, Qt.SolidLine, Qt.RoundCap))
+        p.drawPoints(self.electrons.polygon())
+        p.setRenderHint(QPainter.Antialiasing)
             
         # 4. Амперметр (Визуализация тока)
         p.setPen(QPen(Qt.white, 2))
@@ -273,11 +159,24 @@ class PhotoEffectVisualizer(QFrame):
         # Инфо
         p.setFont(QFont("Arial", 10))
         p.setPen(Qt.gray)
-        p.drawText(10, h - 10, f"Работа выхода A = {WORK_FUNCTION_EV} эВ")
+        p.drawText(10, h - 10, f"Работа выхода A = {self.model.work_function_ev} эВ")
 
 
 # --- ГЛАВНЫЙ КЛАСС ЛАБОРАТОРНОЙ ---
 class PhotoEffectLab(BaseLabWindow):
+    window_size = (1100, 700)
+    panel_width = 340
+    inputs_title = "Управление установкой"
+    answer_label = "Рассчитайте h (Дж·с):"
+    answer_placeholder = "Например: 6.63e-34"
+    table_headers = ["λ (нм), U (В)", "Ваш h", "Эталон", "Статус"]
+    # Допуск 10% (так как эксперимент сложный) — в модели
+    model_class = PhotoEffectModel
+    value_format = "{:.2e}"
+    input_error = "Введите число (можно в формате 6.6e-34)."
+    success_message = "Блестяще! Вы определили фундаментальную константу."
+    failure_message = "Неверно.\nh ≈ {true}"
+
     def __init__(self):
         super().__init__(
             title="10 Класс: Постоянная Планка (Фотоэффект)",
@@ -293,7 +192,7 @@ class PhotoEffectLab(BaseLabWindow):
         self.setup_inputs()
 
     def create_visualizer(self):
-        return PhotoEffectVisualizer()
+        return PhotoEffectVisualizer(self.model)
 
     def setup_inputs(self):
         # Длина волны
@@ -336,7 +235,8 @@ class PhotoEffectLab(BaseLabWindow):
         inten = self.slider_int.value()
         u = self.spin_u.value()
         
-        self.visualizer.update_params(nm, u, inten)
+        self.model.set_params(wavelength_nm=nm, voltage=u, intensity=inten)
+        self.visualizer.refresh()
 
     def get_params_str(self):
         return f"λ={self.slider_lam.value()}нм, U={self.spin_u.value()}В"
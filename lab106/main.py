@@ -1,170 +1,32 @@
 import sys
-import math
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView, QSlider
+    QApplication, QLabel, QPushButton, QFrame, QDoubleSpinBox, QSlider
 )
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPolygon
-from PySide6.QtCore import Qt, QTimer, QRectF, QPointF, QPoint
-
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1000, 600)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # Левая панель
-        control_panel = QFrame(); control_panel.setFixedWidth(320)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
-        ctrl_layout.addWidget(formula_lbl)
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Параметры опыта")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        ans_box = QGroupBox("Результат")
-        ans_layout = QVBoxLayout(ans_box)
-        ans_layout.addWidget(QLabel("Запишите макс. ЭДС (В):"))
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Пиковое значение")
-        ans_layout.addWidget(self.answer_input)
-        
-        self.btn_check = QPushButton("Проверить ответ")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # Правая панель
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=3)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Скорость v", "Число витков N", "Ваш ЭДС", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=1)
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
-
-    def create_visualizer(self): return QFrame()
-    def get_true_value(self): return 0.0
-    def get_params_str(self): return ""
-    def setup_inputs(self): pass
-
-    def check_answer(self):
-        try:
-            val_text = self.answer_input.text().replace(',', '.')
-            user_val = float(val_text)
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Введите числовое значение.")
-            return
-            
-        true_val = self.get_true_value()
-        # Допуск 5%
-        is_correct = abs(user_val - true_val) <= (0.05 * true_val if true_val != 0 else 0.1)
-        
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(self.get_params_str()))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{user_val:.2f}"))
-        
-        status_item = QTableWidgetItem("✅ Верно" if is_correct else "❌ Ошибка")
-        status_item.setForeground(QBrush(QColor("green") if is_correct else QColor("red")))
-        self.table.setItem(row, 3, status_item)
-        
-        if is_correct:
-            QMessageBox.information(self, "Успех", f"Верно! ЭДС пропорциональна скорости.\nМаксимум был: {true_val:.2f} В")
-        else:
-            QMessageBox.warning(self, "Ошибка", f"Неверно.\nПравильный ответ: {true_val:.2f} В")
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPolygon
+from PySide6.QtCore import Qt, QRectF, QPointF, QPoint
 
+from physlab.core import Animated, BaseLabWindow
+from physlab.models import MagnetCoilModel
 
 # --- ВИЗУАЛИЗАТОР ИНДУКЦИИ ---
-class InductionVisualizer(QFrame):
-    def __init__(self):
+class InductionVisualizer(QFrame, Animated):
+    frame_interval = 20 # 50 FPS для плавности
+
+    def __init__(self, model):
         super().__init__()
         self.setStyleSheet("background-color: #333; border: 1px solid #555;")
         
-        self.speed = 1.0 # м/с (условно)
-        self.N_turns = 50
-        
-        # Состояние магнита
-        self.magnet_x = -150 # Начальная позиция (слева)
-        self.is_moving = False
-        
-        # Показания приборов
-        self.current_emf = 0.0
-        self.max_emf_detected = 0.0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20) # 50 FPS для плавности
+        # v, N, положение магнита и ЭДС — в модели
+        self.model = model
 
-    def update_params(self, v, n):
-        self.speed = v
-        self.N_turns = n
-        
     def start_experiment(self):
-        self.magnet_x = -200
-        self.is_moving = True
-        self.max_emf_detected = 0.0
+        self.model.start()
+        self.wake()
 
-    def animate(self):
-        if not self.is_moving:
-            # Плавный возврат стрелки к нулю
-            self.current_emf *= 0.9
-            self.update()
-            return
-
-        # Двигаем магнит
-        step = self.speed * 5 # Коэффициент скорости для анимации
-        self.magnet_x += step
-        
-        # Расчет ЭДС
-        # Модель: Магнитный поток Ф(x) похож на колокол (Гауссиана)
-        # Ф(x) = B * S * exp(-x^2 / w^2)
-        # E = -N * dФ/dt = -N * dФ/dx * dx/dt = -N * Ф'(x) * v
-        # Ф'(x) ~ -2x * exp(...)
-        
-        # Центр катушки в x=0 (визуально центр экрана)
-        # magnet_x - это координата центра магнита относительно центра катушки
-        # Визуально центр экрана w/2. Пусть это будет x=0 в физике.
-        
-        # Переводим экранные координаты в физические (условные)
-        # Пусть ширина катушки ~100 пикселей. Эффективная зона +/- 100.
-        phys_x = self.magnet_x / 60.0 
-        
-        # Производная Гауссианы: -2 * x * exp(-x^2)
-        # E ~ N * v * (2 * x * exp(-x^2))
-        
-        raw_signal = 2 * phys_x * math.exp(-(phys_x**2))
-        
-        # Коэффициент масштабирования, чтобы получить красивые вольты
-        scale_factor = 0.5 
-        
-        # E = - N * v * signal. (Минус по закону Фарадея, но для модуля неважно)
-        emf = - self.N_turns * self.speed * raw_signal * scale_factor
-        
-        self.current_emf = emf
-        
-        # Запоминаем пик (по модулю)
-        if abs(emf) > self.max_emf_detected:
-            self.max_emf_detected = abs(emf)
-            
-        # Если улетел далеко вправо - стоп
-        if self.magnet_x > 200:
-            self.is_moving = False
-            
+    def animate(self, dt):
+        self.model.step(dt)
+        if self.model.is_settled():
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
@@ -190,7 +52,7 @@ class InductionVisualizer(QFrame):
         # Стрелка
         # Макс отклонение +/- 5 делений. Пусть 1 деление = 1 В (условно)
         angle_max = 45 # градусов
-        deflection = (self.current_emf / 5.0) * angle_max
+        deflection = (self.model.emf / 5.0) * angle_max
         deflection = max(-60, min(60, deflection)) # Ограничитель
         
         p.save()
@@ -203,7 +65,7 @@ class InductionVisualizer(QFrame):
         # Цифровое значение (для удобства)
         p.setPen(Qt.black)
         p.setFont(QFont("Arial", 12, QFont.Bold))
-        p.drawText(cx + 110, meter_y - 30, f"{self.current_emf:.2f} В")
+        p.drawText(cx + 110, meter_y - 30, f"{self.model.emf:.2f} В")
         
         # 2. Катушка (Соленоид)
         coil_w = 120
@@ -225,7 +87,7 @@ class InductionVisualizer(QFrame):
         mag_w = 100
         mag_h = 40
         # magnet_x - это смещение относительно центра
-        mx = cx + self.magnet_x - mag_w // 2
+        mx = cx + self.model.magnet_x - mag_w // 2
         my = cy - mag_h // 2
         
         # Северный полюс (Синий)
@@ -258,6 +120,14 @@ class InductionVisualizer(QFrame):
 
 # --- ГЛАВНЫЙ КЛАСС ЛАБОРАТОРНОЙ ---
 class InductionLab(BaseLabWindow):
+    inputs_title = "Параметры опыта"
+    answer_label = "Запишите макс. ЭДС (В):"
+    answer_placeholder = "Пиковое значение"
+    table_headers = ["Параметры (v, N)", "Ваш ЭДС (В)", "Эталон (В)", "Статус"]
+    unit = "В"
+    success_message = "Верно! ЭДС пропорциональна скорости.\nМаксимум был: {true}"
+    model_class = MagnetCoilModel   # E_max = N·v·0.4288 — максимум 2x·e^(-x²)·0.5
+
     def __init__(self):
         super().__init__(
             title="10 Класс: Электромагнитная индукция",
@@ -273,7 +143,7 @@ class InductionLab(BaseLabWindow):
         self.setup_inputs()
 
     def create_visualizer(self):
-        return InductionVisualizer()
+        return InductionVisualizer(self.model)
 
     def setup_inputs(self):
         # Скорость
@@ -307,28 +177,15 @@ class InductionLab(BaseLabWindow):
     def update_ui_labels(self):
         v = self.slider_v.value() / 10.0
         self.lbl_v.setText(f"{v} м/с")
-        # Обновляем параметры визуализатора (на лету)
-        self.visualizer.update_params(v, self.spin_n.value())
+        # Обновляем параметры модели (на лету)
+        self.model.set_params(speed=v, N=self.spin_n.value())
+        self.visualizer.update()
 
     def run_experiment(self):
         v = self.slider_v.value() / 10.0
-        self.visualizer.update_params(v, self.spin_n.value())
+        self.model.set_params(speed=v, N=self.spin_n.value())
         self.visualizer.start_experiment()
 
-    def get_true_value(self):
-        # E_max ~ N * v * const
-        # В нашем визуализаторе формула: emf = N * v * (2*x*exp...) * 0.5
-        # Максимум функции x*exp(-x^2) равен 1/sqrt(2e) ≈ 0.4288 при x = 1/sqrt(2)
-        # Итоговая формула в коде: scale_factor * 2 * 0.4288 = 0.5 * 0.8576 ≈ 0.4288
-        # True E_max = N * v * 0.4288
-        
-        v = self.slider_v.value() / 10.0
-        n = self.spin_n.value()
-        
-        # Вычисленный теоретический максимум для модели
-        peak_factor = 0.42888 
-        return n * v * peak_factor
-
     def get_params_str(self):
         v = self.slider_v.value() / 10.0
         return f"v={v} м/с, N={self.spin_n.value()}"
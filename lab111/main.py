@@ -1,73 +1,61 @@
 import sys
 import math
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox
+    QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox, QSpinBox, QCheckBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import CATCH_UP_DT, Animated
+from physlab.models import PendulumModel
+from physlab.models.elliptic import MAX_AMPLITUDE_DEG
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Маятник + Секундомер
 # ==========================================
-class PendulumWidget(QFrame):
+class PendulumWidget(QFrame, Animated):
+    frame_interval = 20
+    max_dt = CATCH_UP_DT  # угол и секундомер идут по реальному времени, даже если окно подвисло
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 450)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        # Внутренние параметры (Скрыты от ученика)
-        self.length = 1.0   
-        self.g = 9.81       
-        
-        # Анимация
-        self.angle = 0.0    
-        self.max_angle = math.radians(15)
-        self.time = 0.0     
-        self.is_running = False
-        
-        self.stopwatch_time = 0.0
-        self.stopwatch_running = False
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20) 
+        # Внутренние параметры (Скрыты от ученика) — в модели
+        self.model = PendulumModel()
 
-    def set_physics(self, l, g):
-        self.length = l
-        self.g = g
-        self.reset()
+    def new_task(self):
+        self.model.randomize()
+        self.update()
 
     def reset(self):
-        self.time = 0.0
-        self.angle = self.max_angle
-        self.is_running = False
-        self.stopwatch_time = 0.0
-        self.stopwatch_running = False
+        self.model.reset()
+        self.update()
+
+    def set_amplitude(self, amplitude, exact):
+        # Новая амплитуда — маятник снова отводим в крайнее положение
+        self.model.set_params(amplitude=amplitude, exact=exact)
+        self.model.reset()
         self.update()
 
     def start_swing(self):
-        self.is_running = True
+        self.model.start_swing()
+        self.wake()
 
     def toggle_stopwatch(self):
-        self.stopwatch_running = not self.stopwatch_running
+        self.model.toggle_stopwatch()
+        if self.model.stopwatch_running: self.wake()
 
     def reset_stopwatch(self):
-        self.stopwatch_time = 0.0
-        self.stopwatch_running = False
+        self.model.reset_stopwatch()
         self.update()
 
-    def animate(self):
-        if self.is_running:
-            self.time += 0.02
-            # Частота зависит от g и l
-            omega = math.sqrt(self.g / self.length)
-            self.angle = self.max_angle * math.cos(omega * self.time)
-            
-        if self.stopwatch_running:
-            self.stopwatch_time += 0.02
-            
+    def animate(self, dt):
+        self.model.step(dt)
+        if self.model.is_idle():
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
@@ -76,20 +64,21 @@ class PendulumWidget(QFrame):
         w, h = self.width(), self.height()
         cx, cy = w // 2, 50
 
-        # Штатив
-        painter.setPen(QPen(Qt.black, 3))
-        painter.drawLine(cx - 50, cy, cx + 50, cy)
-        
-        # Нить
+        # Нить (при амплитуде больше 90° груз поднимается выше подвеса — опускаем подвес)
         scale = 250 
-        l_px = self.length * scale
-        if l_px > h - 100: l_px = h - 100
+        above = max(0.0, -math.cos(self.model.max_angle))
+        l_px = min(self.model.length * scale, (h - 100) / (1 + above))
+        cy += l_px * above
         
-        bx = cx + l_px * math.sin(self.angle)
-        by = cy + l_px * math.cos(self.angle)
+        bx = cx + l_px * math.sin(self.model.angle)
+        by = cy + l_px * math.cos(self.model.angle)
         
+        # Штатив
+        painter.setPen(QPen(Qt.black, 3))
+        painter.drawLine(QPointF(cx - 50, cy), QPointF(cx + 50, cy))
+
         painter.setPen(QPen(Qt.black, 1))
-        painter.drawLine(cx, cy, bx, by)
+        painter.drawLine(QPointF(cx, cy), QPointF(bx, by))
         
         painter.setBrush(QColor(200, 50, 50))
         painter.setPen(Qt.black)
@@ -104,7 +93,7 @@ class PendulumWidget(QFrame):
         
         painter.setPen(QColor(0, 255, 0))
         painter.setFont(QFont("Courier", 22, QFont.Bold))
-        painter.drawText(sw_x + 10, sw_y + 35, f"{self.stopwatch_time:.2f}")
+        painter.drawText(sw_x + 10, sw_y + 35, f"{self.model.stopwatch:.2f}")
         
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 10))
@@ -119,7 +108,6 @@ class LabFrequencyApp(QWidget):
         self.setWindowTitle("Лабораторная работа: Определение частоты колебаний")
         self.resize(1000, 600)
         
-        self.true_freq = 0.0
         self.setup_ui()
         self.new_experiment()
 
@@ -162,6 +150,15 @@ class LabFrequencyApp(QWidget):
         btn_reset_timer = QPushButton("Сброс секундомера")
         btn_reset_timer.clicked.connect(self.pendulum.reset_stopwatch)
         
+        # Амплитуда: при больших углах период зависит от неё (точная модель)
+        self.spin_amp = QSpinBox(); self.spin_amp.setPrefix("Амплитуда θ0 = "); self.spin_amp.setSuffix("°")
+        self.spin_amp.setRange(5, int(MAX_AMPLITUDE_DEG)); self.spin_amp.setValue(15)
+        self.chk_exact = QCheckBox("Точная модель (большие углы)")
+        self.spin_amp.valueChanged.connect(self.update_amplitude)
+        self.chk_exact.toggled.connect(self.update_amplitude)
+
+        ctrl_l.addWidget(self.spin_amp)
+        ctrl_l.addWidget(self.chk_exact)
         ctrl_l.addWidget(btn_swing)
         ctrl_l.addWidget(self.btn_timer)
         ctrl_l.addWidget(btn_reset_timer)
@@ -195,9 +192,12 @@ class LabFrequencyApp(QWidget):
         
         right_panel.addStretch(1)
 
+    def update_amplitude(self):
+        self.pendulum.set_amplitude(self.spin_amp.value(), self.chk_exact.isChecked())
+
     def toggle_timer_text(self):
         self.pendulum.toggle_stopwatch()
-        if self.pendulum.stopwatch_running:
+        if self.pendulum.model.stopwatch_running:
             self.btn_timer.setText("СТОП")
             self.btn_timer.setStyleSheet("background-color: #F44336; color: white; font-weight: bold;")
         else:
@@ -205,15 +205,8 @@ class LabFrequencyApp(QWidget):
             self.btn_timer.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
 
     def new_experiment(self):
-        # РАНДОМНЫЕ УСЛОВИЯ (g и l)
-        l = random.uniform(0.5, 1.5) 
-        g = random.uniform(3.0, 20.0) # Разная гравитация
-        
-        self.pendulum.set_physics(l, g)
-        
-        # Считаем правильный ответ
-        true_T = 2 * math.pi * math.sqrt(l / g)
-        self.true_freq = 1.0 / true_T
+        # РАНДОМНЫЕ УСЛОВИЯ (g и l) — разная гравитация
+        self.pendulum.new_task()
         
         self.in_t.clear(); self.in_freq.clear()
         self.pendulum.reset_stopwatch()
@@ -230,12 +223,13 @@ class LabFrequencyApp(QWidget):
             return
             
         # Допуск 8% на реакцию человека
-        error_percent = abs(val - self.true_freq) / self.true_freq * 100
+        model = self.pendulum.model
+        true_freq = model.true_value()
         
-        if error_percent < 8.0:
-            QMessageBox.information(self, "Верно", f"✅ Отлично! Ваша частота: {val:.3f} Гц\n(Точная: {self.true_freq:.3f} Гц)")
+        if model.check({"value": val})["value"]:
+            QMessageBox.information(self, "Верно", f"✅ Отлично! Ваша частота: {val:.3f} Гц\n(Точная: {true_freq:.3f} Гц)")
         else:
-            QMessageBox.warning(self, "Ошибка", f"❌ Неверно.\nВы ввели: {val:.3f} Гц\nТочная: {self.true_freq:.3f} Гц\n\nПопробуйте точнее измерить время.")
+            QMessageBox.warning(self, "Ошибка", f"❌ Неверно.\nВы ввели: {val:.3f} Гц\nТочная: {true_freq:.3f} Гц\n\nПопробуйте точнее измерить время.")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
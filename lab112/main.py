@@ -1,13 +1,28 @@
 import sys
 import math
-import random
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox,
-    QSlider
+    QSlider, QComboBox, QCheckBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import LayerCache
+from physlab.core.rays import RayCache, body_polygon, intensity_lines
+from physlab.models import RefractionModel
+from physlab.models.raytrace import fresnel, prism, semicircle, slab, trace_body
+
+# Тела на столе: ключ -> (подпись, построение контура)
+BODIES = {
+    "slab": ("Пластина", slab),
+    "semicircle": ("Полуцилиндр", semicircle),
+    "prism": ("Призма", prism),
+}
+FAN_RAYS = 241      # лучей в веере
+FAN_SPAN = 85       # углы падения веера: от -FAN_SPAN до FAN_SPAN градусов
+SOURCE_DIST = 260   # расстояние от источника до точки падения, px
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Преломление света
@@ -18,79 +33,119 @@ class RefractionWidget(QFrame):
         self.setMinimumSize(500, 450)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.n_glass = 1.5  
-        self.n_air = 1.0
-        self.angle_inc = 45.0 
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(50)
+        self.model = RefractionModel()
+        # Сцена статична: перерисовка только по изменению параметров
+        self.body_kind = "slab"
+        self.body = slab()
+        self.show_fan = False
+        # тело, нормаль и транспортир — один слой, веер (от угла ползунка не зависит) — второй;
+        # выделенный луч — по кэшу на (тело, n, угол, размер)
+        self.table = LayerCache(self, self.draw_table)
+        self.fan = LayerCache(self, self.draw_fan)
+        self._fan_key = None
+        self._rays = RayCache(self.build_ray, maxsize=128)
 
     def set_angle(self, angle):
-        self.angle_inc = angle
+        self.model.angle_inc = angle
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
-        cx, cy = w // 2, h // 2
+    def set_view(self, body_kind=None, show_fan=None):
+        if body_kind is not None and body_kind != self.body_kind:
+            self.body_kind = body_kind
+            self.body = BODIES[body_kind][1]()
+            self.table.invalidate()
+        if show_fan is not None:
+            self.show_fan = show_fan
+        self.update()
+
+    def origin(self):
+        return self.width() // 2, self.height() // 2
+
+    def draw_fan(self, painter):
+        cx, cy = self.origin()
+        angles = np.radians(np.linspace(-FAN_SPAN, FAN_SPAN, FAN_RAYS))
+        trace = trace_body(self.body, self.model.n_glass, *self.body.rays(angles, SOURCE_DIST))
+        for share, lines in intensity_lines(trace, cx, cy):
+            painter.setPen(QPen(QColor(240, 150, 40, int(8 + 60 * share)), 1))
+            painter.drawLines(lines)
+
+    def build_ray(self, key):
+        kind, n, angle, cx, cy = key
+        trace = trace_body(self.body, n, *self.body.rays(math.radians(angle), SOURCE_DIST))
+        return (intensity_lines(trace, cx, cy, rows=trace.depth == 0),
+                intensity_lines(trace, cx, cy, rows=trace.depth > 0))
+
+    def draw_table(self, painter):
+        cx, cy = self.origin()
+        tx, ty = cx + self.body.target[0], cy - self.body.target[1]
+        nx, ny = self.body.normal
 
         # 1. Среда (Стекло/Вода)
-        glass_w = 200
-        glass_h = 100
-        glass_rect = QRectF(cx - glass_w/2, cy, glass_w, glass_h)
-        
         painter.setBrush(QColor(200, 230, 255, 150))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(glass_rect)
-        
-        # Граница сред
-        painter.setPen(QPen(Qt.black, 2))
-        painter.drawLine(cx - 150, cy, cx + 150, cy)
-        
-        # Нормаль
-        painter.setPen(QPen(Qt.black, 1, Qt.DashLine))
-        painter.drawLine(cx, cy - 100, cx, cy + 100)
+        painter.setPen(QPen(QColor(60, 110, 160), 2))
+        painter.drawPolygon(body_polygon(self.body, cx, cy))
 
-        # 2. Лучи
-        alpha_rad = math.radians(self.angle_inc)
-        len_ray = 150
-        start_x = cx - len_ray * math.sin(alpha_rad)
-        start_y = cy - len_ray * math.cos(alpha_rad)
-        
-        # Падающий луч
-        painter.setPen(QPen(Qt.red, 3))
-        painter.drawLine(QPointF(start_x, start_y), QPointF(cx, cy))
-        
-        # Преломленный луч
-        sin_beta = (self.n_air / self.n_glass) * math.sin(alpha_rad)
-        
-        if abs(sin_beta) <= 1.0:
-            beta_rad = math.asin(sin_beta)
-            end_x = cx + len_ray * math.sin(beta_rad)
-            end_y = cy + len_ray * math.cos(beta_rad)
-            painter.setPen(QPen(Qt.blue, 3))
-            painter.drawLine(QPointF(cx, cy), QPointF(end_x, end_y))
-            
-            painter.setPen(Qt.black)
-            painter.setFont(QFont("Arial", 10))
-            painter.drawText(cx - 30, cy - 20, f"α={self.angle_inc:.1f}°")
-            beta_deg = math.degrees(beta_rad)
-            painter.drawText(cx + 10, cy + 30, f"β={beta_deg:.1f}°")
-        else:
-            painter.drawText(cx, cy + 50, "Полное отражение!")
+        # Нормаль в точке падения
+        painter.setPen(QPen(Qt.black, 1, Qt.DashLine))
+        painter.drawLine(QPointF(tx - 110 * nx, ty + 110 * ny), QPointF(tx + 110 * nx, ty - 110 * ny))
 
-        # 3. Транспортир
+        # 3. Транспортир: деления через 10° от нормали
         painter.setPen(QPen(QColor(100, 100, 100, 50), 1))
         painter.setBrush(Qt.NoBrush)
-        painter.drawArc(cx - 100, cy - 100, 200, 200, 0, 180*16)
-        for i in range(0, 181, 10):
-            ang = math.radians(i)
-            p1 = QPointF(cx + 90*math.cos(ang), cy - 90*math.sin(ang))
-            p2 = QPointF(cx + 100*math.cos(ang), cy - 100*math.sin(ang))
+        painter.drawEllipse(QPointF(tx, ty), 100, 100)
+        base = math.atan2(ny, nx)
+        for i in range(0, 360, 10):
+            ang = base + math.radians(i)
+            inner = 85 if i % 30 == 0 else 90
+            p1 = QPointF(tx + inner*math.cos(ang), ty - inner*math.sin(ang))
+            p2 = QPointF(tx + 100*math.cos(ang), ty - 100*math.sin(ang))
             painter.drawLine(p1, p2)
 
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        cx, cy = self.origin()
+        n = self.model.n_glass
+        angle = self.model.angle_inc
+        self.table.draw(painter)
+
+        # 2. Лучи: яркость ветви — доля энергии по Френелю
+        if self.show_fan:
+            if self._fan_key != (self.body_kind, n):
+                self._fan_key = (self.body_kind, n)
+                self.fan.invalidate()
+            self.fan.draw(painter)
+        incident, branches = self._rays.get((self.body_kind, n, angle, cx, cy))
+        for share, lines in incident:
+            painter.setPen(QPen(Qt.red, 3))
+            painter.drawLines(lines)
+        for share, lines in branches:
+            painter.setPen(QPen(QColor(0, 0, 255, int(60 + 195 * share)), 1 + 2 * share))
+            painter.drawLines(lines)
+
+        # Углы на границе, где идёт опыт: у полуцилиндра — плоская грань изнутри
+        tx, ty = cx + self.body.target[0], cy - self.body.target[1]
+        painter.setPen(Qt.black)
+        painter.setFont(QFont("Arial", 10))
+        if self.body_kind == "semicircle":
+            # R — отражённая доля на плоской грани изнутри
+            R = float(fresnel(math.cos(math.radians(angle)), n, 1.0)[0])
+            critical = math.degrees(math.asin(1.0 / n))
+            painter.drawText(QPointF(tx - 70, ty - 20), f"β={angle:.1f}° (стекло)")
+            if angle > critical:
+                painter.drawText(QPointF(tx + 10, ty + 50), "Полное внутреннее отражение!")
+            else:
+                alpha = math.degrees(math.asin(n * math.sin(math.radians(angle))))
+                painter.drawText(QPointF(tx + 10, ty + 30), f"α={alpha:.1f}° (воздух)")
+            painter.drawText(QPointF(10, 20), f"Отражается {R * 100:.1f}% света, предельный угол {critical:.1f}°")
+        else:
+            R = float(fresnel(math.cos(math.radians(angle)), 1.0, n)[0])
+            beta_deg = self.model.refracted_angle()
+            painter.drawText(QPointF(tx - 30, ty - 20), f"α={angle:.1f}°")
+            if beta_deg is not None:
+                painter.drawText(QPointF(tx + 10, ty + 30), f"β={beta_deg:.1f}°")
+            painter.drawText(QPointF(10, 20), f"Отражается {R * 100:.1f}% света")
+
 # ==========================================
 # ГЛАВНОЕ ОКНО
 # ==========================================
@@ -124,6 +179,19 @@ class LabRefractionApp(QWidget):
         slider_layout.addWidget(self.lbl_alpha)
         
         left_layout.addLayout(slider_layout)
+
+        view_layout = QHBoxLayout()
+        view_layout.addWidget(QLabel("Тело:"))
+        self.combo_body = QComboBox()
+        for key, (title, _) in BODIES.items():
+            self.combo_body.addItem(title, key)
+        self.combo_body.currentIndexChanged.connect(self.on_view)
+        view_layout.addWidget(self.combo_body)
+        self.chk_fan = QCheckBox("Веер лучей (все углы падения)")
+        self.chk_fan.toggled.connect(self.on_view)
+        view_layout.addWidget(self.chk_fan)
+        view_layout.addStretch(1)
+        left_layout.addLayout(view_layout)
         left_group.setLayout(left_layout)
         main.addWidget(left_group, 2)
 
@@ -171,16 +239,25 @@ class LabRefractionApp(QWidget):
         right_panel.addStretch(1)
 
     def new_experiment(self):
-        self.n_true = random.uniform(1.3, 1.8)
-        self.refraction.n_glass = self.n_true
+        self.refraction.model.randomize()
+        self.refraction.update()
         self.in_alpha.clear(); self.in_beta.clear(); self.in_n.clear()
         QMessageBox.information(self, "Новый опыт", "Установлена новая среда. Изучите преломление.")
 
+    def on_view(self):
+        self.refraction.set_view(self.combo_body.currentData(), self.chk_fan.isChecked())
+        self.update_angle()
+
     def update_angle(self):
         val = self.slider_alpha.value()
         self.lbl_alpha.setText(f"{val}°")
         self.refraction.set_angle(val)
-        self.in_alpha.setText(str(val))
+        # у полуцилиндра ползунок задаёт угол в стекле (β), угол в воздухе ученик измеряет сам
+        if self.refraction.body_kind == "semicircle":
+            self.in_alpha.clear()
+            self.in_beta.setText(str(val))
+        else:
+            self.in_alpha.setText(str(val))
 
     def check_answer(self):
         try:
@@ -189,10 +266,11 @@ class LabRefractionApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        if abs(val - self.n_true) < 0.1:
-            QMessageBox.information(self, "Верно", f"✅ Отлично! n ≈ {self.n_true:.2f}")
+        model = self.refraction.model
+        if model.check({"value": val})["value"]:
+            QMessageBox.information(self, "Верно", f"✅ Отлично! n ≈ {model.n_glass:.2f}")
         else:
-            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. n ≈ {self.n_true:.2f}.")
+            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. n ≈ {model.n_glass:.2f}.")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
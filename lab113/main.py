@@ -1,13 +1,14 @@
 import sys
-import math
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QSlider
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QPolygonF
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import wavelength_color
+from physlab.models import DiffractionModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Лазер + Решетка + Экран
@@ -18,35 +19,15 @@ class DiffractionWidget(QFrame):
         self.setMinimumSize(600, 450)
         self.setStyleSheet("background-color: #222; border: 1px solid #555; border-radius: 8px;")
         
-        self.wavelength = 650 
-        self.grating_d = 2000 
-        self.distance_L = 1.0 
+        self.model = DiffractionModel()
         
         self.is_on = False
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(50)
-
-    def set_wavelength(self, nm):
-        self.wavelength = nm
-        self.update()
+        # Сцена статична: перерисовка только по изменению параметров
 
     def toggle_laser(self):
         self.is_on = not self.is_on
         self.update()
 
-    def get_color(self):
-        wl = self.wavelength
-        if 380 <= wl < 440: return QColor(148, 0, 211) 
-        if 440 <= wl < 485: return QColor(0, 0, 255)   
-        if 485 <= wl < 500: return QColor(0, 255, 255) 
-        if 500 <= wl < 565: return QColor(0, 255, 0)   
-        if 565 <= wl < 590: return QColor(255, 255, 0) 
-        if 590 <= wl < 625: return QColor(255, 127, 0) 
-        if 625 <= wl < 750: return QColor(255, 0, 0)   
-        return QColor(255, 255, 255)
-
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -68,7 +49,7 @@ class DiffractionWidget(QFrame):
         grating_y = h - 150
         painter.setPen(QPen(Qt.white, 2, Qt.DashLine))
         painter.drawLine(cx - 30, grating_y, cx + 30, grating_y)
-        painter.drawText(cx + 40, grating_y + 5, f"d={self.grating_d}nm")
+        painter.drawText(cx + 40, grating_y + 5, f"d={self.model.grating_d}nm")
 
         # 3. Экран
         screen_y = 50
@@ -95,18 +76,15 @@ class DiffractionWidget(QFrame):
 
         # 4. Лучи
         if self.is_on:
-            color = self.get_color()
+            color = wavelength_color(self.model.wavelength)
             pen = QPen(color, 2)
             painter.setPen(pen)
             
             painter.drawLine(cx, h - 100, cx, 20)
             
             for k in [-2, -1, 1, 2]:
-                sin_phi = (k * self.wavelength) / self.grating_d
-                if abs(sin_phi) < 1.0:
-                    phi = math.asin(sin_phi)
-                    tan_phi = math.tan(phi)
-                    x_dist_m = self.distance_L * tan_phi
+                x_dist_m = self.model.maximum_offset(k)
+                if x_dist_m is not None:
                     
                     x_px = mid_screen + x_dist_m * px_per_m
                     
@@ -204,12 +182,11 @@ class LabDiffractionApp(QWidget):
         right_panel.addStretch(1)
 
     def new_experiment(self):
-        self.true_lambda = random.randint(400, 700)
-        self.diffraction.set_wavelength(self.true_lambda)
-        
-        self.diffraction.grating_d = random.choice([2000, 2500, 3000])
+        model = self.diffraction.model
+        model.randomize()
+        self.diffraction.update()
         
-        self.lbl_d.setText(f"Период решетки d: {self.diffraction.grating_d} нм")
+        self.lbl_d.setText(f"Период решетки d: {model.grating_d} нм")
         
         self.in_b.clear()
         self.in_lambda.clear()
@@ -223,10 +200,11 @@ class LabDiffractionApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        if abs(val - self.true_lambda) < 10: 
-            QMessageBox.information(self, "Верно", f"✅ Отлично! λ = {self.true_lambda} нм")
+        model = self.diffraction.model
+        if model.check({"value": val})["value"]: 
+            QMessageBox.information(self, "Верно", f"✅ Отлично! λ = {model.wavelength} нм")
         else:
-            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. λ = {self.true_lambda} нм.")
+            QMessageBox.warning(self, "Ошибка", f"❌ Неверно. λ = {model.wavelength} нм.")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
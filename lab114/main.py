@@ -6,46 +6,16 @@ from PySide6.QtWidgets import (
     QPushButton, QLineEdit, QMessageBox, QFrame, QComboBox, QCheckBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient
-from PySide6.QtCore import Qt, QTimer
-
-# --- Наборы линий для разных ламп (в нанометрах) ---
-LAMPS = {
-    "Накаливания (лампа накаливания)": {
-        "type": "continuous",
-        "info": "Непрерывный спектр (широкий диапазон длин волн)."
-    },
-    "Водород (линейный, Balmer)": {
-        "type": "lines",
-        "lines": [
-            (656.3, "Hα"),
-            (486.1, "Hβ"),
-            (434.0, "Hγ"),
-            (410.2, "Hδ")
-        ],
-        "info": "Линии Бальмера водорода."
-    },
-    "Гелий (линейный)": {
-        "type": "lines",
-        "lines": [
-            (587.6, "He 587.6"),
-            (501.6, "He 501.6"),
-            (447.1, "He 447.1")
-        ],
-        "info": "Некоторые яркие линии гелия."
-    },
-    "Ртуть (линейный)": {
-        "type": "lines",
-        "lines": [
-            (546.1, "Hg 546.1"),
-            (435.8, "Hg 435.8"),
-            (404.7, "Hg 404.7")
-        ],
-        "info": "Яркие линии ртути."
-    }
-}
-
-# --- Визуальный виджет спектра ---
-class SpectrumWidget(QFrame):
+from PySide6.QtCore import Qt
+
+from physlab.core import Animated, spectrum_stops, wavelength_color
+from physlab.models import SpectroscopeModel
+from physlab.models.optics import LAMPS   # наборы линий для разных ламп (в нанометрах)
+
+
+class SpectrumWidget(QFrame, Animated):
+    frame_interval = 80
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(820, 220)
@@ -55,23 +25,32 @@ class SpectrumWidget(QFrame):
         self.lines = []         # список (wavelength_nm, label)
         self.spectrum_type = "continuous"
         self.phase = 0.0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._animate)
-        self.timer.start(80)
+        self.wake()
 
     def set_lamp(self, name):
         self.lamp_name = name
         info = LAMPS.get(name, {})
         self.spectrum_type = info.get("type", "continuous")
         self.lines = info.get("lines", [])
+        # пульсация есть только у непрерывного спектра
+        if self.spectrum_type == "continuous": self.wake()
         self.update()
 
-    def _animate(self):
+    def shimmer_px(self):
+        return int(6 * math.sin(self.phase))
+
+    def animate(self, dt):
+        if self.spectrum_type != "continuous":
+            self.settle()
+            return
         # небольшая пульсация для непрерывного спектра
-        self.phase += 0.03
+        before = self.shimmer_px()
+        self.phase += 0.375 * dt
         if self.phase > 2*math.pi:
             self.phase -= 2*math.pi
-        self.update()
+        # смещение меняется на пиксель раз в несколько кадров — перерисовываем только тогда
+        if self.shimmer_px() != before:
+            self.update()
 
     def paintEvent(self, event):
         p = QPainter(self); p.setRenderHint(QPainter.Antialiasing)
@@ -87,57 +66,14 @@ class SpectrumWidget(QFrame):
         # непрерывный спектр: градиент от 380..780 nm
         if self.spectrum_type == "continuous":
             grad = QLinearGradient(left, top, right, top)
-            # создаём градиент по видимому спектру (приближённо)
-            def nm_to_qcolor(nm):
-                # приближённое отображение nm -> RGB
-                nm = float(nm)
-                r = g = b = 0.0
-                if 380 <= nm < 440:
-                    r = -(nm - 440) / (440 - 380)
-                    g = 0.0
-                    b = 1.0
-                elif 440 <= nm < 490:
-                    r = 0.0
-                    g = (nm - 440) / (490 - 440)
-                    b = 1.0
-                elif 490 <= nm < 510:
-                    r = 0.0
-                    g = 1.0
-                    b = -(nm - 510) / (510 - 490)
-                elif 510 <= nm < 580:
-                    r = (nm - 510) / (580 - 510)
-                    g = 1.0
-                    b = 0.0
-                elif 580 <= nm < 645:
-                    r = 1.0
-                    g = -(nm - 645) / (645 - 580)
-                    b = 0.0
-                elif 645 <= nm <= 780:
-                    r = 1.0
-                    g = 0.0
-                    b = 0.0
-                # интенсивность коррекция
-                if 380 <= nm < 420:
-                    factor = 0.3 + 0.7*(nm - 380)/(420 - 380)
-                elif 420 <= nm <= 700:
-                    factor = 1.0
-                else:
-                    factor = 0.3 + 0.7*(780 - nm)/(780 - 700)
-                r = max(0.0, min(1.0, r * factor))
-                g = max(0.0, min(1.0, g * factor))
-                b = max(0.0, min(1.0, b * factor))
-                return QColor(int(r*255), int(g*255), int(b*255))
-            # add gradient stops
-            steps = 24
-            for i in range(steps+1):
-                nm = self.range_min + (self.range_max - self.range_min) * (i/steps)
-                pos = left + width * (i/steps)
-                grad.setColorAt(i/steps, nm_to_qcolor(nm))
+            # точки градиента берутся из общей таблицы спектральных цветов
+            for pos, color in spectrum_stops(self.range_min, self.range_max):
+                grad.setColorAt(pos, color)
             p.setBrush(grad)
             p.setPen(Qt.NoPen)
             p.drawRect(left, top, width, bottom - top)
             # subtle shimmer
-            shimmer = int(6 * math.sin(self.phase))
+            shimmer = self.shimmer_px()
             p.setPen(QPen(QColor(255,255,255,20), 1))
             for i in range(0, width, 40):
                 p.drawLine(left + i + shimmer, top, left + i + shimmer, bottom)
@@ -151,9 +87,8 @@ class SpectrumWidget(QFrame):
                 # позиция по шкале
                 frac = (wl - self.range_min) / (self.range_max - self.range_min)
                 x = left + int(frac * width)
-                # яркость по порядку
-                brightness = 220
-                color = QColor(255, 220, 80, brightness)
+                # линия своего цвета, чуть прозрачная
+                color = wavelength_color(wl, 220)
                 p.setPen(Qt.NoPen); p.setBrush(color)
                 p.drawRect(x-2, top, 6, bottom - top)
                 # тонкая ореола
@@ -181,6 +116,8 @@ class LabSpectraApp(QWidget):
         self.setWindowTitle("Спектры — спектроскоп (линейные и непрерывные)")
         self.setMinimumSize(1100, 640)
 
+        self.model = SpectroscopeModel()
+
         main = QHBoxLayout(self)
         left = QVBoxLayout(); right = QVBoxLayout()
         main.addLayout(left, 2); main.addLayout(right, 1)
@@ -244,17 +181,15 @@ class LabSpectraApp(QWidget):
 
         # стартовые значения
         self.random_example()
-        # таймер для обновления UI
-        self.ui_timer = QTimer(self)
-        self.ui_timer.timeout.connect(self._update_ui)
-        self.ui_timer.start(200)
 
     def on_lamp_change(self, name):
+        self.model.lamp = name
         self.spectrum.set_lamp(name)
         self._update_ui()
 
     def apply_lamp(self):
         name = self.combo_lamp.currentText()
+        self.model.lamp = name
         self.spectrum.set_lamp(name)
         self.lbl_feedback.setText("Источник применён. Наблюдайте спектр слева.")
         self._update_ui()
@@ -264,9 +199,7 @@ class LabSpectraApp(QWidget):
         if self.chk_manual.isChecked():
             self.lbl_feedback.setText("Ручной режим: поля не заполняются автоматически.")
             return
-        lamp = self.combo_lamp.currentText()
-        info = LAMPS.get(lamp, {})
-        if info.get("type") == "continuous":
+        if self.model.is_continuous():
             # для непрерывного спектра имитируем пик доминирующей длины волны (например цвет лампы)
             peak_nm = random.uniform(500, 3000)  # incandescent broad; but keep visible
             peak_nm = random.uniform(450, 700)
@@ -275,7 +208,7 @@ class LabSpectraApp(QWidget):
             self.lbl_feedback.setText("Непрерывный спектр: записывайте диапазон/цвета, а не отдельные линии.")
         else:
             # выберем случайную линию из набора и добавим шум
-            lines = info.get("lines", [])
+            lines = self.model.lines()
             if not lines:
                 self.lbl_feedback.setText("Нет линий в модели.")
                 return
@@ -288,35 +221,23 @@ class LabSpectraApp(QWidget):
 
     def check(self):
         # проверка: для линейных спектров — сравнить введённую длину волны с ближайшей модельной линией
-        lamp = self.combo_lamp.currentText()
-        info = LAMPS.get(lamp, {})
         try:
             wl_user = float(self.input_wl.text())
         except Exception:
             QMessageBox.warning(self, "Ошибка", "Введите числовое значение λ (nm).")
             return
         label_user = self.input_label.text().strip()
-        if info.get("type") == "continuous":
+        if self.model.is_continuous():
             # для непрерывного спектра проверяем, что пользователь не пытался указать линию
-            if label_user.lower() in ("", "continuous", "непрерывный", "continuous spectrum"):
+            if self.model.check({"label": label_user})["label"]:
                 self.lbl_feedback.setText("✅ Непрерывный спектр — отдельные линии отсутствуют.")
             else:
                 self.lbl_feedback.setText("❌ Непрерывный спектр: нельзя ожидать ярких отдельных линий.")
             return
-        # для линейного спектра
-        lines = info.get("lines", [])
-        # найдем ближайшую модельную линию
-        best = None
-        best_diff = None
-        for wl_model, lab in lines:
-            diff = abs(wl_user - wl_model)
-            if best is None or diff < best_diff:
-                best = (wl_model, lab)
-                best_diff = diff
-        # допуск: 1% или 1 nm минимум
-        tol = max(0.01 * best[0], 1.0)
-        ok_wl = best_diff <= tol
-        ok_label = (label_user.lower() == best[1].lower()) if label_user else False
+        # для линейного спектра — сравниваем с ближайшей модельной линией (допуск 1% или 1 nm)
+        best = self.model.nearest_line(wl_user)
+        verdict = self.model.check({"wl": wl_user, "label": label_user})
+        ok_wl, ok_label = verdict["wl"], verdict["label"]
         lines_out = []
         if ok_wl:
             lines_out.append(f"✅ λ близко к линии {best[1]} ({best[0]:.1f} nm).")
@@ -330,14 +251,12 @@ class LabSpectraApp(QWidget):
         self._update_ui()
 
     def show_answer(self):
-        lamp = self.combo_lamp.currentText()
-        info = LAMPS.get(lamp, {})
-        if info.get("type") == "continuous":
+        if self.model.is_continuous():
             self.input_wl.setText("")
             self.input_label.setText("continuous")
             self.lbl_feedback.setText("Непрерывный спектр: нет отдельных линий для показа.")
         else:
-            lines = info.get("lines", [])
+            lines = self.model.lines()
             if not lines:
                 self.lbl_feedback.setText("Нет модельных линий для этой лампы.")
                 return
@@ -349,7 +268,7 @@ class LabSpectraApp(QWidget):
 
     def random_example(self):
         # случайный выбор лампы
-        lamp = random.choice(list(LAMPS.keys()))
+        lamp = self.model.randomize().lamp
         self.combo_lamp.setCurrentText(lamp)
         self.spectrum.set_lamp(lamp)
         self.input_wl.clear(); self.input_label.clear(); self.input_comment.clear()
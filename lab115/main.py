@@ -6,96 +6,53 @@ from PySide6.QtWidgets import (
     QPushButton, QLineEdit, QMessageBox, QFrame, QSlider, QCheckBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPolygonF
-from PySide6.QtCore import Qt, QTimer, QPointF
-
-def lens_image_distance(f, do):
-    if abs(do) < 1e-9:
-        return None
-    denom = (1.0 / f) - (1.0 / do)
-    if abs(denom) < 1e-12:
-        return float('inf')
-    return 1.0 / denom
-
-def magnification(di, do):
-    if do == 0 or di is None:
-        return None
-    return -di / do
-
-class MeterWidget(QFrame):
-    def __init__(self, kind="f", parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(120, 120)
-        self.kind = kind
-        self.value = 0.0
-        self.max_display = 1.0
-
-    def set_value(self, val, vmax=None):
-        self.value = val if val is not None else 0.0
-        if vmax is not None:
-            self.max_display = max(1e-9, float(vmax))
-        self.update()
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal
 
-    def paintEvent(self, event):
-        p = QPainter(self); p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
-        cx, cy = w//2, h//2
-        R = min(w, h)//2 - 8
-        p.fillRect(self.rect(), QColor(250,250,250))
-        p.setPen(QPen(Qt.black,2)); p.setBrush(QColor(255,255,255))
-        p.drawEllipse(cx - R, cy - R, 2*R, 2*R)
-        p.setPen(QPen(Qt.black,1))
-        for ang in range(-60, 61, 10):
-            r = math.radians(ang)
-            p.drawLine(cx + int((R-8)*math.cos(r)), cy - int((R-8)*math.sin(r)),
-                       cx + int(R*math.cos(r)),       cy - int(R*math.sin(r)))
-        frac = 0.0
-        if self.max_display > 0:
-            frac = max(0.0, min(1.0, abs(self.value) / self.max_display))
-        ang = -60 + frac*120.0
-        r = math.radians(ang)
-        p.setPen(QPen(QColor(200,30,30),2))
-        p.drawLine(cx, cy, cx + int((R-14)*math.cos(r)), cy - int((R-14)*math.sin(r)))
-        p.setPen(QPen(Qt.black,2)); p.setFont(QFont("Sans",12,QFont.Bold))
-        p.drawText(cx-8, cy+6, self.kind)
-        p.setFont(QFont("Sans",9))
-        p.drawText(8, h-10, f"{self.value:.3f}")
+from physlab.core import MeterWidget
+from physlab.core.rays import RayCache, lens_scene
+from physlab.models import FocalLensModel
+
+FAN_RAYS = 41
 
 class FocalLensWidget(QFrame):
+    paramsChanged = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(820, 420)
         # модельные параметры (в пикселях для визуализации)
-        self.f = 120.0          # фокусное расстояние в пикселях (модель)
-        self.do = 260.0         # расстояние предмета (px)
+        # фокусное расстояние, расстояние предмета и его высота (px)
+        self.model = FocalLensModel()
         self.screen_x = self.width() - 140
-        self.h_obj = 90.0
-        self.t = 0.0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._animate)
-        self.timer.start(30)
         self.dragging_obj = False
         self.dragging_screen = False
         self.drag_offset = 0
+        # лучи считаются один раз на (f, d_o, h, размер окна); экран их только обрезает
+        self._scenes = RayCache(self.build_scene)
 
-    def set_params(self, f=None, do=None, h_obj=None):
-        if f is not None: self.f = float(f)
-        if do is not None: self.do = float(do)
-        if h_obj is not None: self.h_obj = float(h_obj)
-        self.update()
+    def scene(self):
+        key = (self.model.f, self.model.do, self.model.h_obj, self.width() // 2, self.height() // 2)
+        return self._scenes.get(key)
+
+    def build_scene(self, key):
+        f, do, h_obj, cx, baseline = key
+        return lens_scene([(0.0, f)], do, h_obj, self.width() - cx, cx, baseline,
+                          fan=FAN_RAYS, principal=2)
 
-    def _animate(self):
-        self.t += 0.02
-        if self.t > 2*math.pi: self.t -= 2*math.pi
+    def set_params(self, f=None, do=None, h_obj=None):
+        if f is not None: self.model.f = float(f)
+        if do is not None: self.model.do = float(do)
+        if h_obj is not None: self.model.h_obj = float(h_obj)
         self.update()
 
     def mousePressEvent(self, event):
         x = event.position().x()
         y = event.position().y()
         cx = self.width()//2
-        obj_x = cx - int(self.do)
-        obj_y = self.height()//2 - int(self.h_obj/2)
+        obj_x = cx - int(self.model.do)
+        obj_y = self.height()//2 - int(self.model.h_obj/2)
         # если клик рядом с предметом — перетаскиваем предмет
-        if abs(x - obj_x) < 12 and abs(y - (obj_y + self.h_obj/2)) < 40:
+        if abs(x - obj_x) < 12 and abs(y - (obj_y + self.model.h_obj/2)) < 40:
             self.dragging_obj = True
             self.drag_offset = x - obj_x
             self.setCursor(Qt.ClosedHandCursor)
@@ -115,13 +72,15 @@ class FocalLensWidget(QFrame):
             min_x = 40
             max_x = cx - 40
             new_obj_x = max(min_x, min(max_x, new_obj_x))
-            self.do = cx - new_obj_x
+            self.model.do = cx - new_obj_x
+            self.paramsChanged.emit()
             self.update()
         if self.dragging_screen:
             new_screen_x = x - self.drag_offset
             min_x = cx + 40
             max_x = self.width() - 40
             self.screen_x = int(max(min_x, min(max_x, new_screen_x)))
+            self.paramsChanged.emit()
             self.update()
 
     def mouseReleaseEvent(self, event):
@@ -146,7 +105,7 @@ class FocalLensWidget(QFrame):
         p.setPen(QPen(QColor(30,120,200), 2)); p.setBrush(QColor(200,230,255,200))
         p.drawRoundedRect(cx - lens_w//2, baseline - 160, lens_w, 320, 10, 10)
         # фокусы
-        f_px = self.f
+        f_px = self.model.f
         p.setPen(QPen(QColor(200,30,30), 1, Qt.DashLine))
         p.drawLine(cx - f_px, baseline - 8, cx - f_px, baseline + 8)
         p.drawLine(cx + f_px, baseline - 8, cx + f_px, baseline + 8)
@@ -155,15 +114,15 @@ class FocalLensWidget(QFrame):
         p.drawText(cx + f_px - 6, baseline + 22, "F'")
 
         # предмет (стрелка)
-        obj_x = cx - int(self.do)
-        obj_top_y = baseline - int(self.h_obj)
+        obj_x = cx - int(self.model.do)
+        obj_top_y = baseline - int(self.model.h_obj)
         p.setPen(QPen(Qt.black,2)); p.setBrush(QColor(60,60,60))
         p.drawLine(obj_x, baseline, obj_x, obj_top_y)
         tri = QPolygonF([QPointF(obj_x, obj_top_y),
                          QPointF(obj_x - 12, obj_top_y + 18),
                          QPointF(obj_x + 12, obj_top_y + 18)])
         p.drawPolygon(tri)
-        p.setFont(QFont("Sans",9)); p.drawText(obj_x - 18, baseline - int(self.h_obj) - 6, f"object")
+        p.setFont(QFont("Sans",9)); p.drawText(obj_x - 18, baseline - int(self.model.h_obj) - 6, f"object")
 
         # экран
         screen_x = self.screen_x if self.screen_x is not None else w - 140
@@ -174,27 +133,18 @@ class FocalLensWidget(QFrame):
 
         # вычисления изображения по тонкой линзе (в пикселях -> метры условно)
         # используем модельные единицы: 1 px -> 1 условная единица длины
-        do = self.do
         # переводим пиксели в "метры" для расчёта f в метрах: здесь работаем в пикселях, формула сохраняется
         # di по формуле тонкой линзы: 1/f = 1/do + 1/di  => di = 1 / (1/f - 1/do)
         # если do == f -> di = inf
-        di = None
-        try:
-            denom = (1.0 / self.f) - (1.0 / do)
-            if abs(denom) < 1e-9:
-                di = float('inf')
-            else:
-                di = 1.0 / denom
-        except Exception:
-            di = None
+        di = self.model.image_distance()
 
         # позиция изображения на экране (если ди конечна)
         img_x = None
         img_h = None
         if di is not None and not math.isinf(di):
             img_x = cx + int(di)
-            m = magnification(di, do)
-            img_h = int(abs(m) * self.h_obj) if m is not None else 0
+            m = self.model.magnification()
+            img_h = int(abs(m) * self.model.h_obj) if m is not None else 0
             # рисуем изображение на экране (перевёрнутое вниз если di>0)
             if img_x is not None:
                 if di > 0:
@@ -214,28 +164,29 @@ class FocalLensWidget(QFrame):
                                       QPointF(img_x + 12, top_y + 18)])
                     p.drawPolygon(tri2)
 
-        # анимированные лучи для наглядности (параллельный, через центр, через фокус)
-        p.setPen(QPen(QColor(220,100,40), 2))
-        x0, y0 = obj_x, obj_top_y
-        # луч параллельный
-        p.drawLine(x0, y0, cx - 6, y0)
-        if img_x is not None and not math.isinf(di):
-            p.drawLine(cx + 6, y0, img_x, baseline + (img_h if di>0 else -img_h))
-        else:
-            p.drawLine(cx + 6, y0, screen_x, y0)
-
-        # луч через центр
-        p.setPen(QPen(QColor(40,80,200), 2))
-        if img_x is not None and not math.isinf(di):
-            p.drawLine(x0, y0, img_x, baseline + (img_h if di>0 else -img_h))
-        else:
-            p.drawLine(x0, y0, screen_x, baseline)
+        # лучи до экрана: веер по всей оправе и два основных (параллельный, через центр)
+        scene = self.scene()
+        p.save()
+        p.setClipRect(QRectF(0, 0, screen_x - 6, h))
+        p.setPen(QPen(QColor(240, 170, 40, 90), 1))
+        p.drawLines(scene.fan)
+        for color, lines in zip((QColor(220,100,40), QColor(40,80,200)), scene.principal):
+            p.setPen(QPen(color, 2))
+            p.drawLines(lines)
+        p.restore()
+
+        # пятно света на экране: от крайнего до крайнего луча веера
+        spot = scene.trace.at(screen_x - 6 - cx)
+        spot = spot[abs(spot) <= 160]
+        if len(spot):
+            p.setPen(QPen(QColor(240, 150, 20), 4))
+            p.drawLine(QPointF(screen_x - 3, baseline - spot.max()), QPointF(screen_x - 3, baseline - spot.min()))
 
         # подписи
         p.setPen(QPen(Qt.black,1)); p.setFont(QFont("Sans",10))
         di_text = "∞" if (di is not None and math.isinf(di)) else (f"{di:.1f}" if di is not None else "—")
-        p.drawText(12, 18, f"f (модель) = {self.f:.1f} px")
-        p.drawText(12, 36, f"d_o = {self.do:.1f} px")
+        p.drawText(12, 18, f"f (модель) = {self.model.f:.1f} px")
+        p.drawText(12, 36, f"d_o = {self.model.do:.1f} px")
         p.drawText(12, 54, f"d_i (модель) = {di_text} px")
 
 class LabFocalApp(QWidget):
@@ -308,15 +259,14 @@ class LabFocalApp(QWidget):
         right.addWidget(self.lbl_feedback)
         right.addStretch(1)
 
+        # показания прибора следуют за перетаскиванием предмета и экрана
+        self.lens.paramsChanged.connect(self._update_meter)
         self.random_experiment()
-        self.ui_timer = QTimer(self)
-        self.ui_timer.timeout.connect(self._update_meter)
-        self.ui_timer.start(200)
 
     def apply_params(self):
         try:
-            f = float(self.input_f.text()) if self.input_f.text().strip() else self.lens.f
-            do = float(self.input_do.text()) if self.input_do.text().strip() else self.lens.do
+            f = float(self.input_f.text()) if self.input_f.text().strip() else self.lens.model.f
+            do = float(self.input_do.text()) if self.input_do.text().strip() else self.lens.model.do
             screen = int(self.input_screen.text()) if self.input_screen.text().strip() else (self.lens.width() - 140)
         except Exception:
             QMessageBox.warning(self, "Ошибка", "Введите числовые значения f, d_o и положение экрана.")
@@ -331,16 +281,8 @@ class LabFocalApp(QWidget):
             self.lbl_feedback.setText("Ручной режим: поле d_i не заполняется автоматически.")
             return
         # используем модельные di и добавим шум
-        do = self.lens.do
-        f = self.lens.f
-        try:
-            denom = (1.0 / f) - (1.0 / do)
-            if abs(denom) < 1e-9:
-                di = float('inf')
-            else:
-                di = 1.0 / denom
-        except Exception:
-            di = None
+        do = self.lens.model.do
+        di = self.lens.model.image_distance()
         if di is None or math.isinf(di):
             self.input_di_meas.setText("")
             self.input_f_user.setText("")
@@ -349,7 +291,7 @@ class LabFocalApp(QWidget):
         di_meas = di * (1 + random.uniform(-0.02, 0.02))
         self.input_di_meas.setText(f"{di_meas:.2f}")
         # рассчитаем f по измерению: 1/f = 1/do + 1/di
-        f_calc = 1.0 / (1.0 / do + 1.0 / di_meas) if abs(di_meas)>1e-9 else None
+        f_calc = self.lens.model.focal_from(do, di_meas)
         if f_calc:
             self.input_f_user.setText(f"{f_calc:.2f}")
         self.lbl_feedback.setText("Поля заполнены имитацией измерений (с небольшой погрешностью).")
@@ -359,19 +301,19 @@ class LabFocalApp(QWidget):
         try:
             di_user = float(self.input_di_meas.text())
             f_user = float(self.input_f_user.text())
-            do = float(self.input_do.text()) if self.input_do.text().strip() else self.lens.do
+            do = float(self.input_do.text()) if self.input_do.text().strip() else self.lens.model.do
         except Exception:
             QMessageBox.warning(self, "Ошибка", "Введите числовые значения d_i, f и d_o.")
             return
-        if abs(di_user) < 1e-9:
-            QMessageBox.information(self, "Инфо", "d_i слишком мал для корректного расчёта.")
+        model = self.lens.model
+        f_calc = model.focal_from(do, di_user)
+        if f_calc is None:
+            QMessageBox.information(self, "Инфо", "По таким d_i и d_o f не посчитать.")
             return
-        f_calc = 1.0 / (1.0 / do + 1.0 / di_user)
-        f_true = self.lens.f
-        tol_calc = max(0.03 * abs(f_calc), 1e-2)
+        f_true = model.f
         tol_true = max(0.05 * abs(f_true), 1e-2)
-        ok_user = abs(f_user - f_calc) <= tol_calc
-        ok_model = abs(f_calc - f_true) <= tol_true
+        verdict = model.check({"di": di_user, "f": f_user, "do": do})
+        ok_user, ok_model = verdict["f"], verdict["f_measured"]
         lines = []
         if ok_user:
             lines.append("✅ Ваш расчёт f соответствует вычислению по измерениям.")
@@ -385,16 +327,8 @@ class LabFocalApp(QWidget):
         self._update_meter()
 
     def show_answer(self):
-        do = self.lens.do
-        f = self.lens.f
-        try:
-            denom = (1.0 / f) - (1.0 / do)
-            if abs(denom) < 1e-9:
-                di = float('inf')
-            else:
-                di = 1.0 / denom
-        except Exception:
-            di = None
+        f = self.lens.model.f
+        di = self.lens.model.image_distance()
         if di is None or math.isinf(di):
             QMessageBox.information(self, "Инфо", "Изображение на бесконечности или не определено.")
             return
@@ -404,8 +338,8 @@ class LabFocalApp(QWidget):
         self._update_meter()
 
     def random_experiment(self):
-        f = random.choice([80.0, 100.0, 120.0, 140.0])
-        do = random.uniform(0.6*f, 3.0*f)
+        model = self.lens.model.randomize()
+        f, do = model.f, model.do
         screen = self.lens.width() - 140
         self.input_f.setText(f"{f:.1f}")
         self.input_do.setText(f"{do:.1f}")
@@ -425,8 +359,8 @@ class LabFocalApp(QWidget):
         self._update_meter()
 
     def _update_meter(self):
-        self.meter.set_value(self.lens.f, vmax=max(1.0, abs(self.lens.f)*1.5))
-        self.lbl_model.setText(f"Модель: f={self.lens.f:.1f} px, d_o={self.lens.do:.1f} px")
+        self.meter.set_value(self.lens.model.f, vmax=max(1.0, abs(self.lens.model.f)*1.5))
+        self.lbl_model.setText(f"Модель: f={self.lens.model.f:.1f} px, d_o={self.lens.model.do:.1f} px")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,151 +1,22 @@
 import sys
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView, QComboBox
+    QApplication, QLabel, QFrame, QMessageBox, QComboBox
 )
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QLinearGradient, QCursor
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient, QCursor
 from PySide6.QtCore import Qt, QTimer, QRectF, QPointF
 
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1100, 600)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # Левая панель
-        control_panel = QFrame(); control_panel.setFixedWidth(320)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Источник излучения")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        ans_box = QGroupBox("Измерение")
-        ans_layout = QVBoxLayout(ans_box)
-        ans_layout.addWidget(QLabel("Длина волны яркой линии (нм):"))
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Наведите курсор на линию")
-        ans_layout.addWidget(self.answer_input)
-        
-        self.btn_check = QPushButton("Проверить ответ")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; padding: 10px; font-weight: bold;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # Правая панель
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=1)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Газ", "Ваш ответ", "Эталон", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=0) # Таблица поменьше
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
-
-    def create_visualizer(self): return QFrame()
-    def get_true_value(self): return 0.0
-    def get_params_str(self): return ""
-    def setup_inputs(self): pass
-
-    def check_answer(self):
-        try:
-            val = float(self.answer_input.text())
-        except:
-            QMessageBox.warning(self, "Ошибка", "Введите числовое значение (например, 587)."); return
-            
-        true_vals = self.get_true_value()
-        
-        # Погрешность +/- 3 нм (достаточно строго, так как есть точный курсор)
-        hit = False
-        target_line = 0
-        
-        if not true_vals: # Солнце
-             hit = 400 <= val <= 750
-             target_line = val
-        else:
-            # Ищем ближайшую правильную линию
-            closest_diff = 1000
-            for line in true_vals:
-                diff = abs(val - line)
-                if diff < closest_diff:
-                    closest_diff = diff
-                    target_line = line
-            
-            if closest_diff <= 3.0:
-                hit = True
-
-        row = self.table.rowCount(); self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(self.get_params_str()))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{val:.1f}"))
-        
-        true_str = str(int(target_line)) if true_vals else "400-750"
-        self.table.setItem(row, 2, QTableWidgetItem(true_str))
-        
-        status = QTableWidgetItem("✅ Верно" if hit else "❌")
-        status.setForeground(QBrush(QColor("green") if hit else QColor("red")))
-        self.table.setItem(row, 3, status)
-        
-        if hit: QMessageBox.information(self, "Верно", f"Отлично! Линия {target_line} нм определена верно.")
-        else: QMessageBox.warning(self, "Неверно", f"Вы промахнулись. Ближайшая линия была: {target_line} нм")
-
+from physlab.core import BaseLabWindow
+from physlab.models import SpectraModel
+from physlab.models.optics import GAS_SPECTRA   # длина волны нм, цвет HEX, интенсивность
 
 # --- УЛУЧШЕННЫЙ ВИЗУАЛИЗАТОР СПЕКТРА ---
 class SpectraVisualizer(QFrame):
-    def __init__(self):
+    def __init__(self, model):
         super().__init__()
         self.setMouseTracking(True) # Включаем отслеживание мыши без клика
         self.setStyleSheet("background-color: black; border: 2px solid #555;")
-        self.current_gas = "Водород"
+        self.model = model   # SpectraModel: выбранный газ
         self.cursor_nm = None # Текущее положение курсора в нм
-        
-        # Данные спектров (Длина волны нм, Цвет HEX, Интенсивность 0.5-3.0 для ширины)
-        self.spectra_data = {
-            "Водород": [
-                (656, "#FF0000", 2.5), # H-alpha
-                (486, "#00FFFF", 1.5), # H-beta
-                (434, "#0000FF", 1.0), # H-gamma
-                (410, "#800080", 0.8)  # H-delta
-            ],
-            "Гелий": [
-                (706, "#AA0000", 1.0),
-                (667, "#FF0000", 1.5),
-                (587, "#FFFF00", 3.0), # Желтая D3
-                (501, "#00FF00", 1.2),
-                (492, "#00E0E0", 1.0),
-                (471, "#0000FF", 0.8),
-                (447, "#000080", 1.5)
-            ],
-            "Неон": [
-                # Неон - лес красных линий
-                (640, "#FF0000", 2.0), (633, "#FF2000", 1.8), (614, "#FF4000", 1.5),
-                (609, "#FF6000", 1.5), (594, "#FFAA00", 1.2), (585, "#FFFF00", 1.5),
-                (540, "#00FF00", 0.5)
-            ],
-            "Ртуть": [
-                (579, "#FFFF00", 1.8), # Дублет
-                (577, "#FFFF00", 1.8),
-                (546, "#00FF00", 3.0), # Зеленая
-                (436, "#0000FF", 2.0), # Синяя
-                (405, "#800080", 1.2)  # Фиолетовая
-            ],
-            "Непрерывный (Солнце)": [] 
-        }
-
-    def set_gas(self, gas_name):
-        self.current_gas = gas_name
-        self.update()
 
     def mouseMoveEvent(self, event):
         # Преобразование координаты X мыши в нанометры
@@ -206,7 +77,7 @@ class SpectraVisualizer(QFrame):
         # 3. Отрисовка спектральных линий
         spectrum_rect = QRectF(0, 0, w, h - scale_h)
         
-        if self.current_gas == "Непрерывный (Солнце)":
+        if not self.model.lines():
             grad = QLinearGradient(0, 0, w, 0)
             # Цвета радуги по длинам волн (приблизительно)
             grad.setColorAt(0.0, QColor(80, 0, 150)) # 380
@@ -219,7 +90,7 @@ class SpectraVisualizer(QFrame):
             p.fillRect(spectrum_rect, grad)
         else:
             # Линейчатый спектр
-            lines = self.spectra_data.get(self.current_gas, [])
+            lines = GAS_SPECTRA[self.model.gas]
             for nm, color_hex, intensity in lines:
                 if nm < min_nm or nm > max_nm: continue
                 
@@ -269,6 +140,17 @@ class SpectraVisualizer(QFrame):
 
 # --- ЛОГИКА ЛАБОРАТОРНОЙ ---
 class SpectraLab(BaseLabWindow):
+    window_size = (1100, 600)
+    visual_stretch = 1
+    table_stretch = 0  # Таблица поменьше
+    inputs_title = "Источник излучения"
+    answer_title = "Измерение"
+    answer_label = "Длина волны яркой линии (нм):"
+    answer_placeholder = "Наведите курсор на линию"
+    table_headers = ["Газ", "Ваш ответ", "Эталон", "Статус"]
+    input_error = "Введите числовое значение (например, 587)."
+    model_class = SpectraModel
+
     def __init__(self):
         super().__init__(
             title="11 Класс: Изучение спектров",
@@ -284,12 +166,12 @@ class SpectraLab(BaseLabWindow):
         self.setup_inputs()
 
     def create_visualizer(self):
-        return SpectraVisualizer()
+        return SpectraVisualizer(self.model)
 
     def setup_inputs(self):
         self.inputs_layout.addWidget(QLabel("Выберите газ:"))
         self.combo_gas = QComboBox()
-        self.combo_gas.addItems(self.visualizer.spectra_data.keys())
+        self.combo_gas.addItems(GAS_SPECTRA.keys())
         self.combo_gas.currentTextChanged.connect(self.update_gas)
         self.inputs_layout.addWidget(self.combo_gas)
         
@@ -297,18 +179,29 @@ class SpectraLab(BaseLabWindow):
         self.inputs_layout.addWidget(QLabel("<i>Подсказка: наведите курсор на цветную линию, чтобы увидеть точное значение.</i>"))
 
     def update_gas(self, text):
-        self.visualizer.set_gas(text)
-
-    def get_true_value(self):
-        gas = self.combo_gas.currentText()
-        if gas == "Непрерывный (Солнце)": return []
-        
-        lines = self.visualizer.spectra_data.get(gas, [])
-        return [l[0] for l in lines] # Список правильных длин волн
+        self.model.gas = text
+        self.visualizer.update()
 
     def get_params_str(self):
         return self.combo_gas.currentText()
 
+    def check_answer(self):
+        val = self.read_answer()
+        if val is None: return
+
+        true_vals = self.model.lines()
+
+        # Погрешность +/- 3 нм (достаточно строго, так как есть точный курсор);
+        # для Солнца — любая длина волны из диапазона 400-750
+        target_line = self.model.target_line(val)
+        hit = self.model.check({"value": val})["value"]
+
+        true_str = str(int(target_line)) if true_vals else "400-750"
+        self.record([self.get_params_str(), f"{val:.1f}", true_str], val, target_line, hit)
+
+        if hit: QMessageBox.information(self, "Верно", f"Отлично! Линия {target_line} нм определена верно.")
+        else: QMessageBox.warning(self, "Неверно", f"Вы промахнулись. Ближайшая линия была: {target_line} нм")
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
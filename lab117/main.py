@@ -1,92 +1,18 @@
 import sys
 import math
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView, QSpinBox
+    QApplication, QLabel, QPushButton, QFrame, QSpinBox
 )
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPolygon
-from PySide6.QtCore import Qt, QTimer, QPointF
-
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1000, 600)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # Левая панель
-        control_panel = QFrame(); control_panel.setFixedWidth(320)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
-        ctrl_layout.addWidget(formula_lbl)
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Параметры перехода")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        ans_box = QGroupBox("Результат")
-        ans_layout = QVBoxLayout(ans_box)
-        ans_layout.addWidget(QLabel("Энергия фотона E (эВ):"))
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Например: 1.89")
-        ans_layout.addWidget(self.answer_input)
-        
-        self.btn_check = QPushButton("Проверить ответ")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; padding: 10px;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # Правая панель
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=3)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Переход", "Ваш E (эВ)", "Эталон (эВ)", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=1)
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
-
-    def create_visualizer(self): return QFrame()
-    def get_true_value(self): return 0.0
-    def get_params_str(self): return ""
-    def setup_inputs(self): pass
-
-    def check_answer(self):
-        try:
-            user_val = float(self.answer_input.text().replace(',', '.'))
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Введите число."); return
-            
-        true_val = self.get_true_value()
-        # Допуск 0.05 эВ
-        is_correct = abs(user_val - true_val) <= 0.05
-        
-        row = self.table.rowCount(); self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(self.get_params_str()))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{user_val:.2f}"))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{true_val:.2f}"))
-        
-        status = QTableWidgetItem("✅" if is_correct else "❌")
-        status.setForeground(QBrush(QColor("green") if is_correct else QColor("red")))
-        self.table.setItem(row, 3, status)
-        
-        if is_correct: QMessageBox.information(self, "Успех", "Верно! Вы рассчитали энергию кванта.")
-        else: QMessageBox.warning(self, "Ошибка", f"Правильный ответ: {true_val:.2f} эВ")
+from PySide6.QtGui import QPainter, QPen, QFont, QPolygon
+from PySide6.QtCore import Qt, QPointF
 
+from physlab.core import Animated, BaseLabWindow
+from physlab.models import HydrogenModel
 
 # --- ВИЗУАЛИЗАТОР УРОВНЕЙ ---
-class AtomVisualizer(QFrame):
+class AtomVisualizer(QFrame, Animated):
+    frame_interval = 30
+
     def __init__(self):
         super().__init__()
         self.setStyleSheet("background-color: white; border: 1px solid #aaa;")
@@ -97,23 +23,22 @@ class AtomVisualizer(QFrame):
         self.target_y = 0
         self.t = 0.0
         self.animating = False
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
 
     def set_level(self, n):
         self.n_level = n
         self.animating = True # Запускаем анимацию прыжка
         self.t = 0.0
-
-    def animate(self):
-        if self.animating:
-            self.t += 0.05
-            if self.t > 1.0:
-                self.t = 1.0
-                self.animating = False
-            self.update()
+        self.wake()
+
+    def animate(self, dt):
+        if not self.animating:
+            self.settle()
+            return
+        self.t += 1.667 * dt
+        if self.t > 1.0:
+            self.t = 1.0
+            self.animating = False
+        self.update()
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -188,6 +113,17 @@ class AtomVisualizer(QFrame):
 
 # --- ЛОГИКА ЛАБОРАТОРНОЙ ---
 class HydrogenLab(BaseLabWindow):
+    inputs_title = "Параметры перехода"
+    answer_label = "Энергия фотона E (эВ):"
+    answer_placeholder = "Например: 1.89"
+    table_headers = ["Переход", "Ваш E (эВ)", "Эталон (эВ)", "Статус"]
+    # Допуск 0.05 эВ
+    model_class = HydrogenModel   # E = 13.6 * (1/4 - 1/n^2)
+    unit = "эВ"
+    input_error = "Введите число."
+    success_message = "Верно! Вы рассчитали энергию кванта."
+    failure_message = "Правильный ответ: {true}"
+
     def __init__(self):
         super().__init__(
             title="11 Класс: Спектр атома водорода",
@@ -219,18 +155,12 @@ class HydrogenLab(BaseLabWindow):
 
     def update_level(self):
         # Просто обновляет переменную, не прыгает
-        pass
+        self.model.n = self.spin_n.value()
 
     def animate_jump(self):
         n = self.spin_n.value()
         self.visualizer.set_level(n)
 
-    def get_true_value(self):
-        n = self.spin_n.value()
-        # E = 13.6 * (1/4 - 1/n^2)
-        E = 13.6 * (0.25 - 1.0/(n**2))
-        return E
-
     def get_params_str(self):
         return f"n={self.spin_n.value()} -> n=2"
 
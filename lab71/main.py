@@ -1,5 +1,4 @@
 import sys
-import random
 import math
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QLineEdit,
@@ -7,15 +6,21 @@ from PySide6.QtWidgets import (
     QGroupBox, QTextEdit
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPainterPath, QIcon, QAction
-from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtCore import Qt, QRectF
+
+from physlab import journal
+from physlab.core import Animated, ease
+from physlab.models import MenzurkaModel
 
 # ==========================================
 # КЛАСС ВИЗУАЛИЗАЦИИ (Твой код с адаптацией обновления)
 # ==========================================
-class MenzurkaWidget(QFrame):
+class MenzurkaWidget(QFrame, Animated):
     """
     Рисует мензурку с делениями, подписями справа и анимированным уровнем жидкости.
     """
+    frame_interval = 40  # ~25 FPS
+
     def __init__(self, total_volume, liquid_volume, divisions, parent=None):
         super().__init__(parent)
         self.set_parameters(total_volume, liquid_volume, divisions)
@@ -28,21 +33,25 @@ class MenzurkaWidget(QFrame):
         # Анимация
         self.phase = 0.0
         self.amp_px = 3.0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.on_timer)
-        self.timer.start(40)  # ~25 FPS
 
     def set_parameters(self, total_volume, liquid_volume, divisions):
         """Обновляет параметры без пересоздания виджета"""
         self.total_volume = total_volume
         self.base_liquid = liquid_volume
         self.divisions = divisions
+        # Жидкость колышется после доливки и постепенно успокаивается
+        self.agitation = 1.0
+        self.wake()
         self.update() # Перерисовать
 
-    def on_timer(self):
-        self.phase += 0.12
+    def animate(self, dt):
+        self.phase += 3.0 * dt
         if self.phase > 2 * math.pi:
             self.phase -= 2 * math.pi
+        self.agitation *= 1.0 - ease(dt, 1.0)
+        if self.agitation < 0.02:
+            self.agitation = 0.0
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
@@ -78,7 +87,7 @@ class MenzurkaWidget(QFrame):
             ratio = 0
             
         base_height_px = inner_h * ratio
-        anim_offset = self.amp_px * math.sin(self.phase)
+        anim_offset = self.amp_px * self.agitation * math.sin(self.phase)
         liquid_height_px = max(0.0, min(inner_h, base_height_px + anim_offset))
         liquid_top_y = inner_y + inner_h - liquid_height_px
 
@@ -88,7 +97,7 @@ class MenzurkaWidget(QFrame):
         bottom = inner_y + inner_h
         
         # Волны
-        wave_ampl = 4.0 
+        wave_ampl = 4.0 * self.agitation
         path.moveTo(left, bottom)
         path.lineTo(left, liquid_top_y)
         
@@ -164,7 +173,11 @@ class Lab01App(QWidget):
         super().__init__()
         self.setWindowTitle("Лабораторная №1: Определение цены деления мензурки")
         self.resize(900, 600)
+        self.model = MenzurkaModel()
+        self.journal_key = journal.lab_key(self)
         self.setup_ui()
+        journal.track(self)
+        self.restore_log()
         self.generate_task() # Сразу создаем первое задание
 
     def setup_ui(self):
@@ -272,38 +285,15 @@ class Lab01App(QWidget):
     # --- ЛОГИКА ---
     def generate_task(self):
         """Генерация новых случайных условий"""
-        # Варианты полных объемов
-        self.total_v = random.choice([50, 100, 200, 250, 500, 1000])
-        
-        # Подбор адекватного числа делений, чтобы цена деления была красивой
-        # Например, для 100 мл: 10 (цена 10), 20 (цена 5), 50 (цена 2)
-        options = []
-        for n in [10, 20, 25, 50, 100]:
-            if self.total_v % n == 0:
-                options.append(n)
-        
-        if not options: options = [10]
-        self.num_divs = random.choice(options)
-        
-        # Истинная цена деления
-        self.true_price = self.total_v / self.num_divs
-        
-        # Случайный объем жидкости (кратный половине цены деления для реалистичности)
-        # min объем = 10% от полного
-        min_v = int(self.total_v * 0.1)
-        max_v = int(self.total_v * 0.95)
-        step = self.true_price / 2
-        
-        steps_count = int((max_v - min_v) / step)
-        self.current_v = min_v + random.randint(0, steps_count) * step
+        m = self.model.randomize()
 
         # Обновляем UI
-        self.menzurka.set_parameters(self.total_v, self.current_v, self.num_divs)
-        self.lbl_params.setText(f"Макс. объем: {self.total_v} мл | Делений: {self.num_divs}")
+        self.menzurka.set_parameters(m.total_v, m.current_v, m.num_divs)
+        self.lbl_params.setText(f"Макс. объем: {m.total_v} мл | Делений: {m.num_divs}")
         
         # Сброс полей, но не лога
         self.clear_fields()
-        self.txt_result.append(f"--- Новое задание: Vmax={self.total_v}, N={self.num_divs} ---")
+        self.log([f"--- Новое задание: Vmax={m.total_v}, N={m.num_divs} ---"])
 
     def check_answer(self):
         """Проверка ответов пользователя"""
@@ -322,13 +312,9 @@ class Lab01App(QWidget):
             QMessageBox.critical(self, "Ошибка", "Введены некорректные данные. Используйте только числа.")
             return
 
-        # 2. Проверка с допусками
-        # Допуск для цены деления строгий (1%)
-        price_ok = abs(user_price - self.true_price) < (self.true_price * 0.01 + 0.001)
-        
-        # Допуск для объема: обычно половина цены деления
-        vol_tolerance = self.true_price / 2
-        vol_ok = abs(user_vol - self.current_v) <= vol_tolerance
+        # 2. Проверка с допусками: цена деления — 1%, объём — половина деления
+        verdict = self.model.check({"price": user_price, "volume": user_vol})
+        price_ok, vol_ok = verdict["price"], verdict["volume"]
 
         # 3. Вывод результата
         if price_ok and vol_ok:
@@ -338,18 +324,34 @@ class Lab01App(QWidget):
             result_msg = "❌ ОШИБКА"
             color = "red"
             
-        self.txt_result.append(f"<span style='color:{color}'><b>{result_msg}</b></span>")
-        self.txt_result.append(f"Ваш ответ: C={user_price}, V={user_vol}")
+        lines = [f"<span style='color:{color}'><b>{result_msg}</b></span>",
+                 f"Ваш ответ: C={user_price}, V={user_vol}"]
         
         if not (price_ok and vol_ok):
-            self.txt_result.append(f"Правильно: C={self.true_price:.1f}, V={self.current_v:.1f}")
+            lines.append(f"Правильно: C={self.model.price:.1f}, V={self.model.current_v:.1f}")
         
-        self.txt_result.append("-" * 30)
+        lines.append("-" * 30)
+        self.log(lines, {
+            "params": self.model.get_params(), "results": self.model.true_values(),
+            "user_answer": {"price": user_price, "volume": user_vol}, "is_correct": price_ok and vol_ok,
+        })
+
+    def log(self, lines, check=None):
+        # Строки журнала на экран и в журнал сессии (check — поля проверки ответа)
+        for line in lines:
+            self.txt_result.append(line)
+        journal.append(self.journal_key, {**(check or {"kind": "log"}), "log": lines})
         
         # Прокрутка вниз
         sb = self.txt_result.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def restore_log(self):
+        # Окно закрыли или программа упала — возвращаем сегодняшний журнал
+        for rec in journal.restore(self.journal_key):
+            for line in rec.get("log", []):
+                self.txt_result.append(line)
+
     def clear_fields(self):
         self.inp_price.clear()
         self.inp_volume.clear()
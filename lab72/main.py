@@ -7,7 +7,11 @@ from PySide6.QtWidgets import (
     QTextEdit, QSizePolicy, QScrollBar
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QAction
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab import journal
+from physlab.core import Animated, LayerCache, ease
+from physlab.models import BallsRowModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Линейка
@@ -20,11 +24,14 @@ class RulerWidget(QFrame):
         self.setMinimumWidth(int(self.length_mm * self.px_per_mm) + 60)
         self.setMinimumHeight(100)
         self.setStyleSheet("background-color: white; border-bottom: 1px solid #ccc;")
+        # Линейка неподвижна — сотни делений рисуются один раз
+        self._scale = LayerCache(self, self.paint_scale)
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
+        self._scale.draw(painter)
+
+    def paint_scale(self, painter):
         left = 20
         top = 20
         
@@ -56,7 +63,9 @@ class RulerWidget(QFrame):
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Поле с шариками
 # ==========================================
-class BallsRowWidget(QFrame):
+class BallsRowWidget(QFrame, Animated):
+    frame_interval = 30
+
     def __init__(self, ruler_widget: RulerWidget, parent=None):
         super().__init__(parent)
         self.ruler = ruler_widget
@@ -66,29 +75,27 @@ class BallsRowWidget(QFrame):
         self.balls = []
         self.ball_radius = 12
         self.row_y = 100
+        self.model = BallsRowModel(radius=self.ball_radius, px_per_mm=self.ruler.px_per_mm)
         self.drag_index = None
         
-        # Таймер анимации
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
-        
         self._create_random_row()
 
     def _create_random_row(self):
-        n = random.randint(6, 15)
-        left = 40
         # Не выходим за пределы линейки
         max_width = int(self.ruler.length_mm * self.ruler.px_per_mm)
-        right = max(self.width() - 40, max_width)
-        
-        spacing = (right - left) / (n + 1)
+        self.model.row_right = max(self.width() - 40, max_width)
+        self.model.randomize()
+
         self.balls = []
-        for i in range(n):
-            x = left + (i + 1) * spacing + random.uniform(-10, 10)
+        for x in self.model.xs:
             y = self.row_y + random.uniform(-10, 10)
             self.balls.append({'pos': QPointF(x, y), 'r': self.ball_radius, 'target_x': x})
 
+    def sync_model(self):
+        """Передать модели, где шарики лежат сейчас (ученик их двигает мышью)."""
+        self.balls.sort(key=lambda b: b['pos'].x())
+        self.model.set_params(xs=tuple(b['pos'].x() for b in self.balls))
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -165,30 +172,27 @@ class BallsRowWidget(QFrame):
         if len(self.balls) < 2:
             return
         
-        # Сортируем по X
-        self.balls.sort(key=lambda b: b['pos'].x())
-        
-        # Начальная позиция первого шарика
-        start_x = self.balls[0]['pos'].x()
-        
-        # Ставим каждый следующий шарик вплотную
-        diameter = self.ball_radius * 2
-        for i, b in enumerate(self.balls):
-            b['target_x'] = start_x + i * diameter
+        # Ставим каждый следующий шарик вплотную к первому слева
+        self.sync_model()
+        for b, x in zip(self.balls, self.model.snapped()):
+            b['target_x'] = x
+        self.wake()
 
-    def animate(self):
+    def animate(self, dt):
         """Плавная анимация движения"""
         changed = False
         for b in self.balls:
             tx = b.get('target_x', b['pos'].x())
             dx = tx - b['pos'].x()
             if abs(dx) > 0.5:
-                b['pos'].setX(b['pos'].x() + dx * 0.2)
+                b['pos'].setX(b['pos'].x() + dx * ease(dt, 0.134))
                 changed = True
             else:
                 b['pos'].setX(tx)
-        if changed:
-            self.update()
+        if not changed:
+            # Все шарики на местах
+            self.settle()
+        self.update()
 
     def clear(self):
         self.balls = []
@@ -199,23 +203,10 @@ class BallsRowWidget(QFrame):
         self.update()
 
     def get_measurements(self):
-        """Получить истинные значения"""
-        if len(self.balls) < 1:
-            return 0, 0, 0
-        
-        self.balls.sort(key=lambda b: b['pos'].x())
-        
-        # Считаем в пикселях
-        left_edge = self.balls[0]['pos'].x() - self.ball_radius
-        right_edge = self.balls[-1]['pos'].x() + self.ball_radius
-        
-        px_dist = right_edge - left_edge
-        
-        # Переводим в мм
-        mm_L = px_dist / self.ruler.px_per_mm
-        N = len(self.balls)
-        mm_d = mm_L / N
-        return mm_L, N, mm_d
+        """Получить истинные значения (L и d — в мм)"""
+        self.sync_model()
+        true = self.model.true_values()
+        return true["L"], true["N"], true["d"]
 
 # ==========================================
 # ГЛАВНОЕ ОКНО
@@ -228,8 +219,11 @@ class Lab02App(QWidget):
         
         self.ruler_length = 250
         self.px_per_mm = 2.5
+        self.journal_key = journal.lab_key(self)
         
         self.setup_ui()
+        journal.track(self)
+        self.restore_log()
 
     def setup_ui(self):
         main_layout = QHBoxLayout(self)
@@ -337,7 +331,7 @@ class Lab02App(QWidget):
     def on_random(self):
         self.balls_widget.randomize()
         self.clear_inputs()
-        self.txt_log.append("--- Новое задание сгенерировано ---")
+        self.log(["--- Новое задание сгенерировано ---"])
 
     def on_snap(self):
         self.balls_widget.snap_to_row()
@@ -373,38 +367,48 @@ class Lab02App(QWidget):
             QMessageBox.warning(self, "Ошибка", "Шарики отсутствуют!")
             return
 
-        # 4. Сравнение (с допуском погрешности)
-        # L погрешность: 1.5 мм (погрешность глаза + экрана)
-        is_L_ok = abs(user_L - true_L) <= 1.5 
-        
-        # N должно быть точным
-        is_N_ok = (user_N == true_N)
-        
-        # d погрешность небольшая
-        is_d_ok = abs(user_d - true_d) <= 0.2
+        # 4. Сравнение (с допуском погрешности: L — 1.5 мм, N — точно, d — 0.2 мм)
+        verdict = self.balls_widget.model.check({"L": user_L, "N": user_N, "d": user_d})
+        is_L_ok, is_N_ok, is_d_ok = verdict["L"], verdict["N"], verdict["d"]
 
         # 5. Вывод результата
-        self.txt_log.append(f"Ввод: L={user_L}, N={user_N}, d={user_d}")
+        lines = [f"Ввод: L={user_L}, N={user_N}, d={user_d}"]
         
         all_ok = is_L_ok and is_N_ok and is_d_ok
         
         if all_ok:
-            self.txt_log.append("<span style='color:green'><b>✅ ВЕРНО</b></span>")
+            lines.append("<span style='color:green'><b>✅ ВЕРНО</b></span>")
         else:
-            self.txt_log.append("<span style='color:red'><b>❌ ОШИБКА</b></span>")
+            lines.append("<span style='color:red'><b>❌ ОШИБКА</b></span>")
             if not is_L_ok:
-                self.txt_log.append(f"L неверно. Правильно: {true_L:.1f} мм")
+                lines.append(f"L неверно. Правильно: {true_L:.1f} мм")
             if not is_N_ok:
-                self.txt_log.append(f"N неверно. Правильно: {true_N} шт.")
+                lines.append(f"N неверно. Правильно: {true_N} шт.")
             if not is_d_ok:
-                self.txt_log.append(f"d неверно. Правильно: {true_d:.2f} мм")
+                lines.append(f"d неверно. Правильно: {true_d:.2f} мм")
                 
-        self.txt_log.append("-" * 20)
+        lines.append("-" * 20)
+        self.log(lines, {
+            "params": {}, "results": {"L": true_L, "N": true_N, "d": true_d},
+            "user_answer": {"L": user_L, "N": user_N, "d": user_d}, "is_correct": all_ok,
+        })
+
+    def log(self, lines, check=None):
+        # Строки журнала на экран и в журнал сессии (check — поля проверки ответа)
+        for line in lines:
+            self.txt_log.append(line)
+        journal.append(self.journal_key, {**(check or {"kind": "log"}), "log": lines})
         
         # Прокрутка вниз
         sb = self.txt_log.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def restore_log(self):
+        # Окно закрыли или программа упала — возвращаем сегодняшний журнал
+        for rec in journal.restore(self.journal_key):
+            for line in rec.get("log", []):
+                self.txt_log.append(line)
+
     def copy_log(self):
         self.txt_log.selectAll()
         self.txt_log.copy()
@@ -1,5 +1,4 @@
 import sys
-import random
 import math
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -7,7 +6,10 @@ from PySide6.QtWidgets import (
     QTextEdit, QSizePolicy
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QLinearGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
+
+from physlab.core import Animated, LayerCache, ease
+from physlab.models import BalanceScalesModel
 
 # ==========================================
 # КЛАСС: Груз (Гиря или Неизвестное тело)
@@ -26,7 +28,9 @@ class WeightItem:
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Весы
 # ==========================================
-class ScalesWidget(QFrame):
+class ScalesWidget(QFrame, Animated):
+    frame_interval = 20
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(700, 450)
@@ -44,12 +48,9 @@ class ScalesWidget(QFrame):
         # Грузы
         self.items = []
         self.dragged_item = None
-        self.unknown_mass_val = 0
-        
-        # Анимация
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
+        self.model = BalanceScalesModel()
+        # Стойка с градиентом неподвижна — рисуется в кэш
+        self._stand = LayerCache(self, self.paint_stand)
         
         self.create_experiment()
 
@@ -58,20 +59,19 @@ class ScalesWidget(QFrame):
         self.items = []
         
         # 1. Стандартные гири (справа в запасе)
-        masses = [5, 10, 10, 20, 20, 50, 100]
         x0 = 600
         y0 = 350
-        for i, m in enumerate(masses):
+        for i, m in enumerate(self.model.WEIGHTS):
             row = i // 4
             col = i % 4
             pos = QPointF(x0 + col * 40, y0 - row * 40)
             self.items.append(WeightItem(m, pos, is_unknown=False))
             
         # 2. Неизвестное тело (появляется на левой чаше)
-        self.unknown_mass_val = random.choice([25, 35, 45, 55, 65, 75, 85, 95, 115, 125])
+        self.model.randomize()
         
         left_plate_pos = self.get_plate_pos('left')
-        unknown_item = WeightItem(self.unknown_mass_val, QPointF(left_plate_pos.x(), left_plate_pos.y() - 20), is_unknown=True)
+        unknown_item = WeightItem(self.model.unknown_mass, QPointF(left_plate_pos.x(), left_plate_pos.y() - 20), is_unknown=True)
         unknown_item.on_plate = 'left'
         self.items.append(unknown_item)
         
@@ -92,11 +92,7 @@ class ScalesWidget(QFrame):
         # Длина нити подвеса = 100
         return QPointF(self.center.x() + rx, self.center.y() + ry + 100)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # 1. Основание (Стойка)
+    def paint_stand(self, painter):
         painter.setPen(QPen(Qt.black, 1))
         grad_base = QLinearGradient(self.center.x()-10, 0, self.center.x()+10, 0)
         grad_base.setColorAt(0, QColor(100, 100, 100))
@@ -108,6 +104,14 @@ class ScalesWidget(QFrame):
         # Нижняя платформа
         painter.drawRect(int(self.center.x()) - 60, int(self.center.y()) + 200, 120, 20)
 
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # 1. Основание (Стойка)
+        self._stand.draw(painter)
+        painter.setPen(QPen(Qt.black, 1))
+
         # 2. Коромысло (Балка)
         painter.save()
         painter.translate(self.center)
@@ -227,17 +231,18 @@ class ScalesWidget(QFrame):
     def update_physics(self):
         m_left = sum(i.mass for i in self.items if i.on_plate == 'left')
         m_right = sum(i.mass for i in self.items if i.on_plate == 'right')
-        
-        diff = m_right - m_left
-        max_angle = math.radians(20)
-        self.target_angle = max(-max_angle, min(max_angle, diff / 50.0))
+        self.target_angle = self.model.beam_target(m_left, m_right)
+        self.wake()
 
-    def animate(self):
+    def animate(self, dt):
         diff = self.target_angle - self.beam_angle
         if abs(diff) > 0.001:
-            self.beam_angle += diff * 0.1
+            self.beam_angle += diff * ease(dt, 0.19)
             self.update()
             self.update_items_on_plates()
+        else:
+            # Весы уравновесились
+            self.settle()
 
     def update_items_on_plates(self):
         left_c = self.get_plate_pos('left')
@@ -253,7 +258,7 @@ class ScalesWidget(QFrame):
             item.pos = QPointF(right_c.x(), right_c.y() - 10 - idx * (item.r * 1.5))
 
     def get_unknown_mass(self):
-        return self.unknown_mass_val
+        return self.model.unknown_mass
 
 # ==========================================
 # ГЛАВНОЕ ОКНО
@@ -349,7 +354,7 @@ class Lab03App(QWidget):
 
         real_mass = self.scales.get_unknown_mass()
         
-        if user_mass == real_mass:
+        if self.scales.model.check({"value": user_mass})["value"]:
             self.txt_log.append(f"<span style='color:green'>✅ ВЕРНО! Масса = {real_mass} г</span>")
         else:
             self.txt_log.append(f"<span style='color:red'>❌ ОШИБКА. Ваш ответ: {user_mass} г</span>")
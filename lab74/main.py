@@ -1,5 +1,4 @@
 import sys
-import random
 import math
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -7,12 +6,17 @@ from PySide6.QtWidgets import (
     QTextEdit, QSizePolicy
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPainterPath, QLinearGradient, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
+
+from physlab.core import Animated, ease
+from physlab.models import DisplacementModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Мензурка
 # ==========================================
-class MenzurkaWidget(QFrame):
+class MenzurkaWidget(QFrame, Animated):
+    frame_interval = 30 # 30 мс
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(350, 500)
@@ -20,64 +24,53 @@ class MenzurkaWidget(QFrame):
 
         # Параметры анимации
         self.phase = 0.0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.on_timer)
-        self.timer.start(30) # 30 мс
+        self.agitation = 1.0 # амплитуда волн: 1 — после возмущения, 0 — жидкость успокоилась
 
-        # Состояние (0 = вверху, 1 = опускается, 2 = внизу, 3 = поднимается)
-        self.state = 0
-        self.anim_t = 0.0 # 0.0 ... 1.0 (интерполяция)
-        self.anim_speed = 0.02
+        # Объёмы и положение тела (вверху, опускается, внизу, поднимается)
+        self.model = DisplacementModel()
 
         self.generate_parameters()
 
     def generate_parameters(self):
         """Генерация новых параметров эксперимента"""
-        self.V_total = random.randint(200, 500)
-        self.divisions = random.choice([10, 20, 25])
-        
-        # Объём тела (чтобы помещалось)
-        max_body = int(self.V_total * 0.3)
-        self.V_body = random.randint(20, max_body)
-        
-        # Начальный объём жидкости
-        max_liquid = self.V_total - self.V_body - 10
-        self.V1 = random.randint(30, max_liquid)
-        
-        # Сброс анимации
-        self.state = 0
-        self.anim_t = 0.0
+        self.model.randomize()
+        self.stir()
         self.update()
 
-    def on_timer(self):
+    def stir(self):
+        self.agitation = 1.0
+        self.wake()
+
+    def animate(self, dt):
         # Волна на поверхности
-        self.phase += 0.15
+        self.phase += 5.0 * dt
         if self.phase > 2 * math.pi:
             self.phase -= 2 * math.pi
 
         # Движение тела
-        if self.state == 1: # Опускание
-            self.anim_t += self.anim_speed
-            if self.anim_t >= 1.0:
-                self.anim_t = 1.0
-                self.state = 2
-        elif self.state == 3: # Поднятие
-            self.anim_t -= self.anim_speed
-            if self.anim_t <= 0.0:
-                self.anim_t = 0.0
-                self.state = 0
+        self.model.step(dt)
+
+        # Пока тело движется, волны не затухают
+        if self.model.is_moving():
+            self.agitation = 1.0
+        else:
+            self.agitation *= 1.0 - ease(dt, 1.0)
+            if self.agitation < 0.02:
+                self.agitation = 0.0
+                self.settle()
         
         self.update()
 
     def start_lower(self):
-        if self.state == 0: self.state = 1
+        if self.model.start_lower():
+            self.stir()
     
     def start_raise(self):
-        if self.state == 2: self.state = 3
+        if self.model.start_raise():
+            self.stir()
 
     def get_current_volume(self):
-        # V_current = V1 + (V_body * t)
-        return self.V1 + self.V_body * self.anim_t
+        return self.model.current_volume()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -109,7 +102,8 @@ class MenzurkaWidget(QFrame):
         inner_h = cyl_h - 10
         
         current_v = self.get_current_volume()
-        ratio = current_v / self.V_total
+        m = self.model
+        ratio = current_v / m.V_total
         liquid_h = inner_h * ratio
         liquid_top_y = inner_y + inner_h - liquid_h
 
@@ -119,7 +113,7 @@ class MenzurkaWidget(QFrame):
         path.lineTo(inner_x, liquid_top_y)      
         
         steps = 20
-        wave_amp = 3
+        wave_amp = 3 * self.agitation
         for i in range(steps + 1):
             t = i / steps
             x = inner_x + t * inner_w
@@ -138,9 +132,9 @@ class MenzurkaWidget(QFrame):
         font = QFont("Arial", 9)
         painter.setFont(font)
         
-        for i in range(self.divisions + 1):
-            val = int(i * (self.V_total / self.divisions))
-            y_pos = inner_y + inner_h - (i / self.divisions) * inner_h
+        for i in range(m.divisions + 1):
+            val = int(i * (m.V_total / m.divisions))
+            y_pos = inner_y + inner_h - (i / m.divisions) * inner_h
             
             painter.drawLine(inner_x, int(y_pos), inner_x + 15, int(y_pos))
             painter.drawText(inner_x + 20, int(y_pos) + 5, str(val))
@@ -152,7 +146,7 @@ class MenzurkaWidget(QFrame):
         fixed_start_y = inner_y + 40
         end_y = liquid_top_y + body_r + 10 
         
-        body_y = fixed_start_y + (end_y - fixed_start_y) * self.anim_t
+        body_y = fixed_start_y + (end_y - fixed_start_y) * m.depth
         body_x = inner_x + inner_w / 2
         
         # Нить
@@ -168,11 +162,11 @@ class MenzurkaWidget(QFrame):
         painter.drawEllipse(QPointF(body_x, body_y), body_r, body_r)
         
         # Подсказки V1, V2
-        if self.state == 2: # Внизу
+        if m.state == m.BOTTOM:
              painter.setPen(QPen(Qt.darkGreen, 1, Qt.DashLine))
              painter.drawLine(inner_x, int(liquid_top_y), inner_x + inner_w, int(liquid_top_y))
              painter.drawText(inner_x + inner_w + 5, int(liquid_top_y), "V2")
-        elif self.state == 0: # Вверху
+        elif m.state == m.TOP:
              painter.setPen(QPen(Qt.darkBlue, 1, Qt.DashLine))
              painter.drawLine(inner_x, int(liquid_top_y), inner_x + inner_w, int(liquid_top_y))
              painter.drawText(inner_x + inner_w + 5, int(liquid_top_y), "V1")
@@ -293,17 +287,12 @@ class Lab04App(QWidget):
             QMessageBox.warning(self, "Ошибка", "Пожалуйста, введите числа во все поля!")
             return
 
-        # Правильные значения
-        real_v1 = self.menzurka.V1
-        real_v2 = self.menzurka.V1 + self.menzurka.V_body
-        real_v = self.menzurka.V_body
-        
-        # Допуск погрешности (половина цены деления)
-        tolerance = (self.menzurka.V_total / self.menzurka.divisions) / 2
-        
-        is_v1 = abs(u_v1 - real_v1) <= tolerance
-        is_v2 = abs(u_v2 - real_v2) <= tolerance
-        is_v = abs(u_v - real_v) <= tolerance
+        # Правильные значения; допуск — половина цены деления
+        model = self.menzurka.model
+        true = model.true_values()
+        real_v1, real_v2, real_v = true["V1"], true["V2"], true["V"]
+        verdict = model.check({"V1": u_v1, "V2": u_v2, "V": u_v})
+        is_v1, is_v2, is_v = verdict["V1"], verdict["V2"], verdict["V"]
         
         self.txt_log.append(f"Ввод: V1={u_v1}, V2={u_v2}, V={u_v}")
         
@@ -1,5 +1,4 @@
 import sys
-import random
 import math
 from statistics import mean
 from PySide6.QtWidgets import (
@@ -8,62 +7,59 @@ from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox, QSplitter
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPainterPath, QLinearGradient, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
+
+from physlab.core import Animated, LayerCache, ease
+from physlab.models import DensityModel, DisplacementModel
 
 # ==========================================
 # 1. МЕНЗУРКА (Измерение объема)
 # ==========================================
-class MenzurkaWidget(QFrame):
+class MenzurkaWidget(QFrame, Animated):
+    frame_interval = 30
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(250, 400)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
         self.phase = 0.0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.on_timer)
-        self.timer.start(30)
-        
-        self.state = 0 
-        self.anim_t = 0.0
-        self.anim_speed = 0.03
-        
-        self.total_volume = 200
-        self.V1 = 100
-        self.V_body = 50
-        self.divisions = 10
+        self.agitation = 0.0 # амплитуда волн, затухает после погружения тела
+        
+        self.model = DisplacementModel(V_total=200, V1=100, V_body=50, divisions=10)
+        self.model.lower_speed = 1.0  # доля хода за секунду
 
     def set_params(self, total_v, v1, v_body):
-        self.total_volume = total_v
-        self.V1 = v1
-        self.V_body = v_body
-        self.divisions = 20 
-        self.state = 0
-        self.anim_t = 0.0
+        self.model.set_params(V_total=total_v, V1=v1, V_body=v_body, divisions=20)
+        self.model.reset()
+        self.stir()
         self.update()
 
-    def on_timer(self):
-        self.phase += 0.15
+    def stir(self):
+        self.agitation = 1.0
+        self.wake()
+
+    def animate(self, dt):
+        self.phase += 5.0 * dt
         if self.phase > 6.28: self.phase -= 6.28
         
-        if self.state == 1:
-            self.anim_t += self.anim_speed
-            if self.anim_t >= 1.0:
-                self.anim_t = 1.0
-                self.state = 2
-        elif self.state == 3:
-            self.anim_t -= self.anim_speed
-            if self.anim_t <= 0.0:
-                self.anim_t = 0.0
-                self.state = 0
+        self.model.step(dt)
+
+        if self.model.is_moving():
+            self.agitation = 1.0
+        else:
+            self.agitation *= 1.0 - ease(dt, 1.0)
+            if self.agitation < 0.02:
+                self.agitation = 0.0
+                self.settle()
         self.update()
 
     def toggle_immersion(self):
-        if self.state == 0: self.state = 1
-        elif self.state == 2: self.state = 3
+        self.model.toggle()
+        self.stir()
 
     def get_current_volume(self):
-        return self.V1 + self.V_body * self.anim_t
+        return self.model.current_volume()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -91,7 +87,8 @@ class MenzurkaWidget(QFrame):
         inner_h = cyl_h - 8
         
         cur_v = self.get_current_volume()
-        level_h = inner_h * (cur_v / self.total_volume)
+        m = self.model
+        level_h = inner_h * (cur_v / m.V_total)
         liquid_top = inner_y + inner_h - level_h
         
         path = QPainterPath()
@@ -100,7 +97,7 @@ class MenzurkaWidget(QFrame):
         for i in range(21):
             t = i / 20
             x = inner_x + t * inner_w
-            y = liquid_top + math.sin(self.phase + t*10) * 2
+            y = liquid_top + math.sin(self.phase + t*10) * 2 * self.agitation
             path.lineTo(x, y)
         path.lineTo(inner_x + inner_w, inner_y + inner_h)
         path.closeSubpath()
@@ -112,9 +109,9 @@ class MenzurkaWidget(QFrame):
         # Шкала
         painter.setPen(QPen(Qt.black, 1))
         painter.setFont(QFont("Arial", 8))
-        for i in range(self.divisions + 1):
-            val = int(i * (self.total_volume / self.divisions))
-            y = inner_y + inner_h - (i / self.divisions) * inner_h
+        for i in range(m.divisions + 1):
+            val = int(i * (m.V_total / m.divisions))
+            y = inner_y + inner_h - (i / m.divisions) * inner_h
             painter.drawLine(inner_x, int(y), inner_x + 10, int(y))
             if i % 2 == 0:
                 painter.drawText(inner_x + 15, int(y)+4, str(val))
@@ -123,7 +120,7 @@ class MenzurkaWidget(QFrame):
         body_r = min(25, inner_w // 4)
         start_y = inner_y - 30
         end_y = liquid_top + body_r + 5
-        cur_y = start_y + (end_y - start_y) * self.anim_t
+        cur_y = start_y + (end_y - start_y) * m.depth
         cur_x = inner_x + inner_w / 2
         
         painter.setPen(QPen(Qt.black, 1))
@@ -145,9 +142,12 @@ class WeightItem:
         self.dragging = False
         self.on_plate = None
 
-class ScalesWidget(QFrame):
-    def __init__(self, parent=None):
+class ScalesWidget(QFrame, Animated):
+    frame_interval = 20
+
+    def __init__(self, model, parent=None):
         super().__init__(parent)
+        self.model = model  # DensityModel: чувствительность весов
         self.setMinimumSize(350, 300)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
@@ -157,10 +157,7 @@ class ScalesWidget(QFrame):
         self.target_angle = 0.0
         self.items = []
         self.dragged = None
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
+        self._stand = LayerCache(self, self.paint_stand)
         
         self.init_weights()
 
@@ -178,6 +175,7 @@ class ScalesWidget(QFrame):
         self.unknown_body.on_plate = 'left'
         self.items.append(self.unknown_body)
         self.update_layout()
+        self.wake()
 
     def set_body_mass(self, mass):
         self.unknown_body.mass = mass
@@ -189,6 +187,8 @@ class ScalesWidget(QFrame):
         self.unknown_body.on_plate = 'left'
         self.angle = 0.0
         self.update_layout()
+        self.wake()
+        self.update()
 
     def get_plate_pos(self, side):
         offset = -self.beam_len/2 if side == 'left' else self.beam_len/2
@@ -208,25 +208,31 @@ class ScalesWidget(QFrame):
         for k, item in enumerate(r_items):
             item.pos = QPointF(right_p.x(), right_p.y() - 10 - k*15)
 
-    def animate(self):
+    def animate(self, dt):
         m_l = sum(i.mass for i in self.items if i.on_plate == 'left')
         m_r = sum(i.mass for i in self.items if i.on_plate == 'right')
-        diff = m_r - m_l
-        self.target_angle = max(-0.3, min(0.3, diff / 100))
+        self.target_angle = self.model.beam_target(m_l, m_r)
         
         delta = self.target_angle - self.angle
-        self.angle += delta * 0.1
+        self.angle += delta * ease(dt, 0.19)
         self.update_layout()
+        # Коромысло встало — до следующего перекладывания гирь кадры не нужны
+        if abs(delta) < 1e-4 and self.dragged is None:
+            self.angle = self.target_angle
+            self.settle()
         self.update()
 
+    def paint_stand(self, painter):
+        painter.setBrush(QColor(200, 200, 200))
+        painter.drawRect(int(self.center.x())-5, int(self.center.y()), 10, 150)
+        painter.drawRect(int(self.center.x())-40, int(self.center.y())+150, 80, 10)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Стойка
-        painter.setBrush(QColor(200, 200, 200))
-        painter.drawRect(int(self.center.x())-5, int(self.center.y()), 10, 150)
-        painter.drawRect(int(self.center.x())-40, int(self.center.y())+150, 80, 10)
+        # Стойка (неподвижна — из кэша)
+        self._stand.draw(painter)
         
         # Балка
         painter.save()
@@ -272,6 +278,8 @@ class ScalesWidget(QFrame):
         if self.dragged:
             self.dragged.pos = event.position()
             self.dragged.on_plate = None
+            self.wake()
+            self.update()
     
     def mouseReleaseEvent(self, event):
         if self.dragged:
@@ -285,6 +293,8 @@ class ScalesWidget(QFrame):
             
             self.dragged.dragging = False
             self.dragged = None
+            self.wake()
+            self.update()
 
 # ==========================================
 # 3. ГЛАВНОЕ ОКНО
@@ -295,16 +305,7 @@ class LabDensityApp(QWidget):
         self.setWindowTitle("Лабораторная работа № 5: Определение плотности твердых тел.")
         self.resize(1100, 700)
         
-        self.materials = {
-            "дуб": 0.7,
-            "алюминий": 2.7,
-            "железо": 7.8,
-            "медь": 8.9,
-            "свинец": 11.3
-        }
-        self.current_material = ""
-        self.true_mass = 0
-        self.true_vol = 0
+        self.model = DensityModel()
         
         self.setup_ui()
         self.new_experiment()
@@ -318,7 +319,7 @@ class LabDensityApp(QWidget):
         
         scale_group = QGroupBox("1. Измерение массы (Весы)")
         sl = QVBoxLayout()
-        self.scales = ScalesWidget()
+        self.scales = ScalesWidget(self.model)
         sl.addWidget(self.scales)
         scale_group.setLayout(sl)
         
@@ -384,43 +385,10 @@ class LabDensityApp(QWidget):
         main.addWidget(right_area, 1)
 
     def new_experiment(self):
-        # 1. Материалды жана тыгыздыкты тандайбыз
-        name, rho = random.choice(list(self.materials.items()))
-        self.current_material = name
-        
-        # 2. Чектөөлөрдү эсептейбиз
-        # а) Масса боюнча чектөө: Гирлердин суммасы 205г, биз 200г ашпайбыз
-        max_vol_by_mass = int(200 / rho)
-        
-        # б) Көлөм боюнча чектөө: Мензурка чоңураак болушу керек (мисалы 250мл)
-        # Нерсе өтө чоң болбошу керек, айталы мензурканын 1/3 бөлүгүнөн ашпасын
-        max_vol_by_size = 80 
-        
-        # Эки чектөөнүн кичинесин алабыз
-        max_vol = min(max_vol_by_mass, max_vol_by_size)
-        
-        # Өтө кичине болуп калбашы үчүн (минималдуу 10 мл)
-        if max_vol < 10: max_vol = 10
-        
-        # 3. Чыныгы маанилерди генерациялоо
-        self.true_vol = random.randint(10, max_vol)
-        self.true_mass = round(self.true_vol * rho, 1)
-        
-        # 4. Виджеттерди жаңылоо
-        self.scales.set_body_mass(self.true_mass)
-        
-        # Мензурканы жөндөө
-        v_total = 250 # Мензурканын көлөмүн 250 мл кылдык (кенен болуш үчүн)
-        
-        # V1 (суунун деңгээли) ташып кетпегидей болушу керек:
-        # V1 + V_body <= V_total - запас (20мл)
-        max_v1 = v_total - self.true_vol - 20
-        min_v1 = 50 # Минималдуу суу
-        
-        if max_v1 < min_v1: max_v1 = min_v1 # Коопсуздук
-        
-        v1 = random.randint(min_v1, max_v1)
-        self.menzurka.set_params(v_total, v1, self.true_vol)
+        # Материал, объём и масса тела, вода в мензурке
+        m = self.model.randomize()
+        self.scales.set_body_mass(m.mass)
+        self.menzurka.set_params(m.V_total, m.V1, m.volume)
         
         # Талааларды тазалоо
         self.in_m.clear()
@@ -436,14 +404,11 @@ class LabDensityApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите корректные числа!")
             return
             
-        ok_m = abs(u_m - self.true_mass) <= 5.0 
-        ok_v = abs(u_v - self.true_vol) <= 5.0  
-        
-        true_rho = self.true_mass / self.true_vol
-        ok_rho = abs(u_rho - true_rho) <= 1.0
+        verdict = self.model.check({"m": u_m, "V": u_v, "rho": u_rho})
+        ok_m, ok_v, ok_rho = verdict["m"], verdict["V"], verdict["rho"]
         
         if ok_m and ok_v and ok_rho:
-            self.lbl_res.setText(f"<span style='color:green'><b>ВЕРНО! Это: {self.current_material.upper()}</b></span>")
+            self.lbl_res.setText(f"<span style='color:green'><b>ВЕРНО! Это: {self.model.material.upper()}</b></span>")
             
             row = self.table.rowCount()
             self.table.insertRow(row)
@@ -452,11 +417,10 @@ class LabDensityApp(QWidget):
             self.table.setItem(row, 2, QTableWidgetItem(str(u_rho)))
         else:
             msg = "ЕСТЬ ОШИБКИ:\n"
-            if not ok_m: msg += f"- Неверная масса (Правильно: {self.true_mass})\n"
-            if not ok_v: msg += f"- Неверный объем (Правильно: {self.true_vol})\n"
+            if not ok_m: msg += f"- Неверная масса (Правильно: {self.model.mass})\n"
+            if not ok_v: msg += f"- Неверный объем (Правильно: {self.model.volume})\n"
             if not ok_rho: msg += f"- Неверная плотность"
             QMessageBox.warning(self, "Ошибка", msg)
-            print(true_rho, self.true_mass, self.true_vol)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
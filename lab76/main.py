@@ -1,6 +1,5 @@
 import sys
 import math
-import random
 from statistics import mean
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -8,12 +7,17 @@ from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QSlider
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import CATCH_UP_DT, Animated
+from physlab.models import HookeModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Пружина
 # ==========================================
-class SpringWidget(QFrame):
+class SpringWidget(QFrame, Animated):
+    max_dt = CATCH_UP_DT  # колебания груза идут по реальному времени (RK4 с шагом 5 мс)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(300, 550)
@@ -22,62 +26,30 @@ class SpringWidget(QFrame):
         # Физические параметры
         self.px_per_cm = 15.0   # 1 см = 15 пикселей
         self.natural_len_cm = 10.0
-        self.k = 50.0           # Н/м (скрыто)
-        self.mass = 0.0         # кг
-        self.g = 9.81
-
-        # Анимация
-        self.current_y = 0.0
-        self.target_y = 0.0
-        self.velocity = 0.0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
-
-        self.reset_spring()
+        # Жёсткость (скрыта), масса и затухающие колебания груза
+        self.model = HookeModel()
 
     def reset_spring(self):
-        natural_px = self.natural_len_cm * self.px_per_cm
-        self.current_y = natural_px
-        self.target_y = natural_px
-        self.velocity = 0.0
+        self.model.reset()
+        self.update()
 
-    def set_experiment(self, k_val):
-        self.k = k_val
-        self.update_physics()
+    def new_spring(self):
+        self.model.randomize()
+        self.wake()
 
     def set_mass(self, mass_g):
-        self.mass = mass_g / 1000.0 # грамм -> кг
-        self.update_physics()
+        self.model.mass = mass_g / 1000.0 # грамм -> кг
+        self.wake()
 
-    def update_physics(self):
-        # F = k * x  =>  m*g = k * x  =>  x = (m*g)/k
-        if self.k <= 0: return
-        
-        extension_m = (self.mass * self.g) / self.k
-        extension_cm = extension_m * 100.0
-        extension_px = extension_cm * self.px_per_cm
-        
-        natural_px = self.natural_len_cm * self.px_per_cm
-        self.target_y = natural_px + extension_px
-
-    def animate(self):
-        force = (self.target_y - self.current_y) * 0.1
-        self.velocity += force
-        self.velocity *= 0.85 # Затухание
-        self.current_y += self.velocity
-        
-        if abs(self.velocity) < 0.01 and abs(self.target_y - self.current_y) < 0.1:
-            self.current_y = self.target_y
-            self.velocity = 0
-            
+    def animate(self, dt):
+        self.model.step(dt)
+        if self.model.is_settled():
+            # Груз повис неподвижно
+            self.settle()
         self.update()
 
     def get_extension_cm(self):
-        natural_px = self.natural_len_cm * self.px_per_cm
-        diff_px = self.current_y - natural_px
-        return diff_px / self.px_per_cm
+        return self.model.extension
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -111,7 +83,7 @@ class SpringWidget(QFrame):
         painter.drawLine(cx - 20, top_y, cx + 20, top_y)
         
         coils = 15
-        spring_h = self.current_y
+        spring_h = (self.natural_len_cm + self.model.extension) * self.px_per_cm
         step = spring_h / coils
         
         path = list()
@@ -128,10 +100,11 @@ class SpringWidget(QFrame):
             painter.drawLine(path[i], path[i+1])
 
         # 3. Груз
-        if self.mass > 0:
+        mass = self.model.mass
+        if mass > 0:
             bottom_y = top_y + spring_h
             box_w = 50
-            box_h = 50 + (self.mass * 10)
+            box_h = 50 + (mass * 10)
             if box_h > 100: box_h = 100
             
             painter.setPen(QPen(Qt.black, 2))
@@ -147,7 +120,7 @@ class SpringWidget(QFrame):
             
             painter.setPen(Qt.black)
             painter.setFont(QFont("Arial", 10, QFont.Bold))
-            mass_g = int(self.mass * 1000)
+            mass_g = int(mass * 1000)
             painter.drawText(int(cx - box_w/2), int(bottom_y + 15), int(box_w), int(box_h), Qt.AlignCenter, f"{mass_g} г")
             
             # Стрелка
@@ -250,8 +223,7 @@ class LabSpringApp(QWidget):
 
     def new_experiment(self):
         # Случайное k (20..100)
-        self.true_k = random.randint(20, 100)
-        self.spring.set_experiment(self.true_k)
+        self.spring.new_spring()
         
         self.slider.setValue(0)
         self.in_m.clear()
@@ -278,9 +250,9 @@ class LabSpringApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите корректное число!")
             return
 
-        error_margin = self.true_k * 0.05
-        if abs(u_k - self.true_k) <= error_margin:
-            self.lbl_res.setText(f"<span style='color:green'><b>ВЕРНО! k ≈ {self.true_k} Н/м</b></span>")
+        model = self.spring.model
+        if model.check({"value": u_k})["value"]:
+            self.lbl_res.setText(f"<span style='color:green'><b>ВЕРНО! k ≈ {model.k} Н/м</b></span>")
             
             row = self.table.rowCount()
             self.table.insertRow(row)
@@ -288,7 +260,7 @@ class LabSpringApp(QWidget):
             self.table.setItem(row, 1, QTableWidgetItem(self.in_x.text()))
             self.table.setItem(row, 2, QTableWidgetItem(str(u_k)))
         else:
-            self.lbl_res.setText(f"<span style='color:red'><b>ОШИБКА. Правильно: {self.true_k} Н/м</b></span>")
+            self.lbl_res.setText(f"<span style='color:red'><b>ОШИБКА. Правильно: {model.k} Н/м</b></span>")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,6 +1,5 @@
 import sys
 import math
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox,
@@ -9,25 +8,20 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient
 from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
 
+from physlab.models import ArchimedesModel
+
 class ExperimentWidget(QFrame):
-    def __init__(self, parent=None):
+    def __init__(self, model, parent=None):
         super().__init__(parent)
+        self.model = model  # ArchimedesModel: масса и объём тела
         self.setMinimumSize(350, 500)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
 
         self.px_per_cm = 10.0
-        self.g = 9.81
-        self.rho_water = 1000.0 
-
-        self.body_mass = 0.2    
-        self.body_vol = 0.0001  
-        
         self.lift_h = 0.0       
         self.current_force = 0.0
 
-    def set_experiment(self, mass_kg, vol_m3):
-        self.body_mass = mass_kg
-        self.body_vol = vol_m3
+    def set_experiment(self):
         self.lift_h = 0.0
         self.update()
 
@@ -122,9 +116,7 @@ class ExperimentWidget(QFrame):
         painter.setBrush(QColor(220, 220, 220))
         painter.drawRect(int(dyn_x), int(dyn_y_pos), int(dyn_w), int(dyn_h))
         
-        buoyant_force = self.rho_water * self.g * (self.body_vol * submerged_ratio)
-        gravity_force = self.body_mass * self.g
-        self.current_force = max(0, gravity_force - buoyant_force)
+        self.current_force = self.model.dynamometer(submerged_ratio)
         
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 9, QFont.Bold))
@@ -138,8 +130,7 @@ class LabArchimedesApp(QWidget):
         self.setWindowTitle("Лабораторная работа №7: Закон Архимеда")
         self.resize(1000, 650)
         
-        self.true_vol_ml = 0
-        self.true_mass_g = 0
+        self.model = ArchimedesModel()
         self.setup_ui()
         self.new_experiment()
 
@@ -150,7 +141,7 @@ class LabArchimedesApp(QWidget):
         left_group = QGroupBox("Стенд")
         left_layout = QHBoxLayout() # Horizontal
         
-        self.experiment = ExperimentWidget()
+        self.experiment = ExperimentWidget(self.model)
         left_layout.addWidget(self.experiment, 1) 
         
         slider_container = QWidget()
@@ -234,13 +225,8 @@ class LabArchimedesApp(QWidget):
         right_panel.addWidget(res_g)
 
     def new_experiment(self):
-        self.true_mass_g = random.randint(100, 300) 
-        density = random.uniform(2.5, 8.0) 
-        self.true_vol_ml = int(self.true_mass_g / density)
-        
-        mass_kg = self.true_mass_g / 1000.0
-        vol_m3 = self.true_vol_ml * 1e-6
-        self.experiment.set_experiment(mass_kg, vol_m3)
+        self.model.randomize()
+        self.experiment.set_experiment()
         
         self.slider.setValue(0)
         self.in_p0.clear()
@@ -259,20 +245,15 @@ class LabArchimedesApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите числа!")
             return
 
-        g = 9.81
-        true_p0 = (self.true_mass_g / 1000.0) * g
-        true_fa = 1000.0 * g * (self.true_vol_ml * 1e-6)
-        true_p1 = true_p0 - true_fa
-        
-        is_p0 = abs(u_p0 - true_p0) < 0.1
-        is_p1 = abs(u_p1 - true_p1) < 0.1
-        is_fa = abs(u_fa - true_fa) < 0.1
-        # is_v  = abs(u_v - self.true_vol_ml) < 5.0
+        true = self.model.true_values()
+        true_p0, true_p1, true_fa = true["P0"], true["P1"], true["Fa"]
+        verdict = self.model.check({"P0": u_p0, "P1": u_p1, "Fa": u_fa})
+        # is_v  = abs(u_v - self.model.vol_ml) < 5.0
         
-        if is_p0 and is_p1 and is_fa:
+        if all(verdict.values()):
             self.log.append(f"<span style='color:green'>✅ <b>ВЕРНО!</b> (Fa={true_fa:.2f}H)</span>")
             # if is_v:
-            #     self.log.append(f"   Объем верен: {self.true_vol_ml} мл")
+            #     self.log.append(f"   Объем верен: {self.model.vol_ml} мл")
             # else:
             #     self.log.append(f"   Объем неверен. Используйте V = Fa / (ρ*g).")
         else:
@@ -7,7 +7,10 @@ from PySide6.QtWidgets import (
     QPushButton, QLineEdit, QMessageBox, QFrame, QSizePolicy
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPolygon
-from PySide6.QtCore import Qt, QTimer, QPointF, QPoint
+from PySide6.QtCore import Qt, QPointF, QPoint
+
+from physlab.core import Animated, ease
+from physlab.models import LeverModel
 
 G = 9.81  # м/с^2
 
@@ -22,13 +25,15 @@ class Weight:
         self.r = 14 + int(mass / 50)  # радиус зависит от массы
         self.color = QColor(100, 100, 200) if mass < 100 else QColor(200, 100, 100)
 
-class LeverWidget(QFrame):
+class LeverWidget(QFrame, Animated):
     """
     Виджет рычага.
     Рычаг имеет деления (плечи) от -5 до +5.
     Грузы можно вешать на конкретные деления.
     Рычаг наклоняется, если моменты сил не равны.
     """
+    frame_interval = 30
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(600, 400)
@@ -41,11 +46,7 @@ class LeverWidget(QFrame):
         
         # Грузы на рычаге
         self.weights = []
-        
-        # Анимация
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
+        self.model = LeverModel()
 
     def add_weight(self, mass, position):
         """Добавить груз заданной массы на позицию (-5..5)"""
@@ -60,26 +61,19 @@ class LeverWidget(QFrame):
         self.update()
 
     def _update_balance(self):
-        # Расчет моментов сил
-        # Момент = Масса * Плечо (упрощенно для визуализации, g сокращаем)
-        moment_sum = 0
-        for w in self.weights:
-            # w.pos_index: слева (-), справа (+)
-            moment_sum += w.mass * w.pos_index
+        # Момент = Масса * Плечо (g сокращаем); w.pos_index: слева (-), справа (+)
+        self.model.weights = tuple((w.mass, w.pos_index) for w in self.weights)
+        self.target_angle = self.model.target_angle()
+        self.wake()
 
-        if moment_sum == 0:
-            self.target_angle = 0.0
-        elif moment_sum > 0:
-            self.target_angle = math.radians(20) # наклон вправо
-        else:
-            self.target_angle = math.radians(-20) # наклон влево
-
-    def animate(self):
+    def animate(self, dt):
         # Простая анимация поворота с затуханием
         diff = self.target_angle - self.angle
         if abs(diff) > 0.001:
-            self.angle += diff * 0.1
+            self.angle += diff * ease(dt, 0.285)
             self.update()
+        else:
+            self.settle()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -261,11 +255,8 @@ class LabLeverApp(QWidget):
 
     def check_answer(self):
         # Рассчитаем реальный баланс
-        moment_sum = 0
-        for w in self.lever.weights:
-            moment_sum += w.mass * w.pos_index
-            
-        is_balanced = (moment_sum == 0)
+        moment_sum = self.lever.model.moment()
+        is_balanced = self.lever.model.true_values()["balanced"]
         
         if is_balanced:
             QMessageBox.information(self, "Результат", "✅ Рычаг в равновесии!\nВы сделали верно.")
@@ -8,24 +8,24 @@ from PySide6.QtWidgets import (
 )
 # Добавлен QPainterPath
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QBrush, QLinearGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
+
+from physlab.core import Animated, ease
+from physlab.models import FrictionModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Стенд трения
 # ==========================================
-class FrictionWidget(QFrame):
+class FrictionWidget(QFrame, Animated):
+    frame_interval = 20
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 350)
         self.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc; border-radius: 8px;")
 
-        # Физика
-        self.g = 9.81
-        self.block_mass = 0.100 
-        self.weight_mass = 0.100 
-        self.weights_count = 0
-        
-        self.mu = 0.3 
+        # Физика: поверхность, грузы на бруске, μ
+        self.model = FrictionModel()
         self.surface_color = QColor(222, 184, 135) 
         
         self.current_force = 0.0
@@ -34,38 +34,32 @@ class FrictionWidget(QFrame):
         self.block_x = 50
         self.is_pulling = False
         self.spring_len = 0 
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
 
     def set_surface(self, index):
+        self.model.surface = index
         if index == 0: 
-            self.mu = 0.3
             self.surface_color = QColor(222, 184, 135) # Дерево
         elif index == 1: 
-            self.mu = 0.15
             self.surface_color = QColor(200, 230, 255) # Пластик
         elif index == 2: 
-            self.mu = 0.6
             self.surface_color = QColor(100, 100, 100) # Наждачка
         self.reset_pos()
 
     def add_weight(self):
-        if self.weights_count < 4:
-            self.weights_count += 1
+        if self.model.weights_count < self.model.max_weights:
+            self.model.weights_count += 1
             self.reset_pos()
 
     def remove_weight(self):
-        if self.weights_count > 0:
-            self.weights_count -= 1
+        if self.model.weights_count > 0:
+            self.model.weights_count -= 1
             self.reset_pos()
 
     def start_pull(self):
         self.is_pulling = True
         # F = mu * N = mu * m * g
-        total_mass = self.block_mass + (self.weights_count * self.weight_mass)
-        self.current_force = self.mu * total_mass * self.g
+        self.current_force = self.model.friction_force()
+        self.wake()
 
     def stop_pull(self):
         self.is_pulling = False
@@ -77,18 +71,20 @@ class FrictionWidget(QFrame):
         self.update()
 
     def get_total_mass_kg(self):
-        return self.block_mass + (self.weights_count * self.weight_mass)
+        return self.model.total_mass()
 
-    def animate(self):
+    def animate(self, dt):
         if self.is_pulling:
-            self.block_x += 2
+            self.block_x += 100 * dt
             if self.block_x > self.width() - 250:
                 self.block_x = 50
             
             target_spring = self.current_force * 20 
-            self.spring_len += (target_spring - self.spring_len) * 0.1
+            self.spring_len += (target_spring - self.spring_len) * ease(dt, 0.19)
         else:
+            # Брусок стоит — кадр с разжатой пружиной и хватит
             self.spring_len = 0
+            self.settle()
             
         self.update()
 
@@ -121,7 +117,7 @@ class FrictionWidget(QFrame):
         weight_w = 30
         weight_h = 20
         start_wx = bx + 10
-        for i in range(self.weights_count):
+        for i in range(self.model.weights_count):
             wx = start_wx + i * (weight_w + 5)
             wy = by - weight_h
             painter.setBrush(QColor(50, 50, 50))
@@ -264,17 +260,13 @@ class LabFrictionApp(QWidget):
             return
 
         real_m = self.stand.get_total_mass_kg()
-        real_f = self.stand.current_force
         
         if not self.stand.is_pulling:
              QMessageBox.warning(self, "Инфо", "Сначала нажмите кнопку 'Тянуть'!")
              return
 
-        real_mu = real_f / (real_m * 9.81)
-
-        ok_m = abs(u_m - real_m) < 0.01
-        ok_f = abs(u_f - real_f) < 0.1
-        ok_mu = abs(u_mu - real_mu) < 0.05
+        verdict = self.stand.model.check({"m": u_m, "F": u_f, "mu": u_mu})
+        ok_m, ok_f, ok_mu = verdict["m"], verdict["F"], verdict["mu"]
 
         if ok_m and ok_f and ok_mu:
             QMessageBox.information(self, "Результат", "✅ ВЕРНО! Коэффициент найден.")
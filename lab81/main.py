@@ -1,81 +1,49 @@
 import sys
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtCore import Qt, QRectF
+
+from physlab.core import Animated
+from physlab.models import MixingModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Калориметр
 # ==========================================
-class CalorimeterWidget(QFrame):
+class CalorimeterWidget(QFrame, Animated):
+    frame_interval = 30
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(400, 500)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.hot_vol = 0
-        self.cold_vol = 0
-        self.current_vol = 0
-        self.target_vol = 0
-        
-        self.hot_temp = 0
-        self.cold_temp = 0
-        self.final_temp = 0
-        self.current_temp = 20 
-        self.target_temp = 20
-        
-        self.is_mixed = False
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
+        # Массы и температуры воды, уровень и показание термометра
+        self.model = MixingModel()
 
-    def set_params(self, m1, t1, m2, t2):
-        self.hot_vol = m1 
-        self.hot_temp = t1
-        self.cold_vol = m2
-        self.cold_temp = t2
-        self.is_mixed = False
-        
-        self.current_vol = 0
-        self.target_vol = 0
-        self.current_temp = 20
-        self.target_temp = 20
+    def new_task(self):
+        self.model.randomize()
         self.update()
 
     def pour_hot(self):
-        self.target_vol = self.hot_vol
-        self.target_temp = self.hot_temp
-        self.is_mixed = False
+        self.model.pour_hot()
+        self.wake()
 
     def pour_cold(self):
-        self.target_vol = self.cold_vol
-        self.target_temp = self.cold_temp
-        self.is_mixed = False
+        self.model.pour_cold()
+        self.wake()
 
     def mix_water(self):
-        if self.hot_vol + self.cold_vol == 0: return
-        self.target_vol = self.hot_vol + self.cold_vol
-        self.final_temp = (self.hot_vol*self.hot_temp + self.cold_vol*self.cold_temp) / self.target_vol
-        self.target_temp = self.final_temp
-        self.is_mixed = True
-
-    def animate(self):
-        diff_v = self.target_vol - self.current_vol
-        if abs(diff_v) > 0.5:
-            self.current_vol += diff_v * 0.1
-        else:
-            self.current_vol = self.target_vol
-            
-        diff_t = self.target_temp - self.current_temp
-        if abs(diff_t) > 0.1:
-            self.current_temp += diff_t * 0.05
-        else:
-            self.current_temp = self.target_temp
-            
+        self.model.mix()
+        self.wake()
+
+    def animate(self, dt):
+        self.model.step(dt)
+        # Уровень и температура установились — дальше картинка не меняется
+        if self.model.is_settled():
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
@@ -100,11 +68,12 @@ class CalorimeterWidget(QFrame):
         
         # 2. Вода
         max_vol = 500 
-        if self.current_vol > 0:
-            level_h = (self.current_vol / max_vol) * (ch - 40)
+        m = self.model
+        if m.volume > 0:
+            level_h = (m.volume / max_vol) * (ch - 40)
             if level_h > ch - 20: level_h = ch - 20
             
-            r = int((self.current_temp / 100.0) * 255)
+            r = int((m.temp / 100.0) * 255)
             b = 255 - r
             water_color = QColor(r, 50, b, 180)
             
@@ -127,7 +96,7 @@ class CalorimeterWidget(QFrame):
         painter.drawRect(th_x, th_y, th_w, th_h)
         painter.drawEllipse(th_x - 5, th_y + th_h - 10, 25, 25) 
         
-        mercury_h = (self.current_temp / 100.0) * (th_h - 20)
+        mercury_h = (self.model.temp / 100.0) * (th_h - 20)
         painter.setBrush(QColor(255, 0, 0))
         painter.setPen(Qt.NoPen)
         painter.drawRect(th_x + 5, th_y + th_h - 10 - mercury_h, 5, mercury_h + 10)
@@ -135,7 +104,7 @@ class CalorimeterWidget(QFrame):
         
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 12, QFont.Bold))
-        painter.drawText(th_x + 30, th_y + th_h - mercury_h, f"{self.current_temp:.1f}°C")
+        painter.drawText(th_x + 30, th_y + th_h - mercury_h, f"{self.model.temp:.1f}°C")
 
 # ==========================================
 # ГЛАВНОЕ ОКНО
@@ -226,19 +195,16 @@ class LabMixApp(QWidget):
         right_panel.addStretch(1)
 
     def new_experiment(self):
-        self.m1 = random.randint(50, 200)
-        self.t1 = random.randint(60, 90)
-        self.m2 = random.randint(50, 200)
-        self.t2 = random.randint(10, 30)
-        
-        self.lbl_hot.setText(f"Горячая вода: m1={self.m1} г, t1={self.t1} °C")
-        self.lbl_cold.setText(f"Холодная вода: m2={self.m2} г, t2={self.t2} °C")
+        self.calorimeter.new_task()
+        m = self.calorimeter.model
         
-        self.calorimeter.set_params(self.m1, self.t1, self.m2, self.t2)
+        self.lbl_hot.setText(f"Горячая вода: m1={m.m1} г, t1={m.t1} °C")
+        self.lbl_cold.setText(f"Холодная вода: m2={m.m2} г, t2={m.t2} °C")
         self.in_temp.clear()
 
     def check_answer(self):
-        if not self.calorimeter.is_mixed:
+        model = self.calorimeter.model
+        if not model.is_mixed:
             QMessageBox.warning(self, "Ошибка", "Сначала смешайте воду!")
             return
             
@@ -248,9 +214,9 @@ class LabMixApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        real_t = self.calorimeter.final_temp
+        real_t = model.true_value()
         
-        if abs(u_t - real_t) < 0.5:
+        if model.check({"value": u_t})["value"]:
             QMessageBox.information(self, "Результат", f"✅ ВЕРНО! T ≈ {real_t:.1f} °C")
         else:
             QMessageBox.warning(self, "Результат", f"❌ ОШИБКА. Правильно: {real_t:.1f} °C")
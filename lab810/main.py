@@ -6,107 +6,90 @@ from PySide6.QtWidgets import (
     QPushButton, QLineEdit, QMessageBox, QFrame, QSlider, QCheckBox, QComboBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPolygonF
-from PySide6.QtCore import Qt, QTimer, QPointF
-
-# --- Вспомогательные функции ---
-def lens_image_distance(f, do):
-    if abs(do) < 1e-9:
-        return None
-    denom = (1.0 / f) - (1.0 / do)
-    if abs(denom) < 1e-12:
-        return float('inf')
-    return 1.0 / denom
-
-def magnification(di, do):
-    if do == 0 or di is None:
-        return None
-    return -di / do
-
-# --- Универсальный аналоговый прибор (в стиле предыдущих работ) ---
-class MeterWidget(QFrame):
-    def __init__(self, kind="M", parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(120, 120)
-        self.kind = kind
-        self.value = 0.0
-        self.max_display = 1.0
-
-    def set_value(self, val, vmax=None):
-        self.value = val if val is not None else 0.0
-        if vmax is not None:
-            self.max_display = max(1e-6, float(vmax))
-        self.update()
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal
 
-    def paintEvent(self, event):
-        p = QPainter(self); p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
-        cx, cy = w//2, h//2
-        R = min(w, h)//2 - 8
-        p.fillRect(self.rect(), QColor(250,250,250))
-        p.setPen(QPen(Qt.black,2)); p.setBrush(QColor(255,255,255))
-        p.drawEllipse(cx - R, cy - R, 2*R, 2*R)
-        p.setPen(QPen(Qt.black,1))
-        for ang in range(-60, 61, 10):
-            r = math.radians(ang)
-            p.drawLine(cx + int((R-8)*math.cos(r)), cy - int((R-8)*math.sin(r)),
-                       cx + int(R*math.cos(r)),       cy - int(R*math.sin(r)))
-        frac = 0.0
-        if self.max_display > 0:
-            frac = max(0.0, min(1.0, abs(self.value) / self.max_display))
-        ang = -60 + frac*120.0
-        r = math.radians(ang)
-        p.setPen(QPen(QColor(200,30,30),2))
-        p.drawLine(cx, cy, cx + int((R-14)*math.cos(r)), cy - int((R-14)*math.sin(r)))
-        p.setPen(QPen(Qt.black,2)); p.setFont(QFont("Sans",12,QFont.Bold))
-        p.drawText(cx-8, cy+6, self.kind)
-        p.setFont(QFont("Sans",9))
-        p.drawText(8, h-10, f"{self.value:.3f}")
+from physlab.core import Animated, MeterWidget
+from physlab.core.rays import RayCache, lens_scene, thin_lenses
+from physlab.models import ThinLensModel
+from physlab.models.optics import REAL_IMAGE, VIRTUAL_IMAGE, lens_image_distance
+from physlab.models.raytrace import EXACT, PARAXIAL
+
+FAN_RAYS = 61                                        # лучей в веере
+EYEPIECE_F = {"microscope": 60.0, "telescope": 50.0} # фокус окуляра, px
+PRINCIPAL_COLORS = (QColor(220,100,40), QColor(40,80,200), QColor(80,160,80))
 
 # --- Виджет линзы с анимацией лучей и перетаскиванием предмета ---
-class LensWidget(QFrame):
+class LensWidget(QFrame, Animated):
+    frame_interval = 30  # ~33 FPS
+    paramsChanged = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(820, 420)
         # параметры (в пикселях для визуализации)
-        self.f = 120.0
-        self.do = 260.0
-        self.h_obj = 90.0
-        # анимация лучей: параметр t от 0..1 для движения точек по лучам
+        self.model = ThinLensModel()
+        # анимация лучей: доля пути от предмета до правого края, которую лучи уже прошли
         self.t = 0.0
-        self.t_dir = 1.0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._animate)
-        self.timer.start(30)  # ~33 FPS
         # перетаскивание предмета
         self.dragging = False
         self.drag_offset = 0
+        # лучи: None — только три основных, PARAXIAL/EXACT — ещё и веер; система — одна линза или две
+        self.ray_mode = None
+        self.system_kind = "single"
+        self._scenes = RayCache(self.build_scene)
         # вычисления
         self.update_image()
 
     def set_params(self, f=None, do=None, h_obj=None):
-        if f is not None: self.f = float(f)
-        if do is not None: self.do = float(do)
-        if h_obj is not None: self.h_obj = float(h_obj)
+        if f is not None: self.model.f = float(f)
+        if do is not None: self.model.do = float(do)
+        if h_obj is not None: self.model.h_obj = float(h_obj)
         self.update_image()
+        self.restart_rays()
         self.update()
 
-    def update_image(self):
-        try:
-            di = lens_image_distance(self.f, self.do)
-        except Exception:
-            di = None
-        self.di = di
-        self.m = magnification(di, self.do) if di is not None else None
+    def set_view(self, ray_mode=None, system_kind="single"):
+        self.ray_mode = ray_mode
+        self.system_kind = system_kind
+        self.restart_rays()
+        self.update()
+
+    def restart_rays(self):
+        # лучи заново «пробегают» от предмета к изображению, потом картинка застывает
+        self.t = 0.0
+        self.wake()
 
-    def _animate(self):
+    def update_image(self):
+        self.di = self.model.image_distance()
+        self.m = self.model.magnification()
+
+    def lenses(self, f, do, kind):
+        """Линзы (x от центра, f): объектив и, для микроскопа и телескопа, окуляр."""
+        if kind == "single":
+            return [(0.0, f)]
+        f2 = EYEPIECE_F[kind]
+        di = lens_image_distance(f, do)
+        if kind == "microscope" and di is not None and 0 < di < 4 * f:
+            # окуляр как лупа: промежуточное изображение чуть ближе его фокуса
+            return [(0.0, f), (di + 0.8 * f2, f2)]
+        return [(0.0, f), (f + f2, f2)]
+
+    def scene(self):
+        key = (self.model.f, self.model.do, self.model.h_obj, self.ray_mode, self.system_kind,
+               self.width() // 2, self.height() // 2)
+        return self._scenes.get(key)
+
+    def build_scene(self, key):
+        f, do, h_obj, ray_mode, kind, cx, baseline = key
+        return lens_scene(self.lenses(f, do, kind), do, h_obj, self.width() - cx, cx, baseline,
+                          mode=ray_mode or PARAXIAL, fan=FAN_RAYS if ray_mode else 0)
+
+    def animate(self, dt):
         # плавное движение параметра t
-        self.t += 0.02 * self.t_dir
+        self.t += 0.667 * dt
         if self.t >= 1.0:
             self.t = 1.0
-            self.t_dir = -1.0
-        elif self.t <= 0.0:
-            self.t = 0.0
-            self.t_dir = 1.0
+            self.settle()
         self.update()
 
     # --- мышь: перетаскивание предмета по оси ---
@@ -114,10 +97,11 @@ class LensWidget(QFrame):
         x = event.position().x()
         y = event.position().y()
         cx = self.width() // 2
-        obj_x = cx - int(self.do)
-        obj_top_y = self.height()//2 - int(self.h_obj)
+        obj_x = cx - int(self.model.do)
+        h_obj = self.scene().h_obj   # в режиме EXACT предмет может быть уменьшен
+        obj_top_y = self.height()//2 - int(h_obj)
         # если клик рядом со стержнем предмета — начинаем перетаскивание
-        if abs(x - obj_x) < 12 and abs(y - (obj_top_y + self.h_obj/2)) < 40:
+        if abs(x - obj_x) < 12 and abs(y - (obj_top_y + h_obj/2)) < 40:
             self.dragging = True
             self.drag_offset = x - obj_x
             self.setCursor(Qt.ClosedHandCursor)
@@ -132,8 +116,9 @@ class LensWidget(QFrame):
         min_x = 40
         max_x = cx - 40
         new_obj_x = max(min_x, min(max_x, new_obj_x))
-        self.do = cx - new_obj_x
+        self.model.do = cx - new_obj_x
         self.update_image()
+        self.paramsChanged.emit()
         self.update()
 
     def mouseReleaseEvent(self, event):
@@ -147,6 +132,8 @@ class LensWidget(QFrame):
         p.fillRect(self.rect(), QColor(250,250,250))
         cx = w // 2
         baseline = h // 2
+        # лучи и изображение посчитаны заранее (кэш по f, d_o, h и режиму)
+        scene = self.scene()
 
         # оптическая ось
         p.setPen(QPen(Qt.black, 1, Qt.DashLine))
@@ -166,24 +153,31 @@ class LensWidget(QFrame):
         p.setFont(QFont("Sans",9))
         p.drawText(cx-10, scale_y-16, "Lens")
 
-        # линза (вертикальная)
+        # линзы: тонкие — вертикальные пластинки, стеклянные (точный расчёт) — по сферам
         lens_w = 14
         p.setPen(QPen(QColor(30,120,200), 2))
         p.setBrush(QColor(200,230,255, 200))
-        p.drawRoundedRect(cx - lens_w//2, baseline - 160, lens_w, 320, 10, 10)
-
-        # фокусы
-        f_px = self.f
-        p.setPen(QPen(QColor(200,30,30), 1, Qt.DashLine))
-        p.drawLine(cx - f_px, baseline - 8, cx - f_px, baseline + 8)
-        p.drawLine(cx + f_px, baseline - 8, cx + f_px, baseline + 8)
-        p.setPen(QPen(Qt.black,1)); p.setFont(QFont("Sans",9))
-        p.drawText(cx - f_px - 18, baseline + 22, "F")
-        p.drawText(cx + f_px - 6, baseline + 22, "F'")
-
-        # предмет (стрелка) — положение зависит от self.do
-        obj_x = cx - int(self.do)
-        obj_top_y = baseline - int(self.h_obj)
+        for lens in thin_lenses(scene.system):
+            lx = cx + lens.x
+            p.drawRoundedRect(QRectF(lx - lens_w/2, baseline - lens.aperture, lens_w, 2*lens.aperture), 10, 10)
+        for outline in scene.outlines:
+            p.drawPolygon(outline)
+
+        # фокусы — посчитанной линзы (у стеклянной чуть дальше f)
+        for k, (front, back) in enumerate(scene.foci):
+            if front is None:
+                continue
+            mark = "" if k == 0 else str(k + 1)
+            p.setPen(QPen(QColor(200,30,30), 1, Qt.DashLine))
+            p.drawLine(QPointF(cx + front, baseline - 8), QPointF(cx + front, baseline + 8))
+            p.drawLine(QPointF(cx + back, baseline - 8), QPointF(cx + back, baseline + 8))
+            p.setPen(QPen(Qt.black,1)); p.setFont(QFont("Sans",9))
+            p.drawText(QPointF(cx + front - 18, baseline + 22), f"F{mark}")
+            p.drawText(QPointF(cx + back - 6, baseline + 22), f"F{mark}'")
+
+        # предмет (стрелка) — положение зависит от self.model.do; высота — та, по которой шли лучи
+        obj_x = cx - int(self.model.do)
+        obj_top_y = baseline - int(round(scene.h_obj))
         p.setPen(QPen(Qt.black,2)); p.setBrush(QColor(60,60,60))
         p.drawLine(obj_x, baseline, obj_x, obj_top_y)
         # наконечник стрелки (треугольник)
@@ -193,105 +187,65 @@ class LensWidget(QFrame):
         p.drawPolygon(tri)
         # подпись расстояния do (как на мензурке)
         p.setFont(QFont("Sans",9))
-        p.drawText(obj_x - 18, scale_y + 6, f"d={int(self.do)} px")
-
-        # вычисления изображения
-        self.update_image()
-        di = self.di
-        img_x = None
-        img_h = None
-        if di is None or math.isinf(di):
-            img_x = None
-        else:
-            img_x = cx + int(di)
-            img_h = int(abs(self.m) * self.h_obj) if self.m is not None else 0
-
-        # изображение: реальное (вниз) или виртуное (вверх)
-        if img_x is not None:
-            if self.di > 0:
-                top_y = baseline + img_h
+        p.drawText(obj_x - 18, scale_y + 6, f"d={int(self.model.do)} px")
+
+        # изображение системы: реальное (за последней линзой) или мнимое
+        img_x = scene.image_x
+        if img_x is not None and math.isfinite(img_x) and scene.magnification is not None:
+            real = img_x > scene.system.elements[-1].x
+            ix = cx + img_x
+            top_y = baseline - scene.magnification * scene.h_obj
+            tip = 18 if top_y > baseline else -18
+            if real:
                 p.setPen(QPen(Qt.darkGreen,2)); p.setBrush(QColor(30,120,30))
-                p.drawLine(img_x, baseline, img_x, top_y)
-                tri2 = QPolygonF([QPointF(img_x, top_y),
-                                  QPointF(img_x - 12, top_y - 18),
-                                  QPointF(img_x + 12, top_y - 18)])
-                p.drawPolygon(tri2)
             else:
-                top_y = baseline - img_h
                 p.setPen(QPen(Qt.darkMagenta,2)); p.setBrush(QColor(150,30,120))
-                p.drawLine(img_x, baseline, img_x, top_y)
-                tri2 = QPolygonF([QPointF(img_x, top_y),
-                                  QPointF(img_x - 12, top_y + 18),
-                                  QPointF(img_x + 12, top_y + 18)])
-                p.drawPolygon(tri2)
+            p.drawLine(QPointF(ix, baseline), QPointF(ix, top_y))
+            p.drawPolygon(QPolygonF([QPointF(ix, top_y),
+                                     QPointF(ix - 12, top_y - tip),
+                                     QPointF(ix + 12, top_y - tip)]))
 
         # --- анимированные лучи ---
-        # три основных луча: параллельный->через фокус, через центр->прямой, через фокус->параллельный
-        # для анимации рисуем движущиеся точки/сегменты вдоль этих линий
-        # луч 1: от вершины предмета параллельно оси к линзе, затем через фокус
-        p.setPen(QPen(QColor(220,100,40), 2))
-        x0, y0 = obj_x, obj_top_y
-        x_mid, y_mid = cx, obj_top_y
-        # сегмент до линзы
-        seg1_x = x0 + (x_mid - x0) * self.t
-        seg1_y = y0
-        p.drawLine(x0, y0, seg1_x, seg1_y)
-        # после линзы: направлен к фокусу (или параллельно для виртуального)
-        if img_x is not None and not math.isinf(di):
-            if self.di > 0:
-                # направляем к (img_x, baseline + img_h)
-                x_after = x_mid + (img_x - x_mid) * self.t
-                y_after = y_mid + (baseline + img_h - y_mid) * self.t
-                p.drawLine(x_mid, y_mid, x_after, y_after)
-            else:
-                # виртуальное: луч выходит из линзы как будто от правого фокуса (пунктир)
-                p.setPen(QPen(QColor(220,100,40), 1, Qt.DashLine))
-                p.drawLine(x_mid, y_mid, cx + f_px, y_mid - ( (cx + f_px) - x_mid ) * ((baseline - y_mid)/(cx + f_px - x_mid + 1e-6)))
-                p.setPen(QPen(QColor(220,100,40), 2))
-        else:
-            p.drawLine(x_mid, y_mid, w, y_mid)
-
-        # луч 2: через центр линзы (прямой)
-        p.setPen(QPen(QColor(40,80,200), 2))
-        # точка движется от предмета к изображению вдоль прямой через центр
-        cx_line = cx + 1
-        # координаты точки на линии
-        if img_x is not None and not math.isinf(di):
-            x_line = x0 + (img_x - x0) * self.t
-            y_line = y0 + ( (baseline + (img_h if self.di>0 else -img_h)) - y0 ) * self.t
-            p.drawLine(x0, y0, x_line, y_line)
-            p.drawLine(x_line, y_line, img_x, baseline + (img_h if self.di>0 else -img_h))
-        else:
-            x_line = x0 + (w - x0) * self.t
-            y_line = y0 + ( (baseline) - y0 ) * self.t
-            p.drawLine(x0, y0, x_line, y_line)
-            p.drawLine(x_line, y_line, w, baseline)
-
-        # луч 3: через фокус слева -> после линзы параллельно
-        p.setPen(QPen(QColor(80,160,80), 2))
-        fx = cx - f_px
-        # точка движется от предмет к фокусу, затем параллельно вправо
-        if self.t < 0.6:
-            t3 = self.t / 0.6
-            x3 = x0 + (fx - x0) * t3
-            y3 = y0 + (baseline - y0) * t3
-            p.drawLine(x0, y0, x3, y3)
-        else:
-            # после прохождения фокуса — параллельный сегмент
-            t3 = (self.t - 0.6) / 0.4
-            x3 = fx + (w - fx) * t3
-            y3 = baseline
-            p.drawLine(fx, baseline, x3, y3)
-            p.drawLine(x0, y0, fx, baseline)
+        # готовые отрезки открываются слева направо: t — доля пути от предмета до края
+        p.save()
+        p.setClipRect(QRectF(0, 0, obj_x + (w - obj_x) * self.t, h))
+        if scene.fan:
+            p.setPen(QPen(QColor(240, 170, 40, 90), 1))
+            p.drawLines(scene.fan)
+        # три основных луча: параллельный -> через фокус, через центр, через фокус -> параллельный
+        for color, lines in zip(PRINCIPAL_COLORS, scene.principal):
+            p.setPen(QPen(color, 2))
+            p.drawLines(lines)
+        if scene.extensions:
+            # мнимое изображение: продолжения лучей назад (пунктир)
+            p.setPen(QPen(QColor(150,30,120), 1, Qt.DashLine))
+            p.drawLines(scene.extensions)
+        p.restore()
 
         # подписи численных значений
         p.setPen(QPen(Qt.black,1)); p.setFont(QFont("Sans",10))
         di_text = "∞" if (self.di is not None and math.isinf(self.di)) else (f"{self.di:.1f}" if self.di is not None else "—")
         m_text = f"{self.m:.3f}" if self.m is not None else "—"
-        p.drawText(12, 18, f"F = {self.f:.1f} px")
-        p.drawText(12, 36, f"d_o = {self.do:.1f} px")
-        p.drawText(12, 54, f"d_i = {di_text} px")
-        p.drawText(12, 72, f"m = {m_text}")
+        p.drawText(12, 18, f"F = {self.model.f:.1f} px")
+        p.drawText(12, 36, f"d_o = {self.model.do:.1f} px")
+        exact = self.ray_mode == EXACT and len(scene.lenses) == 1
+        if exact and img_x is not None and math.isfinite(img_x) and scene.magnification is not None:
+            # стеклянная линза: подписи — по нарисованному изображению, проверка — по тонкой линзе
+            p.drawText(12, 54, f"d_i = {img_x:.1f} px (стеклянная линза)")
+            p.drawText(12, 72, f"m = {scene.magnification:.3f} (стеклянная линза)")
+            p.setPen(QPen(QColor(120,120,120),1))
+            p.drawText(12, 90, f"Проверка — по формуле тонкой линзы: d_i = {di_text} px, m = {m_text}")
+            p.drawText(12, 108, "Лучи от края линзы сходятся ближе изображения — сферическая аберрация")
+            if scene.h_obj < self.model.h_obj:
+                p.drawText(12, 126, f"Предмет уменьшен до {scene.h_obj:.0f} px, чтобы лучи прошли через стекло")
+        else:
+            p.drawText(12, 54, f"d_i = {di_text} px")
+            p.drawText(12, 72, f"m = {m_text}")
+        if len(scene.lenses) > 1:
+            if img_x is None or not math.isfinite(img_x):
+                p.drawText(12, 90, "Система: изображение на бесконечности")
+            else:
+                p.drawText(12, 90, f"Система: изображение x = {img_x:.0f} px, Г = {scene.magnification:.2f}")
 
 # --- Главное приложение (интерфейс и логика проверки) ---
 class LabLensAnimatedApp(QWidget):
@@ -326,7 +280,7 @@ class LabLensAnimatedApp(QWidget):
         right.addWidget(QLabel("Быстрая регулировка d_o"))
         self.slider_d = QSlider(Qt.Horizontal)
         self.slider_d.setRange(40, 600)
-        self.slider_d.setValue(int(self.lens.do))
+        self.slider_d.setValue(int(self.lens.model.do))
         self.slider_d.valueChanged.connect(self.on_slider_d)
         right.addWidget(self.slider_d)
 
@@ -335,6 +289,20 @@ class LabLensAnimatedApp(QWidget):
         self.chk_manual = QCheckBox("Ручной режим (ученик сам записывает показания)")
         right.addWidget(self.chk_manual)
 
+        # ход лучей: основные лучи или веер; точный расчёт — стеклянная линза со сферической аберрацией
+        self.combo_rays = QComboBox()
+        self.combo_rays.addItem("Три основных луча", None)
+        self.combo_rays.addItem("Веер лучей (параксиально, ABCD)", PARAXIAL)
+        self.combo_rays.addItem("Веер лучей (точно, стеклянная линза)", EXACT)
+        self.combo_system = QComboBox()
+        self.combo_system.addItem("Одна линза", "single")
+        self.combo_system.addItem("Микроскоп (окуляр F=60)", "microscope")
+        self.combo_system.addItem("Телескоп (окуляр F=50)", "telescope")
+        self.combo_rays.currentIndexChanged.connect(self.on_view)
+        self.combo_system.currentIndexChanged.connect(self.on_view)
+        right.addWidget(self.combo_rays)
+        right.addWidget(self.combo_system)
+
         right.addSpacing(6)
         right.addWidget(QLabel("<b>Поля ученика (введите свои измерения)</b>"))
         self.input_di_meas = QLineEdit(); self.input_di_meas.setPlaceholderText("d_i (px) — измеренное")
@@ -342,8 +310,8 @@ class LabLensAnimatedApp(QWidget):
         self.combo_type = QComboBox()
         self.combo_type.addItems([
             "Выберите тип изображения",
-            "реальное, перевёрнутое",
-            "виртуальное, прямое"
+            REAL_IMAGE,
+            VIRTUAL_IMAGE
         ])
         right.addWidget(self.input_di_meas)
         right.addWidget(self.input_m_meas)
@@ -383,17 +351,21 @@ class LabLensAnimatedApp(QWidget):
         right.addWidget(self.lbl_feedback)
         right.addStretch(1)
 
+        # прибор (демонстрационный) следует за перетаскиванием предмета
+        self.lens.paramsChanged.connect(self._update_meter)
         self.random_example()
-        # обновление прибора (демонстрационного) по таймеру
-        self.ui_timer = QTimer(self)
-        self.ui_timer.timeout.connect(self._update_meter)
-        self.ui_timer.start(200)
 
     def _update_meter(self):
         # показываем модуль m на приборе (условно)
         m = self.lens.m if self.lens.m is not None and not math.isinf(self.lens.m) else 0.0
         self.meter.set_value(abs(m), vmax=max(0.1, abs(m)*1.5))
 
+    def on_view(self, _=None):
+        self.lens.set_view(self.combo_rays.currentData(), self.combo_system.currentData())
+        if self.combo_system.currentData() != "single":
+            self.lbl_feedback.setText("Две линзы: на схеме — итоговое изображение системы. "
+                                      "Проверка ответа — по первой линзе (d_i, m).")
+
     def on_slider_d(self, val):
         self.input_d.setText(str(val))
         try:
@@ -405,8 +377,8 @@ class LabLensAnimatedApp(QWidget):
 
     def apply_params(self):
         try:
-            F = float(self.input_F.text()) if self.input_F.text().strip() else self.lens.f
-            d = float(self.input_d.text()) if self.input_d.text().strip() else self.lens.do
+            F = float(self.input_F.text()) if self.input_F.text().strip() else self.lens.model.f
+            d = float(self.input_d.text()) if self.input_d.text().strip() else self.lens.model.do
         except Exception:
             QMessageBox.warning(self, "Ошибка", "Введите числовые значения F и d_o.")
             return
@@ -434,25 +406,12 @@ class LabLensAnimatedApp(QWidget):
         noise_m = m * (1 + random.uniform(-0.03, 0.03)) if m is not None else None
         self.input_di_meas.setText(f"{noise_di:.2f}")
         self.input_m_meas.setText(f"{noise_m:.3f}" if noise_m is not None else "")
-        typ = "реальное, перевёрнутое" if di > 0 else "виртуальное, прямое"
-        self.combo_type.setCurrentText(typ)
+        self.combo_type.setCurrentText(self.lens.model.image_type())
         self.lbl_feedback.setText("Поля заполнены имитацией измерений (с небольшой погрешностью).")
         self.update_results()
 
     def classify_case(self):
-        f = self.lens.f
-        do = self.lens.do
-        if do < f:
-            cls = "d < F: виртуальное, прямое, увеличенное"
-        elif abs(do - f) < 1e-6:
-            cls = "d = F: изображение на бесконечности"
-        elif f < do < 2*f:
-            cls = "F < d < 2F: реальное, перевёрнутое, увеличенное"
-        elif abs(do - 2*f) < 1e-6:
-            cls = "d = 2F: реальное, перевёрнутое, равного размера"
-        else:
-            cls = "d > 2F: реальное, перевёрнутое, уменьшенное"
-        return cls
+        return self.lens.model.classify_case()
 
     def update_results(self):
         di = self.lens.di
@@ -462,6 +421,7 @@ class LabLensAnimatedApp(QWidget):
         self.lbl_di.setText(f"d_i = {di_text} px")
         self.lbl_m.setText(f"m = {m_text}")
         self.lbl_type.setText(f"Класс: {self.classify_case()}")
+        self._update_meter()
 
     def check(self):
         # проверка полей ученика: d_i, m и классификация
@@ -472,15 +432,14 @@ class LabLensAnimatedApp(QWidget):
         except Exception:
             QMessageBox.warning(self, "Ошибка", "Введите числовые значения d_i и m и выберите тип изображения.")
             return
-        di_true = self.lens.di
-        m_true = self.lens.m
+        model = self.lens.model
+        true, tols = model.true_values(), model.tolerances()
+        di_true, m_true, typ_true = true["di"], true["m"], true["type"]
         # допуски
-        tol_di = max(0.03 * abs(di_true) if di_true else 1.0, 1.0)
-        tol_m = max(0.05 * abs(m_true) if m_true else 0.05, 0.02)
-        ok_di = (di_true is not None and not math.isinf(di_true) and abs(di_user - di_true) <= tol_di)
-        ok_m = (m_true is not None and abs(m_user - m_true) <= tol_m)
-        typ_true = "реальное, перевёрнутое" if (di_true is not None and di_true > 0) else "виртуальное, прямое"
-        ok_type = (type_user == typ_true)
+        tol_di = tols["di"].limit(di_true or 0.0)
+        tol_m = tols["m"].limit(m_true or 0.0)
+        verdict = model.check({"di": di_user, "m": m_user, "type": type_user})
+        ok_di, ok_m, ok_type = verdict["di"], verdict["m"], verdict["type"]
         lines = []
         if ok_di:
             lines.append("✅ d_i измерено верно.")
@@ -509,14 +468,13 @@ class LabLensAnimatedApp(QWidget):
             return
         self.input_di_meas.setText(f"{di:.2f}")
         self.input_m_meas.setText(f"{m:.3f}")
-        typ = "реальное, перевёрнутое" if di > 0 else "виртуальное, прямое"
-        self.combo_type.setCurrentText(typ)
+        self.combo_type.setCurrentText(self.lens.model.image_type())
         self.lbl_feedback.setText("Показаны правильные значения по модели.")
         self.update_results()
 
     def random_example(self):
-        F = random.choice([80.0, 100.0, 120.0, 140.0])
-        d = random.uniform(0.5*F, 3.0*F)
+        model = self.lens.model.randomize()
+        F, d = model.f, model.do
         self.input_F.setText(f"{F:.1f}")
         self.input_d.setText(f"{d:.1f}")
         self.slider_d.setValue(int(d))
@@ -527,11 +485,12 @@ class LabLensAnimatedApp(QWidget):
 
     def reset_all(self):
         self.input_F.clear(); self.input_d.clear()
-        self.slider_d.setValue(int(self.lens.do))
+        self.slider_d.setValue(int(self.lens.model.do))
         self.lens.set_params(f=120.0, do=260.0)
         self.update_results()
         self.input_di_meas.clear(); self.input_m_meas.clear(); self.combo_type.setCurrentIndex(0)
         self.chk_manual.setChecked(False)
+        self.combo_rays.setCurrentIndex(0); self.combo_system.setCurrentIndex(0)
         self.lbl_feedback.setText("Сброшено.")
 
 if __name__ == "__main__":
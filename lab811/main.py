@@ -1,181 +1,72 @@
 import sys
-import time
-import math
 import random
-import json
-from dataclasses import dataclass, asdict
-from typing import List, Dict
 
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QSlider, QMessageBox, QTabWidget, QGroupBox, QFileDialog
+    QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QFrame,
+    QDoubleSpinBox, QSlider
 )
-from PySide6.QtGui import QPainter, QColor, QFont, QPen, QBrush
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
-
-# --- КОНСТАНТЫ ---
-G = 9.81
-PI = 3.14159
-H_PLANCK = 6.626e-34
-E_CHARGE = 1.602e-19
-C_LIGHT = 3e8
-
-# --- МОДЕЛИ ДАННЫХ ---
-@dataclass
-class Measurement:
-    timestamp: float
-    params: Dict[str, float]  # Входные параметры (I, R, t...)
-    results: Dict[str, float] # Вычисленные моделью значения
-    user_answer: float        # Ответ ученика
-    is_correct: bool
+from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtCore import Qt, QPointF, QRectF
+
+from physlab.core import CATCH_UP_DT, Animated, BaseLabWindow, ParticlePool, TickAccumulator
+from physlab.models import JouleTrainerModel, PhotoTrainerModel, SpringPendulumModel
 
 # --- БАЗОВЫЙ КЛАСС ВИЗУАЛИЗАЦИИ ---
-class BaseVisualWidget(QFrame):
-    def __init__(self):
+class BaseVisualWidget(QFrame, Animated):
+    frame_interval = 30 # 30ms ~ 33 FPS
+
+    def __init__(self, model=None):
         super().__init__()
         self.setMinimumSize(500, 300)
         self.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc;")
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
+        self.model = model  # модель работы (physlab.models), если визуализации нужна физика
         self.t = 0.0  # Время симуляции
 
     def start_animation(self):
-        self.timer.start(30) # 30ms ~ 33 FPS
+        self.wake()
 
     def stop_animation(self):
-        self.timer.stop()
+        self.settle()
 
-    def animate(self):
-        self.t += 0.05
+    def animate(self, dt):
+        self.t += 1.667 * dt
         self.update()
 
-# --- БАЗОВЫЙ КЛАСС ЛАБОРАТОРНОЙ (ШАБЛОН) ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula_html, description):
-        super().__init__()
-        self.setWindowTitle(f"Лабораторная: {title}")
-        self.resize(1200, 800)
-        self.measurements: List[Measurement] = []
-        
-        # Основной Layout
-        main_layout = QHBoxLayout(self)
+# --- ШАБЛОН ТРЕНАЖЁРА (общее окно + кнопка сброса) ---
+class TrainerLabWindow(BaseLabWindow):
+    window_size = (1200, 800)
+    panel_width = 350
+    visual_stretch = 2
+    answer_label = "Ваш результат:"
+    check_text = "Проверить"
+    # Допустимая погрешность 5% — в моделях тренажёра
+    input_error = "Введите число"
+    success_message = "Отличная работа.\nПравильный ответ: {true}"
+    failure_message = "Попробуйте еще раз.\nПравильный ответ: {true}"
 
-        # --- ЛЕВАЯ ПАНЕЛЬ (Управление) ---
-        control_panel = QFrame()
-        control_panel.setFixedWidth(350)
-        self.control_layout = QVBoxLayout(control_panel)
-        
-        # Описание
-        lbl_title = QLabel(f"<h3>{title}</h3>")
-        lbl_formula = QLabel(f"<div style='font-size:14px; color:blue'>{formula_html}</div>")
-        lbl_desc = QLabel(description)
-        lbl_desc.setWordWrap(True)
-        
-        self.control_layout.addWidget(lbl_title)
-        self.control_layout.addWidget(lbl_formula)
-        self.control_layout.addWidget(lbl_desc)
-        self.control_layout.addWidget(QLabel("<hr>"))
-
-        # Место для контролов (добавляются в наследниках)
-        self.inputs_group = QGroupBox("Параметры эксперимента")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        self.control_layout.addWidget(self.inputs_group)
-
-        # Ввод ответа
-        self.control_layout.addWidget(QLabel("<b>Ваш результат:</b>"))
-        self.answer_input = QLineEdit()
-        self.control_layout.addWidget(self.answer_input)
-
-        # Кнопки
-        btn_box = QHBoxLayout()
-        self.btn_check = QPushButton("Проверить")
-        self.btn_check.clicked.connect(self.check_answer)
-        self.btn_check.setStyleSheet("background-color: #d4edda; padding: 8px;")
-        
+    def __init__(self, title, formula_html, description):
+        super().__init__(title, formula_html, description)
         self.btn_reset = QPushButton("Сброс")
         self.btn_reset.clicked.connect(self.reset_lab)
-        
-        btn_box.addWidget(self.btn_check)
-        btn_box.addWidget(self.btn_reset)
-        self.control_layout.addLayout(btn_box)
-        
-        self.control_layout.addStretch() # Пружина вниз
-
-        # --- ПРАВАЯ ПАНЕЛЬ (Визуализация + Таблица) ---
-        right_panel = QWidget()
-        right_layout = QVBoxLayout(right_panel)
-
-        # Визуализация
-        self.visualizer = self.create_visualizer() # Метод должен быть переопределен
-        right_layout.addWidget(self.visualizer, stretch=2)
-
-        # Таблица результатов
-        self.table = QTableWidget(0, 4) # Default columns
-        right_layout.addWidget(self.table, stretch=1)
-
-        main_layout.addWidget(control_panel)
-        main_layout.addWidget(right_panel)
+        self.answer_layout.addWidget(self.btn_reset)
 
         self.setup_inputs() # Метод для наследников
         self.visualizer.start_animation()
 
-    # --- Методы для переопределения ---
     def create_visualizer(self):
         return BaseVisualWidget()
 
-    def setup_inputs(self):
-        pass
-
-    def get_current_params(self):
-        return {}
-
     def calculate_true_value(self, params):
-        return 0.0
-
-    # --- Общая логика ---
-    def check_answer(self):
-        try:
-            user_val = float(self.answer_input.text().replace(',', '.'))
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Введите число")
-            return
+        return self.model.set_params(**params).true_value()
 
-        params = self.get_current_params()
-        true_val = self.calculate_true_value(params)
-        
-        # Допустимая погрешность 5%
-        error = abs(user_val - true_val)
-        is_correct = error <= 0.05 * abs(true_val) if true_val != 0 else error < 0.1
-
-        # Сохранение
-        meas = Measurement(time.time(), params, {"True": true_val}, user_val, is_correct)
-        self.measurements.append(meas)
-        self.update_table(meas)
-
-        if is_correct:
-            QMessageBox.information(self, "Верно!", f"Отличная работа.\nПравильный ответ: {true_val:.2f}")
-        else:
-            QMessageBox.warning(self, "Неверно", f"Попробуйте еще раз.\nПравильный ответ: {true_val:.2f}")
-
-    def update_table(self, m: Measurement):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # Формируем строку: Параметры | Ответ ученика | Эталон | Статус
-        param_str = ", ".join([f"{k}={v:.1f}" for k,v in m.params.items()])
-        
-        self.table.setItem(row, 0, QTableWidgetItem(param_str))
-        self.table.setItem(row, 1, QTableWidgetItem(str(m.user_answer)))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{list(m.results.values())[0]:.2f}"))
-        
-        status = QTableWidgetItem("✅" if m.is_correct else "❌")
-        status.setBackground(QColor("#d4edda") if m.is_correct else QColor("#f8d7da"))
-        self.table.setItem(row, 3, status)
+    def get_true_value(self):
+        return self.calculate_true_value(self.get_current_params())
+
+    def get_params_str(self):
+        return ", ".join([f"{k}={v:.1f}" for k, v in self.get_current_params().items()])
 
     def reset_lab(self):
-        self.measurements.clear()
-        self.table.setRowCount(0)
+        self.reset_results()
         self.answer_input.clear()
 
 # ============================================================================
@@ -183,23 +74,18 @@ class BaseLabWindow(QWidget):
 # ============================================================================
 
 class JouleLenzVisualizer(BaseVisualWidget):
-    def __init__(self):
-        super().__init__()
-        self.I = 0
-        self.R = 0
-        self.heat_color = 0 # 0 - blue, 255 - red
-    
     def update_params(self, I, R):
-        self.I = I
-        self.R = R
+        self.model.set_params(I=I, R=R)
+        self.wake()
 
-    def animate(self):
-        super().animate()
+    def animate(self, dt):
+        super().animate(dt)
         # Имитация нагрева: чем больше ток и сопротивление, тем быстрее краснеет
-        power = self.I**2 * self.R
-        step = power * 0.05
-        self.heat_color = min(255, self.heat_color + step)
-        if self.I == 0: self.heat_color = max(0, self.heat_color - 2) # Остывание
+        prev = self.model.heat_level
+        self.model.step(dt)
+        if self.model.heat_level == prev:
+            # Вода прогрелась до предела (или остыла) — цвет больше не меняется
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
@@ -208,7 +94,8 @@ class JouleLenzVisualizer(BaseVisualWidget):
         
         # Рисуем стакан
         rect = QRectF(200, 100, 150, 180)
-        water_color = QColor(int(self.heat_color), 0, 255 - int(self.heat_color), 150)
+        heat_color = self.model.heat_level * 255 # 0 - blue, 255 - red
+        water_color = QColor(int(heat_color), 0, 255 - int(heat_color), 150)
         p.setBrush(water_color)
         p.setPen(QPen(Qt.black, 3))
         p.drawRect(rect)
@@ -222,7 +109,7 @@ class JouleLenzVisualizer(BaseVisualWidget):
             p.drawLine(QPointF(220, y), QPointF(330, y+15))
         
         # Пузырьки (если горячо)
-        if self.heat_color > 100:
+        if heat_color > 100:
             p.setBrush(Qt.white)
             p.setPen(Qt.NoPen)
             for _ in range(5):
@@ -230,18 +117,20 @@ class JouleLenzVisualizer(BaseVisualWidget):
                 ry = random.randint(120, 260)
                 p.drawEllipse(rx, ry, 5, 5)
 
-class JouleLenzLab(BaseLabWindow):
+class JouleLenzLab(TrainerLabWindow):
+    model_class = JouleTrainerModel
+    table_headers = ["Параметры (I, R, t)", "Ваш Q (Дж)", "Эталон Q", "Статус"]
+    answer_placeholder = "Введите Q (Дж)"
+
     def __init__(self):
         super().__init__(
             "Закон Джоуля–Ленца", 
             "Q = I² · R · t",
             "Рассчитайте количество теплоты, выделившееся в проводнике."
         )
-        self.table.setHorizontalHeaderLabels(["Параметры (I, R, t)", "Ваш Q (Дж)", "Эталон Q", "Статус"])
-        self.answer_input.setPlaceholderText("Введите Q (Дж)")
 
     def create_visualizer(self):
-        return JouleLenzVisualizer()
+        return JouleLenzVisualizer(self.model)
 
     def setup_inputs(self):
         self.spin_I = QDoubleSpinBox(); self.spin_I.setPrefix("I = "); self.spin_I.setSuffix(" А"); self.spin_I.setRange(0, 10)
@@ -262,31 +151,30 @@ class JouleLenzLab(BaseLabWindow):
     def get_current_params(self):
         return {"I": self.spin_I.value(), "R": self.spin_R.value(), "t": self.spin_t.value()}
 
-    def calculate_true_value(self, p):
-        return (p["I"] ** 2) * p["R"] * p["t"]
-
 # ============================================================================
 # ЛАБОРАТОРНАЯ 2: ПРУЖИННЫЙ МАЯТНИК (9 КЛАСС)
 # ============================================================================
 
 class PendulumVisualizer(BaseVisualWidget):
-    def __init__(self):
-        super().__init__()
-        self.mass = 1.0
-        self.k = 10.0
+    max_dt = CATCH_UP_DT  # x(t) известен явно — после подвисания время догоняется
+
+    def __init__(self, model):
+        super().__init__(model)
         self.amplitude = 50.0 # пиксели
 
     def update_params(self, m, k):
-        self.mass = m
-        self.k = k
+        self.model.set_params(m=m, k=k)
+
+    def animate(self, dt):
+        self.model.step(dt)
+        self.update()
 
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
         
         # Расчет смещения y = A * cos(omega * t)
-        omega = math.sqrt(self.k / self.mass) if self.mass > 0 else 0
-        dy = self.amplitude * math.cos(omega * self.t)
+        dy = self.model.displacement(self.amplitude)
         
         center_x = self.width() // 2
         base_y = 50
@@ -312,24 +200,26 @@ class PendulumVisualizer(BaseVisualWidget):
         p.drawLine(prev_pt, QPointF(center_x, current_y))
 
         # Груз
-        radius = 20 + self.mass * 2 # Визуально зависит от массы
+        radius = 20 + self.model.m * 2 # Визуально зависит от массы
         p.setBrush(QColor("#e74c3c"))
         p.drawEllipse(QPointF(center_x, current_y + radius), radius, radius)
         
-        p.drawText(10, 20, f"Время t: {self.t:.1f} с")
+        p.drawText(10, 20, f"Время t: {self.model.time:.1f} с")
+
+class SpringPendulumLab(TrainerLabWindow):
+    model_class = SpringPendulumModel
+    table_headers = ["Параметры (m, k)", "Ваш T (с)", "Эталон T", "Статус"]
+    answer_placeholder = "Введите Период T (с)"
 
-class SpringPendulumLab(BaseLabWindow):
     def __init__(self):
         super().__init__(
             "Пружинный маятник",
             "T = 2π √(m / k)",
             "Определите период колебаний маятника."
         )
-        self.table.setHorizontalHeaderLabels(["Параметры (m, k)", "Ваш T (с)", "Эталон T", "Статус"])
-        self.answer_input.setPlaceholderText("Введите Период T (с)")
 
     def create_visualizer(self):
-        return PendulumVisualizer()
+        return PendulumVisualizer(self.model)
 
     def setup_inputs(self):
         self.spin_m = QDoubleSpinBox(); self.spin_m.setPrefix("m = "); self.spin_m.setSuffix(" кг"); self.spin_m.setRange(0.1, 10); self.spin_m.setValue(1)
@@ -348,9 +238,6 @@ class SpringPendulumLab(BaseLabWindow):
     def get_current_params(self):
         return {"m": self.spin_m.value(), "k": self.spin_k.value()}
 
-    def calculate_true_value(self, p):
-        return 2 * PI * math.sqrt(p["m"] / p["k"])
-
 # ============================================================================
 # ЛАБОРАТОРНАЯ 3: ФОТОЭФФЕКТ (10-11 КЛАСС)
 # ============================================================================
@@ -360,39 +247,47 @@ class PhotoEffectVisualizer(BaseVisualWidget):
         super().__init__()
         self.intensity = 50
         self.voltage = 0.0 # Задерживающее напряжение (отрицательное)
-        self.electrons = [] # List of [x, y, speed_x]
+        self.electrons = ParticlePool()  # x, y, скорость по x
+        self.ticks = TickAccumulator(0.03) # модель электронов — на шаг 30 мс
 
     def update_params(self, intensity, voltage):
         self.intensity = intensity
         self.voltage = voltage # U
+        self.wake()
+
+    def debug_counts(self):
+        return {"электроны": len(self.electrons)}
+
+    def animate(self, dt):
+        n = self.ticks.steps(dt)
+        if n == 0:
+            return
+        for _ in range(n):
+            self.step_electrons()
+        if self.intensity <= 0 and not self.electrons:
+            # Свет выключен, все электроны долетели
+            self.settle()
+        self.update()
 
-    def animate(self):
+    def step_electrons(self):
         # Генерация электронов (вероятность зависит от интенсивности)
         if random.randint(0, 100) < self.intensity:
             # Начальная скорость зависит (условно) от энергии света, 
             # здесь упрощенно считаем что свет фиксированной частоты, 
             # но V0 зависит от задерживающего напряжения
             v_init = 5.0 
-            self.electrons.append([50, random.randint(100, 200), v_init])
+            self.electrons.emit(50, random.randint(100, 200), v_init)
 
         # Движение электронов
-        surviving = []
-        for e in self.electrons:
-            # Ускорение (торможение) a ~ U
-            # Если U < 0 (задерживающее), электроны тормозят
-            acc = self.voltage * 0.1 
-            e[2] += acc # changing speed
-            e[0] += e[2] # changing x position
-
-            # Если скорость стала < 0, электрон летит назад
-            if e[0] < 50: # Вернулся на катод
-                continue 
-            if e[0] > 400: # Долетел до анода
-                continue # Ток пошел
-            
-            surviving.append(e)
-        self.electrons = surviving
-        self.update()
+        # Ускорение (торможение) a ~ U
+        # Если U < 0 (задерживающее), электроны тормозят
+        acc = self.voltage * 0.1 
+        self.electrons.step(ax=acc)
+
+        # Если скорость стала < 0, электрон летит назад и возвращается на катод;
+        # долетевшие до анода дают ток
+        x, _ = self.electrons.positions()
+        self.electrons.remove((x < 50) | (x > 400))
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -414,20 +309,21 @@ class PhotoEffectVisualizer(BaseVisualWidget):
             p.drawLine(0, 100+i*20, 40, 120+i*10)
 
         # Электроны
-        p.setBrush(Qt.cyan)
-        p.setPen(Qt.NoPen)
-        for e in self.electrons:
-            p.drawEllipse(QPointF(e[0], e[1]), 3, 3)
+        p.setPen(QPen(Qt.cyan, 6, Qt.SolidLine, Qt.RoundCap))
+        p.drawPoints(self.electrons.polygon())
+
+class PhotoEffectLab(TrainerLabWindow):
+    model_class = PhotoTrainerModel
+    table_headers = ["ν (Гц), U (В)", "Ваш h (Дж·с)", "Эталон", "Статус"]
+    answer_placeholder = "Введите h (например 6.63e-34)"
+    value_format = "{:.3e}"
 
-class PhotoEffectLab(BaseLabWindow):
     def __init__(self):
         super().__init__(
             "Фотоэффект: Постоянная Планка",
             "h = e·U / ν",
             "Подберите запирающее напряжение U для данной частоты света, чтобы ток стал равен 0. Рассчитайте h."
         )
-        self.table.setHorizontalHeaderLabels(["ν (Гц), U (В)", "Ваш h (Дж·с)", "Эталон", "Статус"])
-        self.answer_input.setPlaceholderText("Введите h (например 6.63e-34)")
 
     def create_visualizer(self):
         return PhotoEffectVisualizer()
@@ -461,25 +357,15 @@ class PhotoEffectLab(BaseLabWindow):
 
     def update_vis(self):
         # Логика: если e*U > Ek_max, электроны не долетают
-        # Ek_max = h*nu - A_out
-        # Пусть Работа выхода A = 2.0 эВ (примерно цезий)
-        A_ev = 2.0
-        A_j = A_ev * E_CHARGE
-        
-        nu = self.spin_freq.value() * 1e14
-        Ek_max = (H_PLANCK * nu) - A_j
+        # Ek_max = h*nu - A_out, работа выхода A = 2.0 эВ (примерно цезий)
+        model = self.model.set_params(nu=self.spin_freq.value(), voltage=self.spin_U.value(),
+                                      intensity=self.slider_intensity.value())
         
         # Если энергия фотона меньше работы выхода - фотоэффекта нет
-        if Ek_max < 0: 
-            intensity_factor = 0 
-        else:
-            intensity_factor = self.slider_intensity.value()
-
-        # Реальное запирающее напряжение (U_stop должно быть отрицательным)
-        # Ek_max = e * |U_stop|
-        U_stop_needed = - (Ek_max / E_CHARGE) 
-        
-        current_U = self.spin_U.value()
+        intensity_factor = model.intensity if model.is_emitting() else 0
+
+        # Реальное запирающее напряжение (U_stop отрицательное): model.stopping_voltage()
+        current_U = model.voltage
         
         # Передаем в визуализатор "эффективное напряжение" для анимации скорости
         # Если current_U < U_stop_needed, электроны остановятся
@@ -493,7 +379,7 @@ class PhotoEffectLab(BaseLabWindow):
         # В реальности студент вводит U, и мы проверяем формулу
         # Но здесь мы знаем входные данные. 
         # Давайте просто вернем константу Планка как эталон
-        return H_PLANCK
+        return self.model.true_value()
 
 # --- ГЛАВНОЕ ОКНО (МЕНЮ) ---
 class MainWindow(QWidget):
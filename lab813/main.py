@@ -1,94 +1,15 @@
 import sys
 import math
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView
+    QApplication, QFrame, QDoubleSpinBox
 )
 # ИСПРАВЛЕНИЕ: Добавлен QPolygon
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPolygon
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPolygon
 # ИСПРАВЛЕНИЕ: Добавлен QPoint
-from PySide6.QtCore import Qt, QTimer, QRectF, QPointF, QPoint
-
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1000, 600)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # Левая панель
-        control_panel = QFrame(); control_panel.setFixedWidth(320)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
-        ctrl_layout.addWidget(formula_lbl)
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Параметры эксперимента")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        ans_box = QGroupBox("Результат"); ans_layout = QVBoxLayout(ans_box)
-        ans_layout.addWidget(QLabel("Введите КПД (%):"))
-        self.answer_input = QLineEdit(); self.answer_input.setPlaceholderText("Например: 75.5")
-        ans_layout.addWidget(self.answer_input)
-        
-        self.btn_check = QPushButton("Проверить ответ")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # Правая панель
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=3)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Параметры (Aп, Aз)", "Ваш ответ (%)", "Эталон (%)", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=1)
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
-
-    def create_visualizer(self): return QFrame()
-    def get_true_value(self): return 0.0
-    def get_params_str(self): return ""
-    def setup_inputs(self): pass
-
-    def check_answer(self):
-        try:
-            val_text = self.answer_input.text().replace(',', '.')
-            if not val_text: raise ValueError
-            user_val = float(val_text)
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Введите числовое значение.")
-            return
-            
-        true_val = self.get_true_value()
-        is_correct = abs(user_val - true_val) <= 2.0
-        
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(self.get_params_str()))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{user_val:.1f}%"))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{true_val:.1f}%"))
-        
-        status_item = QTableWidgetItem("✅ Верно" if is_correct else "❌ Ошибка")
-        status_item.setForeground(QBrush(QColor("green") if is_correct else QColor("red")))
-        self.table.setItem(row, 3, status_item)
-        
-        if is_correct:
-            QMessageBox.information(self, "Успех", "Отлично! КПД рассчитан верно.")
-        else:
-            QMessageBox.warning(self, "Ошибка", f"Неверно. Правильный КПД: {true_val:.1f}%")
+from PySide6.QtCore import Qt, QRectF, QPointF, QPoint
 
+from physlab.core import BaseLabWindow, frame_clock
+from physlab.models import EfficiencyModel
 
 # --- ВИЗУАЛИЗАТОР (БЛОК С ГРУЗОМ) ---
 class BlockVisualizer(QFrame):
@@ -100,9 +21,7 @@ class BlockVisualizer(QFrame):
         self.efficiency = 0.0
         self.t = 0.0
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(40)
+        frame_clock().subscribe(self, self.animate, 40)
 
     def update_params(self, Au, As):
         self.A_useful = Au
@@ -112,8 +31,8 @@ class BlockVisualizer(QFrame):
         else:
             self.efficiency = 0.0
 
-    def animate(self):
-        self.t += 0.1
+    def animate(self, dt):
+        self.t += 2.5 * dt
         self.update()
 
     def paintEvent(self, event):
@@ -203,6 +122,14 @@ class BlockVisualizer(QFrame):
 
 # --- ГЛАВНЫЙ КЛАСС ЛАБОРАТОРНОЙ ---
 class EfficiencyLab(BaseLabWindow):
+    answer_label = "Введите КПД (%):"
+    answer_placeholder = "Например: 75.5"
+    table_headers = ["Параметры (Aп, Aз)", "Ваш ответ (%)", "Эталон (%)", "Статус"]
+    model_class = EfficiencyModel
+    value_format = "{:.1f}%"
+    success_message = "Отлично! КПД рассчитан верно."
+    failure_message = "Неверно. Правильный КПД: {true}"
+
     def __init__(self):
         super().__init__(
             title="8 Класс: Определение КПД",
@@ -234,14 +161,9 @@ class EfficiencyLab(BaseLabWindow):
     def update_simulation(self):
         Au = self.spin_Au.value()
         As = self.spin_As.value()
+        self.model.set_params(A_useful=Au, A_spent=As)
         self.visualizer.update_params(Au, As)
 
-    def get_true_value(self):
-        Au = self.spin_Au.value()
-        As = self.spin_As.value()
-        if As == 0: return 0.0
-        return (Au / As) * 100.0
-
     def get_params_str(self):
         return f"Aп={self.spin_Au.value()}Дж, Aз={self.spin_As.value()}Дж"
 
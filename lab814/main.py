@@ -1,94 +1,13 @@
 import sys
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView, QComboBox, QSlider
+    QApplication, QLabel, QFrame, QComboBox, QSlider
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QLinearGradient
 from PySide6.QtCore import Qt, QTimer, QRectF
 
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1000, 600)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # Левая панель
-        control_panel = QFrame(); control_panel.setFixedWidth(320)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
-        ctrl_layout.addWidget(formula_lbl)
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Параметры проводника")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        ans_box = QGroupBox("Результат")
-        ans_layout = QVBoxLayout(ans_box)
-        ans_layout.addWidget(QLabel("Рассчитайте сопротивление R (Ом):"))
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Например: 0.55")
-        ans_layout.addWidget(self.answer_input)
-        
-        self.btn_check = QPushButton("Проверить ответ")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # Правая панель
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=3)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Параметры (Mat, L, S)", "Ваш R (Ом)", "Эталон (Ом)", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=1)
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
-
-    def create_visualizer(self): return QFrame()
-    def get_true_value(self): return 0.0
-    def get_params_str(self): return ""
-    def setup_inputs(self): pass
-
-    def check_answer(self):
-        try:
-            val_text = self.answer_input.text().replace(',', '.')
-            if not val_text: raise ValueError
-            user_val = float(val_text)
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Введите числовое значение.")
-            return
-            
-        true_val = self.get_true_value()
-        # Допуск 5%
-        is_correct = abs(user_val - true_val) <= (0.05 * true_val if true_val != 0 else 0.01)
-        
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(self.get_params_str()))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{user_val:.3f}"))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{true_val:.3f}"))
-        
-        status_item = QTableWidgetItem("✅ Верно" if is_correct else "❌ Ошибка")
-        status_item.setForeground(QBrush(QColor("green") if is_correct else QColor("red")))
-        self.table.setItem(row, 3, status_item)
-        
-        if is_correct:
-            QMessageBox.information(self, "Успех", "Верно! Вы освоили зависимость R от размеров.")
-        else:
-            QMessageBox.warning(self, "Ошибка", f"Неверно.\nПравильный ответ: {true_val:.4f} Ом")
-
+from physlab.core import BaseLabWindow
+from physlab.models import WireResistanceModel
+from physlab.models.electricity import WIRE_RESISTIVITY
 
 # --- ВИЗУАЛИЗАТОР ПРОВОДНИКА ---
 class WireVisualizer(QFrame):
@@ -161,6 +80,15 @@ class WireVisualizer(QFrame):
 
 # --- ЛОГИКА ЛАБОРАТОРНОЙ ---
 class ResistanceLab(BaseLabWindow):
+    inputs_title = "Параметры проводника"
+    answer_label = "Рассчитайте сопротивление R (Ом):"
+    answer_placeholder = "Например: 0.55"
+    table_headers = ["Параметры (Mat, L, S)", "Ваш R (Ом)", "Эталон (Ом)", "Статус"]
+    model_class = WireResistanceModel
+    value_format = "{:.3f}"
+    unit = "Ом"
+    success_message = "Верно! Вы освоили зависимость R от размеров."
+
     def __init__(self):
         super().__init__(
             title="8 Класс: Сопротивление проводника",
@@ -174,13 +102,17 @@ class ResistanceLab(BaseLabWindow):
                 "Выберите материал, настройте размеры и рассчитайте R."
             )
         )
-        # Данные материалов: rho в Ом*мм^2/м
+        # Данные материалов: rho в Ом*мм^2/м (из модели) и цвет провода
+        colors = {
+            "Медь": QColor("#B87333"),
+            "Алюминий": QColor("#D3D3D3"),
+            "Железо": QColor("#434B4D"),
+            "Нихром": QColor("#A0A0A0"),
+            "Серебро": QColor("#E0E0E0"),
+        }
         self.materials = {
-            "Медь": {"rho": 0.017, "color": QColor("#B87333"), "name": "Медь"},
-            "Алюминий": {"rho": 0.028, "color": QColor("#D3D3D3"), "name": "Алюминий"},
-            "Железо": {"rho": 0.10, "color": QColor("#434B4D"), "name": "Железо"},
-            "Нихром": {"rho": 1.10, "color": QColor("#A0A0A0"), "name": "Нихром"},
-            "Серебро": {"rho": 0.016, "color": QColor("#E0E0E0"), "name": "Серебро"}
+            name: {"rho": rho, "color": colors[name], "name": name}
+            for name, rho in WIRE_RESISTIVITY.items()
         }
         self.setup_inputs()
 
@@ -236,17 +168,9 @@ class ResistanceLab(BaseLabWindow):
         L = self.slider_L.value() / 10.0
         S = self.slider_S.value() / 10.0
         
+        self.model.set_params(material=mat_name, L=L, S=S)
         self.visualizer.update_params(L, S, self.materials[mat_name])
 
-    def get_true_value(self):
-        mat_name = self.combo_mat.currentText()
-        rho = self.materials[mat_name]["rho"]
-        L = self.slider_L.value() / 10.0
-        S = self.slider_S.value() / 10.0
-        
-        # R = rho * L / S
-        return rho * L / S
-
     def get_params_str(self):
         mat = self.combo_mat.currentText()
         L = self.slider_L.value() / 10.0
@@ -1,112 +1,20 @@
 import sys
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView, QCheckBox
+    QApplication, QHBoxLayout, QFrame, QDoubleSpinBox, QCheckBox, QTabWidget
 )
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPolygon
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPolygon
 from PySide6.QtCore import Qt, QTimer, QPoint
 
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1000, 600)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # Левая панель
-        control_panel = QFrame(); control_panel.setFixedWidth(320)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
-        ctrl_layout.addWidget(formula_lbl)
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Управление цепью")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        ans_box = QGroupBox("Результат")
-        ans_layout = QVBoxLayout(ans_box)
-        ans_layout.addWidget(QLabel("Общее сопротивление R (Ом):"))
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Например: 5.0")
-        ans_layout.addWidget(self.answer_input)
-        
-        self.btn_check = QPushButton("Проверить ответ")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # Правая панель
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=3)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["R1, R2, R3 (Ом)", "Ваш R (Ом)", "Эталон (Ом)", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=1)
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
-
-    def create_visualizer(self): return QFrame()
-    def get_true_value(self): return 0.0
-    def get_params_str(self): return ""
-    def setup_inputs(self): pass
-
-    def check_answer(self):
-        try:
-            val_text = self.answer_input.text().replace(',', '.')
-            if not val_text: raise ValueError
-            user_val = float(val_text)
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Введите числовое значение.")
-            return
-            
-        true_val = self.get_true_value()
-        # Допуск 5%
-        is_correct = abs(user_val - true_val) <= (0.05 * true_val if true_val != 0 else 0.1)
-        
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(self.get_params_str()))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{user_val:.2f}"))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{true_val:.2f}"))
-        
-        status_item = QTableWidgetItem("✅ Верно" if is_correct else "❌ Ошибка")
-        status_item.setForeground(QBrush(QColor("green") if is_correct else QColor("red")))
-        self.table.setItem(row, 3, status_item)
-        
-        if is_correct:
-            QMessageBox.information(self, "Успех", "Расчет выполнен верно!")
-        else:
-            QMessageBox.warning(self, "Ошибка", f"Неверно.\nПравильный ответ: {true_val:.2f} Ом")
-
+from physlab.core import BaseLabWindow, SchematicPanel
+from physlab.models import ParallelModel, Schematic
 
 # --- ВИЗУАЛИЗАТОР СХЕМЫ ---
 class CircuitVisualizer(QFrame):
-    def __init__(self):
+    def __init__(self, model):
         super().__init__()
         self.setStyleSheet("background-color: white; border: 1px solid #aaa;")
-        # Список резисторов: {'enabled': bool, 'R': float}
-        self.resistors = [
-            {'enabled': True, 'R': 10.0},
-            {'enabled': True, 'R': 20.0},
-            {'enabled': False, 'R': 30.0}
-        ]
-        self.voltage = 12.0 # Фиксированное напряжение для наглядности тока
-
-    def update_resistor(self, index, enabled, resistance):
-        self.resistors[index]['enabled'] = enabled
-        self.resistors[index]['R'] = resistance
-        self.update()
+        # Ветви (включена, R) и фиксированное напряжение — в модели
+        self.model = model
 
     def draw_resistor(self, p, x, y, r_val, label):
         # Рисуем резистор (прямоугольник)
@@ -121,7 +29,7 @@ class CircuitVisualizer(QFrame):
         p.drawText(int(x - rect_w/2), int(y - 15), f"{label} = {r_val} Ом")
         
         # Ток в ветви
-        i_branch = self.voltage / r_val
+        i_branch = self.model.U / r_val
         p.setPen(QColor("blue"))
         p.drawText(int(x - rect_w/2), int(y + 25), f"I = {i_branch:.2f} A")
 
@@ -160,19 +68,18 @@ class CircuitVisualizer(QFrame):
         # Распределяем 3 ветви равномерно
         branch_spacing = schema_w / 4
         
-        total_current = 0.0
+        total_current = self.model.total_current()
         
-        for i, res in enumerate(self.resistors):
+        for i, (enabled, R) in enumerate(self.model.branches):
             bx = start_x + branch_spacing * (i + 1)
             
             # Провод сверху до резистора
             p.setPen(QPen(Qt.black, 2))
             
-            if res['enabled']:
+            if enabled:
                 p.drawLine(bx, top_wire_y, bx, bot_wire_y)
                 # Рисуем резистор поверх линии
-                self.draw_resistor(p, bx, cy, res['R'], f"R{i+1}")
-                total_current += self.voltage / res['R']
+                self.draw_resistor(p, bx, cy, R, f"R{i+1}")
                 
                 # Точки соединения
                 p.setBrush(Qt.black)
@@ -199,8 +106,32 @@ class CircuitVisualizer(QFrame):
         p.drawText(int(start_x), int(top_wire_y) - 20, f"I общ = {total_current:.2f} A")
 
 
+def starter_schematic():
+    """Заготовка для конструктора: источник, амперметр и две параллельные ветви с ключами."""
+    sch = Schematic()
+    sch.add_part("source", 4, 4, rot=1)             # «+» сверху
+    sch.add_part("ammeter", 4, 4)
+    sch.add_wire((7, 4), (28, 4))
+    for x, R in ((12, 10.0), (20, 20.0)):
+        sch.add_part("switch", x, 4, rot=1)
+        sch.add_part("resistor", x, 7, rot=1, value=R)
+        sch.add_wire((x, 10), (x, 13))
+    sch.add_part("voltmeter", 28, 4, rot=1)
+    sch.add_wire((28, 7), (28, 13))
+    sch.add_wire((4, 7), (4, 13))
+    sch.add_wire((4, 13), (28, 13))
+    return sch
+
+
 # --- ГЛАВНЫЙ КЛАСС ЛАБОРАТОРНОЙ ---
 class ParallelLab(BaseLabWindow):
+    inputs_title = "Управление цепью"
+    answer_label = "Общее сопротивление R (Ом):"
+    answer_placeholder = "Например: 5.0"
+    table_headers = ["R1, R2, R3 (Ом)", "Ваш R (Ом)", "Эталон (Ом)", "Статус"]
+    unit = "Ом"
+    model_class = ParallelModel
+
     def __init__(self):
         super().__init__(
             title="8 Класс: Параллельное соединение",
@@ -214,7 +145,14 @@ class ParallelLab(BaseLabWindow):
         self.setup_inputs()
 
     def create_visualizer(self):
-        return CircuitVisualizer()
+        # Схема работы и конструктор, где ученик собирает свою цепь
+        tabs = QTabWidget()
+        self.circuit_view = CircuitVisualizer(self.model)
+        self.constructor = SchematicPanel(starter_schematic())
+        tabs.addTab(self.circuit_view, "Схема работы")
+        tabs.addTab(self.constructor, "Конструктор")
+        self.constructor.editor.refresh()
+        return tabs
 
     def setup_inputs(self):
         # R1
@@ -246,29 +184,13 @@ class ParallelLab(BaseLabWindow):
         self.update_simulation()
 
     def update_simulation(self):
-        # Обновляем состояние визуализатора
-        self.visualizer.update_resistor(0, self.chk_r1.isChecked(), self.spin_r1.value())
-        self.visualizer.update_resistor(1, self.chk_r2.isChecked(), self.spin_r2.value())
-        self.visualizer.update_resistor(2, self.chk_r3.isChecked(), self.spin_r3.value())
-
-    def get_true_value(self):
-        conductance = 0.0
-        active_count = 0
-        
-        if self.chk_r1.isChecked():
-            conductance += 1.0 / self.spin_r1.value()
-            active_count += 1
-        if self.chk_r2.isChecked():
-            conductance += 1.0 / self.spin_r2.value()
-            active_count += 1
-        if self.chk_r3.isChecked():
-            conductance += 1.0 / self.spin_r3.value()
-            active_count += 1
-            
-        if active_count == 0 or conductance == 0:
-            return 0.0 # Цепь разомкнута (бесконечность, но для проверки вернем 0 или обработаем отдельно)
-            
-        return 1.0 / conductance
+        # Обновляем состояние модели и визуализатора
+        self.model.branches = (
+            (self.chk_r1.isChecked(), self.spin_r1.value()),
+            (self.chk_r2.isChecked(), self.spin_r2.value()),
+            (self.chk_r3.isChecked(), self.spin_r3.value()),
+        )
+        self.circuit_view.update()
 
     def get_params_str(self):
         s = []
@@ -1,79 +1,48 @@
 import sys
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QRectF, QPointF
+from PySide6.QtCore import Qt, QRectF, QPointF
+
+from physlab.core import Animated
+from physlab.models import SpecificHeatModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Калориметр + Цилиндр
 # ==========================================
-class CalorimeterWidget(QFrame):
+class CalorimeterWidget(QFrame, Animated):
+    frame_interval = 30
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(400, 500)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.m1 = 100 
-        self.t1 = 20  
-        self.m2 = 100 
-        self.t2 = 90  
-        self.c1 = 4.2 
-        self.c2 = 0.9 
-        
-        self.final_temp = 0
-        self.current_temp = 20
-        
-        self.is_submerged = False
-        self.cyl_y = 50 
+        # Вода, цилиндр, показание термометра и положение цилиндра
+        self.model = SpecificHeatModel()
         self.water_level = 0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(30)
 
-    def set_params(self, m1, t1, m2, t2, c2_real):
-        self.m1 = m1
-        self.t1 = t1
-        self.m2 = m2
-        self.t2 = t2
-        self.c2 = c2_real
-        
-        self.is_submerged = False
-        self.current_temp = t1
-        self.cyl_y = 50
+    def new_task(self):
+        self.model.randomize()
         self.update()
 
     def submerge(self):
-        if self.is_submerged: return
-        
-        numerator = self.c1 * self.m1 * self.t1 + self.c2 * self.m2 * self.t2
-        denominator = self.c1 * self.m1 + self.c2 * self.m2
-        self.final_temp = numerator / denominator
-        
-        self.is_submerged = True
-
-    def animate(self):
-        target_y = 50
-        if self.is_submerged:
-            target_y = 350 
-            
-            diff_t = self.final_temp - self.current_temp
-            if abs(diff_t) > 0.1:
-                self.current_temp += diff_t * 0.05
-            else:
-                self.current_temp = self.final_temp
-        
-        diff_y = target_y - self.cyl_y
-        if abs(diff_y) > 1:
-            self.cyl_y += diff_y * 0.1
-            
+        if self.model.is_submerged: return
+        self.model.submerge()
+        self.wake()
+
+    def animate(self, dt):
+        self.model.step(dt)
+        if self.model.is_settled():
+            # Цилиндр опущен и тепловое равновесие наступило
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
+        m = self.model
         painter.setRenderHint(QPainter.Antialiasing)
         w, h = self.width(), self.height()
         cx = w // 2
@@ -91,17 +60,17 @@ class CalorimeterWidget(QFrame):
         painter.drawRect(cx - cw//2, cy + 10, cw, ch - 20)
         
         # 2. Вода
-        base_water_h = (self.m1 / 500) * (ch - 40)
+        base_water_h = (m.m1 / 500) * (ch - 40)
         if base_water_h < 50: base_water_h = 50
         
         water_rise = 0
-        if self.cyl_y > cy + ch - base_water_h: 
-            water_rise = (self.m2 / 500) * 20 
+        if m.cyl_y > cy + ch - base_water_h: 
+            water_rise = (m.m2 / 500) * 20 
             
         current_water_h = base_water_h + water_rise
         if current_water_h > ch - 20: current_water_h = ch - 20
         
-        temp_ratio = (self.current_temp - 20) / 80 
+        temp_ratio = (m.temp - 20) / 80 
         if temp_ratio > 1: temp_ratio = 1
         if temp_ratio < 0: temp_ratio = 0
         
@@ -124,13 +93,13 @@ class CalorimeterWidget(QFrame):
         cyl_x = cx - cyl_w//2
         
         painter.setPen(QPen(Qt.black, 1))
-        painter.drawLine(cx, 0, cx, int(self.cyl_y))
+        painter.drawLine(cx, 0, cx, int(m.cyl_y))
         
         cyl_temp_ratio = 0
-        if self.is_submerged:
+        if m.is_submerged:
             cyl_temp_ratio = temp_ratio
         else:
-            cyl_temp_ratio = (self.t2 - 20) / 80
+            cyl_temp_ratio = (m.t2 - 20) / 80
             
         cr = int(100 + 155 * cyl_temp_ratio)
         cb = int(100 - 100 * cyl_temp_ratio)
@@ -138,7 +107,7 @@ class CalorimeterWidget(QFrame):
         
         painter.setBrush(cyl_color)
         painter.setPen(QPen(Qt.black, 1))
-        painter.drawRect(int(cyl_x), int(self.cyl_y), cyl_w, cyl_h)
+        painter.drawRect(int(cyl_x), int(m.cyl_y), cyl_w, cyl_h)
         
         # 4. Термометр
         th_x = cx + 80
@@ -150,7 +119,7 @@ class CalorimeterWidget(QFrame):
         painter.drawRect(th_x, th_y, th_w, th_h)
         painter.drawEllipse(th_x - 4, th_y + th_h - 8, 20, 20)
         
-        merc_h = (self.current_temp / 100) * (th_h - 20)
+        merc_h = (m.temp / 100) * (th_h - 20)
         painter.setBrush(QColor(200, 0, 0))
         painter.setPen(Qt.NoPen)
         painter.drawRect(th_x + 3, th_y + th_h - 10 - merc_h, 6, merc_h + 10)
@@ -158,7 +127,7 @@ class CalorimeterWidget(QFrame):
         
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 12, QFont.Bold))
-        painter.drawText(th_x + 25, th_y + th_h - merc_h, f"{self.current_temp:.1f}°C")
+        painter.drawText(th_x + 25, th_y + th_h - merc_h, f"{m.temp:.1f}°C")
 
 # ==========================================
 # ГЛАВНОЕ ОКНО
@@ -169,14 +138,6 @@ class LabSpecificHeatApp(QWidget):
         self.setWindowTitle("Лабораторная работа №11: Удельная теплоемкость")
         self.resize(1000, 650)
         
-        self.materials = {
-            "Алюминий": 0.92,
-            "Медь": 0.38,
-            "Железо": 0.46,
-            "Латунь": 0.38
-        }
-        self.current_c2 = 0
-        
         self.setup_ui()
         self.new_experiment()
 
@@ -248,24 +209,16 @@ class LabSpecificHeatApp(QWidget):
         right_panel.addStretch(1)
 
     def new_experiment(self):
-        self.m1 = random.randint(100, 200) 
-        self.t1 = random.randint(15, 25)
-        
-        self.m2 = random.randint(50, 150) 
-        self.t2 = random.randint(80, 95)
-        
-        name, c2 = random.choice(list(self.materials.items()))
-        self.current_c2 = c2
-        self.current_material = name
-        
-        self.lbl_water.setText(f"Вода (c1=4.2): m1={self.m1} г, t1={self.t1} °C")
-        self.lbl_cyl.setText(f"Цилиндр: m2={self.m2} г, t2={self.t2} °C")
+        self.calorimeter.new_task()
+        m = self.calorimeter.model
         
-        self.calorimeter.set_params(self.m1, self.t1, self.m2, self.t2, c2)
+        self.lbl_water.setText(f"Вода (c1=4.2): m1={m.m1} г, t1={m.t1} °C")
+        self.lbl_cyl.setText(f"Цилиндр: m2={m.m2} г, t2={m.t2} °C")
         self.in_c2.clear()
 
     def check_answer(self):
-        if not self.calorimeter.is_submerged:
+        model = self.calorimeter.model
+        if not model.is_submerged:
             QMessageBox.warning(self, "Ошибка", "Сначала опустите цилиндр!")
             return
             
@@ -275,10 +228,10 @@ class LabSpecificHeatApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        if abs(u_c2 - self.current_c2) < 0.1:
-            QMessageBox.information(self, "Результат", f"✅ ВЕРНО! Это {self.current_material} (c2={self.current_c2})")
+        if model.check({"value": u_c2})["value"]:
+            QMessageBox.information(self, "Результат", f"✅ ВЕРНО! Это {model.material} (c2={model.c2})")
         else:
-            QMessageBox.warning(self, "Результат", f"❌ ОШИБКА. Правильно: {self.current_c2}")
+            QMessageBox.warning(self, "Результат", f"❌ ОШИБКА. Правильно: {model.c2}")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,6 +1,6 @@
 # lab_current_series_improved.py
 # Требуется: pip install PySide6
-import sys, random, math
+import sys, math
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame
@@ -8,6 +8,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
 from PySide6.QtCore import Qt
 
+from physlab.models import SeriesCircuitModel
+
 class CircuitWidget(QFrame):
     """
     Красивый замкнутый контур с батареей, последовательными лампами (резисторами)
@@ -16,20 +18,17 @@ class CircuitWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(640, 360)
-        self.U = 12.0
-        self.resistors = [10.0, 10.0]  # Ом
+        self.model = SeriesCircuitModel()  # U и сопротивления в Ом
         self.I = None
         self.update_current()
 
     def set_params(self, U, resistors):
-        self.U = float(U)
-        self.resistors = [float(r) for r in resistors]
+        self.model.set_params(U=float(U), resistors=tuple(float(r) for r in resistors))
         self.update_current()
         self.update()
 
     def update_current(self):
-        R_total = sum(self.resistors) if self.resistors else 0.0
-        self.I = (self.U / R_total) if R_total > 1e-9 else None
+        self.I = self.model.current()
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -56,7 +55,7 @@ class CircuitWidget(QFrame):
         # --- последовательные лампы / резисторы ---
         x = left_x + 90
         lamp_gap = 110
-        for i, R in enumerate(self.resistors):
+        for i, R in enumerate(self.model.resistors):
             # провод до элемента
             p.setPen(QPen(Qt.black, 2))
             p.drawLine(x, mid_y, x + 30, mid_y)
@@ -99,8 +98,8 @@ class CircuitWidget(QFrame):
         # стрелка амперметра: угол пропорционален тока
         if self.I is not None:
             # определим Imax для визуальной шкалы (приблизительно)
-            R_total = sum(self.resistors)
-            Imax = max(0.1, self.U / max(1.0, R_total * 0.6))
+            R_total = sum(self.model.resistors)
+            Imax = max(0.1, self.model.U / max(1.0, R_total * 0.6))
             frac = min(1.0, self.I / Imax)
             angle = -60 + frac * 120.0
             rad = math.radians(angle)
@@ -136,7 +135,7 @@ class CircuitWidget(QFrame):
         p.drawLine(left_x + 2, mid_y + 6, left_x + 10, mid_y + 6)
         # декоративные подписи
         p.setFont(QFont("Sans", 9))
-        p.drawText(12, mid_y - 40, f"U = {self.U:.1f} В")
+        p.drawText(12, mid_y - 40, f"U = {self.model.U:.1f} В")
 
 class LabCurrentImprovedApp(QWidget):
     def __init__(self):
@@ -210,9 +209,10 @@ class LabCurrentImprovedApp(QWidget):
         except Exception:
             QMessageBox.warning(self, "Ошибка", "Введите числовое значение I.")
             return
+        model = self.circuit.model
         I_true = self.circuit.I
-        tol = max(0.05 * abs(I_true), 0.005)
-        if abs(I_user - I_true) <= tol:
+        tol = model.tolerance.limit(I_true)
+        if model.check({"value": I_user})["value"]:
             self.lbl_result.setText("✅ Ответ верный.")
         else:
             self.lbl_result.setText(f"❌ Неверно. Правильное I = {I_true:.3f} A (допуск ±{tol:.3f}).")
@@ -225,12 +225,11 @@ class LabCurrentImprovedApp(QWidget):
         self.lbl_result.setText("Показан правильный ответ.")
 
     def random_experiment(self):
-        U = random.randint(6, 18)
-        n = random.choice([2, 3])
-        Rs = [random.randint(5, 30) for _ in range(n)]
-        self.input_U.setText(str(U))
-        self.input_Rs.setText(",".join(str(r) for r in Rs))
-        self.circuit.set_params(U, Rs)
+        m = self.circuit.model.randomize()
+        self.input_U.setText(str(m.U))
+        self.input_Rs.setText(",".join(str(r) for r in m.resistors))
+        self.circuit.update_current()
+        self.circuit.update()
         self.input_I.clear()
         self.lbl_result.setText("Сгенерирован новый эксперимент.")
 
@@ -1,5 +1,5 @@
 # lab_rheostat.py
-import sys, math, random
+import sys, math
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QSlider
@@ -7,6 +7,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
 from PySide6.QtCore import Qt
 
+from physlab.models import RheostatModel
+
 class CircuitWidget(QFrame):
     """
     Батарея — реостат — амперметр. Замкнутая схема. Красивый аналоговый амперметр.
@@ -14,26 +16,23 @@ class CircuitWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(560, 340)
-        self.U = 12.0         # В
-        self.R_fixed = 10.0   # Ом (постоянный резистор/лампа)
-        self.R_rheo = 20.0    # Ом (реостат)
-        self.I = self.compute_current()
+        # U в В, Rфикс (постоянный резистор/лампа) и R реостата в Ом
+        self.model = RheostatModel()
+
+    # Ток считается при чтении: ползунок лишь меняет модель, а update()
+    # сливает движения за кадр в одну перерисовку и один пересчёт цепи
+    @property
+    def I(self):
+        return self.model.current()
 
     def set_params(self, U, R_fixed):
-        self.U = float(U)
-        self.R_fixed = max(0.0, float(R_fixed))
-        self.I = self.compute_current()
+        self.model.set_params(U=float(U), R_fixed=max(0.0, float(R_fixed)))
         self.update()
 
     def set_rheo(self, R_rheo):
-        self.R_rheo = max(0.0, float(R_rheo))
-        self.I = self.compute_current()
+        self.model.R_rheo = max(0.0, float(R_rheo))
         self.update()
 
-    def compute_current(self):
-        R_total = self.R_fixed + self.R_rheo
-        return (self.U / R_total) if R_total > 0 else 0.0
-
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
@@ -60,13 +59,13 @@ class CircuitWidget(QFrame):
         p.drawRoundedRect(base_x+40, mid_y-18, 80, 36, 6, 6)
         # ползунок (позиция визуально пропорциональна R_rheo)
         # нормируем R_rheo к [0, 1] относительно 0..100 Ом визуально
-        norm = max(0.0, min(1.0, self.R_rheo / 100.0))
+        norm = max(0.0, min(1.0, self.model.R_rheo / 100.0))
         knob_x = int(base_x+46 + norm * 68)
         p.setBrush(QColor(80,120,180))
         p.drawRoundedRect(knob_x-6, mid_y-22, 12, 44, 3, 3)
         p.setFont(QFont("Sans",9))
         p.drawText(base_x+42, mid_y-24, "Реостат")
-        p.drawText(base_x+42, mid_y+32, f"R={self.R_rheo:.1f} Ω")
+        p.drawText(base_x+42, mid_y+32, f"R={self.model.R_rheo:.1f} Ω")
 
         # провод к амперметру
         p.setPen(QPen(Qt.black,2))
@@ -87,7 +86,7 @@ class CircuitWidget(QFrame):
             y0 = ay - 18*math.sin(rad)
             p.drawLine(x0, y0, x1, y1)
         # стрелка: масштабируем ток к углу [-60..60] при диапазоне 0..Imax
-        Imax = max(0.1, self.U / max(1.0, self.R_fixed + 1.0))  # приблизительная шкала
+        Imax = max(0.1, self.model.U / max(1.0, self.model.R_fixed + 1.0))  # приблизительная шкала
         angle = -60 + max(0.0, min(120.0, (self.I / Imax) * 120.0))
         rad = math.radians(angle)
         p.setPen(QPen(Qt.red,2))
@@ -107,7 +106,7 @@ class CircuitWidget(QFrame):
 
         # подпись фикс. резистора
         p.setFont(QFont("Sans",10))
-        p.drawText(40, mid_y-50, f"U={self.U:.1f} В, Rфикс={self.R_fixed:.1f} Ω")
+        p.drawText(40, mid_y-50, f"U={self.model.U:.1f} В, Rфикс={self.model.R_fixed:.1f} Ω")
 
 class LabRheostatApp(QWidget):
     def __init__(self):
@@ -187,9 +186,10 @@ class LabRheostatApp(QWidget):
         except Exception:
             QMessageBox.warning(self, "Ошибка", "Введите числовое значение I.")
             return
+        model = self.circuit.model
         I_true = self.circuit.I
-        tol = max(0.05 * I_true, 0.01)
-        if abs(I_user - I_true) <= tol:
+        tol = model.tolerance.limit(I_true)
+        if model.check({"value": I_user})["value"]:
             self.lbl_result.setText("✅ I рассчитано верно.")
         else:
             self.lbl_result.setText(f"❌ Неверно. Правильное I ≈ {I_true:.3f} А (допуск ±{tol:.3f}).")
@@ -199,14 +199,11 @@ class LabRheostatApp(QWidget):
         self.lbl_result.setText("Показано правильное I при текущем R.")
 
     def random_experiment(self):
-        U = random.randint(6, 18)
-        Rf = random.randint(5, 30)
-        Rr = random.randint(5, 80)
-        self.input_U.setText(str(U))
-        self.input_Rfixed.setText(str(Rf))
-        self.slider.setValue(Rr)
-        self.circuit.set_params(U, Rf)
-        self.circuit.set_rheo(Rr)
+        m = self.circuit.model.randomize()
+        self.input_U.setText(str(m.U))
+        self.input_Rfixed.setText(str(m.R_fixed))
+        self.slider.setValue(m.R_rheo)
+        self.circuit.set_rheo(m.R_rheo)
         self.input_I.clear()
         self.lbl_result.setText("Сгенерирован новый эксперимент.")
 
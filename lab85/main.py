@@ -1,6 +1,6 @@
 # lab_resistance.py
 # Требуется: pip install PySide6
-import sys, random, math
+import sys
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QSlider
@@ -8,63 +8,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
 from PySide6.QtCore import Qt
 
-class MeterWidget(QFrame):
-    """Универсальный аналоговый прибор (A или V) с шкалой и стрелкой."""
-    def __init__(self, kind="A", parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(120, 120)
-        self.kind = kind  # "A" или "V"
-        self.value = 0.0
-        self.max_display = 1.0
-
-    def set_value(self, val, vmax=None):
-        self.value = val if val is not None else 0.0
-        if vmax is not None:
-            self.max_display = max(1e-6, float(vmax))
-        self.update()
-
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
-        cx, cy = w//2, h//2
-        radius = min(w, h)//2 - 8
-
-        p.fillRect(self.rect(), QColor(250,250,250))
-        p.setPen(QPen(Qt.black, 2))
-        p.setBrush(QColor(255,255,255))
-        p.drawEllipse(cx - radius, cy - radius, 2*radius, 2*radius)
-
-        # шкала делений
-        p.setPen(QPen(Qt.black, 1))
-        for angle in range(-60, 61, 10):
-            rad = math.radians(angle)
-            x0 = cx + int((radius-8) * math.cos(rad))
-            y0 = cy - int((radius-8) * math.sin(rad))
-            x1 = cx + int(radius * math.cos(rad))
-            y1 = cy - int(radius * math.sin(rad))
-            p.drawLine(x0, y0, x1, y1)
-
-        # стрелка (угол пропорционален value/max_display)
-        frac = 0.0
-        if self.max_display > 0:
-            frac = max(0.0, min(1.0, self.value / self.max_display))
-        angle = -60 + frac * 120.0
-        rad = math.radians(angle)
-        p.setPen(QPen(QColor(200,30,30), 2))
-        x_end = cx + int((radius-14) * math.cos(rad))
-        y_end = cy - int((radius-14) * math.sin(rad))
-        p.drawLine(cx, cy, x_end, y_end)
-
-        # подпись и цифровое значение
-        p.setPen(QPen(Qt.black, 2))
-        p.setFont(QFont("Sans", 12, QFont.Bold))
-        p.drawText(cx-10, cy+6, self.kind)
-        p.setFont(QFont("Sans", 9))
-        if self.kind == "A":
-            p.drawText(8, h-10, f"{self.value:.3f} A / {self.max_display:.3f}")
-        else:
-            p.drawText(8, h-10, f"{self.value:.2f} V / {self.max_display:.2f}")
+from physlab.core import MeterWidget
+from physlab.models import VoltAmmeterModel
 
 class CircuitWidget(QFrame):
     """Замкнутая схема: батарея, образец (резистор), амперметр и вольтметр."""
@@ -72,27 +17,19 @@ class CircuitWidget(QFrame):
         super().__init__(parent)
         self.setMinimumSize(640, 360)
         # параметры цепи
-        self.U_source = 5.0
-        self.R_sample = 10.0  # Ом (эталон/истинное)
-        self.R_internal = 1.0  # внутреннее сопротивление проводов/источника
+        # Uист, R образца (эталон/истинное) и внутреннее сопротивление проводов/источника
+        self.model = VoltAmmeterModel()
         self.I = None
         self.U_sample = None
 
     def set_params(self, U_source, R_sample, R_internal=1.0):
-        self.U_source = float(U_source)
-        self.R_sample = float(R_sample)
-        self.R_internal = float(R_internal)
+        self.model.set_params(U_source=float(U_source), R_sample=float(R_sample), R_internal=float(R_internal))
         self._recalc()
         self.update()
 
     def _recalc(self):
-        R_total = self.R_sample + self.R_internal
-        if R_total <= 1e-9:
-            self.I = None
-            self.U_sample = None
-        else:
-            self.I = self.U_source / R_total
-            self.U_sample = self.I * self.R_sample
+        self.I = self.model.current()
+        self.U_sample = self.model.sample_voltage()
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -121,7 +58,7 @@ class CircuitWidget(QFrame):
         p.setBrush(QColor(180,180,80))
         p.drawRect(sample_cx - 30, mid_y - 18, 60, 36)
         p.setFont(QFont("Sans", 10))
-        p.drawText(sample_cx - 22, mid_y + 4, f"R_s={self.R_sample:.1f}Ω")
+        p.drawText(sample_cx - 22, mid_y + 4, f"R_s={self.model.R_sample:.1f}Ω")
         x = sample_cx + 30
 
         # провод к амперметру (верхняя ветвь)
@@ -168,7 +105,7 @@ class CircuitWidget(QFrame):
 
         # подписи источника
         p.setFont(QFont("Sans", 10))
-        p.drawText(12, mid_y - 40, f"Uист = {self.U_source:.2f} В")
+        p.drawText(12, mid_y - 40, f"Uист = {self.model.U_source:.2f} В")
 
 class LabResistanceApp(QWidget):
     def __init__(self):
@@ -256,8 +193,8 @@ class LabResistanceApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите числовые значения U и R_образца (и опционально R_внутр).")
             return
         self.circuit.set_params(U, Rs, Rint)
-        self.ammeter.set_value(self.circuit.I if self.circuit.I is not None else 0.0, vmax=max(0.1, (self.circuit.U_source / max(1.0, Rs+Rint))))
-        self.voltmeter.set_value(self.circuit.U_sample if self.circuit.U_sample is not None else 0.0, vmax=max(0.1, self.circuit.U_source))
+        self.ammeter.set_value(self.circuit.I if self.circuit.I is not None else 0.0, vmax=max(0.1, (self.circuit.model.U_source / max(1.0, Rs+Rint))))
+        self.voltmeter.set_value(self.circuit.U_sample if self.circuit.U_sample is not None else 0.0, vmax=max(0.1, self.circuit.model.U_source))
         self.lbl_result.setText("Цепь собрана. Нажмите «Измерить», чтобы увидеть показания приборов.")
 
     def measure(self):
@@ -267,8 +204,8 @@ class LabResistanceApp(QWidget):
         # показать показания приборов и заполнить поля измерений (имитация)
         I_meas = self.circuit.I
         U_meas = self.circuit.U_sample
-        self.ammeter.set_value(I_meas, vmax=max(0.1, (self.circuit.U_source / max(1.0, self.circuit.R_sample + self.circuit.R_internal))))
-        self.voltmeter.set_value(U_meas, vmax=max(0.1, self.circuit.U_source))
+        self.ammeter.set_value(I_meas, vmax=max(0.1, (self.circuit.model.U_source / max(1.0, self.circuit.model.R_sample + self.circuit.model.R_internal))))
+        self.voltmeter.set_value(U_meas, vmax=max(0.1, self.circuit.model.U_source))
         # заполняем поля измерений (в реальном опыте ученик записывает сам; здесь — имитация)
         self.input_Umeas.setText(f"{U_meas:.3f}")
         self.input_Imeas.setText(f"{I_meas:.3f}")
@@ -286,10 +223,9 @@ class LabResistanceApp(QWidget):
             QMessageBox.information(self, "Инфо", "Ток слишком мал для корректного расчёта R.")
             return
         R_calc = U / I
-        R_true = self.circuit.R_sample
+        R_true = self.circuit.model.R_sample
         tol = max(0.03 * R_true, 0.05)  # 3% или минимум 0.05 Ом
-        ok = abs(R_user - R_calc) <= max(0.02 * R_calc, 0.01) and abs(R_calc - R_true) <= tol
-        if ok:
+        if self.circuit.model.check({"U": U, "I": I, "R": R_user})["R"]:
             self.lbl_result.setText("✅ R рассчитано верно и близко к эталону.")
         else:
             self.lbl_result.setText(f"❌ Неверно. R_расчёт = {R_calc:.3f} Ω; эталон R = {R_true:.3f} Ω (допуск ±{tol:.3f}).")
@@ -307,16 +243,15 @@ class LabResistanceApp(QWidget):
         self.lbl_result.setText("Показаны правильные измерения и расчёт R.")
 
     def random_experiment(self):
-        U = random.choice([3.0, 4.5, 6.0, 9.0, 12.0])
-        R_sample = random.uniform(2.0, 50.0)
-        R_int = random.uniform(0.5, 3.0)
+        m = self.circuit.model.randomize()
+        U, R_sample, R_int = m.U_source, m.R_sample, m.R_internal
         self.input_U.setText(f"{U:.1f}")
         self.input_Rs.setText(f"{R_sample:.2f}")
         self.input_Rint.setText(f"{R_int:.2f}")
         self.circuit.set_params(U, R_sample, R_int)
         # обновим приборы визуально
-        self.ammeter.set_value(self.circuit.I if self.circuit.I is not None else 0.0, vmax=max(0.1, (self.circuit.U_source / max(1.0, R_sample+R_int))))
-        self.voltmeter.set_value(self.circuit.U_sample if self.circuit.U_sample is not None else 0.0, vmax=max(0.1, self.circuit.U_source))
+        self.ammeter.set_value(self.circuit.I if self.circuit.I is not None else 0.0, vmax=max(0.1, (self.circuit.model.U_source / max(1.0, R_sample+R_int))))
+        self.voltmeter.set_value(self.circuit.U_sample if self.circuit.U_sample is not None else 0.0, vmax=max(0.1, self.circuit.model.U_source))
         self.input_Umeas.clear(); self.input_Imeas.clear(); self.input_Ruser.clear()
         self.lbl_result.setText("Случайный эксперимент сгенерирован.")
 
@@ -1,69 +1,15 @@
 # lab_power_lamp.py
 # Требуется: pip install PySide6
 import sys
-import math
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QSlider
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
 
-# Универсальный аналоговый прибор
-class MeterWidget(QFrame):
-    def __init__(self, kind="A", parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(120, 120)
-        self.kind = kind
-        self.value = 0.0
-        self.max_display = 1.0
-
-    def set_value(self, val, vmax=None):
-        self.value = val if val is not None else 0.0
-        if vmax is not None:
-            self.max_display = max(1e-6, float(vmax))
-        self.update()
-
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
-        cx, cy = w // 2, h // 2
-        radius = min(w, h) // 2 - 8
-
-        p.fillRect(self.rect(), QColor(250, 250, 250))
-        p.setPen(QPen(Qt.black, 2))
-        p.setBrush(QColor(255, 255, 255))
-        p.drawEllipse(cx - radius, cy - radius, 2 * radius, 2 * radius)
-
-        p.setPen(QPen(Qt.black, 1))
-        for angle in range(-60, 61, 10):
-            rad = math.radians(angle)
-            x0 = cx + int((radius - 8) * math.cos(rad))
-            y0 = cy - int((radius - 8) * math.sin(rad))
-            x1 = cx + int(radius * math.cos(rad))
-            y1 = cy - int(radius * math.sin(rad))
-            p.drawLine(x0, y0, x1, y1)
-
-        frac = 0.0
-        if self.max_display > 0:
-            frac = max(0.0, min(1.0, self.value / self.max_display))
-        angle = -60 + frac * 120.0
-        rad = math.radians(angle)
-        p.setPen(QPen(QColor(200, 30, 30), 2))
-        x_end = cx + int((radius - 14) * math.cos(rad))
-        y_end = cy - int((radius - 14) * math.sin(rad))
-        p.drawLine(cx, cy, x_end, y_end)
-
-        p.setPen(QPen(Qt.black, 2))
-        p.setFont(QFont("Sans", 12, QFont.Bold))
-        p.drawText(cx - 8, cy + 6, self.kind)
-        p.setFont(QFont("Sans", 9))
-        if self.kind == "A":
-            p.drawText(8, h - 10, f"{self.value:.3f} A / {self.max_display:.3f}")
-        else:
-            p.drawText(8, h - 10, f"{self.value:.2f} V / {self.max_display:.2f}")
+from physlab.core import MeterWidget, frame_clock
+from physlab.models import LampPowerModel
 
 # Визуальная лампа с яркостью по мощности
 class LampWidget(QFrame):
@@ -112,40 +58,33 @@ class CircuitWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(640, 240)
-        self.U = 6.0
-        self.R_lamp = 10.0
-        self.R_internal = 1.0
+        # Uист, R лампы и внутреннее; время модели — секундомер
+        self.model = LampPowerModel()
         self.I = None
         self.P = None
         self._recalc()
 
     def set_params(self, U, R_lamp, R_internal=1.0):
-        self.U = float(U)
-        self.R_lamp = float(R_lamp)
-        self.R_internal = float(R_internal)
+        self.model.set_params(U=float(U), R_lamp=float(R_lamp), R_internal=float(R_internal))
         self._recalc()
         self.update()
 
     def set_U(self, U):
-        self.U = float(U)
+        self.model.U = float(U)
         self._recalc()
         self.update()
 
     def set_Rlamp(self, R):
-        self.R_lamp = float(R)
+        self.model.R_lamp = float(R)
         self._recalc()
         self.update()
 
     def _recalc(self):
-        R_total = self.R_lamp + self.R_internal
-        if R_total <= 1e-9:
-            self.I = None
-            self.P = None
-        else:
-            self.I = self.U / R_total
-            self.P = self.U * self.I  # мощность источника, мощность на лампе близка к I^2 * R_lamp
-            # мощность на лампе
-            self.P_lamp = (self.I ** 2) * self.R_lamp
+        self.I = self.model.current()
+        # мощность источника, мощность на лампе близка к I^2 * R_lamp
+        self.P = self.model.U * self.I if self.I is not None else None
+        # мощность на лампе
+        self.P_lamp = self.model.lamp_power()
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -175,7 +114,7 @@ class CircuitWidget(QFrame):
         p.drawEllipse(lamp_cx - 28, mid_y - 28, 56, 56)
         p.setPen(QPen(Qt.black, 1))
         p.setFont(QFont("Sans", 9))
-        p.drawText(lamp_cx - 22, mid_y + 40, f"R={self.R_lamp:.1f}Ω")
+        p.drawText(lamp_cx - 22, mid_y + 40, f"R={self.model.R_lamp:.1f}Ω")
 
         # провод к амперметру
         p.setPen(QPen(Qt.black, 2))
@@ -204,7 +143,7 @@ class CircuitWidget(QFrame):
 
         # подписи
         p.setFont(QFont("Sans", 10))
-        p.drawText(12, mid_y - 40, f"Uист = {self.U:.2f} В")
+        p.drawText(12, mid_y - 40, f"Uист = {self.model.U:.2f} В")
         if hasattr(self, "P_lamp"):
             p.drawText(12, mid_y - 24, f"P лампы = {self.P_lamp:.3f} Вт")
 
@@ -300,12 +239,7 @@ class LabPowerApp(QWidget):
         right.addWidget(self.lbl_result)
         right.addStretch(1)
 
-        # таймер для секундомера
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._tick)
-        self.elapsed = 0.0
-        self.running = False
-
+        # секундомер (время модели) тикает от общих часов, пока запущен
         # стартовые значения
         self.random_experiment()
 
@@ -320,43 +254,39 @@ class LabPowerApp(QWidget):
         self.circuit.set_params(U, R, Rint)
         # обновить приборы
         self.ammeter.set_value(self.circuit.I if self.circuit.I is not None else 0.0,
-                               vmax=max(0.1, self.circuit.U / max(1.0, R + Rint)))
-        self.voltmeter.set_value(self.circuit.P_lamp if hasattr(self.circuit, "P_lamp") else 0.0,
-                                 vmax=max(0.1, self.circuit.U))
-        # лампа яркость по мощности на лампе
-        P_lamp = getattr(self.circuit, "P_lamp", 0.0)
-        # нормируем яркость по разумному максимум
-        b = min(1.0, P_lamp / max(0.1, self.circuit.U * self.circuit.I if self.circuit.I else 0.1))
-        self.lamp.set_brightness(b)
+                               vmax=max(0.1, self.circuit.model.U / max(1.0, R + Rint)))
+        self.voltmeter.set_value(self.circuit.P_lamp,
+                                 vmax=max(0.1, self.circuit.model.U))
+        # лампа яркость по мощности на лампе, нормированной по разумному максимуму
+        self.lamp.set_brightness(self.circuit.model.brightness())
         self.lbl_result.setText("Параметры применены. Нажмите Запустить для измерения времени.")
 
     def start(self):
         if self.circuit.I is None:
             QMessageBox.information(self, "Инфо", "Сначала задайте параметры и соберите цепь.")
             return
-        if not self.running:
-            self.timer.start(100)  # 0.1 с шаг
-            self.running = True
+        if not self.circuit.model.running:
+            frame_clock().subscribe(self, self._tick, 100)  # 0.1 с шаг
+            self.circuit.model.running = True
             self.lbl_result.setText("Таймер запущен.")
 
     def stop(self):
-        if self.running:
-            self.timer.stop()
-            self.running = False
+        if self.circuit.model.running:
+            frame_clock().unsubscribe(self._tick)
+            self.circuit.model.running = False
             self.lbl_result.setText("Таймер остановлен.")
 
     def reset_timer(self):
-        self.elapsed = 0.0
+        self.circuit.model.time = 0.0
         self.lbl_time.setText("t = 0.00 с")
         self.lbl_result.setText("Таймер сброшен.")
 
-    def _tick(self):
-        self.elapsed += 0.1
-        self.lbl_time.setText(f"t = {self.elapsed:.2f} с")
+    def _tick(self, dt):
+        model = self.circuit.model
+        model.step(dt)
+        self.lbl_time.setText(f"t = {model.time:.2f} с")
         # обновляем лампу яркость динамически если нужно
-        P_lamp = getattr(self.circuit, "P_lamp", 0.0)
-        b = min(1.0, P_lamp / max(0.1, self.circuit.U * self.circuit.I if self.circuit.I else 0.1))
-        self.lamp.set_brightness(b)
+        self.lamp.set_brightness(model.brightness())
 
     def measure(self):
         if self.circuit.I is None:
@@ -364,10 +294,10 @@ class LabPowerApp(QWidget):
             return
         # имитируем показания приборов
         I_meas = self.circuit.I
-        U_meas = self.circuit.U
-        P_lamp = getattr(self.circuit, "P_lamp", 0.0)
-        self.ammeter.set_value(I_meas, vmax=max(0.1, self.circuit.U / max(1.0, self.circuit.R_lamp + self.circuit.R_internal)))
-        self.voltmeter.set_value(U_meas, vmax=max(0.1, self.circuit.U))
+        U_meas = self.circuit.model.U
+        P_lamp = self.circuit.P_lamp
+        self.ammeter.set_value(I_meas, vmax=max(0.1, self.circuit.model.U / max(1.0, self.circuit.model.R_lamp + self.circuit.model.R_internal)))
+        self.voltmeter.set_value(U_meas, vmax=max(0.1, self.circuit.model.U))
         QMessageBox.information(self, "Измерение", f"Показания: I = {I_meas:.3f} A, U = {U_meas:.2f} V\nP лампы = {P_lamp:.3f} W")
         # не заполняем поля P и A автоматически — ученик должен рассчитать
         self.lbl_result.setText("Приборы показали значения. Рассчитайте P и A и введите их.")
@@ -383,13 +313,12 @@ class LabPowerApp(QWidget):
             QMessageBox.information(self, "Инфо", "Сначала соберите цепь и измерьте приборы.")
             return
         # истинные значения
-        P_true = getattr(self.circuit, "P_lamp", None)
-        t = self.elapsed
-        A_true = P_true * t if P_true is not None else None
-        tol_P = max(0.03 * abs(P_true) if P_true else 0.01, 0.01)
-        tol_A = max(0.03 * abs(A_true) if A_true else 0.05, 0.05)
-        okP = abs(P_user - P_true) <= tol_P
-        okA = abs(A_user - A_true) <= tol_A
+        model = self.circuit.model
+        true, tols = model.true_values(), model.tolerances()
+        P_true, A_true = true["P"], true["A"]
+        tol_P, tol_A = tols["P"].limit(P_true), tols["A"].limit(A_true)
+        verdict = model.check({"P": P_user, "A": A_user})
+        okP, okA = verdict["P"], verdict["A"]
         lines = []
         if okP:
             lines.append("✅ P рассчитана верно.")
@@ -405,25 +334,24 @@ class LabPowerApp(QWidget):
         if self.circuit.I is None:
             QMessageBox.information(self, "Инфо", "Сначала соберите цепь.")
             return
-        P_true = getattr(self.circuit, "P_lamp", 0.0)
-        A_true = P_true * self.elapsed
+        true = self.circuit.model.true_values()
+        P_true, A_true = true["P"], true["A"]
         self.input_P.setText(f"{P_true:.3f}")
         self.input_A.setText(f"{A_true:.3f}")
         self.lbl_result.setText("Показаны правильные значения P и A.")
 
     def random_experiment(self):
-        U = random.choice([3.0, 4.5, 6.0, 9.0, 12.0])
-        Rlamp = random.uniform(2.0, 40.0)
-        Rint = random.uniform(0.5, 3.0)
+        self.stop()
+        m = self.circuit.model.randomize()
+        U, Rlamp, Rint = m.U, m.R_lamp, m.R_internal
         self.input_U.setText(f"{U:.1f}")
         self.input_R.setText(f"{Rlamp:.2f}")
         self.input_Rint.setText(f"{Rint:.2f}")
         self.circuit.set_params(U, Rlamp, Rint)
         self.ammeter.set_value(self.circuit.I if self.circuit.I is not None else 0.0,
-                               vmax=max(0.1, self.circuit.U / max(1.0, Rlamp + Rint)))
-        self.voltmeter.set_value(self.circuit.U, vmax=max(0.1, self.circuit.U))
-        self.lamp.set_brightness(min(1.0, getattr(self.circuit, "P_lamp", 0.0) / max(0.1, self.circuit.U * (self.circuit.I or 0.1))))
-        self.elapsed = 0.0
+                               vmax=max(0.1, self.circuit.model.U / max(1.0, Rlamp + Rint)))
+        self.voltmeter.set_value(self.circuit.model.U, vmax=max(0.1, self.circuit.model.U))
+        self.lamp.set_brightness(self.circuit.model.brightness())
         self.lbl_time.setText("t = 0.00 с")
         self.input_P.clear(); self.input_A.clear()
         self.lbl_result.setText("Случайный эксперимент сгенерирован.")
@@ -435,7 +363,7 @@ class LabPowerApp(QWidget):
         self.ammeter.set_value(0.0, vmax=1.0)
         self.voltmeter.set_value(0.0, vmax=5.0)
         self.lamp.set_brightness(0.0)
-        self.elapsed = 0.0
+        self.circuit.model.time = 0.0
         self.lbl_time.setText("t = 0.00 с")
         self.lbl_result.setText("Сброшено.")
 
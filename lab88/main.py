@@ -1,53 +1,41 @@
 import sys
-import math
 import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QSlider, QCheckBox, QSpinBox, QGroupBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import Animated
+from physlab.models import ElectromagnetModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Электромагнит и Компас
 # ==========================================
-class ElectromagnetWidget(QFrame):
+class ElectromagnetWidget(QFrame, Animated):
+    frame_interval = 20
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 400)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.I = 0.0        
-        self.N = 50         
-        self.has_core = False 
-        
-        self.current_angle = 0.0
-        self.target_angle = 0.0
-        self.mag_field_strength = 0.0 
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
+        # Ток, витки, сердечник и угол стрелки компаса
+        self.model = ElectromagnetModel()
 
     def set_params(self, I, N, has_core):
-        self.I = I
-        self.N = N
-        self.has_core = has_core
-        self.calc_physics()
+        self.model.set_params(I=I, N=N, has_core=has_core)
         self.update()
+        self.wake()
 
-    def calc_physics(self):
-        mu = 5.0 if self.has_core else 1.0 
-        B = mu * self.N * self.I
-        
-        self.mag_field_strength = min(1.0, B / 1000.0) 
-        self.target_angle = 90 * math.tanh(B / 500.0)
-
-    def animate(self):
-        diff = self.target_angle - self.current_angle
-        if abs(diff) > 0.1:
-            self.current_angle += diff * 0.1
+    def animate(self, dt):
+        if not self.model.is_settled():
+            self.model.step(dt)
             self.update()
+        else:
+            # Стрелка компаса остановилась
+            self.settle()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -62,7 +50,7 @@ class ElectromagnetWidget(QFrame):
         coil_h = 60
         
         # Сердечник
-        if self.has_core:
+        if self.model.has_core:
             painter.setBrush(QColor(100, 100, 100)) 
             painter.setPen(Qt.NoPen)
             painter.drawRect(coil_x - 10, coil_y - 20, coil_w + 20, 40)
@@ -71,7 +59,7 @@ class ElectromagnetWidget(QFrame):
         painter.setPen(QPen(QColor(184, 115, 51), 3)) 
         painter.setBrush(Qt.NoBrush)
         
-        turns = min(20, self.N // 5) 
+        turns = min(20, self.model.N // 5) 
         step = coil_w / turns
         
         for i in range(turns):
@@ -84,8 +72,9 @@ class ElectromagnetWidget(QFrame):
         painter.drawLine(coil_x + coil_w, coil_y + 30, coil_x + coil_w, h - 20)
         
         # Магнитное поле
-        if self.mag_field_strength > 0.01:
-            alpha = int(self.mag_field_strength * 200)
+        field = self.model.field_strength()
+        if field > 0.01:
+            alpha = int(field * 200)
             painter.setPen(QPen(QColor(0, 0, 255, alpha), 1, Qt.DashLine))
             painter.setBrush(Qt.NoBrush)
             for i in range(1, 4):
@@ -109,7 +98,7 @@ class ElectromagnetWidget(QFrame):
         # Стрелка
         painter.save()
         painter.translate(comp_x, comp_y)
-        painter.rotate(self.current_angle)
+        painter.rotate(self.model.angle)
         
         painter.setBrush(QColor(255, 0, 0))
         painter.setPen(Qt.NoPen)
@@ -127,7 +116,7 @@ class ElectromagnetWidget(QFrame):
         
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 10, QFont.Bold))
-        painter.drawText(comp_x - 20, comp_y + 70, f"{self.current_angle:.1f}°")
+        painter.drawText(comp_x - 20, comp_y + 70, f"{self.model.angle:.1f}°")
 
 # ==========================================
 # ГЛАВНОЕ ОКНО
@@ -226,8 +215,8 @@ class LabElectromagnetApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Введите число!")
             return
             
-        real_ang = self.magnet.current_angle
-        if abs(ang - real_ang) < 2.0:
+        real_ang = self.magnet.model.angle
+        if self.magnet.model.check({"value": ang})["value"]:
             QMessageBox.information(self, "Верно", "✅ Угол записан верно!")
         else:
             QMessageBox.warning(self, "Ошибка", f"❌ Неверно. Текущий угол: {real_ang:.1f}°")
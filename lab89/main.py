@@ -6,46 +6,36 @@ from PySide6.QtWidgets import (
     QPushButton, QLineEdit, QMessageBox, QFrame, QSlider, QCheckBox, QGroupBox, QSpinBox
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import Animated
+from physlab.models import MotorModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Электродвигатель
 # ==========================================
-class MotorWidget(QFrame):
+class MotorWidget(QFrame, Animated):
+    frame_interval = 20
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 400)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.I = 0.0        
-        self.N = 50         
-        self.is_reversed = False 
-        
-        self.angle = 0.0    
-        self.speed = 0.0    
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
+        # Ток, витки, полярность; угол и скорость якоря
+        self.model = MotorModel()
 
     def set_params(self, I, N, is_reversed):
-        self.I = I
-        self.N = N
-        self.is_reversed = is_reversed
+        self.model.set_params(I=I, N=N, is_reversed=is_reversed)
+        self.wake()
         self.update()
 
-    def animate(self):
-        target_speed = (self.I * self.N) / 500.0
-        
-        if self.is_reversed:
-            target_speed = -target_speed
-            
-        diff = target_speed - self.speed
-        self.speed += diff * 0.05
-        
-        self.angle += self.speed
-        if self.angle > 360: self.angle -= 360
-        if self.angle < 0: self.angle += 360
+    def animate(self, dt):
+        self.model.step(dt)
+
+        # Ток выключен и ротор остановился
+        if self.model.is_settled():
+            self.settle()
         
         self.update()
 
@@ -72,7 +62,7 @@ class MotorWidget(QFrame):
         # 2. Ротор
         painter.save()
         painter.translate(cx, cy)
-        painter.rotate(self.angle)
+        painter.rotate(self.model.angle)
         
         painter.setBrush(QColor(200, 200, 200))
         painter.setPen(Qt.black)
@@ -89,18 +79,18 @@ class MotorWidget(QFrame):
         painter.setBrush(QColor(255, 200, 100)) 
         painter.setPen(Qt.black)
         painter.drawPie(cx - comm_r, cy - comm_r, comm_r*2, comm_r*2, 
-                       int((self.angle + 10)*16), 160*16)
+                       int((self.model.angle + 10)*16), 160*16)
         painter.drawPie(cx - comm_r, cy - comm_r, comm_r*2, comm_r*2, 
-                       int((self.angle + 190)*16), 160*16)
+                       int((self.model.angle + 190)*16), 160*16)
                        
         painter.setBrush(QColor(50, 50, 50))
         painter.drawRect(cx - 10, cy - 35, 20, 10) 
         painter.drawRect(cx - 10, cy + 25, 20, 10) 
         
         # 4. Стрелка
-        if abs(self.speed) > 0.1:
+        if abs(self.model.speed) > 0.1:
             painter.setPen(QPen(Qt.black, 3))
-            if self.speed > 0: 
+            if self.model.speed > 0: 
                 painter.drawArc(cx - 60, cy - 60, 120, 120, 45*16, 90*16)
                 painter.drawText(cx, cy - 70, "↻")
             else: 
@@ -109,7 +99,7 @@ class MotorWidget(QFrame):
 
         painter.setPen(Qt.black)
         painter.setFont(QFont("Arial", 10))
-        speed_rpm = abs(self.speed) * 100
+        speed_rpm = abs(self.model.speed) * 100
         painter.drawText(10, 20, f"Скорость: {speed_rpm:.0f} об/мин")
 
 # ==========================================
@@ -203,15 +193,16 @@ class LabMotorApp(QWidget):
 
     def check_val(self):
         txt = self.in_dir.text().lower()
-        real_speed = self.motor.speed
+        model = self.motor.model
         
-        if abs(real_speed) < 0.1:
+        if not model.is_spinning():
             QMessageBox.warning(self, "Внимание", "Двигатель стоит! Подайте ток.")
             return
             
-        is_cw = real_speed > 0 
+        is_cw = model.direction() == "cw"
+        answer = "ccw" if "против" in txt else ("cw" if "по" in txt else None)
         
-        if ("по" in txt and is_cw) or ("против" in txt and not is_cw):
+        if model.check({"value": answer})["value"]:
             QMessageBox.information(self, "Верно", "✅ Направление определено верно!")
         else:
             correct = "По часовой" if is_cw else "Против часовой"
@@ -1,32 +1,31 @@
 import sys
 import math
-import random
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QMessageBox, QFrame, QGroupBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QSlider
 )
 from PySide6.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt, QPointF
+
+from physlab.core import Animated, ease
+from physlab.models import InductanceModel
 
 # ==========================================
 # ВИЗУАЛИЗАЦИЯ: Катушка и Амперметр
 # ==========================================
-class CoilWidget(QFrame):
+class CoilWidget(QFrame, Animated):
+    frame_interval = 20
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(500, 400)
         self.setStyleSheet("background-color: #fcfcfc; border: 1px solid #ccc; border-radius: 8px;")
         
-        self.L = 0.5    
         self.I_ind = 0.0 
         
         self.needle_angle = 0.0
         self.target_angle = 0.0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
 
     def trigger_pulse(self, emf, resistance):
         if resistance <= 0: resistance = 1e-6
@@ -38,10 +37,15 @@ class CoilWidget(QFrame):
         
         self.needle_angle = angle 
         self.target_angle = 0.0   
+        self.wake()
 
-    def animate(self):
+    def animate(self, dt):
         diff = self.target_angle - self.needle_angle
-        self.needle_angle += diff * 0.1
+        self.needle_angle += diff * ease(dt, 0.19)
+        if abs(diff) < 0.05:
+            # Стрелка вернулась к нулю
+            self.needle_angle = self.target_angle
+            self.settle()
         self.update()
 
     def paintEvent(self, event):
@@ -112,7 +116,7 @@ class LabInductanceApp(QWidget):
         self.setWindowTitle("Лабораторная работа №14: Индуктивность")
         self.resize(1000, 600)
         
-        self.L_true = 0.5 
+        self.model = InductanceModel()
         self.setup_ui()
         self.new_experiment()
 
@@ -190,8 +194,7 @@ class LabInductanceApp(QWidget):
         right_panel.addStretch(1)
 
     def new_experiment(self):
-        self.L_true = random.uniform(0.1, 2.0) 
-        self.coil.L = self.L_true
+        self.model.randomize()
         
         self.in_dI.clear()
         self.in_dt.setText("0.1")
@@ -213,7 +216,7 @@ class LabInductanceApp(QWidget):
             QMessageBox.warning(self, "Ошибка", "Время должно быть больше нуля!")
             return
 
-        E = -self.L_true * (dI / dt)
+        E = self.model.emf(dI, dt)
         
         self.lbl_emf.setText(f"ЭДС (E) = {abs(E):.4f} В")
         self.coil.trigger_pulse(E, R)
@@ -224,8 +227,8 @@ class LabInductanceApp(QWidget):
         except:
             return
             
-        if abs(u_L - self.L_true) < 0.05:
-            QMessageBox.information(self, "Верно", f"✅ Отлично! L = {self.L_true:.3f} Гн")
+        if self.model.check({"value": u_L})["value"]:
+            QMessageBox.information(self, "Верно", f"✅ Отлично! L = {self.model.L:.3f} Гн")
         else:
             QMessageBox.warning(self, "Ошибка", "❌ Неверно. Проверьте формулу.")
 
@@ -1,111 +1,113 @@
 import sys
 import math
+import numpy as np
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTableWidget, QTableWidgetItem, QPushButton, QFrame,
-    QDoubleSpinBox, QMessageBox, QGroupBox, QHeaderView, QComboBox, QCheckBox
+    QApplication, QLabel, QLineEdit, QFrame, QDoubleSpinBox, QMessageBox,
+    QComboBox, QCheckBox
 )
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QRectF, QPointF
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QImage
+from PySide6.QtCore import Qt, QRectF, QPointF
 
-# --- БАЗОВЫЙ ШАБЛОН ---
-class BaseLabWindow(QWidget):
-    def __init__(self, title, formula, description):
-        super().__init__()
-        self.setWindowTitle(title)
-        self.resize(1100, 700)
-        
-        main_layout = QHBoxLayout(self)
-        
-        # --- ЛЕВАЯ ПАНЕЛЬ ---
-        control_panel = QFrame(); control_panel.setFixedWidth(340)
-        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
-        ctrl_layout = QVBoxLayout(control_panel)
-        
-        ctrl_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
-        formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
-        ctrl_layout.addWidget(formula_lbl)
-        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); ctrl_layout.addWidget(desc_lbl)
-        ctrl_layout.addWidget(QLabel("<hr>"))
-        
-        self.inputs_group = QGroupBox("Параметры источников")
-        self.inputs_layout = QVBoxLayout(self.inputs_group)
-        ctrl_layout.addWidget(self.inputs_group)
-        
-        # Блок ответа
-        ans_box = QGroupBox("Анализ точки P")
-        ans_layout = QVBoxLayout(ans_box)
-        
-        ans_layout.addWidget(QLabel("1. Рассчитайте разность хода Δd (см):"))
-        self.answer_delta = QLineEdit()
-        self.answer_delta.setPlaceholderText("|d1 - d2|")
-        ans_layout.addWidget(self.answer_delta)
-        
-        ans_layout.addWidget(QLabel("2. Тип интерференции:"))
-        self.combo_type = QComboBox()
-        self.combo_type.addItems(["Не выбрано", "Максимум (Усиление)", "Минимум (Гашение)", "Промежуточное"])
-        ans_layout.addWidget(self.combo_type)
-        
-        self.btn_check = QPushButton("Проверить")
-        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
-        self.btn_check.clicked.connect(self.check_answer)
-        ans_layout.addWidget(self.btn_check)
-        
-        ctrl_layout.addWidget(ans_box); ctrl_layout.addStretch()
-        
-        # --- ПРАВАЯ ПАНЕЛЬ ---
-        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
-        self.visualizer = self.create_visualizer()
-        right_layout.addWidget(self.visualizer, stretch=3)
-        
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Δd (Ваш)", "Δd (Факт)", "Тип", "Статус"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        right_layout.addWidget(self.table, stretch=1)
-        
-        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
+from physlab.core import Animated, BaseLabWindow, parse_answer
+from physlab.models import InterferenceModel
+from physlab.models.optics import INTERMEDIATE, MAXIMUM, MINIMUM
 
-    def create_visualizer(self): return QFrame()
-    def check_answer(self): pass # Переопределим в наследнике
-    def setup_inputs(self): pass
+# --- КАРТА ИНТЕНСИВНОСТИ ---
+FIELD_CELL = 2        # сторона ячейки сетки, px (картинка растягивается на виджет)
+PHASE_BUCKETS = 16    # кадров на период: дальше картинки берутся из кэша
 
-# --- ВИЗУАЛИЗАТОР ВОЛНОВОЙ ВАННЫ ---
-class RippleTankVisualizer(QFrame):
+# Палитра: тёмная вода -> светлый гребень
+_FIELD_LUT = np.linspace((16, 16, 32), (0, 200, 255), 256).astype(np.uint8)
+
+
+class InterferenceField:
+    """
+    Картина двух когерентных источников на сетке виджета.
+
+    u = cos(k(d1 - s)) + cos(k(d2 - s)) = 2·cos(kΔd/2)·cos(k(d1 + d2)/2 - ks),
+    поэтому огибающая cos(kΔd/2) и полусумма фаз считаются один раз на
+    параметры, а кадр анимации — это один cos по сетке. Кадры кэшируются
+    по корзинам фазы.
+    """
     def __init__(self):
+        self._grid_key = None    # (dist, scale, w, h) -> d1, d2
+        self._phase_key = None   # + lam -> огибающая и полусумма фаз
+        self._frames = {}        # корзина фазы (None — средняя интенсивность) -> QImage
+
+    def _distances(self, dist, scale, w, h):
+        key = (dist, scale, w, h)
+        if key != self._grid_key:
+            cols, rows = -(-w // FIELD_CELL), -(-h // FIELD_CELL)
+            xs = ((np.arange(cols, dtype=np.float32) + 0.5) * FIELD_CELL - w / 2) / scale
+            ys = ((np.arange(rows, dtype=np.float32) + 0.5) * FIELD_CELL - h / 2) / scale
+            yy2 = (ys * ys)[:, None]
+            self._d1 = np.sqrt((xs + dist / 2) ** 2 + yy2)
+            self._d2 = np.sqrt((xs - dist / 2) ** 2 + yy2)
+            self._grid_key = key
+            self._phase_key = None
+
+    def image(self, dist, lam, scale, w, h, phase=None):
+        """QImage интенсивности; phase=None — усреднённая по времени картина."""
+        self._distances(dist, scale, w, h)
+        key = (self._grid_key, lam)
+        if key != self._phase_key:
+            k = 2 * math.pi / lam
+            self._envelope = np.cos(0.5 * k * (self._d1 - self._d2))
+            self._mean_phase = 0.5 * k * (self._d1 + self._d2)
+            self._phase_key = key
+            self._frames.clear()
+
+        bucket = None if phase is None else int(phase / lam * PHASE_BUCKETS) % PHASE_BUCKETS
+        img = self._frames.get(bucket)
+        if img is None:
+            if bucket is None:
+                intensity = self._envelope ** 2
+            else:
+                shift = 2 * math.pi * bucket / PHASE_BUCKETS
+                intensity = (self._envelope * np.cos(self._mean_phase - shift)) ** 2
+            rgb = _FIELD_LUT[(intensity * 255).astype(np.uint8)]
+            rows, cols = rgb.shape[:2]
+            img = QImage(rgb.tobytes(), cols, rows, 3 * cols, QImage.Format_RGB888).copy()
+            self._frames[bucket] = img
+        return img
+
+
+# --- ВИЗУАЛИЗАТОР ВОЛНОВОЙ ВАННЫ ---
+class RippleTankVisualizer(QFrame, Animated):
+    frame_interval = 33
+
+    def __init__(self, model):
         super().__init__()
         self.setStyleSheet("background-color: #101020; border: 1px solid #555;")
         
-        # Физические параметры (в условных см)
-        self.dist_S1_S2 = 10.0 # Расстояние между источниками
-        self.wavelength = 2.0  # Длина волны
+        # Физические параметры (в условных см) и точка детектора — в модели
+        self.model = model
         self.phase_shift = 0.0 # Сдвиг фазы анимации
         
         # Масштаб (пикселей в 1 см)
         self.scale = 20.0 
         
-        # Точка детектора (None, пока не кликнули)
-        self.detector_pos = None 
-        self.d1 = 0.0
-        self.d2 = 0.0
-        
         self.show_waves = True
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(50)
+        self.show_field = False  # карта I(x, y) вместо кругов-гребней
+        self.field = InterferenceField()
+        self.wake()
 
-    def update_params(self, dist, lam, show_w):
-        self.dist_S1_S2 = dist
-        self.wavelength = lam
+    def update_params(self, dist, lam, show_w, show_field=False):
+        self.model.set_params(dist=dist, lam=lam)
         self.show_waves = show_w
-        self.update_detector_calculations()
+        self.show_field = show_field
+        if show_w: self.wake()
         self.update()
 
-    def animate(self):
+    def animate(self, dt):
+        if not self.show_waves:
+            # Без волн картина неподвижна
+            self.settle()
+            return
         # Движение волн (фаза меняется от 0 до wavelength)
-        self.phase_shift += 0.2
-        if self.phase_shift > self.wavelength:
-            self.phase_shift -= self.wavelength
+        self.phase_shift += 4.0 * dt
+        if self.phase_shift > self.model.lam:
+            self.phase_shift -= self.model.lam
         self.update()
 
     def mousePressEvent(self, event):
@@ -121,21 +123,9 @@ class RippleTankVisualizer(QFrame):
         phys_x = (mx - cx) / self.scale
         phys_y = (my - cy) / self.scale
         
-        self.detector_pos = QPointF(phys_x, phys_y)
-        self.update_detector_calculations()
+        self.model.detector = (phys_x, phys_y)
         self.update()
 
-    def update_detector_calculations(self):
-        if self.detector_pos is None: return
-        
-        # Координаты источников
-        s1_x = -self.dist_S1_S2 / 2
-        s2_x = self.dist_S1_S2 / 2
-        
-        # Расстояния
-        self.d1 = math.sqrt((self.detector_pos.x() - s1_x)**2 + (self.detector_pos.y())**2)
-        self.d2 = math.sqrt((self.detector_pos.x() - s2_x)**2 + (self.detector_pos.y())**2)
-
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
@@ -144,12 +134,19 @@ class RippleTankVisualizer(QFrame):
         cx, cy = w / 2, h / 2
         
         # Координаты источников на экране
-        s1_scr_x = cx - (self.dist_S1_S2 / 2) * self.scale
-        s2_scr_x = cx + (self.dist_S1_S2 / 2) * self.scale
+        s1_scr_x = cx - (self.model.dist / 2) * self.scale
+        s2_scr_x = cx + (self.model.dist / 2) * self.scale
         src_y = cy
         
-        # 1. Рисуем волны (Концентрические круги)
-        if self.show_waves:
+        # 1. Карта интенсивности: узловые линии видны сразу
+        if self.show_field:
+            phase = self.phase_shift if self.show_waves else None
+            img = self.field.image(self.model.dist, self.model.lam, self.scale, w, h, phase)
+            p.setRenderHint(QPainter.SmoothPixmapTransform)
+            p.drawImage(QRectF(0, 0, img.width() * FIELD_CELL, img.height() * FIELD_CELL), img)
+
+        # Волны (Концентрические круги)
+        elif self.show_waves:
             # Максимальный радиус (диагональ экрана)
             max_r_cm = math.sqrt((w/self.scale)**2 + (h/self.scale)**2)
             
@@ -159,7 +156,7 @@ class RippleTankVisualizer(QFrame):
             # Радиус r = n * lambda + phase
             n = 0
             while True:
-                r_cm = n * self.wavelength + self.phase_shift
+                r_cm = n * self.model.lam + self.phase_shift
                 if r_cm > max_r_cm: break
                 r_px = r_cm * self.scale
                 
@@ -187,9 +184,11 @@ class RippleTankVisualizer(QFrame):
         p.drawText(int(s2_scr_x)-10, int(src_y)-15, "S2")
 
         # 3. Рисуем Детектор (если выбран)
-        if self.detector_pos:
-            det_scr_x = cx + self.detector_pos.x() * self.scale
-            det_scr_y = cy + self.detector_pos.y() * self.scale
+        if self.model.detector is not None:
+            det_x, det_y = self.model.detector
+            det_scr_x = cx + det_x * self.scale
+            det_scr_y = cy + det_y * self.scale
+            d1, d2 = self.model.distances()
             
             # Линии от источников к детектору
             p.setPen(QPen(QColor("red"), 1, Qt.DashLine))
@@ -205,11 +204,11 @@ class RippleTankVisualizer(QFrame):
             # Подписи длин
             mid_x1 = (s1_scr_x + det_scr_x) / 2
             mid_y1 = (src_y + det_scr_y) / 2
-            p.drawText(int(mid_x1), int(mid_y1), f"d1={self.d1:.1f}")
+            p.drawText(int(mid_x1), int(mid_y1), f"d1={d1:.1f}")
             
             mid_x2 = (s2_scr_x + det_scr_x) / 2
             mid_y2 = (src_y + det_scr_y) / 2
-            p.drawText(int(mid_x2), int(mid_y2), f"d2={self.d2:.1f}")
+            p.drawText(int(mid_x2), int(mid_y2), f"d2={d2:.1f}")
         else:
             p.setPen(QColor("white"))
             p.setFont(QFont("Arial", 12))
@@ -218,6 +217,15 @@ class RippleTankVisualizer(QFrame):
 
 # --- ЛОГИКА ЛАБОРАТОРНОЙ ---
 class InterferenceLab(BaseLabWindow):
+    window_size = (1100, 700)
+    panel_width = 340
+    inputs_title = "Параметры источников"
+    answer_title = "Анализ точки P"
+    check_text = "Проверить"
+    table_headers = ["Δd (Ваш)", "Δd (Факт)", "Тип", "Статус"]
+    model_class = InterferenceModel
+    TYPE_ITEMS = (None, MAXIMUM, MINIMUM, INTERMEDIATE)
+
     def __init__(self):
         super().__init__(
             title="9 Класс: Интерференция волн",
@@ -232,8 +240,19 @@ class InterferenceLab(BaseLabWindow):
         )
         self.setup_inputs()
 
+    def setup_answer(self):
+        self.answer_layout.addWidget(QLabel("1. Рассчитайте разность хода Δd (см):"))
+        self.answer_delta = QLineEdit()
+        self.answer_delta.setPlaceholderText("|d1 - d2|")
+        self.answer_layout.addWidget(self.answer_delta)
+
+        self.answer_layout.addWidget(QLabel("2. Тип интерференции:"))
+        self.combo_type = QComboBox()
+        self.combo_type.addItems(["Не выбрано", "Максимум (Усиление)", "Минимум (Гашение)", "Промежуточное"])
+        self.answer_layout.addWidget(self.combo_type)
+
     def create_visualizer(self):
-        return RippleTankVisualizer()
+        return RippleTankVisualizer(self.model)
 
     def setup_inputs(self):
         # Расстояние между источниками
@@ -254,10 +273,14 @@ class InterferenceLab(BaseLabWindow):
         self.chk_waves = QCheckBox("Показывать волны")
         self.chk_waves.setChecked(True)
         self.inputs_layout.addWidget(self.chk_waves)
+
+        self.chk_field = QCheckBox("Карта интенсивности I(x, y)")
+        self.inputs_layout.addWidget(self.chk_field)
         
         self.spin_dist.valueChanged.connect(self.update_vis)
         self.spin_lam.valueChanged.connect(self.update_vis)
         self.chk_waves.stateChanged.connect(self.update_vis)
+        self.chk_field.stateChanged.connect(self.update_vis)
         
         self.update_vis()
 
@@ -265,64 +288,36 @@ class InterferenceLab(BaseLabWindow):
         self.visualizer.update_params(
             self.spin_dist.value(),
             self.spin_lam.value(),
-            self.chk_waves.isChecked()
+            self.chk_waves.isChecked(),
+            self.chk_field.isChecked()
         )
 
     def check_answer(self):
-        if self.visualizer.detector_pos is None:
+        if self.model.detector is None:
             QMessageBox.warning(self, "Внимание", "Сначала кликните по полю, чтобы установить точку измерения!")
             return
 
         # 1. Проверка числа
         try:
-            user_delta = float(self.answer_delta.text().replace(',', '.'))
+            user_delta = parse_answer(self.answer_delta.text())
         except ValueError:
             QMessageBox.warning(self, "Ошибка", "Введите числовое значение разности хода.")
             return
             
-        true_delta = abs(self.visualizer.d1 - self.visualizer.d2)
-        lam = self.spin_lam.value()
-        
-        # Погрешность 0.1 см
-        is_val_correct = abs(user_delta - true_delta) <= 0.1
-        
-        # 2. Проверка типа интерференции
-        # k = delta / (lam / 2)
-        # Если k четное (0, 2, 4...) -> Максимум (целое число волн)
-        # Если k нечетное (1, 3, 5...) -> Минимум (полуцелое число волн)
+        true = self.model.true_values()
+        true_delta, type_str = true["delta"], true["type"]
+        lam = self.model.lam
         
-        ratio = true_delta / (lam / 2.0)
-        closest_integer = round(ratio)
-        deviation = abs(ratio - closest_integer)
-        
-        # Определяем "истинный" тип
-        if deviation < 0.2: # Достаточно близко к целому полуволн
-            if closest_integer % 2 == 0:
-                true_type_idx = 1 # Максимум
-                type_str = "Максимум"
-            else:
-                true_type_idx = 2 # Минимум
-                type_str = "Минимум"
-        else:
-            true_type_idx = 3 # Промежуточное
-            type_str = "Промежуточное"
-            
-        user_type_idx = self.combo_type.currentIndex()
-        
-        is_type_correct = (user_type_idx == true_type_idx)
+        # 2. Тип интерференции: пункты списка по порядку, 0 — "Не выбрано"
+        # Погрешность Δd — 0.1 см (допуск модели)
+        user_type = self.TYPE_ITEMS[self.combo_type.currentIndex()]
+        verdict = self.model.check({"delta": user_delta, "type": user_type})
+        is_val_correct, is_type_correct = verdict["delta"], verdict["type"]
         
         # Формируем отчет
         is_total_correct = is_val_correct and is_type_correct
         
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(f"{user_delta:.2f}"))
-        self.table.setItem(row, 1, QTableWidgetItem(f"{true_delta:.2f}"))
-        self.table.setItem(row, 2, QTableWidgetItem(type_str))
-        
-        status_item = QTableWidgetItem("✅ Верно" if is_total_correct else "❌ Ошибка")
-        status_item.setForeground(QBrush(QColor("green") if is_total_correct else QColor("red")))
-        self.table.setItem(row, 3, status_item)
+        self.record([f"{user_delta:.2f}", f"{true_delta:.2f}", type_str], user_delta, true_delta, is_total_correct)
         
         if is_total_correct:
             QMessageBox.information(self, "Верно", f"Отлично! Δd={true_delta:.2f} см ≈ {true_delta/lam:.1f}λ -> {type_str}")
@@ -0,0 +1,19 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from physlab.launcher import LauncherWindow
+from physlab.registry import find_lab
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    window = LauncherWindow()
+    window.show()
+
+    # python3 main.py lab94 — сразу открыть указанную работу (ярлыки на рабочем столе)
+    for name in sys.argv[1:]:
+        window.open_lab(find_lab(name))
+
+    sys.exit(app.exec())
@@ -0,0 +1,6 @@
+"""
+physlab — общий пакет виртуальных лабораторных работ по физике.
+
+Лабораторные (папки labNN) остаются самостоятельными скриптами,
+а всё, что используется несколькими работами сразу, живёт здесь.
+"""
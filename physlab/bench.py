@@ -0,0 +1,216 @@
+"""
+Замеры отрисовки всех работ без экрана: python3 -m physlab.bench.
+
+Каждая работа открывается в окне фиксированного размера с фиксированным
+seed. Затем N кадров подряд часы анимации тикают вручную с шагом
+FRAME_MS, и каждый виджет со своим paintEvent рисуется в QImage через
+render(). По каждой работе выводятся перцентили времени кадра
+(p50/p95/p99), число paintEvent на кадр и память. Память — это пик
+выделений Python за кадр (tracemalloc) и прирост за весь прогон.
+
+--save пишет результаты в JSON. --compare сравнивает прогон с
+сохранённым базовым и возвращает код 1, если p95 какой-то работы
+вырос больше допустимого. Чтобы сравнение не реагировало на случайные
+задержки системы, замер кадров повторяется --repeat раз, и берётся
+минимум каждого перцентиля.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
+
+from physlab.core.clock import FRAME_MS, MAX_DT, frame_clock
+from physlab.core.instrument import has_own_paint
+from physlab.models import session
+from physlab.registry import LABS, LabInfo, find_lab, load_lab
+
+WINDOW_SIZE = (1100, 700)
+WARMUP_FRAMES = 5
+ALLOC_FRAMES = 50          # кадров под tracemalloc (он сам замедляет рисование)
+REGRESSION_MIN_MS = 0.2    # меньшая разница p95 — шум, а не регрессия
+
+
+class PaintCounter(QObject):
+    """Считает события Paint у виджетов, на которые установлен фильтром."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.count += 1
+        return False
+
+
+class LabBench:
+    """Одна работа: окно, её визуализаторы и ручные тики часов."""
+
+    def __init__(self, info: LabInfo, size, seed):
+        random.seed(seed)
+        np.random.seed(seed)
+        session.set_seed(seed)   # задания моделей — из model.rng
+        self.info = info
+        self.window = load_lab(info)
+        self.window.resize(*size)
+        self.window.show()
+        QApplication.processEvents()   # раскладка: у визуализаторов появляется размер
+        self.widgets = [w for w in self.window.findChildren(QWidget) if w.isVisible() and has_own_paint(w)]
+        self.images = [QImage(w.size(), QImage.Format_ARGB32_Premultiplied) for w in self.widgets]
+        self.counter = PaintCounter()
+        for w in self.widgets:
+            w.installEventFilter(self.counter)
+        self.now = 0.0
+        self.last: Dict = {}
+
+    def frame(self):
+        # Тот же порядок, что у FrameClock._tick, но время модельное: кадр = FRAME_MS
+        self.now += FRAME_MS / 1000.0
+        half_frame = FRAME_MS / 2000.0
+        for callback, interval in frame_clock().subscriptions(self.window):
+            dt = self.now - self.last.setdefault(callback, self.now - FRAME_MS / 1000.0)
+            if dt < interval - half_frame:
+                continue
+            self.last[callback] = self.now
+            callback(min(dt, MAX_DT))
+        # Отложенные пересчёты (FrameClock.request) — как в конце _tick
+        frame_clock().run_requests(self.window)
+        for w, img in zip(self.widgets, self.images):
+            w.render(img)
+
+    def frame_times(self, frames) -> List[float]:
+        times = []
+        for _ in range(frames):
+            t0 = time.perf_counter()
+            self.frame()
+            times.append((time.perf_counter() - t0) * 1000.0)
+        return times
+
+    def run(self, frames, repeat=1) -> Dict:
+        for _ in range(WARMUP_FRAMES):
+            self.frame()
+
+        self.counter.count = 0
+        runs = [statistics.quantiles(self.frame_times(frames), n=100) for _ in range(repeat)]
+        q = [min(values) for values in zip(*runs)]
+        paints = self.counter.count / (frames * repeat)
+
+        tracemalloc.start()
+        start, _ = tracemalloc.get_traced_memory()
+        peaks = []
+        for _ in range(min(frames, ALLOC_FRAMES)):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self.frame()
+            peaks.append((tracemalloc.get_traced_memory()[1] - before) / 1024.0)
+        retained = (tracemalloc.get_traced_memory()[0] - start) / 1024.0
+        tracemalloc.stop()
+
+        return {
+            "widgets": [type(w).__name__ for w in self.widgets],
+            "p50_ms": round(q[49], 3), "p95_ms": round(q[94], 3), "p99_ms": round(q[98], 3),
+            "paints_per_frame": round(paints, 2),
+            "alloc_peak_kb": round(statistics.median(peaks), 1),
+            "retained_kb": round(retained, 1),
+        }
+
+    def close(self):
+        self.window.close()
+        self.window.deleteLater()
+        QApplication.processEvents()
+
+
+def run_all(labs: List[LabInfo], frames, size, seed, repeat=1) -> Dict[str, Dict]:
+    results = {}
+    # Первое окно в процессе платит за холодные кэши шрифтов и стилей — его не считаем
+    warmup = LabBench(labs[0], size, seed)
+    warmup.run(WARMUP_FRAMES)
+    warmup.close()
+    for info in labs:
+        bench = LabBench(info, size, seed)
+        try:
+            results[info.key] = bench.run(frames, repeat)
+        finally:
+            bench.close()
+        print_row(info.key, results[info.key])
+    return results
+
+
+def print_row(key, r):
+    print(f"{key:30} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['p99_ms']:8.2f} "
+          f"{r['paints_per_frame']:7.2f} {r['alloc_peak_kb']:9.1f} {r['retained_kb']:9.1f}  "
+          f"{', '.join(sorted(set(r['widgets'])))}", flush=True)
+
+
+def regressions(current: Dict[str, Dict], baseline: Dict[str, Dict], threshold) -> List[str]:
+    found = []
+    for key, r in current.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        limit = base["p95_ms"] * (1 + threshold)
+        if r["p95_ms"] > limit and r["p95_ms"] - base["p95_ms"] > REGRESSION_MIN_MS:
+            found.append(f"{key}: p95 {base['p95_ms']:.2f} -> {r['p95_ms']:.2f} мс")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m physlab.bench",
+                                     description="Замеры отрисовки визуализаторов (offscreen).")
+    parser.add_argument("labs", nargs="*", help="работы (lab95, lab811:PhotoEffectLab); по умолчанию все")
+    parser.add_argument("-n", "--frames", type=int, default=300, help="кадров на работу")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="повторов замера (берётся минимум)")
+    parser.add_argument("--size", default="x".join(map(str, WINDOW_SIZE)), help="размер окна, ШxВ")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", help="записать результаты в JSON (базовый прогон)")
+    parser.add_argument("--compare", help="сравнить с базовым JSON")
+    parser.add_argument("--threshold", type=float, default=0.25, help="допустимый рост p95 (доля)")
+    args = parser.parse_args(argv)
+
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    labs = [find_lab(name) for name in args.labs] if args.labs else LABS
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    # Окна работ показывают подсказки в QMessageBox — в замерах они не нужны
+    for name in ("information", "warning", "critical", "question"):
+        setattr(QMessageBox, name, staticmethod(lambda *a, **k: QMessageBox.Ok))
+
+    print(f"{'работа':30} {'p50 мс':>8} {'p95 мс':>8} {'p99 мс':>8} {'paint/к':>7} "
+          f"{'пик КБ':>9} {'прирост':>9}  виджеты")
+    results = run_all(labs, args.frames, size, args.seed, args.repeat)
+
+    if args.save:
+        report = {
+            "frames": args.frames, "repeat": args.repeat, "size": list(size), "seed": args.seed,
+            "python": platform.python_version(), "pyside": PYSIDE_VERSION,
+            "platform": app.platformName(), "labs": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["labs"]
+        found = regressions(results, baseline, args.threshold)
+        for line in found:
+            print("РЕГРЕССИЯ", line)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Сборщик результатов класса: python3 -m physlab.collector [--port 8765].
+
+Запускается на компьютере учителя. Окна работ отправляют каждую запись
+журнала (physlab.journal) на PHYSLAB_COLLECTOR=http://<учитель>:8765.
+Отправка идёт пачками из фонового потока physlab.uplink. Учитель
+открывает тот же адрес в браузере и видит сводку по ученикам и работам.
+
+Протокол — простой HTTP/1.1 на asyncio, без сторонних библиотек:
+    POST /records   тело — JSON Lines записей журнала, ответ {"accepted": n}
+    GET  /summary   сводка JSON: ученик -> работа -> попытки/верно/последняя
+    GET  /          та же сводка таблицей HTML
+
+Повторно присланные записи (тот же session, lab и timestamp) не
+считаются дважды. --out дописывает принятые записи в файл JSON Lines
+(в формате журнала).
+"""
+import argparse
+import asyncio
+import html
+import json
+import sys
+import time
+from typing import Any, Dict, Optional, Tuple
+
+MAX_BODY = 8 * 1024 * 1024
+
+
+class Summary:
+    """Сводка по ученикам и работам; записи с одинаковым ключом учитываются один раз."""
+
+    def __init__(self):
+        self.seen = set()
+        self.students: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def key(rec) -> Tuple:
+        return rec.get("session"), rec.get("lab"), rec.get("timestamp")
+
+    def add(self, rec: Dict[str, Any]) -> bool:
+        if rec.get("kind", "check") != "check":
+            return False
+        key = self.key(rec)
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        self.count(rec)
+        return True
+
+    def count(self, rec: Dict[str, Any]):
+        """Учесть проверку без проверки на повтор (поток уже без повторов — physlab.merge)."""
+        student = rec.get("student") or rec.get("machine") or "?"
+        lab = self.students.setdefault(student, {}).setdefault(
+            rec.get("lab", "?"), {"attempts": 0, "correct": 0, "last": 0.0, "machine": ""})
+        lab["attempts"] += 1
+        lab["correct"] += bool(rec.get("is_correct"))
+        if rec.get("timestamp", 0.0) >= lab["last"]:
+            lab["last"] = rec.get("timestamp", 0.0)
+            lab["machine"] = rec.get("machine", "")
+
+    def as_dict(self):
+        return {s: dict(sorted(labs.items())) for s, labs in sorted(self.students.items())}
+
+    def as_html(self):
+        rows = []
+        for student, labs in sorted(self.students.items()):
+            for lab, st in sorted(labs.items()):
+                rows.append(f"<tr><td>{html.escape(student)}</td><td>{html.escape(lab)}</td>"
+                            f"<td>{st['correct']} / {st['attempts']}</td>"
+                            f"<td>{time.strftime('%H:%M:%S', time.localtime(st['last']))}</td>"
+                            f"<td>{html.escape(st['machine'])}</td></tr>")
+        return ("<!doctype html><meta charset='utf-8'><meta http-equiv='refresh' content='5'>"
+                "<title>Результаты класса</title><table border='1' cellpadding='4'>"
+                "<tr><th>Ученик</th><th>Работа</th><th>Верно / попыток</th><th>Последняя</th><th>Компьютер</th></tr>"
+                + "".join(rows) + "</table>")
+
+
+class Collector:
+    def __init__(self, out: Optional[str] = None):
+        self.summary = Summary()
+        self.out = open(out, "a", encoding="utf-8") if out else None
+        self.received = 0
+
+    def ingest(self, body: bytes) -> int:
+        accepted = 0
+        for line in body.decode("utf-8", "replace").splitlines():
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict) and self.summary.add(rec):
+                accepted += 1
+                if self.out:
+                    self.out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self.received += accepted
+        if self.out and accepted:
+            self.out.flush()
+        return accepted
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+                method, path, _ = (request.decode("latin-1").split() + ["", "", ""])[:3]
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0) or 0)
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, {"error": "слишком большая пачка"})
+                    break
+                body = await reader.readexactly(length) if length else b""
+                if method == "POST" and path == "/records":
+                    await self.respond(writer, 200, {"accepted": self.ingest(body)})
+                elif method == "GET" and path == "/summary":
+                    await self.respond(writer, 200, self.summary.as_dict())
+                elif method == "GET" and path == "/":
+                    await self.respond(writer, 200, self.summary.as_html(), "text/html; charset=utf-8")
+                else:
+                    await self.respond(writer, 404, {"error": "нет такого адреса"})
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def respond(writer, status, payload, content_type="application/json; charset=utf-8"):
+        body = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+        data = body.encode("utf-8")
+        reason = {200: "OK", 404: "Not Found", 413: "Payload Too Large"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data)
+        await writer.drain()
+
+    async def serve(self, host="0.0.0.0", port=8765):
+        # backlog с запасом: в конце урока отправляет весь класс разом
+        return await asyncio.start_server(self.handle, host, port, backlog=256)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m physlab.collector",
+                                     description="Сборщик результатов класса (HTTP).")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--out", help="дописывать принятые записи в файл JSON Lines")
+    args = parser.parse_args(argv)
+
+    collector = Collector(args.out)
+
+    async def run():
+        server = await collector.serve(args.host, args.port)
+        print(f"Сборщик: http://{args.host}:{args.port}/ (Ctrl+C — выход)", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    print(f"Принято записей: {collector.received}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
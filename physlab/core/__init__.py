@@ -0,0 +1,26 @@
+"""
+physlab.core — общий код лабораторных: базовое окно, проверка ответов,
+таблица результатов, аналоговый прибор, общие часы анимации, кэш
+статичных слоёв, цвета спектра, пул частиц и редактор схем. Оверлей замеров —
+модуль physlab.core.instrument (подключает лаунчер).
+
+Проверка ответов и шаг по времени живут в physlab.models (без Qt) и
+реэкспортируются отсюда для окон лабораторных.
+"""
+from physlab.models.checking import Tolerance, parse_answer
+from physlab.models.timestep import TickAccumulator, ease
+from physlab.core.results import Measurement, ResultsModel, ResultsTable
+from physlab.core.layers import LayerCache
+from physlab.core.meter import MeterWidget
+from physlab.core.particles import ParticlePool
+from physlab.core.base_window import BaseLabWindow
+from physlab.core.clock import CATCH_UP_DT, Animated, FrameClock, frame_clock
+from physlab.core.spectrum import spectrum_stops, wavelength_color, wavelength_rgb
+from physlab.core.schematic import SchematicEditor, SchematicPanel
+
+__all__ = [
+    "Animated", "BaseLabWindow", "CATCH_UP_DT", "FrameClock", "LayerCache", "Measurement", "MeterWidget",
+    "ParticlePool", "ResultsModel", "ResultsTable", "SchematicEditor", "SchematicPanel", "TickAccumulator",
+    "Tolerance", "ease", "frame_clock",
+    "parse_answer", "spectrum_stops", "wavelength_color", "wavelength_rgb",
+]
@@ -0,0 +1,170 @@
+"""
+Базовое окно лабораторной: слева описание, параметры и ответ,
+справа визуализация и таблица результатов.
+
+Наследник задаёт create_visualizer, setup_inputs, get_params_str и
+model_class — модель из physlab.models, которая знает эталон и допуск;
+оформление — атрибутами класса (заголовки, формат чисел, тексты
+сообщений).
+"""
+from typing import Dict, List
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QFrame, QMessageBox, QGroupBox
+)
+
+from physlab import journal
+from physlab.models.checking import Tolerance, parse_answer
+from physlab.core.results import Measurement, ResultsTable
+
+
+class BaseLabWindow(QWidget):
+    # --- Оформление (переопределяется в наследниках) ---
+    window_size = (1000, 600)
+    panel_width = 320
+    visual_stretch = 3
+    table_stretch = 1
+
+    inputs_title = "Параметры эксперимента"
+    answer_title = "Результат"
+    answer_label = "Ваш ответ:"
+    answer_placeholder = ""
+    check_text = "Проверить ответ"
+    table_headers = ["Параметры", "Ваш ответ", "Эталон", "Статус"]
+
+    # --- Проверка ---
+    model_class = None   # physlab.models.LabModel; без модели — get_true_value и tolerance
+    tolerance = Tolerance(rel=0.05)
+    value_format = "{:.2f}"
+    unit = ""
+    input_error = "Введите числовое значение."
+    success_message = "Расчет выполнен верно!"
+    failure_message = "Неверно.\nПравильный ответ: {true}"
+
+    def __init__(self, title, formula, description):
+        super().__init__()
+        self.setWindowTitle(title)
+        self.resize(*self.window_size)
+        self.model = self.model_class() if self.model_class else None
+
+        main_layout = QHBoxLayout(self)
+
+        # --- ЛЕВАЯ ПАНЕЛЬ ---
+        control_panel = QFrame(); control_panel.setFixedWidth(self.panel_width)
+        control_panel.setStyleSheet("background-color: #f5f5f5; border-right: 1px solid #ddd;")
+        self.control_layout = QVBoxLayout(control_panel)
+
+        self.control_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
+        if formula:
+            formula_lbl = QLabel(f"<div style='background:#eef; padding:10px; border-radius:5px; font-size:16px; color:blue'><b>{formula}</b></div>")
+            self.control_layout.addWidget(formula_lbl)
+        desc_lbl = QLabel(description); desc_lbl.setWordWrap(True); self.control_layout.addWidget(desc_lbl)
+        self.control_layout.addWidget(QLabel("<hr>"))
+
+        self.inputs_group = QGroupBox(self.inputs_title)
+        self.inputs_layout = QVBoxLayout(self.inputs_group)
+        self.control_layout.addWidget(self.inputs_group)
+
+        # Блок ответа
+        ans_box = QGroupBox(self.answer_title)
+        self.answer_layout = QVBoxLayout(ans_box)
+        self.setup_answer()
+
+        self.btn_check = QPushButton(self.check_text)
+        self.btn_check.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
+        self.btn_check.clicked.connect(self.check_answer)
+        self.answer_layout.addWidget(self.btn_check)
+        self.control_layout.addWidget(ans_box); self.control_layout.addStretch()
+
+        # --- ПРАВАЯ ПАНЕЛЬ ---
+        right_panel = QWidget(); right_layout = QVBoxLayout(right_panel)
+        self.visualizer = self.create_visualizer()
+        right_layout.addWidget(self.visualizer, stretch=self.visual_stretch)
+
+        self.table = ResultsTable(self.table_headers)
+        right_layout.addWidget(self.table, stretch=self.table_stretch)
+        self.journal_key = journal.lab_key(self)
+        journal.track(self)
+        self.restore_results()
+
+        main_layout.addWidget(control_panel); main_layout.addWidget(right_panel)
+        # setup_inputs вызывается в конце конструктора наследника,
+        # когда self.visualizer уже создан нужного типа
+
+    # --- Методы для переопределения ---
+    def create_visualizer(self): return QFrame()
+    def setup_inputs(self): pass
+    def get_true_value(self): return self.model.true_value() if self.model else 0.0
+    def get_current_params(self) -> Dict[str, float]: return {}
+
+    def get_params_str(self):
+        return ", ".join(f"{k}={v}" for k, v in self.get_current_params().items())
+
+    def setup_answer(self):
+        self.answer_layout.addWidget(QLabel(self.answer_label))
+        self.answer_input = QLineEdit()
+        self.answer_input.setPlaceholderText(self.answer_placeholder)
+        self.answer_layout.addWidget(self.answer_input)
+
+    # --- Общая логика ---
+    def format_value(self, val):
+        return self.value_format.format(val)
+
+    def read_answer(self):
+        # None, если ученик ввёл не число (предупреждение уже показано)
+        try:
+            return parse_answer(self.answer_input.text())
+        except ValueError:
+            QMessageBox.warning(self, "Ошибка", self.input_error)
+            return None
+
+    @property
+    def measurements(self) -> List[Measurement]:
+        # Хранятся в модели таблицы, отдельного списка нет
+        return self.table.results.measurements()
+
+    def record(self, cells, user_val, true_val, is_correct):
+        meas = Measurement.now(self.get_current_params(), {"True": true_val}, user_val, is_correct)
+        self.table.add_row(cells, is_correct, meas)
+        journal.append(self.journal_key, {
+            "timestamp": meas.timestamp, "params": meas.params, "results": meas.results,
+            "user_answer": user_val, "is_correct": is_correct, "cells": list(cells),
+        })
+        return meas
+
+    def restore_results(self):
+        # Окно закрыли или программа упала — сегодняшние результаты берём из журнала
+        rows = []
+        for rec in journal.restore(self.journal_key):
+            if rec.get("kind") != "check":
+                continue
+            meas = Measurement(rec["timestamp"], rec.get("params", {}), rec.get("results", {}),
+                               rec.get("user_answer"), bool(rec.get("is_correct")))
+            rows.append((rec.get("cells", []), meas.is_correct, meas))
+        self.table.results.extend(rows)
+
+    def check_answer(self):
+        user_val = self.read_answer()
+        if user_val is None:
+            return
+
+        true_val = self.get_true_value()
+        is_correct = self.accepts(user_val, true_val)
+        self.record([self.get_params_str(), self.format_value(user_val), self.format_value(true_val)],
+                    user_val, true_val, is_correct)
+
+        true_text = f"{self.format_value(true_val)} {self.unit}".strip()
+        if is_correct:
+            QMessageBox.information(self, "Успех", self.success_message.format(true=true_text))
+        else:
+            QMessageBox.warning(self, "Ошибка", self.failure_message.format(true=true_text))
+
+    def accepts(self, user_val, true_val):
+        if self.model is not None:
+            return self.model.check({"value": user_val})["value"]
+        return self.tolerance.accepts(user_val, true_val)
+
+    def reset_results(self):
+        self.table.clear_rows()
+        journal.append(self.journal_key, {"kind": "reset"})
@@ -0,0 +1,196 @@
+"""
+Общие часы анимации: один QTimer на весь процесс.
+
+Визуализаторы не заводят собственных таймеров, а подписываются на
+FrameClock и получают реальный dt (секунды) с прошлого вызова. Все
+подписчики тикают в одной фазе, а когда подписчиков нет, таймер стоит.
+
+Статичная сцена кадров не просит: виджет с примесью Animated вызывает
+settle(), когда всё успокоилось, и wake() — когда параметры изменились.
+
+request(owner, callback) — разовый вызов callback() на ближайшем кадре.
+Повторные запросы до кадра сливаются: перетаскивание ползунка шлёт
+десятки событий мыши за кадр, а пересчёт и показания приборов — один.
+
+Подписчик, чьё окно скрыто, свернуто или полностью перекрыто (если
+платформа об этом сообщает), на паузе: модель стоит, а время простоя
+в dt не попадает. Если на паузе все, таймер останавливается до
+события Show/Expose/WindowStateChange у наблюдаемых окон.
+"""
+import time
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Qt
+from PySide6.QtWidgets import QWidget
+
+FRAME_MS = 16        # базовый шаг часов (~60 Гц)
+MAX_DT = 0.1         # больший dt (модальное окно, подвисание) не отдаём в физику
+CATCH_UP_DT = 1.0    # колебательные модели догоняют реальное время после подвисания до 1 с
+
+# События, после которых видимость окна могла измениться
+_VISIBILITY_EVENTS = (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose)
+_WATCHED = "_frame_clock_watched"
+
+
+class _Subscription:
+    __slots__ = ("callback", "owner", "owner_id", "interval", "max_dt", "last")
+
+    def __init__(self, callback, owner, interval, max_dt, now):
+        self.callback = callback
+        self.owner = owner
+        self.owner_id = id(owner)
+        self.interval = interval  # минимальный период вызова, с
+        self.max_dt = max_dt
+        self.last = now
+
+
+class FrameClock(QObject):
+    def __init__(self, frame_ms=FRAME_MS, parent=None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(frame_ms)
+        self._half_frame = frame_ms / 2000.0
+        self._timer.timeout.connect(self._tick)
+        self._subs: Dict[Callable, _Subscription] = {}
+        self._once: Dict[Callable, QObject] = {}   # разовые вызовы на следующем кадре -> владелец
+        self._owners = set()  # id владельцев, у которых уже подключён destroyed
+        self.probe = None     # physlab.core.instrument.Probe, пока включён оверлей замеров
+
+    def subscribe(self, owner: QObject, callback: Callable[[float], None], interval_ms: int = 0,
+                  max_dt: float = MAX_DT):
+        """
+        callback(dt) будет вызываться каждый кадр (или не чаще interval_ms);
+        dt больше max_dt обрезается.
+        """
+        if callback in self._subs:
+            return
+        self._subs[callback] = _Subscription(callback, owner, interval_ms / 1000.0, max_dt, time.perf_counter())
+        self._track(owner)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def request(self, owner: QObject, callback: Callable[[], None]):
+        """callback() один раз на ближайшем кадре; повторный запрос до кадра ничего не добавляет."""
+        self._once[callback] = owner
+        self._track(owner)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unsubscribe(self, callback: Callable[[float], None]):
+        self._subs.pop(callback, None)
+        if not self._subs and not self._once:
+            self._timer.stop()
+
+    def is_subscribed(self, callback) -> bool:
+        return callback in self._subs
+
+    def subscriptions(self, window: Optional[QWidget] = None):
+        """(callback, interval в секундах) подписчиков; window — только виджеты этого окна."""
+        return [(sub.callback, sub.interval) for sub in list(self._subs.values())
+                if window is None or (isinstance(sub.owner, QWidget) and sub.owner.window() is window)]
+
+    def run_requests(self, window: Optional[QWidget] = None):
+        """Выполнить отложенные request(); window — только владельцев из этого окна (physlab.bench)."""
+        due = [cb for cb, owner in self._once.items()
+               if window is None or (isinstance(owner, QWidget) and owner.window() is window)]
+        for cb in due:
+            del self._once[cb]
+        for cb in due:
+            cb()
+
+    def _track(self, owner):
+        owner_id = id(owner)
+        if owner_id not in self._owners:
+            # Виджет удалён — его подписки исчезают вместе с ним
+            self._owners.add(owner_id)
+            owner.destroyed.connect(lambda *_: self._drop_owner(owner_id))
+
+    def _drop_owner(self, owner_id):
+        self._owners.discard(owner_id)
+        for cb in [cb for cb, sub in self._subs.items() if sub.owner_id == owner_id]:
+            del self._subs[cb]
+        for cb in [cb for cb, owner in self._once.items() if id(owner) == owner_id]:
+            del self._once[cb]
+
+    def _watch(self, obj):
+        if obj is not None and not obj.property(_WATCHED):
+            obj.setProperty(_WATCHED, True)
+            obj.installEventFilter(self)
+
+    def _is_shown(self, owner) -> bool:
+        if not isinstance(owner, QWidget):
+            return True
+        win = owner.window()
+        self._watch(owner)
+        self._watch(win)
+        handle = win.windowHandle()
+        self._watch(handle)
+        if not owner.isVisible() or win.isMinimized():
+            return False
+        return handle is None or handle.isExposed()
+
+    def eventFilter(self, obj, event):
+        # Окно показали или развернули — будим остановленный таймер
+        if event.type() in _VISIBILITY_EVENTS and self._subs and not self._timer.isActive():
+            now = time.perf_counter()
+            for sub in self._subs.values():
+                sub.last = now
+            self._timer.start()
+        return False
+
+    def _tick(self):
+        now = time.perf_counter()
+        probe = self.probe
+        if probe is not None:
+            probe.tick(now, self._timer.interval())
+        running = 0
+        for sub in list(self._subs.values()):
+            if not self._is_shown(sub.owner):
+                # Пауза: время, пока окно не видно, в dt не попадёт
+                sub.last = now
+                continue
+            running += 1
+            dt = now - sub.last
+            # Период подписчика округляется до ближайшего целого числа кадров
+            if dt < sub.interval - self._half_frame:
+                continue
+            sub.last = now
+            if probe is None:
+                sub.callback(min(dt, sub.max_dt))
+            else:
+                probe.call(sub.owner, sub.callback, min(dt, sub.max_dt))
+        if self._once:
+            self.run_requests()
+        if not running and not self._once:
+            self._timer.stop()
+
+
+_clock: Optional[FrameClock] = None
+
+
+def frame_clock() -> FrameClock:
+    # Создаётся лениво: к этому моменту QApplication уже существует
+    global _clock
+    if _clock is None:
+        _clock = FrameClock()
+    return _clock
+
+
+class Animated:
+    """
+    Примесь для визуализаторов (class W(QFrame, Animated)): кадры идут
+    в animate(dt), только пока виджет «не успокоился».
+    """
+    frame_interval = 0  # мс; 0 — каждый кадр часов
+    max_dt = MAX_DT     # модели, которые догоняют реальное время, берут CATCH_UP_DT
+
+    def wake(self):
+        frame_clock().subscribe(self, self.animate, self.frame_interval, self.max_dt)
+
+    def settle(self):
+        frame_clock().unsubscribe(self.animate)
+
+    def is_animating(self) -> bool:
+        return frame_clock().is_subscribed(self.animate)
+
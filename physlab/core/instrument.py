@@ -0,0 +1,207 @@
+"""
+Замеры «на живую»: F12 в окне работы (открытом из лаунчера) показывает
+поверх визуализации FPS, время paintEvent и animate(), опоздание тиков
+часов и счётчики объектов. Shift+F12 пишет последние записи в файл
+JSON Lines.
+
+Пока оверлей выключен, ничего не измеряется: у FrameClock нет probe,
+paintEvent виджетов не обёрнуты, остаются только два QShortcut на окно.
+PHYSLAB_HUD=1 включает оверлей сразу при открытии окна, PHYSLAB_TRACE —
+путь файла для выгрузки (по умолчанию physlab-trace-<время>.jsonl).
+
+Визуализатор может показать свои счётчики методом debug_counts(),
+который возвращает {"электроны": 120, ...}.
+"""
+import json
+import os
+import sys
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QTimer, Qt
+from PySide6.QtGui import QColor, QFont, QKeySequence, QPainter, QShortcut
+from PySide6.QtWidgets import QWidget
+
+from physlab.core.clock import frame_clock
+
+HUD_ENV = "PHYSLAB_HUD"
+TRACE_ENV = "PHYSLAB_TRACE"
+TRACE_LENGTH = 20000     # записей в кольцевом буфере (~1 мин при 60 Гц и паре виджетов)
+WINDOW_S = 1.0           # окно усреднения оверлея
+REFRESH_MS = 250
+
+
+def has_own_paint(widget: QWidget) -> bool:
+    # Свой paintEvent — у классов работ и physlab, а не у стандартных виджетов Qt
+    return any("paintEvent" in cls.__dict__ for cls in type(widget).__mro__
+               if not cls.__module__.startswith("PySide6"))
+
+
+class Probe:
+    """
+    Кольцевой буфер записей (t, kind, window_id, name, ms); kind — "tick"
+    (ms — опоздание тика), "animate" или "paint" (ms — длительность).
+    """
+
+    def __init__(self, length=TRACE_LENGTH):
+        self.records = deque(maxlen=length)
+        self.titles: Dict[int, str] = {}
+        self.start = time.perf_counter()
+        self._last_tick: Optional[float] = None
+        self._painted: Dict[QWidget, int] = {}   # обёрнутый виджет -> id его окна
+
+    def tick(self, now, interval_ms):
+        if self._last_tick is not None:
+            late = (now - self._last_tick) * 1000.0 - interval_ms
+            self.records.append((now, "tick", 0, "", max(0.0, late)))
+        self._last_tick = now
+
+    def call(self, owner, callback, dt):
+        t0 = time.perf_counter()
+        callback(dt)
+        ms = (time.perf_counter() - t0) * 1000.0
+        win = owner.window() if isinstance(owner, QWidget) else None
+        self.records.append((t0, "animate", id(win), type(owner).__name__, ms))
+
+    # --- paintEvent ---
+    def watch_paint(self, widget: QWidget):
+        if widget in self._painted:
+            return
+        original = widget.paintEvent
+        win_id = id(widget.window())
+        name = type(widget).__name__
+        records = self.records
+
+        def paint_event(event):
+            t0 = time.perf_counter()
+            original(event)
+            records.append((t0, "paint", win_id, name, (time.perf_counter() - t0) * 1000.0))
+
+        widget.paintEvent = paint_event
+        self._painted[widget] = win_id
+
+    def unwatch_paint(self, window: QWidget):
+        for widget in [w for w, win_id in self._painted.items() if win_id == id(window)]:
+            del self._painted[widget]
+            try:
+                del widget.paintEvent   # снова метод класса
+            except RuntimeError:
+                pass                    # виджет уже удалён
+
+    # --- выборки ---
+    def recent(self, window_id, now, span=WINDOW_S) -> List[tuple]:
+        out = []
+        for rec in reversed(self.records):
+            if rec[0] < now - span:
+                break
+            if rec[2] == window_id or rec[1] == "tick":
+                out.append(rec)
+        return out
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for t, kind, window_id, name, ms in list(self.records):
+                f.write(json.dumps({"t": round(t - self.start, 6), "kind": kind,
+                                    "window": self.titles.get(window_id, ""), "name": name,
+                                    "ms": round(ms, 3)}, ensure_ascii=False) + "\n")
+
+
+def _stat(values):
+    if not values:
+        return "—"
+    return f"{sum(values) / len(values):.2f} / {max(values):.2f}"
+
+
+class HudOverlay(QWidget):
+    """Полупрозрачная табличка в правом верхнем углу окна работы."""
+
+    def __init__(self, window: QWidget, probe: Probe):
+        super().__init__(window)
+        self.probe = probe
+        self.lines: List[str] = []
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setFont(QFont("Monospace", 9))
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(REFRESH_MS)
+        self.refresh()
+        self.show()
+
+    def refresh(self):
+        window = self.parentWidget()
+        recs = self.probe.recent(id(window), time.perf_counter())
+        paints: Dict[str, List[float]] = {}
+        for _, kind, _, name, ms in recs:
+            if kind == "paint":
+                paints.setdefault(name, []).append(ms)
+        # FPS — сколько раз за секунду перерисовался самый частый виджет окна
+        fps = max((len(v) for v in paints.values()), default=0) / WINDOW_S
+        lines = [
+            f"FPS          {fps:5.0f}",
+            f"paint, мс    {_stat([r[4] for r in recs if r[1] == 'paint'])}",
+            f"animate, мс  {_stat([r[4] for r in recs if r[1] == 'animate'])}",
+            f"опоздание    {_stat([r[4] for r in recs if r[1] == 'tick'])}",
+            f"подписчики   {len(frame_clock().subscriptions(window))}",
+        ]
+        for widget in window.findChildren(QWidget):
+            counts = getattr(widget, "debug_counts", None)
+            if counts is not None:
+                lines += [f"{name:12} {value}" for name, value in counts().items()]
+        self.lines = lines
+        fm = self.fontMetrics()
+        self.resize(max(fm.horizontalAdvance(s) for s in lines) + 16, fm.height() * len(lines) + 10)
+        self.move(window.width() - self.width() - 8, 8)
+        self.raise_()
+        self.update()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.fillRect(self.rect(), QColor(0, 0, 0, 170))
+        p.setPen(QColor("#8f8"))
+        fm = self.fontMetrics()
+        for i, line in enumerate(self.lines):
+            p.drawText(8, 5 + fm.ascent() + i * fm.height(), line)
+
+
+_probe: Optional[Probe] = None
+_overlays: Dict[QWidget, HudOverlay] = {}
+
+
+def toggle(window: QWidget):
+    """Включает/выключает оверлей окна; probe живёт, пока включён хоть один."""
+    global _probe
+    overlay = _overlays.pop(window, None)
+    if overlay is not None:
+        overlay.deleteLater()
+        _probe.unwatch_paint(window)
+        if not _overlays:
+            frame_clock().probe = None
+        return
+    if _probe is None:
+        _probe = Probe()
+    frame_clock().probe = _probe
+    _probe.titles[id(window)] = window.windowTitle()
+    for widget in window.findChildren(QWidget):
+        if has_own_paint(widget) and not isinstance(widget, HudOverlay):
+            _probe.watch_paint(widget)
+    _overlays[window] = HudOverlay(window, _probe)
+
+
+def dump_trace(path: Optional[str] = None) -> Optional[str]:
+    """Пишет буфер замеров в JSON Lines и возвращает путь (None — замеров не было)."""
+    if _probe is None:
+        return None
+    path = path or os.environ.get(TRACE_ENV) or time.strftime("physlab-trace-%Y%m%d-%H%M%S.jsonl")
+    _probe.dump(path)
+    print(f"physlab: трасса записана в {path}", file=sys.stderr)
+    return path
+
+
+def attach(window: QWidget):
+    """Горячие клавиши F12 / Shift+F12 для окна работы."""
+    QShortcut(QKeySequence(Qt.Key_F12), window, lambda: toggle(window))
+    QShortcut(QKeySequence(Qt.SHIFT | Qt.Key_F12), window, lambda: dump_trace())
+    window.destroyed.connect(lambda *_: _overlays.pop(window, None))
+    if os.environ.get(HUD_ENV, "") not in ("", "0"):
+        toggle(window)
@@ -0,0 +1,44 @@
+"""
+Кэш статичных слоёв: шкала прибора, деления линейки, стойка весов.
+
+Неподвижная часть рисуется один раз в QPixmap и перерисовывается только
+при смене размера виджета или devicePixelRatio (окно перетащили на
+другой монитор). В paintEvent остаётся наложить картинку и дорисовать
+то, что движется.
+"""
+import math
+from typing import Callable
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtWidgets import QWidget
+
+
+class LayerCache:
+    def __init__(self, widget: QWidget, paint: Callable[[QPainter], None]):
+        self.widget = widget
+        self.paint = paint  # paint(painter) рисует слой в координатах виджета
+        self._pixmap = None
+        self._key = None
+
+    def invalidate(self):
+        """Сбросить слой, если поменялось то, что в нём нарисовано."""
+        self._pixmap = None
+
+    def pixmap(self) -> QPixmap:
+        w = self.widget
+        dpr = w.devicePixelRatioF()
+        key = (w.width(), w.height(), dpr)
+        if self._pixmap is None or key != self._key:
+            pm = QPixmap(math.ceil(w.width() * dpr), math.ceil(w.height() * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.Antialiasing)
+            self.paint(p)
+            p.end()
+            self._pixmap, self._key = pm, key
+        return self._pixmap
+
+    def draw(self, painter: QPainter):
+        painter.drawPixmap(0, 0, self.pixmap())
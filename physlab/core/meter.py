@@ -0,0 +1,80 @@
+"""
+Аналоговый измерительный прибор (амперметр, вольтметр, фокусометр...).
+"""
+import math
+
+from PySide6.QtWidgets import QFrame
+from PySide6.QtGui import QPainter, QColor, QPen, QFont
+from PySide6.QtCore import Qt
+
+from physlab.core.layers import LayerCache
+
+
+class MeterWidget(QFrame):
+    """Универсальный аналоговый прибор (A или V) с шкалой и стрелкой."""
+    def __init__(self, kind="A", parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(120, 120)
+        self.kind = kind  # "A", "V" или любая подпись
+        self.value = 0.0
+        self.max_display = 1.0
+        self._dial = LayerCache(self, self.paint_dial)
+
+    def set_value(self, val, vmax=None):
+        self.value = val if val is not None else 0.0
+        if vmax is not None:
+            self.max_display = max(1e-9, float(vmax))
+        self.update()
+
+    def value_text(self):
+        if self.kind == "A":
+            return f"{self.value:.3f} A / {self.max_display:.3f}"
+        if self.kind == "V":
+            return f"{self.value:.2f} V / {self.max_display:.2f}"
+        return f"{self.value:.3f}"
+
+    def dial_geometry(self):
+        w, h = self.width(), self.height()
+        return w // 2, h // 2, min(w, h) // 2 - 8
+
+    def paint_dial(self, p):
+        # корпус и деления не зависят от показаний — рисуются в кэш
+        cx, cy, radius = self.dial_geometry()
+        p.fillRect(self.rect(), QColor(250, 250, 250))
+        p.setPen(QPen(Qt.black, 2))
+        p.setBrush(QColor(255, 255, 255))
+        p.drawEllipse(cx - radius, cy - radius, 2 * radius, 2 * radius)
+
+        # шкала делений
+        p.setPen(QPen(Qt.black, 1))
+        for angle in range(-60, 61, 10):
+            rad = math.radians(angle)
+            x0 = cx + int((radius - 8) * math.cos(rad))
+            y0 = cy - int((radius - 8) * math.sin(rad))
+            x1 = cx + int(radius * math.cos(rad))
+            y1 = cy - int(radius * math.sin(rad))
+            p.drawLine(x0, y0, x1, y1)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        self._dial.draw(p)
+        cx, cy, radius = self.dial_geometry()
+
+        # стрелка (угол пропорционален |value|/max_display)
+        frac = 0.0
+        if self.max_display > 0:
+            frac = max(0.0, min(1.0, abs(self.value) / self.max_display))
+        angle = -60 + frac * 120.0
+        rad = math.radians(angle)
+        p.setPen(QPen(QColor(200, 30, 30), 2))
+        x_end = cx + int((radius - 14) * math.cos(rad))
+        y_end = cy - int((radius - 14) * math.sin(rad))
+        p.drawLine(cx, cy, x_end, y_end)
+
+        # подпись и цифровое значение
+        p.setPen(QPen(Qt.black, 2))
+        p.setFont(QFont("Sans", 12, QFont.Bold))
+        p.drawText(cx - 8, cy + 6, self.kind)
+        p.setFont(QFont("Sans", 9))
+        p.drawText(8, self.height() - 10, self.value_text())
@@ -0,0 +1,61 @@
+"""
+Пул частиц (электроны фотоэффекта и т.п.) на массивах numpy.
+
+Координаты и скорости лежат в отдельных массивах фиксированной ёмкости
+(структура массивов): шаг интегрирования и удаление по маске идут одной
+векторной операцией, а список частиц не пересобирается каждый кадр.
+"""
+import numpy as np
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPolygonF
+
+
+class ParticlePool:
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, vx, vy=0.0):
+        """Добавить частицы (числа или массивы). Сверх ёмкости не добавляются; возвращает сколько добавлено."""
+        x, y, vx, vy = np.broadcast_arrays(*(np.atleast_1d(np.asarray(a, dtype=float)) for a in (x, y, vx, vy)))
+        n = min(len(x), self.capacity - self.count)
+        s = slice(self.count, self.count + n)
+        self.x[s], self.y[s], self.vx[s], self.vy[s] = x[:n], y[:n], vx[:n], vy[:n]
+        self.count += n
+        return n
+
+    def step(self, ax=0.0, ay=0.0, dt=1.0):
+        """Шаг полуявного Эйлера: сначала скорость, потом координата."""
+        n = self.count
+        self.vx[:n] += ax * dt
+        self.vy[:n] += ay * dt
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+
+    def remove(self, mask):
+        """Убрать частицы, где mask истинна (mask длиной count); возвращает сколько убрано."""
+        keep = ~mask
+        kept = int(np.count_nonzero(keep))
+        for a in (self.x, self.y, self.vx, self.vy):
+            a[:kept] = a[:self.count][keep]
+        removed = self.count - kept
+        self.count = kept
+        return removed
+
+    def positions(self):
+        """Представления (x, y) живых частиц — без копирования."""
+        return self.x[:self.count], self.y[:self.count]
+
+    def polygon(self) -> QPolygonF:
+        # Все частицы одним drawPoints вместо drawEllipse на каждую
+        return QPolygonF(list(map(QPointF, self.x[:self.count].tolist(), self.y[:self.count].tolist())))
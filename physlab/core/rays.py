@@ -0,0 +1,153 @@
+"""
+Ход лучей (physlab.models.raytrace) в окне: готовые отрезки QLineF и
+кэш сцен по параметрам.
+
+Сцена — веер лучей, основные лучи, изображение и контуры линз для
+одного набора (f, d_o, h, режим, система). Она считается один раз при
+смене параметров; paintEvent только рисует готовые списки отрезков
+drawLines. RayCache помнит последние сцены: когда ученик водит предмет
+туда-обратно, лучи для уже виденных положений не пересчитываются.
+
+Для тел на столе (пластина, полуцилиндр, призма) отрезки ветвей
+раскладываются по ступеням яркости: одно перо на ступень — и веер из
+сотен лучей рисуется десятком вызовов drawLines.
+"""
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Tuple
+
+import numpy as np
+from PySide6.QtCore import QLineF, QPointF
+from PySide6.QtGui import QPolygonF
+
+from physlab.models.raytrace import EXACT, PARAXIAL, Surface, ThinLens, lens_system
+
+FIT = 0.8   # в режиме EXACT основные лучи входят в стеклянную линзу не выше этой доли оправы
+
+
+def to_lines(segments: np.ndarray, cx: float, baseline: float) -> List[QLineF]:
+    """Отрезки (x0, y0, x1, y1) в координатах скамьи (y вверх) -> QLineF виджета."""
+    if not len(segments):
+        return []
+    s = np.asarray(segments, dtype=float)
+    x0, x1 = (s[:, 0] + cx).tolist(), (s[:, 2] + cx).tolist()
+    y0, y1 = (baseline - s[:, 1]).tolist(), (baseline - s[:, 3]).tolist()
+    return list(map(QLineF, x0, y0, x1, y1))
+
+
+def lens_outlines(system, cx: float, baseline: float, samples=24) -> List[QPolygonF]:
+    """Контуры стеклянных линз системы (пары поверхностей); тонкие линзы окно рисует само."""
+    outlines = []
+    surfaces = [el for el in system.elements if isinstance(el, Surface)]
+    for front, back in zip(surfaces[::2], surfaces[1::2]):
+        a = min(front.aperture, back.aperture)
+        y = np.linspace(-a, a, samples)
+        xf = front.x + front.R - np.sign(front.R) * np.sqrt(front.R ** 2 - y ** 2)
+        xb = back.x + back.R - np.sign(back.R) * np.sqrt(back.R ** 2 - y ** 2)
+        xs = np.concatenate([xf, xb[::-1]]) + cx
+        ys = baseline - np.concatenate([y, y[::-1]])
+        outlines.append(QPolygonF(list(map(QPointF, xs.tolist(), ys.tolist()))))
+    return outlines
+
+
+def body_polygon(body, cx: float, cy: float) -> QPolygonF:
+    """Контур тела (physlab.models.raytrace.Body) в координатах виджета."""
+    points = body.outline()
+    return QPolygonF(list(map(QPointF, (points[:, 0] + cx).tolist(), (cy - points[:, 1]).tolist())))
+
+
+def intensity_lines(trace, cx: float, cy: float, levels=8, rows=None) -> List[Tuple[float, List[QLineF]]]:
+    """Отрезки BodyTrace по ступеням яркости: [(доля 0..1, [QLineF])], от тусклых к ярким."""
+    keep = slice(None) if rows is None else rows
+    segments, intensity = trace.segments[keep], trace.intensity[keep]
+    step = np.clip(np.ceil(intensity * levels), 1, levels).astype(int)
+    return [(k / levels, to_lines(segments[step == k], cx, cy))
+            for k in range(1, levels + 1) if np.any(step == k)]
+
+
+def thin_lenses(system):
+    return [el for el in system.elements if isinstance(el, ThinLens)]
+
+
+class RayScene:
+    """Сцена, готовая к рисованию: отрезки лучей и изображение системы."""
+
+    def __init__(self, system, lenses, fan=(), principal=(), extensions=(), outlines=(),
+                 image_x=None, magnification=None, trace=None, h_obj=None, foci=()):
+        self.system = system
+        self.lenses = lenses               # [(x, f)] линз системы
+        self.foci = foci                   # [(x переднего, x заднего фокуса)] каждой линзы — по её матрице
+        self.h_obj = h_obj                 # высота предмета, по которой идут лучи (в EXACT — не выше оправы)
+        self.fan = fan                     # [QLineF] веера
+        self.principal = principal         # [[QLineF]] по одному списку на основной луч
+        self.extensions = extensions       # [QLineF] продолжения к мнимому изображению
+        self.outlines = outlines           # [QPolygonF] стеклянные линзы
+        self.image_x = image_x
+        self.magnification = magnification
+        self.trace = trace                 # Trace веера или основных лучей (экран, пятно)
+
+
+def lens_scene(lenses, do, h_obj, x_end, cx, baseline, mode=PARAXIAL, fan=0, principal=3) -> RayScene:
+    """
+    Сцена для предмета высотой h_obj на расстоянии do перед первой линзой
+    (линзы — (x, f) от центра скамьи cx). principal основных лучей из
+    вершины предмета: параллельный оси, через центр, через передний фокус
+    первой линзы; fan > 0 — ещё веер из fan лучей по всей оправе.
+
+    Фокусы и изображение берутся из матриц посчитанной системы: у
+    стеклянной линзы (EXACT) они немного дальше, чем f тонкой. Основные
+    лучи тонких линз — построительные: оправа их не обрезает. Стеклянная
+    линза не выше 0.6·R, а выше ~0.5·R край преломляет с полным внутренним
+    отражением, поэтому в EXACT предмет уменьшается (scene.h_obj) так, чтобы
+    параллельный луч и луч через фокус вошли в линзу не выше FIT·оправы.
+    """
+    system = lens_system(lenses, mode)
+    foci = [lens_system([lens], mode).focal_points() for lens in lenses]
+    x0 = -do
+    front = foci[0][0]
+    if mode == EXACT:
+        # луч через передний фокус входит в линзу на высоте h·(x линзы − фокус)/(фокус − x0)
+        reach = 1.0
+        if front is not None and abs(front - x0) > 1e-6:
+            reach = max(reach, abs((lenses[0][0] - front) / (front - x0)))
+        h_obj = min(h_obj, FIT * system.elements[0].aperture / reach)
+    image_x, m = system.image(x0)
+    focus_slope = -h_obj / (front - x0) if front is not None and abs(front - x0) > 1e-6 else None
+    slopes = [0.0, -h_obj / do, focus_slope][:principal]
+    slopes = [s for s in slopes if s is not None]
+    main = system.trace(x0, h_obj, slopes, x_end, mode, clip=False)
+    extensions = []
+    last_x = system.elements[-1].x
+    if image_x is not None and np.isfinite(image_x) and image_x < last_x:
+        extensions = to_lines(main.extensions(image_x), cx, baseline)
+    scene = RayScene(
+        system, list(lenses),
+        principal=[to_lines(main.segments(slice(i, i + 1)), cx, baseline) for i in range(len(main))],
+        extensions=extensions, outlines=lens_outlines(system, cx, baseline),
+        image_x=image_x, magnification=m, trace=main, h_obj=h_obj, foci=foci,
+    )
+    if fan:
+        rays = system.trace(x0, h_obj, system.fan(x0, h_obj, fan), x_end, mode)
+        scene.fan, scene.trace = to_lines(rays.segments(), cx, baseline), rays
+    return scene
+
+
+class RayCache:
+    """Последние maxsize сцен по ключу; build(key) строит сцену при промахе."""
+
+    def __init__(self, build: Callable[[Hashable], object], maxsize=32):
+        self.build = build
+        self.maxsize = maxsize
+        self._scenes: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def get(self, key):
+        scene = self._scenes.get(key)
+        if scene is None:
+            scene = self._scenes[key] = self.build(key)
+            if len(self._scenes) > self.maxsize:
+                self._scenes.popitem(last=False)
+        else:
+            self._scenes.move_to_end(key)
+        return scene
+
+    def clear(self):
+        self._scenes.clear()
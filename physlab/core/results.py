@@ -0,0 +1,154 @@
+"""
+Результаты измерений: запись Measurement и таблица результатов.
+
+Строки хранятся по столбцам в ResultsModel: тексты ячеек — списками,
+время и статус — массивами array. Measurement собирается только по
+запросу. ResultsTable — это QTableView с фиксированной высотой строк,
+поэтому Qt спрашивает data() только у видимых строк. Статус рисует
+StatusDelegate, а не отдельный QTableWidgetItem с цветом.
+"""
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QTimer, Qt
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QStyledItemDelegate, QTableView
+
+STATUS_TEXT = {True: "✅ Верно", False: "❌ Ошибка"}
+STATUS_COLOR = {True: QColor("green"), False: QColor("red")}
+
+
+@dataclass
+class Measurement:
+    timestamp: float
+    params: Dict[str, float]  # Входные параметры (I, R, t...)
+    results: Dict[str, float] # Вычисленные моделью значения
+    user_answer: float        # Ответ ученика
+    is_correct: bool
+
+    @classmethod
+    def now(cls, params, results, user_answer, is_correct):
+        return cls(time.time(), dict(params), dict(results), user_answer, is_correct)
+
+
+class ResultsModel(QAbstractTableModel):
+    """Строки таблицы результатов; последний столбец — статус."""
+
+    def __init__(self, headers: Sequence[str], parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self._cells: List[List[str]] = [[] for _ in self.headers[:-1]]
+        self._status = array("b")
+        self._time = array("d")
+        self._extra: List[Optional[tuple]] = []   # (params, results, user_answer) или None
+
+    # --- Запись ---
+    def append(self, cells: Sequence[str], is_correct: bool, meas: Optional[Measurement] = None):
+        self.extend([(cells, is_correct, meas)])
+
+    def extend(self, rows: Sequence[tuple]):
+        """Строки (cells, is_correct, meas) одной вставкой — восстановление из журнала."""
+        if not rows:
+            return
+        row = len(self._status)
+        self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+        for cells, is_correct, meas in rows:
+            self._add(cells, is_correct, meas)
+        self.endInsertRows()
+
+    def _add(self, cells, is_correct, meas):
+        for col, column in enumerate(self._cells):
+            column.append(cells[col] if col < len(cells) else "")
+        self._status.append(bool(is_correct))
+        if meas is None:
+            self._time.append(time.time())
+            self._extra.append(None)
+        else:
+            self._time.append(meas.timestamp)
+            self._extra.append((meas.params, meas.results, meas.user_answer))
+
+    def clear(self):
+        self.beginResetModel()
+        for column in self._cells:
+            column.clear()
+        self._status = array("b")
+        self._time = array("d")
+        self._extra.clear()
+        self.endResetModel()
+
+    def measurement(self, row: int) -> Optional[Measurement]:
+        extra = self._extra[row]
+        if extra is None:
+            return None
+        params, results, user_answer = extra
+        return Measurement(self._time[row], params, results, user_answer, bool(self._status[row]))
+
+    def measurements(self) -> List[Measurement]:
+        return [m for m in map(self.measurement, range(len(self._status))) if m is not None]
+
+    # --- QAbstractTableModel ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._status)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole) -> Any:
+        row, col = index.row(), index.column()
+        if col == len(self._cells):
+            if role == Qt.DisplayRole:
+                return STATUS_TEXT[bool(self._status[row])]
+            if role == Qt.UserRole:
+                return bool(self._status[row])
+            return None
+        if role == Qt.DisplayRole:
+            return self._cells[col][row]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Цвет текста статуса — по Qt.UserRole (верно/ошибка)."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        color = STATUS_COLOR[bool(index.data(Qt.UserRole))]
+        option.palette.setColor(QPalette.Text, color)
+        option.palette.setColor(QPalette.HighlightedText, color)
+
+
+class ResultsTable(QTableView):
+    """Таблица «параметры | ответ | эталон | статус» с цветным статусом."""
+
+    def __init__(self, headers: Sequence[str], parent=None):
+        super().__init__(parent)
+        self.results = ResultsModel(headers, self)
+        self.setModel(self.results)
+        self.setItemDelegateForColumn(len(headers) - 1, StatusDelegate(self))
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Одинаковая высота строк: размеры не пересчитываются по содержимому всех строк
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Прокрутка к новой строке — одна на проход цикла событий, даже если строк добавили сотню
+        self._scroll = QTimer(self)
+        self._scroll.setSingleShot(True)
+        self._scroll.timeout.connect(self.scrollToBottom)
+
+    def add_row(self, cells: Sequence[str], is_correct: bool, meas: Optional[Measurement] = None):
+        # cells — все столбцы, кроме последнего (статус)
+        self.results.append(cells, is_correct, meas)
+        self._scroll.start(0)
+
+    def clear_rows(self):
+        self.results.clear()
+
+    def rowCount(self):
+        return self.results.rowCount()
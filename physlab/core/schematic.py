@@ -0,0 +1,401 @@
+"""
+Редактор электрических схем на сетке (physlab.models.schematic).
+
+SchematicPanel — редактор с рядом кнопок-деталей над ним.
+
+Ученик выбирает деталь (set_tool) и ставит её щелчком; в режиме
+"select" деталь перетаскивается мышью, провод тянется от вывода или
+от любой точки сетки, правая кнопка удаляет, двойной щелчок меняет
+значение (ключ — замыкает и размыкает), R или пробел поворачивает
+деталь под курсором, Delete удаляет её.
+
+После каждой правки схема решается заново (не чаще раза в кадр, через
+frame_clock().request), а ток рисуется бегущими точками по проводам и
+деталям. Кадр собирается из слоёв: сетка и сама схема с подписями и
+показаниями лежат в LayerCache и перерисовываются только после правки,
+а каждый кадр добавляет лишь точки тока одним drawPoints — поэтому и
+схема из сотни деталей идёт с частотой часов.
+"""
+import math
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import QPointF, QRectF, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import (
+    QButtonGroup, QFrame, QHBoxLayout, QInputDialog, QLabel, QPushButton, QToolButton, QVBoxLayout, QWidget
+)
+
+from physlab.core.clock import Animated, frame_clock
+from physlab.core.layers import LayerCache
+from physlab.models.schematic import PART_KINDS, SPAN, Schematic
+
+GRID = 20            # пикселей в клетке сетки
+DOT_STEP = 14.0      # расстояние между точками тока, px
+FLOW_SPEED = 90.0    # скорость точек при наибольшем токе в схеме, px/с
+MIN_CURRENT = 1e-6   # меньший ток не рисуется
+
+TOOL_NAMES = {
+    "select": "Выбор и провода",
+    "source": "Источник",
+    "resistor": "Резистор",
+    "lamp": "Лампа",
+    "switch": "Ключ",
+    "ammeter": "Амперметр",
+    "voltmeter": "Вольтметр",
+}
+
+
+class SchematicEditor(QFrame, Animated):
+    changed = Signal()       # схема решена после правки
+    toolChanged = Signal(str)
+
+    def __init__(self, schematic: Optional[Schematic] = None, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(500, 360)
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setStyleSheet("background-color: white; border: 1px solid #aaa;")
+        self.schematic = schematic if schematic is not None else Schematic()
+        self.tool = "select"
+        self.hover = None          # результат Schematic.hit под курсором
+        self.drag = None           # (имя детали, сдвиг вывода a от курсора)
+        self.wire_from = None      # начало тянущегося провода
+        self.cursor_point = None   # узел сетки под курсором
+        self._grid = LayerCache(self, self.paint_grid)
+        self._scene = LayerCache(self, self.paint_scene)
+        # Точки тока: участок каждой точки, её смещение от начала участка
+        self._seg_start = np.zeros((0, 2))
+        self._seg_dir = np.zeros((0, 2))
+        self._seg_len = np.zeros(0)
+        self._seg_speed = np.zeros(0)
+        self._dot_seg = np.zeros(0, dtype=int)
+        self._dot_base = np.zeros(0)
+        self._shift = np.zeros(0)
+
+    # --- Координаты ---
+    @staticmethod
+    def to_px(point):
+        return QPointF(point[0] * GRID, point[1] * GRID)
+
+    @staticmethod
+    def to_grid(pos):
+        return pos.x() / GRID, pos.y() / GRID
+
+    @staticmethod
+    def snap(pos):
+        return round(pos.x() / GRID), round(pos.y() / GRID)
+
+    # --- Правка ---
+    def set_tool(self, tool):
+        self.tool = tool
+        self.wire_from = None
+        self.setCursor(Qt.ArrowCursor if tool == "select" else Qt.CrossCursor)
+        self.toolChanged.emit(tool)
+
+    def edited(self):
+        """Схема изменилась: пересчёт и перерисовка слоя — на ближайшем кадре."""
+        frame_clock().request(self, self.refresh)
+        self.update()
+
+    def refresh(self):
+        sch = self.schematic
+        sch.solve()
+        self.build_flow(sch.flows())
+        self._scene.invalidate()
+        self.update()
+        self.changed.emit()
+
+    def mousePressEvent(self, event):
+        pos = event.position()
+        gx, gy = self.to_grid(pos)
+        hit = self.schematic.hit(gx, gy)
+        if event.button() == Qt.RightButton:
+            if hit is not None:
+                self.schematic.remove(hit[1].name)
+                self.hover = None
+                self.edited()
+            return
+        if event.button() != Qt.LeftButton:
+            return
+        if self.tool in PART_KINDS:
+            x, y = self.snap(pos)
+            self.schematic.add_part(self.tool, x, y)
+            self.set_tool("select")
+            self.edited()
+        elif hit is not None and hit[0] == "part":
+            part = hit[1]
+            x, y = self.snap(pos)
+            self.drag = part.name, (part.x - x, part.y - y)
+        elif hit is not None and hit[0] == "pin":
+            self.wire_from = hit[1].pins()[hit[2]]
+        else:
+            self.wire_from = self.snap(pos)
+        self.cursor_point = self.snap(pos)
+
+    def mouseMoveEvent(self, event):
+        pos = event.position()
+        point = self.snap(pos)
+        if self.drag is not None:
+            name, (dx, dy) = self.drag
+            part = self.schematic.parts.get(name)
+            if part is not None and (part.x, part.y) != (point[0] + dx, point[1] + dy):
+                self.schematic.move_part(name, point[0] + dx, point[1] + dy)
+                self.edited()
+        elif self.wire_from is not None:
+            if point != self.cursor_point:
+                self.cursor_point = point
+                self.update()
+        else:
+            hover = self.schematic.hit(*self.to_grid(pos))
+            if hover != self.hover:
+                self.hover = hover
+                self.update()
+
+    def mouseReleaseEvent(self, event):
+        if self.wire_from is not None:
+            if self.schematic.add_wire(self.wire_from, self.snap(event.position())):
+                self.edited()
+            self.wire_from = None
+            self.update()
+        self.drag = None
+
+    def mouseDoubleClickEvent(self, event):
+        hit = self.schematic.hit(*self.to_grid(event.position()))
+        if hit is None or hit[0] == "wire":
+            return
+        part = hit[1]
+        self.wire_from = None
+        if part.kind == "switch":
+            self.schematic.toggle(part.name)
+        elif part.kind in ("source", "resistor", "lamp"):
+            unit = PART_KINDS[part.kind][1]
+            value, ok = QInputDialog.getDouble(self, part.name, f"{part.name}, {unit}:", part.value, 0.0, 1000.0, 2)
+            if not ok:
+                return
+            self.schematic.set_value(part.name, value)
+        self.edited()
+
+    def keyPressEvent(self, event):
+        hover = self.hover
+        if hover is None or hover[0] == "wire" and event.key() != Qt.Key_Delete:
+            super().keyPressEvent(event)
+            return
+        if event.key() in (Qt.Key_R, Qt.Key_Space):
+            self.schematic.rotate(hover[1].name)
+        elif event.key() == Qt.Key_Delete:
+            self.schematic.remove(hover[1].name)
+            self.hover = None
+        else:
+            super().keyPressEvent(event)
+            return
+        self.edited()
+
+    # --- Ток ---
+    def build_flow(self, flows):
+        """Участки с током и точки на них; скорость точки пропорциональна току."""
+        flows = [(a, b, i) for a, b, i in flows if i > MIN_CURRENT and a != b]
+        if not flows:
+            self._dot_seg = np.zeros(0, dtype=int)
+            self.settle()
+            return
+        start = np.array([a for a, _, _ in flows], dtype=float) * GRID
+        end = np.array([b for _, b, _ in flows], dtype=float) * GRID
+        current = np.array([i for _, _, i in flows])
+        vec = end - start
+        length = np.hypot(vec[:, 0], vec[:, 1])
+        self._seg_start, self._seg_dir, self._seg_len = start, vec / length[:, None], length
+        self._seg_speed = FLOW_SPEED * current / current.max()
+        counts = np.maximum(1, (length // DOT_STEP).astype(int))
+        self._dot_seg = np.repeat(np.arange(len(flows)), counts)
+        first = np.cumsum(counts) - counts
+        self._dot_base = (np.arange(counts.sum()) - np.repeat(first, counts)) * DOT_STEP
+        self._shift = np.zeros(len(flows))
+        self.wake()
+
+    def animate(self, dt):
+        self._shift = (self._shift + self._seg_speed * dt) % DOT_STEP
+        self.update()
+
+    def dots(self) -> QPolygonF:
+        seg = self._dot_seg
+        if not len(seg):
+            return QPolygonF()
+        offset = (self._dot_base + self._shift[seg]) % self._seg_len[seg]
+        pos = self._seg_start[seg] + self._seg_dir[seg] * offset[:, None]
+        return QPolygonF(list(map(QPointF, pos[:, 0].tolist(), pos[:, 1].tolist())))
+
+    # --- Рисование ---
+    def paint_grid(self, p):
+        p.setPen(QPen(QColor(215, 220, 230), 1.5))
+        points = [QPointF(x, y) for x in range(0, self.width(), GRID) for y in range(0, self.height(), GRID)]
+        p.drawPoints(QPolygonF(points))
+
+    def paint_scene(self, p):
+        sch = self.schematic
+        sch.solve()
+        node_of, segments = sch.topology()
+
+        # Провода и точки соединений, где сходится больше двух концов
+        p.setPen(QPen(QColor(40, 40, 40), 2))
+        for wire in sch.wires.values():
+            p.drawLine(self.to_px(wire.a), self.to_px(wire.b))
+        ends = {}
+        for a, b, _ in segments:
+            ends[a] = ends.get(a, 0) + 1
+            ends[b] = ends.get(b, 0) + 1
+        for part in sch.parts.values():
+            for pin in part.pins():
+                ends[pin] = ends.get(pin, 0) + 1
+        p.setBrush(QColor(40, 40, 40))
+        for point, n in ends.items():
+            if n > 2:
+                p.drawEllipse(self.to_px(point), 3.5, 3.5)
+
+        p.setFont(QFont("Arial", 8))
+        for part in sch.parts.values():
+            self.paint_part(p, part)
+
+        if sch.error:
+            p.setPen(QColor(200, 0, 0))
+            p.setFont(QFont("Arial", 11, QFont.Bold))
+            p.drawText(10, 20, sch.error)
+
+    def paint_part(self, p, part):
+        sch = self.schematic
+        a, b = part.pins()
+        length = SPAN * GRID
+        p.save()
+        p.translate(self.to_px(a))
+        p.rotate(part.rot * 90)
+        pen = QPen(QColor(40, 40, 40), 2)
+        p.setPen(pen)
+        p.setBrush(Qt.white)
+        mid = length / 2
+        kind = part.kind
+        if kind == "resistor":
+            p.drawLine(QPointF(0, 0), QPointF(mid - 15, 0))
+            p.drawLine(QPointF(mid + 15, 0), QPointF(length, 0))
+            p.drawRect(QRectF(mid - 15, -6, 30, 12))
+        elif kind == "lamp":
+            power = sch.power(part.name)
+            glow = max(0.0, min(1.0, power / 2.0))
+            p.drawLine(QPointF(0, 0), QPointF(mid - 10, 0))
+            p.drawLine(QPointF(mid + 10, 0), QPointF(length, 0))
+            p.setBrush(QColor(255, 255, int(255 * (1 - glow))) if glow > 0.01 else Qt.white)
+            p.drawEllipse(QPointF(mid, 0), 10, 10)
+            d = 10 / math.sqrt(2)
+            p.drawLine(QPointF(mid - d, -d), QPointF(mid + d, d))
+            p.drawLine(QPointF(mid - d, d), QPointF(mid + d, -d))
+        elif kind == "source":
+            # «+» (длинная пластина) у вывода a
+            p.drawLine(QPointF(0, 0), QPointF(mid - 4, 0))
+            p.drawLine(QPointF(mid + 4, 0), QPointF(length, 0))
+            p.setPen(QPen(QColor(40, 40, 40), 3))
+            p.drawLine(QPointF(mid - 4, -14), QPointF(mid - 4, 14))
+            p.drawLine(QPointF(mid + 4, -7), QPointF(mid + 4, 7))
+        elif kind == "switch":
+            p.drawLine(QPointF(0, 0), QPointF(mid - 12, 0))
+            p.drawLine(QPointF(mid + 12, 0), QPointF(length, 0))
+            tip = QPointF(mid + 12, 0) if part.value else QPointF(mid + 8, -14)
+            p.drawLine(QPointF(mid - 12, 0), tip)
+            p.setBrush(QColor(40, 40, 40))
+            p.drawEllipse(QPointF(mid - 12, 0), 2.5, 2.5)
+        else:
+            p.drawLine(QPointF(0, 0), QPointF(mid - 12, 0))
+            p.drawLine(QPointF(mid + 12, 0), QPointF(length, 0))
+            p.drawEllipse(QPointF(mid, 0), 12, 12)
+        p.restore()
+
+        # Подписи — без поворота, рядом с серединой детали
+        center = (self.to_px(a) + self.to_px(b)) / 2
+        vertical = part.rot % 2 == 1
+        label_at = center + (QPointF(14, 4) if vertical else QPointF(-18, -16))
+        p.setPen(QColor(20, 20, 120))
+        unit = PART_KINDS[kind][1]
+        if kind in ("ammeter", "voltmeter"):
+            p.setFont(QFont("Arial", 10, QFont.Bold))
+            p.drawText(center + QPointF(-4, 4), kind[0].upper())
+            p.setFont(QFont("Arial", 8))
+            value = sch.reading(part.name)
+            text = f"{part.name}: {value:.3f} {unit}" if value is not None else f"{part.name}: —"
+        elif kind == "switch":
+            text = f"{part.name} {'замкнут' if part.value else 'разомкнут'}"
+        else:
+            text = f"{part.name} {part.value:g} {unit}"
+        p.drawText(label_at, text)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        self._grid.draw(p)
+        self._scene.draw(p)
+
+        # Бегущие точки тока — одним вызовом на все участки
+        if len(self._dot_seg):
+            p.setPen(QPen(QColor(230, 120, 0), 5, Qt.SolidLine, Qt.RoundCap))
+            p.drawPoints(self.dots())
+
+        hover = self.hover
+        if hover is not None and self.wire_from is None:
+            p.setPen(QPen(QColor(0, 120, 255, 160), 6, Qt.SolidLine, Qt.RoundCap))
+            p.setBrush(Qt.NoBrush)
+            if hover[0] == "pin":
+                p.drawEllipse(self.to_px(hover[1].pins()[hover[2]]), 5, 5)
+            elif hover[0] == "part":
+                a, b = hover[1].pins()
+                p.drawLine(self.to_px(a), self.to_px(b))
+            else:
+                p.drawLine(self.to_px(hover[1].a), self.to_px(hover[1].b))
+
+        if self.wire_from is not None and self.cursor_point is not None:
+            # Будущий провод — тем же уголком, что и Schematic.add_wire
+            a, b = self.wire_from, self.cursor_point
+            corner = (b[0], a[1])
+            p.setPen(QPen(QColor(0, 120, 255), 2, Qt.DashLine))
+            p.drawLine(self.to_px(a), self.to_px(corner))
+            p.drawLine(self.to_px(corner), self.to_px(b))
+
+
+class SchematicPanel(QWidget):
+    """Редактор схем с кнопками деталей и кнопкой «Очистить»."""
+
+    def __init__(self, schematic: Optional[Schematic] = None, parent=None):
+        super().__init__(parent)
+        self.editor = SchematicEditor(schematic)
+        layout = QVBoxLayout(self)
+
+        tools = QHBoxLayout()
+        self.tool_buttons = QButtonGroup(self)
+        for tool, title in TOOL_NAMES.items():
+            btn = QToolButton()
+            btn.setText(title)
+            btn.setCheckable(True)
+            btn.setChecked(tool == "select")
+            btn.clicked.connect(lambda _=False, t=tool: self.editor.set_tool(t))
+            self.tool_buttons.addButton(btn)
+            tools.addWidget(btn)
+            btn.setProperty("tool", tool)
+        tools.addStretch(1)
+        btn_clear = QPushButton("Очистить")
+        btn_clear.clicked.connect(self.clear)
+        tools.addWidget(btn_clear)
+        layout.addLayout(tools)
+
+        layout.addWidget(self.editor, stretch=1)
+        hint = QLabel("Провод — тянуть мышью от вывода или точки сетки. Двойной щелчок — значение "
+                      "или ключ, R — повернуть, правая кнопка или Delete — удалить.")
+        hint.setWordWrap(True)
+        hint.setStyleSheet("color: #555;")
+        layout.addWidget(hint)
+        self.editor.toolChanged.connect(self.show_tool)
+
+    def show_tool(self, tool):
+        for btn in self.tool_buttons.buttons():
+            if btn.property("tool") == tool:
+                btn.setChecked(True)
+
+    def clear(self):
+        self.editor.schematic.clear()
+        self.editor.hover = None
+        self.editor.edited()
@@ -0,0 +1,76 @@
+"""
+Цвет видимого света по длине волны — одна таблица на все спектральные
+лабораторные (фотоэффект, дифракция, спектроскоп).
+
+Таблица 380..780 нм с шагом 0.1 нм считается один раз, при первом
+запросе; в paintEvent остаётся поиск по индексу. Вне видимого
+диапазона — чёрный.
+"""
+from functools import lru_cache
+from typing import Tuple
+
+from PySide6.QtGui import QColor
+
+VISIBLE_MIN = 380.0  # нм
+VISIBLE_MAX = 780.0
+STEP = 0.1
+
+
+def _nm_to_rgb(nm):
+    # приближённое отображение nm -> RGB с ослаблением к краям диапазона
+    r = g = b = 0.0
+    if 380 <= nm < 440:
+        r = -(nm - 440) / (440 - 380); b = 1.0
+    elif 440 <= nm < 490:
+        g = (nm - 440) / (490 - 440); b = 1.0
+    elif 490 <= nm < 510:
+        g = 1.0; b = -(nm - 510) / (510 - 490)
+    elif 510 <= nm < 580:
+        r = (nm - 510) / (580 - 510); g = 1.0
+    elif 580 <= nm < 645:
+        r = 1.0; g = -(nm - 645) / (645 - 580)
+    elif 645 <= nm <= 780:
+        r = 1.0
+    if 380 <= nm < 420:
+        factor = 0.3 + 0.7 * (nm - 380) / (420 - 380)
+    elif 420 <= nm <= 700:
+        factor = 1.0
+    else:
+        factor = 0.3 + 0.7 * (780 - nm) / (780 - 700)
+    return tuple(int(max(0.0, min(1.0, c * factor)) * 255) for c in (r, g, b))
+
+
+_SIZE = int(round((VISIBLE_MAX - VISIBLE_MIN) / STEP)) + 1
+_TABLE = []
+_COLORS = [None] * _SIZE  # QColor создаются по первому запросу
+
+
+def _index(nm):
+    if not _TABLE:
+        _TABLE.extend(_nm_to_rgb(VISIBLE_MIN + i * STEP) for i in range(_SIZE))
+    i = int(round((nm - VISIBLE_MIN) / STEP))
+    return i if 0 <= i < _SIZE else None
+
+
+def wavelength_rgb(nm) -> Tuple[int, int, int]:
+    i = _index(nm)
+    return _TABLE[i] if i is not None else (0, 0, 0)
+
+
+def wavelength_color(nm, alpha=255) -> QColor:
+    """QColor для длины волны nm. Непрозрачный цвет общий — менять его нельзя, только копию."""
+    if alpha != 255:
+        return QColor(*wavelength_rgb(nm), alpha)
+    i = _index(nm)
+    if i is None:
+        return QColor(0, 0, 0)
+    if _COLORS[i] is None:
+        _COLORS[i] = QColor(*_TABLE[i])
+    return _COLORS[i]
+
+
+@lru_cache(maxsize=None)
+def spectrum_stops(nm_min=VISIBLE_MIN, nm_max=VISIBLE_MAX, steps=24):
+    """Точки градиента (доля, QColor) для непрерывного спектра nm_min..nm_max."""
+    return tuple((i / steps, wavelength_color(nm_min + (nm_max - nm_min) * i / steps))
+                 for i in range(steps + 1))
@@ -0,0 +1,157 @@
+"""
+Пакетная проверка ответов без GUI: python3 -m physlab.grading.
+
+Вход — JSON Lines, по записи на попытку ученика:
+
+    {"id": "9А-17", "lab": "lab94", "params": {"m": 1.0, "k": 20.0}, "answers": {"value": "0,71"}}
+
+lab — "lab94" или полный ключ "lab811:PhotoEffectLab"; params — параметры
+модели (см. LabModel.params); state — необязательные поля состояния,
+которые окно измерило по ходу опыта (например {"max_voltage": 412.0} для
+lab101); answers — ответы ученика, числа можно строкой с запятой.
+
+Выход — JSON Lines в том же порядке: id, lab, correct, verdict по
+каждому ответу и эталон true; при ошибке в записи — поле error.
+Эталоны и допуски те же, что в окнах: их считает модель работы.
+Записи читаются потоком и раздаются пачками по процессам.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from physlab.models import MODELS
+from physlab.models.checking import parse_answer
+from physlab.registry import find_lab
+
+
+def _model_class(lab: str):
+    key = lab if lab in MODELS else find_lab(lab).key
+    return key, MODELS[key]
+
+
+def _answer(value):
+    # Числа из журнала приходят и строкой ("1,59"); текстовые ответы (тип изображения) — как есть
+    if isinstance(value, str):
+        try:
+            return parse_answer(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _plain(value):
+    # Эталон для JSON: кортежи линий — списком, бесконечность — null
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def grade_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Вердикт по одной попытке; ошибки записи не прерывают проверку остальных."""
+    out = {"id": record.get("id"), "lab": record.get("lab")}
+    try:
+        key, cls = _model_class(record["lab"])
+        model = cls(**record.get("params", {}))
+        for name, value in record.get("state", {}).items():
+            setattr(model, name, value)
+        answers = {name: _answer(v) for name, v in record["answers"].items()}
+        verdict = model.check(answers)
+        true = model.true_values()
+    except Exception as exc:
+        out["error"] = f"{type(exc).__name__}: {exc}"
+        return out
+    out["lab"] = key
+    out["correct"] = all(verdict.values())
+    out["verdict"] = verdict
+    out["true"] = {name: _plain(true.get(name)) for name in verdict}
+    return out
+
+
+def grade_lines(lines: List[str]) -> List[Tuple[str, Optional[bool]]]:
+    """
+    Пачка строк JSON Lines -> (строка вердикта, correct) — выполняется в
+    процессе пула; correct равен None, если запись не удалось проверить.
+    """
+    result = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            verdict = {"id": None, "lab": None, "error": f"JSON: {exc}"}
+        else:
+            verdict = grade_record(record)
+        result.append((json.dumps(verdict, ensure_ascii=False), verdict.get("correct")))
+    return result
+
+
+def _batches(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    it = (line for line in lines if line.strip())
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def grade_stream(lines: Iterable[str], jobs: int = 0, batch: int = 500) -> Iterator[Tuple[str, Optional[bool]]]:
+    """
+    Вердикты в порядке входа. jobs=1 — без пула; иначе в полёте не больше
+    2·jobs пачек, так что файл любого размера не держится в памяти целиком.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for chunk in _batches(lines, batch):
+            yield from grade_lines(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for chunk in _batches(lines, batch):
+            pending.append(pool.submit(grade_lines, chunk))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m physlab.grading",
+                                     description="Пакетная проверка ответов учеников (JSON Lines).")
+    parser.add_argument("input", help="файл попыток .jsonl, '-' — stdin")
+    parser.add_argument("-o", "--output", default="-", help="файл вердиктов, по умолчанию stdout")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="число процессов (по умолчанию — все ядра)")
+    parser.add_argument("--batch", type=int, default=500, help="записей в одной пачке")
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    total = correct = errors = 0
+    start = time.perf_counter()
+    try:
+        for line, ok in grade_stream(src, args.jobs, args.batch):
+            dst.write(line + "\n")
+            total += 1
+            if ok is None:
+                errors += 1
+            elif ok:
+                correct += 1
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    elapsed = time.perf_counter() - start
+    print(f"Проверено {total}: верно {correct}, ошибок в записях {errors} ({elapsed:.1f} с)", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+Журнал сессии: каждая проверка ответа дописывается строкой JSON в файл
+работы за текущий день, так что закрытое или упавшее окно при повторном
+открытии восстанавливает таблицу результатов.
+
+Файл: <каталог>/<ГГГГ-ММ-ДД>-<labNN>-<Окно>.jsonl, каталог —
+PHYSLAB_JOURNAL_DIR или ~/.physlab/journal; PHYSLAB_JOURNAL=0 отключает
+запись. Запись (поля Measurement и кто/где):
+
+    {"kind": "check", "timestamp": 1760700000.5, "lab": "lab94:PendulumFreqLab",
+     "session": "3f2a…", "machine": "pc-07", "student": "ivanov",
+     "params": {...}, "results": {...}, "user_answer": 0.71, "is_correct": true,
+     "cells": ["m=1.0, k=20.0", "0.71", "0.71"]}
+
+kind "log" — строка текстового журнала (lab71, lab72), kind "reset" —
+ученик очистил таблицу: восстановление начинается после последнего reset.
+Восстанавливаются только записи того же ученика на том же компьютере:
+за общим ПК класса следующий ученик начинает с пустой таблицы.
+kind "events" — зерно модели и её действия до проверки
+(physlab.models.session); по ним python3 -m physlab.replay повторяет
+опыт без окна. Импорт журнала включает эту запись, track(window)
+направляет её в журнал работы.
+
+Окно ничего не ждёт: append() кладёт запись в очередь, фоновый поток
+пишет пачками. После каждой пачки делается flush, поэтому падение
+программы ничего не теряет. fsync (на случай отключения питания)
+делается не чаще раза в FSYNC_INTERVAL секунд. Обрыв посреди строки
+читатель пропускает, а писатель, открывая такой файл, сначала ставит
+перевод строки — следующая запись не склеивается с обрывком.
+"""
+import atexit
+import getpass
+import json
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+import uuid
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterator, List, Optional
+
+from physlab import uplink
+from physlab.models import session
+
+FSYNC_INTERVAL = 1.0   # с
+BATCH = 256            # записей за один проход потока
+
+SESSION = uuid.uuid4().hex[:12]
+
+
+def journal_dir() -> str:
+    return os.environ.get("PHYSLAB_JOURNAL_DIR") or os.path.join(os.path.expanduser("~"), ".physlab", "journal")
+
+
+def enabled() -> bool:
+    return os.environ.get("PHYSLAB_JOURNAL", "1") != "0"
+
+
+@lru_cache(maxsize=1)
+def machine_name() -> str:
+    return socket.gethostname()
+
+
+@lru_cache(maxsize=1)
+def student_name() -> str:
+    # Имя ученика задаёт PHYSLAB_STUDENT (ярлык класса); иначе — учётная запись
+    try:
+        return os.environ.get("PHYSLAB_STUDENT") or getpass.getuser()
+    except Exception:
+        return ""
+
+
+def lab_key(window) -> str:
+    """Ключ работы как в physlab.registry: "lab94:PendulumFreqLab" — и при запуске python3 -m labNN.main."""
+    module = sys.modules.get(type(window).__module__)
+    path = getattr(module, "__file__", None) or ""
+    lab_id = os.path.basename(os.path.dirname(os.path.abspath(path))) if path else type(window).__module__
+    return f"{lab_id}:{type(window).__name__}"
+
+
+def track(window):
+    """Действия с моделями окна (и его виджетов) — в журнал работы окна."""
+    key = lab_key(window)
+    stack = [window]
+    while stack:
+        obj = stack.pop()
+        for value in getattr(obj, "__dict__", {}).values():
+            rec = getattr(value, "recorder", None)
+            if isinstance(rec, session.Recorder) and rec.sink is None:
+                rec.sink = partial(append, key)
+        stack.extend(obj.children())
+
+
+def journal_path(key: str, day: Optional[str] = None) -> str:
+    day = day or time.strftime("%Y-%m-%d")
+    return os.path.join(journal_dir(), f"{day}-{key.replace(':', '-')}.jsonl")
+
+
+def read_journal(path: str) -> Iterator[Dict[str, Any]]:
+    """Записи файла по порядку; битые строки (обрыв записи) пропускаются."""
+    try:
+        f = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def restore(key: str, day: Optional[str] = None, student: Optional[str] = None,
+            machine: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Записи сегодняшнего журнала работы после последнего reset — этого ученика на этом компьютере."""
+    if not enabled():
+        return []
+    student = student_name() if student is None else student
+    machine = machine_name() if machine is None else machine
+    records: List[Dict[str, Any]] = []
+    for rec in read_journal(journal_path(key, day)):
+        if rec.get("student", student) != student or rec.get("machine", machine) != machine:
+            continue
+        if rec.get("kind") == "reset":
+            records.clear()
+        else:
+            records.append(rec)
+    return records
+
+
+def _torn_tail(path: str) -> bool:
+    """Файл есть и не кончается переводом строки (запись оборвалась)."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except FileNotFoundError:
+        return False
+
+
+class JournalWriter:
+    """Фоновый поток: очередь -> пачка строк -> write + flush -> fsync раз в FSYNC_INTERVAL."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._files: Dict[str, Any] = {}
+        self._thread = threading.Thread(target=self._run, name="physlab-journal", daemon=True)
+        self._thread.start()
+
+    def write(self, path: str, line: str):
+        self._queue.put((path, line))
+
+    def close(self, timeout=5.0):
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _file(self, path):
+        f = self._files.get(path)
+        if f is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            torn = _torn_tail(path)
+            f = self._files[path] = open(path, "a", encoding="utf-8")
+            if torn:
+                # Прошлый запуск оборвался посреди строки: новая запись начинается с новой строки,
+                # иначе читатель выбросит её вместе с обрывком
+                f.write("\n")
+        return f
+
+    def _flush(self, sync):
+        for f in self._files.values():
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+
+    def _run(self):
+        dirty = False
+        last_sync = time.monotonic()
+        while True:
+            timeout = max(0.0, FSYNC_INTERVAL - (time.monotonic() - last_sync)) if dirty else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ()
+            batch = [item]
+            while len(batch) < BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            wrote = False
+            for entry in batch:
+                if entry:
+                    try:
+                        self._file(entry[0]).write(entry[1])
+                        wrote = dirty = True
+                    except OSError as exc:
+                        print(f"physlab: журнал не записан: {exc}", file=sys.stderr)
+            sync = dirty and (stop or time.monotonic() - last_sync >= FSYNC_INTERVAL)
+            if wrote or sync:
+                try:
+                    self._flush(sync)
+                except OSError as exc:
+                    print(f"physlab: журнал не записан: {exc}", file=sys.stderr)
+            if sync:
+                dirty = False
+                last_sync = time.monotonic()
+            if stop:
+                for f in self._files.values():
+                    f.close()
+                self._files.clear()
+                return
+
+
+_writer: Optional[JournalWriter] = None
+session.recording = enabled()
+
+
+def append(key: str, record: Dict[str, Any]):
+    """
+    Дописать запись в журнал работы key и, если задан PHYSLAB_COLLECTOR,
+    отправить её сборщику класса (physlab.uplink). Не блокирует.
+    """
+    global _writer
+    url = uplink.collector_url()
+    if not enabled() and not url:
+        return
+    record = {"kind": "check", "timestamp": time.time(), "lab": key, "session": SESSION,
+              "machine": machine_name(), "student": student_name(), **record}
+    line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+    if enabled():
+        if _writer is None:
+            _writer = JournalWriter()
+            atexit.register(_writer.close)
+        _writer.write(journal_path(key), line)
+    if url:
+        uplink.uplink(url).send(line)
@@ -0,0 +1,83 @@
+"""
+Лаунчер: один процесс и один QApplication на все лабораторные.
+
+Окна работ создаются при первом открытии и затем переиспользуются,
+поэтому повторное переключение между работами мгновенное.
+"""
+import time
+import traceback
+from typing import Dict
+
+from PySide6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
+    QMessageBox, QTabWidget, QScrollArea
+)
+from PySide6.QtCore import Qt
+
+from physlab import journal
+from physlab.core import instrument
+from physlab.registry import LabInfo, labs_by_grade, load_lab
+
+
+class LauncherWindow(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Виртуальная Лаборатория по Физике")
+        self.resize(460, 620)
+        self.windows: Dict[str, QWidget] = {}
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("<h2>Выберите лабораторную работу</h2>"))
+
+        tabs = QTabWidget()
+        for grade, labs in labs_by_grade().items():
+            tabs.addTab(self._make_grade_page(labs), f"{grade} класс")
+        layout.addWidget(tabs, stretch=1)
+
+        self.status = QLabel("")
+        self.status.setStyleSheet("color: gray;")
+        layout.addWidget(self.status)
+        layout.addWidget(QLabel("© 2025 Physics Virtual Labs"))
+
+    def _make_grade_page(self, labs):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        for info in labs:
+            btn = QPushButton(info.title)
+            btn.setStyleSheet("text-align: left; padding: 8px;")
+            btn.clicked.connect(lambda checked=False, i=info: self.open_lab(i))
+            page_layout.addWidget(btn)
+        page_layout.addStretch()
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(page)
+        return scroll
+
+    def open_lab(self, info: LabInfo):
+        win = self.windows.get(info.key)
+        if win is None:
+            t0 = time.perf_counter()
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                win = load_lab(info)
+            except Exception:
+                QApplication.restoreOverrideCursor()
+                QMessageBox.critical(self, "Ошибка",
+                                     f"Не удалось открыть «{info.title}».\n\n{traceback.format_exc(limit=3)}")
+                return
+            QApplication.restoreOverrideCursor()
+            self.windows[info.key] = win
+            instrument.attach(win)  # F12 — оверлей замеров, Shift+F12 — выгрузка трассы
+            journal.track(win)      # действия с моделями — в журнал, для physlab.replay
+            self.status.setText(f"{info.lab_id}: загружено за {(time.perf_counter() - t0) * 1000:.0f} мс")
+
+        win.showNormal()
+        win.raise_()
+        win.activateWindow()
+
+    def closeEvent(self, event):
+        # Закрываем меню — закрываем и все открытые работы
+        for win in self.windows.values():
+            win.close()
+        super().closeEvent(event)
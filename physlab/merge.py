@@ -0,0 +1,134 @@
+"""
+Слияние журналов с нескольких компьютеров без сети:
+python3 -m physlab.merge E:/журналы -o итог.jsonl --summary сводка.json --csv сводка.csv
+
+На вход — файлы и каталоги (обходятся рекурсивно, берутся *.jsonl):
+журналы ~/.physlab/journal с каждого ПК и файлы сборщика (--out).
+Проверки (kind "check") сливаются в один поток по timestamp, как
+k-путевое слияние heapq.merge. В памяти одновременно одна строка на
+файл плюс сводка. Повторы одной записи (тот же session, lab и
+timestamp, например файл скопирован дважды или запись ушла и в журнал,
+и на сборщик) пишутся один раз.
+
+Журнал дописывается по времени, поэтому каждый файл уже упорядочен.
+Если часы компьютера переводили назад, такой файл сортируется в памяти
+целиком: это один день одной работы.
+"""
+import argparse
+import csv
+import heapq
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from physlab.collector import Summary
+from physlab.journal import read_journal
+
+
+def journal_files(paths: Iterable[str]) -> List[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files += [os.path.join(root, n) for n in sorted(names) if n.endswith(".jsonl")]
+        else:
+            files.append(path)
+    return files
+
+
+def _checks(path: str) -> Iterator[Dict[str, Any]]:
+    return (rec for rec in read_journal(path)
+            if isinstance(rec, dict) and rec.get("kind", "check") == "check" and "timestamp" in rec)
+
+
+def _is_sorted(path: str) -> bool:
+    last = float("-inf")
+    for rec in _checks(path):
+        if rec["timestamp"] < last:
+            return False
+        last = rec["timestamp"]
+    return True
+
+
+def _source(path: str) -> Iterator[Tuple[float, Dict[str, Any]]]:
+    records = _checks(path) if _is_sorted(path) else iter(sorted(_checks(path), key=lambda r: r["timestamp"]))
+    return ((rec["timestamp"], rec) for rec in records)
+
+
+def merged(files: List[str]) -> Iterator[Dict[str, Any]]:
+    """Проверки из всех файлов по возрастанию timestamp, без повторов."""
+    current_ts = None
+    keys_at_ts = set()
+    for ts, rec in heapq.merge(*map(_source, files), key=lambda item: item[0]):
+        # Повторы имеют один timestamp и в слитом потоке идут рядом
+        if ts != current_ts:
+            current_ts = ts
+            keys_at_ts.clear()
+        key = Summary.key(rec)
+        if key in keys_at_ts:
+            continue
+        keys_at_ts.add(key)
+        yield rec
+
+
+def lab_summary(summary: Summary) -> Dict[str, Dict[str, Any]]:
+    labs: Dict[str, Dict[str, Any]] = {}
+    for labs_of_student in summary.students.values():
+        for lab, st in labs_of_student.items():
+            agg = labs.setdefault(lab, {"attempts": 0, "correct": 0, "students": 0})
+            agg["attempts"] += st["attempts"]
+            agg["correct"] += st["correct"]
+            agg["students"] += 1
+    return dict(sorted(labs.items()))
+
+
+def write_csv(path: str, summary: Summary):
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:   # BOM — чтобы Excel понял UTF-8
+        out = csv.writer(f, delimiter=";")
+        out.writerow(["Ученик", "Работа", "Попыток", "Верно", "Последняя", "Компьютер"])
+        for student, labs in summary.as_dict().items():
+            for lab, st in labs.items():
+                out.writerow([student, lab, st["attempts"], st["correct"],
+                              time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st["last"])), st["machine"]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m physlab.merge",
+                                     description="Слияние журналов результатов с разных компьютеров.")
+    parser.add_argument("paths", nargs="+", help="файлы .jsonl и каталоги с журналами")
+    parser.add_argument("-o", "--output", help="слитый журнал проверок (JSON Lines)")
+    parser.add_argument("--summary", help="сводка JSON по ученикам и работам")
+    parser.add_argument("--csv", help="сводка по ученикам в CSV (для таблиц)")
+    args = parser.parse_args(argv)
+
+    files = journal_files(args.paths)
+    summary = Summary()
+    out = open(args.output, "w", encoding="utf-8") if args.output else None
+    total = 0
+    try:
+        for rec in merged(files):
+            summary.count(rec)
+            total += 1
+            if out:
+                out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    finally:
+        if out:
+            out.close()
+
+    labs = lab_summary(summary)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump({"students": summary.as_dict(), "labs": labs}, f, ensure_ascii=False, indent=1)
+    if args.csv:
+        write_csv(args.csv, summary)
+
+    print(f"Файлов: {len(files)}, проверок: {total}, учеников: {len(summary.students)}", file=sys.stderr)
+    for lab, agg in labs.items():
+        print(f"{lab:30} учеников {agg['students']:4}  верно {agg['correct']:5} из {agg['attempts']:5}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+physlab.models — физика лабораторных без Qt: параметры задания,
+состояние, шаг по времени, эталонные ответы и их проверка.
+
+Окна labNN/main.py только показывают модель. Всё остальное — пакетная
+проверка ответов, перемотка, замеры — работает с моделями напрямую и
+не требует QApplication.
+"""
+from physlab.models.checking import Tolerance, parse_answer
+from physlab.models.timestep import FixedStep, TickAccumulator, ease, rk4
+from physlab.models.base import LabModel
+from physlab.models.circuit import CircuitError, Netlist, Solution
+from physlab.models.schematic import Schematic
+from physlab.models.measurement import BallsRowModel, DisplacementModel, MenzurkaModel
+from physlab.models.mechanics import (
+    ArchimedesModel, BalanceScalesModel, DensityModel, EfficiencyModel, FrictionModel,
+    HookeModel, LeverModel, PendulumModel, SpringFrequencyModel, SpringPendulumModel,
+    SurfaceTensionModel,
+)
+from physlab.models.thermal import JouleHeatingModel, JouleTrainerModel, MixingModel, SpecificHeatModel
+from physlab.models.electricity import (
+    CoilInductionModel, ElectromagnetModel, EmfModel, InductanceModel, LampPowerModel,
+    MagnetCoilModel, MotorModel, ParallelModel, RheostatModel, SeriesCircuitModel,
+    TempCoeffModel, VoltAmmeterModel, WireResistanceModel,
+)
+from physlab.models.optics import (
+    DiffractionModel, FocalLensModel, InterferenceModel, RefractionModel, SpectraModel,
+    SpectroscopeModel, ThinLensModel,
+)
+from physlab.models.quantum import HydrogenModel, PhotoEffectModel, PhotoTrainerModel
+
+# Модель каждой работы по ключу из physlab.registry (LabInfo.key)
+MODELS = {
+    "lab71:Lab01App": MenzurkaModel,
+    "lab72:Lab02App": BallsRowModel,
+    "lab73:Lab03App": BalanceScalesModel,
+    "lab74:Lab04App": DisplacementModel,
+    "lab75:LabDensityApp": DensityModel,
+    "lab76:LabSpringApp": HookeModel,
+    "lab77:LabArchimedesApp": ArchimedesModel,
+    "lab78:LabLeverApp": LeverModel,
+    "lab79:LabFrictionApp": FrictionModel,
+    "lab81:LabMixApp": MixingModel,
+    "lab82:LabSpecificHeatApp": SpecificHeatModel,
+    "lab83:LabCurrentImprovedApp": SeriesCircuitModel,
+    "lab84:LabRheostatApp": RheostatModel,
+    "lab85:LabResistanceApp": VoltAmmeterModel,
+    "lab86:LabPowerApp": LampPowerModel,
+    "lab87:LabElectromagnetApp": ElectromagnetModel,
+    "lab88:LabElectromagnetApp": ElectromagnetModel,
+    "lab89:LabMotorApp": MotorModel,
+    "lab810:LabLensAnimatedApp": ThinLensModel,
+    "lab811:JouleLenzLab": JouleTrainerModel,
+    "lab812:JouleLenzLab": JouleHeatingModel,
+    "lab813:EfficiencyLab": EfficiencyModel,
+    "lab814:ResistanceLab": WireResistanceModel,
+    "lab815:ParallelLab": ParallelModel,
+    "lab91:LabInductanceApp": InductanceModel,
+    "lab92:LabTempCoeffApp": TempCoeffModel,
+    "lab93:LabSpringApp": HookeModel,
+    "lab94:PendulumFreqLab": SpringFrequencyModel,
+    "lab811:SpringPendulumLab": SpringPendulumModel,
+    "lab95:InterferenceLab": InterferenceModel,
+    "lab101:LabInductionApp": CoilInductionModel,
+    "lab102:Lab17App": EmfModel,
+    "lab103:LabSurfaceTensionApp": SurfaceTensionModel,
+    "lab104:LabTempCoeffApp": TempCoeffModel,
+    "lab105:PhotoEffectLab": PhotoEffectModel,
+    "lab811:PhotoEffectLab": PhotoTrainerModel,
+    "lab106:InductionLab": MagnetCoilModel,
+    "lab111:LabFrequencyApp": PendulumModel,
+    "lab112:LabRefractionApp": RefractionModel,
+    "lab113:LabDiffractionApp": DiffractionModel,
+    "lab114:LabSpectraApp": SpectroscopeModel,
+    "lab115:LabFocalApp": FocalLensModel,
+    "lab116:SpectraLab": SpectraModel,
+    "lab117:HydrogenLab": HydrogenModel,
+}
+
+__all__ = [
+    "ArchimedesModel", "BalanceScalesModel", "BallsRowModel", "CircuitError", "CoilInductionModel", "DensityModel",
+    "DiffractionModel", "DisplacementModel", "EfficiencyModel", "ElectromagnetModel", "EmfModel",
+    "FixedStep", "FocalLensModel", "FrictionModel", "HookeModel", "HydrogenModel", "InductanceModel",
+    "InterferenceModel", "JouleHeatingModel", "JouleTrainerModel", "LabModel", "LampPowerModel",
+    "LeverModel", "MODELS", "MagnetCoilModel", "MenzurkaModel", "MixingModel", "MotorModel", "Netlist",
+    "ParallelModel", "PendulumModel", "PhotoEffectModel", "PhotoTrainerModel", "RefractionModel",
+    "RheostatModel", "Schematic", "SeriesCircuitModel", "Solution", "SpecificHeatModel", "SpectraModel", "SpectroscopeModel",
+    "SpringFrequencyModel", "SpringPendulumModel", "SurfaceTensionModel", "TempCoeffModel",
+    "ThinLensModel", "TickAccumulator", "Tolerance", "VoltAmmeterModel", "WireResistanceModel",
+    "ease", "parse_answer", "rk4",
+]
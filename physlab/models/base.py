@@ -0,0 +1,104 @@
+"""
+Базовая модель лабораторной: параметры задания, состояние, шаг по
+времени и эталонные ответы — без Qt.
+
+Окно лабораторной держит модель и только показывает её: ползунки
+меняют параметры (set_params), часы кадров двигают время (step), кнопка
+«Проверить» спрашивает модель (check). Всё это же можно делать без
+QApplication — в пакетной проверке, перемотке и замерах.
+"""
+import math
+import random
+from typing import Any, Dict, Mapping, Tuple
+
+from physlab.models import session
+from physlab.models.checking import Tolerance
+
+
+class LabModel:
+    params: Tuple[str, ...] = ()         # имена параметров; значения по умолчанию — атрибуты класса
+    answers: Tuple[str, ...] = ("value",)  # что вводит ученик
+    actions: Tuple[str, ...] = ()        # методы, которые окно вызывает по кнопке (пишутся для повтора)
+    tolerance = Tolerance(rel=0.05)      # допуск по умолчанию для всех ответов
+
+    def __init__(self, seed=None, **params):
+        # Своё зерно у каждой модели: задание повторяется по seed и записи действий (physlab.models.session)
+        self.seed = session.next_seed(type(self).__name__) if seed is None else seed
+        self.time = 0.0
+        self.set_params(**params)
+        self.reset()
+        if session.recording and seed is None:   # модель с заданным зерном — это повтор, её не пишем
+            session.record(self)
+
+    @property
+    def rng(self) -> random.Random:
+        # Создаётся при первом задании: пакетная проверка создаёт модель на каждую запись
+        rng = self.__dict__.get("_rng")
+        if rng is None:
+            rng = self._rng = random.Random(self.seed)
+        return rng
+
+    @rng.setter
+    def rng(self, value):
+        self._rng = value
+
+    # --- Параметры ---
+    def set_params(self, **params):
+        for name, value in params.items():
+            if name not in self.params:
+                raise KeyError(f"{type(self).__name__}: неизвестный параметр {name!r}")
+            setattr(self, name, value)
+        return self
+
+    def get_params(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.params}
+
+    def randomize(self):
+        """Новое задание: случайные параметры из того же распределения, что и в окне."""
+        self.new_task(self.rng)
+        self.reset()
+        return self
+
+    def new_task(self, rng):
+        pass
+
+    # --- Время ---
+    def reset(self):
+        self.time = 0.0
+
+    def step(self, dt):
+        self.time += dt
+
+    def run(self, duration, dt=0.02):
+        """Перемотка без окна: duration секунд шагами по dt."""
+        for _ in range(int(round(duration / dt))):
+            self.step(dt)
+        return self
+
+    # --- Эталон и проверка ---
+    def true_value(self):
+        raise NotImplementedError
+
+    def true_values(self) -> Dict[str, Any]:
+        return {"value": self.true_value()}
+
+    def tolerances(self) -> Dict[str, Tolerance]:
+        return {name: self.tolerance for name in self.answers}
+
+    def check(self, answers: Mapping[str, Any]) -> Dict[str, bool]:
+        """Вердикт по каждому ответу. Текстовые ответы (тип изображения и т.п.) сравниваются точно."""
+        true = self.true_values()
+        tols = self.tolerances()
+        verdict = {}
+        for name, user_val in answers.items():
+            if name not in true:
+                raise KeyError(f"{type(self).__name__}: неизвестный ответ {name!r}")
+            true_val = true[name]
+            if isinstance(true_val, (str, bool)) or true_val is None:
+                verdict[name] = user_val == true_val
+            elif not math.isfinite(true_val):
+                # Изображение на бесконечности и т.п. — числового ответа нет
+                verdict[name] = False
+            else:
+                verdict[name] = tols[name].accepts(float(user_val), true_val)
+        return verdict
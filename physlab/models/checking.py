@@ -0,0 +1,38 @@
+"""
+Проверка ответов ученика: разбор числа и допуски.
+
+Одни и те же функции используются окнами лабораторных и всем, что
+проверяет ответы без GUI (модели physlab.models).
+"""
+from dataclasses import dataclass
+
+
+def parse_answer(text: str) -> float:
+    # Ученики часто пишут десятичную запятую: "1,59"
+    text = text.strip().replace(',', '.')
+    if not text:
+        raise ValueError("пустой ответ")
+    return float(text)
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    rel: float = 0.0       # относительный допуск (доля от эталона)
+    absolute: float = 0.0  # абсолютный допуск; вместе с rel — нижняя граница допуска
+    zero: float = 0.1      # допуск, когда эталон равен нулю (для rel без absolute)
+    strict: bool = False   # ответ ровно на границе допуска — неверный (строгое «<», как в части работ)
+    strict_zero: bool = False  # то же только для допуска zero: «≤ rel·эталон, иначе < zero» (тренажёры lab811)
+
+    def limit(self, true_val: float) -> float:
+        if self.rel and self.absolute:
+            # max(5% от эталона, 0.01) — так считались допуски в работах по электричеству
+            return max(self.rel * abs(true_val), self.absolute)
+        if self.rel:
+            return self.rel * abs(true_val) if true_val != 0 else self.zero
+        return self.absolute
+
+    def accepts(self, user_val: float, true_val: float) -> bool:
+        error, limit = abs(user_val - true_val), self.limit(true_val)
+        zero_case = bool(self.rel) and not self.absolute and true_val == 0
+        strict = self.strict or (zero_case and self.strict_zero)
+        return error < limit if strict else error <= limit
@@ -0,0 +1,291 @@
+"""
+Цепи постоянного тока: список элементов (netlist) и узловой анализ
+(модифицированный метод узловых потенциалов, MNA).
+
+    net = Netlist()
+    net.source("E", "+", "0", emf=6.0, r=1.0)
+    net.ammeter("A", "+", "1")
+    net.resistor("R1", "1", "0", 10.0)
+    net.voltmeter("V", "1", "0")
+    sol = net.solve()
+    sol.reading("A"), sol.reading("V"), sol.voltage("1"), sol.current("R1")
+
+Узел "0" — земля. Неизвестные — потенциалы узлов и токи элементов без
+сопротивления: идеальных источников, амперметров, замкнутых ключей,
+проводников с R = 0. Источник с внутренним сопротивлением входит
+эквивалентом Нортона и лишних неизвестных не даёт. Идеальный вольтметр
+и разомкнутый ключ в матрицу не входят. Если система вырождена из-за
+«висящего» узла (за разомкнутым ключом), каждый узел связывается с
+землёй проводимостью GMIN и система решается ещё раз.
+
+Матрица собирается из штампов (строка, столбец, значение), как
+разреженная, а обращается плотным numpy.linalg.inv: у цепей работ
+десятки узлов, и LAPACK на такой матрице быстрее разреженного
+решателя. Ток элемента считается от узла a к узлу b, ток источника —
+отдаваемый во внешнюю цепь из «+».
+
+Обратная матрица хранится между решениями. Netlist.set меняет одно
+значение: новое R — поправка ранга 1 по формуле Шермана — Моррисона
+(O(n²) вместо O(n³)), новая ЭДС — только правая часть. Заново система
+собирается, если изменилась схема (ключ, R = 0) или поправок набралось
+REFACTOR_EVERY — чтобы не копилась ошибка округления. Пока значения не
+менялись, solve() возвращает то же решение: сколько бы приборов ни
+читали показания за кадр, счёт один.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+GROUND = "0"
+GMIN = 1e-12     # См: утечка узла на землю
+R_SHORT = 1e-9   # Ом: сопротивление меньше — проводник без сопротивления
+REFACTOR_EVERY = 256   # поправок ранга 1 до полной пересборки
+
+
+class CircuitError(ValueError):
+    """Цепь не решается: короткое замыкание идеального источника, контур из источников."""
+
+
+class Element:
+    __slots__ = ("name", "kind", "a", "b", "value", "r")
+
+    def __init__(self, name, kind, a, b, value=0.0, r=0.0):
+        self.name, self.kind, self.a, self.b = name, kind, str(a), str(b)
+        self.value = value   # R для резисторов, ЭДС для источника, замкнут ли — для ключа
+        self.r = r           # внутреннее сопротивление источника
+
+    @property
+    def resistive(self) -> bool:
+        if self.kind in ("resistor", "lamp", "rheostat"):
+            return self.value > R_SHORT
+        return self.kind == "source" and self.r > R_SHORT
+
+    @property
+    def branch(self) -> bool:
+        """Элемент — своя неизвестная (ток) в системе."""
+        if self.a == self.b and self.kind != "source":
+            return False   # замкнут сам на себя: уравнение ветви пустое, ток 0
+        if self.kind == "ammeter" or (self.kind == "switch" and self.value):
+            return True
+        return self.kind in ("resistor", "lamp", "rheostat", "source") and not self.resistive
+
+
+class _System:
+    __slots__ = ("index", "branches", "inv", "rhs", "updates")
+
+    def __init__(self, index, branches, inv, rhs):
+        self.index, self.branches, self.inv, self.rhs = index, branches, inv, rhs
+        self.updates = 0
+
+
+class Netlist:
+    def __init__(self):
+        self.elements: Dict[str, Element] = {}
+        self._system: Optional[_System] = None
+        self._solution: Optional[Solution] = None
+
+    # --- Элементы ---
+    def _add(self, name, kind, a, b, value=0.0, r=0.0):
+        if name in self.elements:
+            raise KeyError(f"элемент {name!r} уже есть в цепи")
+        self.elements[name] = Element(name, kind, a, b, value, r)
+        self.invalidate()
+        return self
+
+    def resistor(self, name, a, b, R):
+        return self._add(name, "resistor", a, b, float(R))
+
+    def lamp(self, name, a, b, R):
+        return self._add(name, "lamp", a, b, float(R))
+
+    def rheostat(self, name, a, b, R):
+        return self._add(name, "rheostat", a, b, float(R))
+
+    def source(self, name, plus, minus, emf, r=0.0):
+        return self._add(name, "source", plus, minus, float(emf), float(r))
+
+    def ammeter(self, name, a, b):
+        return self._add(name, "ammeter", a, b)
+
+    def voltmeter(self, name, a, b):
+        return self._add(name, "voltmeter", a, b)
+
+    def switch(self, name, a, b, closed=True):
+        return self._add(name, "switch", a, b, bool(closed))
+
+    def set(self, name, value):
+        """Новое R, ЭДС или положение ключа; то же значение — ничего не пересчитывается."""
+        el = self.elements[name]
+        value = bool(value) if el.kind == "switch" else float(value)
+        if value == el.value:
+            return self
+        shape = el.resistive, el.branch
+        old, el.value = el.value, value
+        system = self._system
+        self._solution = None
+        if system is None:
+            return self
+        if (el.resistive, el.branch) != shape or system.updates >= REFACTOR_EVERY:
+            self.invalidate()
+        elif el.kind == "source":
+            self._update_emf(system, el, value - old)
+        elif el.resistive:
+            self._update_conductance(system, el, 1.0 / value - 1.0 / old)
+        return self
+
+    def invalidate(self):
+        self._system = None
+        self._solution = None
+
+    def _update_emf(self, system, el, d_emf):
+        a, b = system.index.get(el.a), system.index.get(el.b)
+        if el.branch:
+            system.rhs[system.branches[el.name]] = el.value
+            return
+        g = 1.0 / el.r
+        if a is not None:
+            system.rhs[a] += d_emf * g
+        if b is not None:
+            system.rhs[b] -= d_emf * g
+
+    def _update_conductance(self, system, el, dg):
+        # A' = A + dg·u·uᵀ, u = e_a - e_b  =>  A'⁻¹ = A⁻¹ - dg·(A⁻¹u)(uᵀA⁻¹) / (1 + dg·uᵀA⁻¹u)
+        inv = system.inv
+        a, b = system.index.get(el.a), system.index.get(el.b)
+        col = np.zeros(len(inv))
+        row = np.zeros(len(inv))
+        if a is not None:
+            col += inv[:, a]
+            row += inv[a]
+        if b is not None:
+            col -= inv[:, b]
+            row -= inv[b]
+        denom = 1.0 + dg * ((col[a] if a is not None else 0.0) - (col[b] if b is not None else 0.0))
+        if abs(denom) < 1e-12:
+            self.invalidate()
+            return
+        inv -= np.outer(col, row) * (dg / denom)
+        system.updates += 1
+
+    # --- Решение ---
+    def nodes(self) -> List[str]:
+        seen = {}
+        for el in self.elements.values():
+            for node in (el.a, el.b):
+                if node != GROUND:
+                    seen.setdefault(node, len(seen))
+        return list(seen)
+
+    def stamps(self, index: Dict[str, int], gmin=0.0) -> Tuple[List[int], List[int], List[float], np.ndarray, Dict[str, int]]:
+        """Штампы матрицы (rows, cols, vals), правая часть и номер неизвестной тока для элементов-ветвей."""
+        n = len(index)
+        branches = {name: n + k for k, name in enumerate(el.name for el in self.elements.values() if el.branch)}
+        rows: List[int] = []
+        cols: List[int] = []
+        vals: List[float] = []
+        rhs = np.zeros(n + len(branches))
+
+        def put(i, j, v):
+            if i is not None and j is not None:
+                rows.append(i); cols.append(j); vals.append(v)
+
+        if gmin:
+            for i in range(n):
+                put(i, i, gmin)
+        for el in self.elements.values():
+            a, b = index.get(el.a), index.get(el.b)
+            if el.resistive:
+                g = 1.0 / (el.r if el.kind == "source" else el.value)
+                put(a, a, g); put(b, b, g); put(a, b, -g); put(b, a, -g)
+                if el.kind == "source":
+                    # Нортон: в «+» втекает ток E/r
+                    if a is not None:
+                        rhs[a] += el.value * g
+                    if b is not None:
+                        rhs[b] -= el.value * g
+            elif el.branch:
+                k = branches[el.name]
+                put(a, k, 1.0); put(b, k, -1.0); put(k, a, 1.0); put(k, b, -1.0)
+                rhs[k] = el.value if el.kind == "source" else 0.0
+        return rows, cols, vals, rhs, branches
+
+    def _factor(self) -> _System:
+        index = {node: i for i, node in enumerate(self.nodes())}
+        for gmin in (0.0, GMIN):
+            rows, cols, vals, rhs, branches = self.stamps(index, gmin)
+            size = len(rhs)
+            A = np.zeros((size, size))
+            np.add.at(A, (rows, cols), vals)
+            try:
+                inv = np.linalg.inv(A)
+            except np.linalg.LinAlgError:
+                continue
+            if np.all(np.isfinite(inv)):
+                return _System(index, branches, inv, rhs)
+        raise CircuitError("цепь не решается: короткое замыкание источника или контур из источников")
+
+    def solve(self) -> "Solution":
+        if self._solution is None:
+            if self._system is None:
+                self._system = self._factor()
+            system = self._system
+            x = system.inv @ system.rhs
+            if not np.all(np.isfinite(x)):
+                self.invalidate()
+                raise CircuitError("цепь не решается: короткое замыкание источника или контур из источников")
+            self._solution = Solution(self, system.index, system.branches, x)
+        return self._solution
+
+
+class Solution:
+    """Потенциалы узлов и токи элементов одной расстановки значений (значения запомнены на момент решения)."""
+
+    def __init__(self, netlist: Netlist, index: Dict[str, int], branches: Dict[str, int], x: np.ndarray):
+        self.netlist = netlist
+        self.index = index
+        self.branches = branches
+        self.x = x
+        self.values = {name: el.value for name, el in netlist.elements.items()}
+
+    def voltage(self, node, ref=GROUND) -> float:
+        def v(n):
+            i = self.index.get(str(n))
+            return 0.0 if i is None else float(self.x[i])
+        return v(node) - v(ref)
+
+    def current(self, name) -> float:
+        el = self.netlist.elements[name]
+        k = self.branches.get(name)
+        if k is not None:
+            i = float(self.x[k])   # ток от a к b через элемент
+            return -i if el.kind == "source" else i
+        u = self.voltage(el.a, el.b)
+        if el.kind == "source":
+            return (self.values[name] - u) / el.r
+        if el.kind in ("resistor", "lamp", "rheostat") and self.values[name] > R_SHORT:
+            return u / self.values[name]
+        return 0.0   # вольтметр, разомкнутый ключ
+
+    def reading(self, name) -> float:
+        """Показание прибора: амперметр — ток, вольтметр — напряжение между зажимами."""
+        el = self.netlist.elements[name]
+        return self.voltage(el.a, el.b) if el.kind == "voltmeter" else self.current(name)
+
+    def power(self, name) -> float:
+        """Мощность, выделяемая на элементе (у источника — отдаваемая)."""
+        el = self.netlist.elements[name]
+        return self.current(name) * self.voltage(el.a, el.b)
+
+    def voltages(self) -> Dict[str, float]:
+        return {GROUND: 0.0, **{node: float(self.x[i]) for node, i in self.index.items()}}
+
+    def currents(self) -> Dict[str, float]:
+        return {name: self.current(name) for name in self.netlist.elements}
+
+
+def solve(netlist: Netlist) -> Optional[Solution]:
+    """Решение или None, если цепь не решается."""
+    try:
+        return netlist.solve()
+    except CircuitError:
+        return None
@@ -0,0 +1,527 @@
+"""
+Электричество и магнетизм: цепи постоянного тока, электромагнит,
+двигатель, индукция, ЭДС источника, температурный коэффициент.
+
+Цепи работ (lab83, lab84, lab85, lab86, lab102, lab815) собираются
+списком элементов netlist() и решаются узловым анализом
+physlab.models.circuit; показания приборов — из его решения.
+CircuitModel держит собранную цепь между решениями: ползунок реостата
+меняет одно значение, и пересчёт — поправка ранга 1, а не новая система.
+"""
+import math
+
+from physlab.models.base import LabModel
+from physlab.models.checking import Tolerance
+from physlab.models.circuit import Netlist, solve
+from physlab.models.timestep import ease
+
+
+class CircuitModel(LabModel):
+    """
+    Модель с цепью. netlist() собирает схему, topology() — то, что меняет
+    саму схему (число резисторов, внутреннее сопротивление), а
+    element_values() — значения элементов по текущим параметрам.
+    """
+
+    def netlist(self) -> Netlist:
+        raise NotImplementedError
+
+    def topology(self):
+        return ()
+
+    def element_values(self):
+        return {}
+
+    def solution(self):
+        """Решение цепи или None; параметры не менялись — то же решение без пересчёта."""
+        key = self.topology()
+        net = self.__dict__.get("_net")
+        if net is None or self._net_key != key:
+            net = self._net = self.netlist()
+            self._net_key = key
+        else:
+            for name, value in self.element_values().items():
+                net.set(name, value)
+        return solve(net)
+
+
+class SeriesCircuitModel(CircuitModel):
+    """Сила тока в последовательной цепи (lab83): I = U / (R1 + R2 + ...)."""
+    params = ("U", "resistors")
+    U = 12.0
+    resistors = (10.0, 10.0)   # Ом
+    tolerance = Tolerance(rel=0.05, absolute=0.005)
+
+    def new_task(self, rng):
+        self.U = rng.randint(6, 18)
+        self.resistors = tuple(rng.randint(5, 30) for _ in range(rng.choice([2, 3])))
+
+    def netlist(self):
+        nodes = [str(i + 2) for i in range(len(self.resistors))] + ["0"]
+        net = Netlist().source("E", "1", "0", self.U).ammeter("A", "1", nodes[0])
+        for i, R in enumerate(self.resistors):
+            net.resistor(f"R{i + 1}", nodes[i], nodes[i + 1], R)
+        return net
+
+    def topology(self):
+        return len(self.resistors)
+
+    def element_values(self):
+        return {"E": self.U, **{f"R{i + 1}": R for i, R in enumerate(self.resistors)}}
+
+    def current(self):
+        """None, если цепь не собрана (нет сопротивления)."""
+        sol = self.solution()
+        return sol.reading("A") if sol else None
+
+    def true_value(self):
+        return self.current()
+
+
+class RheostatModel(CircuitModel):
+    """Регулирование силы тока реостатом (lab84): I = U / (Rфикс + Rрео)."""
+    params = ("U", "R_fixed", "R_rheo")
+    U = 12.0
+    R_fixed = 10.0   # Ом
+    R_rheo = 20.0    # Ом, положение ползунка
+    tolerance = Tolerance(rel=0.05, absolute=0.01)
+
+    def new_task(self, rng):
+        self.U = rng.randint(6, 18)
+        self.R_fixed = rng.randint(5, 30)
+        self.R_rheo = rng.randint(5, 80)
+
+    def netlist(self):
+        return (Netlist().source("E", "1", "0", self.U).ammeter("A", "1", "2")
+                .resistor("R", "2", "3", self.R_fixed).rheostat("Rh", "3", "0", self.R_rheo))
+
+    def element_values(self):
+        return {"E": self.U, "R": self.R_fixed, "Rh": self.R_rheo}
+
+    def current(self):
+        sol = self.solution()
+        return sol.reading("A") if sol else 0.0
+
+    def true_value(self):
+        return self.current()
+
+
+class VoltAmmeterModel(CircuitModel):
+    """
+    Сопротивление проводника по амперметру и вольтметру (lab85). Ученик
+    вводит показания U, I и вычисленное R; верно, если R = U/I посчитано
+    точно, а сами показания близки к сопротивлению образца.
+    """
+    params = ("U_source", "R_sample", "R_internal")
+    answers = ("R",)
+    U_source = 5.0
+    R_sample = 10.0    # Ом, эталон
+    R_internal = 1.0   # провода и источник
+
+    def new_task(self, rng):
+        self.U_source = rng.choice([3.0, 4.5, 6.0, 9.0, 12.0])
+        self.R_sample = rng.uniform(2.0, 50.0)
+        self.R_internal = rng.uniform(0.5, 3.0)
+
+    def netlist(self):
+        # Амперметр последовательно с образцом, вольтметр — параллельно ему
+        return (Netlist().source("E", "+", "0", self.U_source, r=self.R_internal).ammeter("A", "+", "1")
+                .resistor("Rx", "1", "0", self.R_sample).voltmeter("V", "1", "0"))
+
+    def topology(self):
+        return self.R_internal
+
+    def element_values(self):
+        return {"E": self.U_source, "Rx": self.R_sample}
+
+    def current(self):
+        sol = self.solution()
+        return sol.reading("A") if sol else None
+
+    def sample_voltage(self):
+        sol = self.solution()
+        return sol.reading("V") if sol else None
+
+    def true_values(self):
+        return {"R": self.R_sample}
+
+    def check(self, answers):
+        """answers: U и I (показания приборов) и R (ответ ученика)."""
+        if abs(answers["I"]) < 1e-6:
+            return {"R": False}   # по такому току R не посчитать — как и в окне
+        R_calc = answers["U"] / answers["I"]
+        ok = (abs(answers["R"] - R_calc) <= max(0.02 * R_calc, 0.01)
+              and abs(R_calc - self.R_sample) <= max(0.03 * self.R_sample, 0.05))
+        return {"R": ok}
+
+
+class LampPowerModel(CircuitModel):
+    """Мощность и работа тока в лампе (lab86): P = I²·R, A = P·t по секундомеру."""
+    params = ("U", "R_lamp", "R_internal")
+    answers = ("P", "A")
+    U = 6.0
+    R_lamp = 10.0
+    R_internal = 1.0
+
+    def reset(self):
+        super().reset()
+        self.running = False
+
+    def new_task(self, rng):
+        self.U = rng.choice([3.0, 4.5, 6.0, 9.0, 12.0])
+        self.R_lamp = rng.uniform(2.0, 40.0)
+        self.R_internal = rng.uniform(0.5, 3.0)
+
+    def netlist(self):
+        return (Netlist().source("E", "+", "0", self.U, r=self.R_internal).ammeter("A", "+", "1")
+                .lamp("L", "1", "0", self.R_lamp))
+
+    def topology(self):
+        return self.R_internal
+
+    def element_values(self):
+        return {"E": self.U, "L": self.R_lamp}
+
+    def current(self):
+        sol = self.solution()
+        return sol.reading("A") if sol else None
+
+    def lamp_power(self):
+        sol = self.solution()
+        return sol.power("L") if sol else 0.0
+
+    def brightness(self):
+        I = self.current()
+        return min(1.0, self.lamp_power() / max(0.1, self.U * I if I else 0.1))
+
+    def step(self, dt):
+        # Время модели — показание секундомера: идёт, только пока лампа горит
+        if self.running:
+            super().step(dt)
+
+    def true_values(self):
+        P = self.lamp_power()
+        return {"P": P, "A": P * self.time}
+
+    def tolerances(self):
+        return {"P": Tolerance(rel=0.03, absolute=0.01), "A": Tolerance(rel=0.03, absolute=0.05)}
+
+
+class ElectromagnetModel(LabModel):
+    """
+    Электромагнит и компас (lab87, lab88). Стрелка плавно поворачивается к
+    углу 90°·th(B/500); ответ — угол, на котором она остановилась.
+    """
+    params = ("I", "N", "has_core")
+    I = 0.0
+    N = 50
+    has_core = False
+    tolerance = Tolerance(absolute=2.0, strict=True)
+
+    def reset(self):
+        super().reset()
+        self.angle = 0.0
+
+    def field(self):
+        mu = 5.0 if self.has_core else 1.0  # Сердечник усиливает поле
+        return mu * self.N * self.I
+
+    def field_strength(self):
+        """Поле для рисования линий: 0..1."""
+        return min(1.0, self.field() / 1000.0)
+
+    def target_angle(self):
+        return 90 * math.tanh(self.field() / 500.0)
+
+    def step(self, dt):
+        super().step(dt)
+        diff = self.target_angle() - self.angle
+        if abs(diff) > 0.1:
+            self.angle += diff * ease(dt, 0.19)
+
+    def is_settled(self):
+        return abs(self.target_angle() - self.angle) <= 0.1
+
+    def true_value(self):
+        return self.angle
+
+
+class MotorModel(LabModel):
+    """Модель электродвигателя (lab89): направление вращения якоря."""
+    params = ("I", "N", "is_reversed")
+    I = 0.0
+    N = 50
+    is_reversed = False
+
+    def reset(self):
+        super().reset()
+        self.angle = 0.0   # градусы
+        self.speed = 0.0   # градусов за шаг 20 мс
+
+    def target_speed(self):
+        speed = self.I * self.N / 500.0
+        return -speed if self.is_reversed else speed
+
+    def step(self, dt):
+        super().step(dt)
+        target = self.target_speed()
+        self.speed += (target - self.speed) * ease(dt, 0.39)
+        self.angle = (self.angle + self.speed * dt / 0.02) % 360
+        if target == 0 and abs(self.speed) < 0.01:
+            self.speed = 0.0
+
+    def is_settled(self):
+        return self.speed == 0.0 and self.target_speed() == 0
+
+    def is_spinning(self):
+        return abs(self.speed) > 0.1
+
+    def direction(self):
+        """'cw' — по часовой, 'ccw' — против, None — якорь стоит."""
+        if not self.is_spinning():
+            return None
+        return "cw" if self.speed > 0 else "ccw"
+
+    def true_value(self):
+        return self.direction()
+
+
+WIRE_RESISTIVITY = {  # Ом·мм²/м
+    "Медь": 0.017,
+    "Алюминий": 0.028,
+    "Железо": 0.10,
+    "Нихром": 1.10,
+    "Серебро": 0.016,
+}
+
+
+class WireResistanceModel(LabModel):
+    """Сопротивление проводника (lab814): R = ρ·L / S."""
+    params = ("material", "L", "S")
+    material = "Медь"
+    L = 5.0    # м
+    S = 1.0    # мм²
+    tolerance = Tolerance(rel=0.05, zero=0.01)
+
+    @property
+    def rho(self):
+        return WIRE_RESISTIVITY[self.material]
+
+    def true_value(self):
+        return self.rho * self.L / self.S
+
+
+class ParallelModel(CircuitModel):
+    """Параллельное соединение (lab815). Ветви — пары (включена, R)."""
+    params = ("branches",)
+    branches = ((True, 10.0), (True, 20.0), (False, 30.0))
+    U = 12.0   # Фиксированное напряжение для наглядности тока
+
+    def netlist(self):
+        net = Netlist().source("E", "+", "0", self.U)
+        for i, (on, R) in enumerate(self.branches):
+            net.switch(f"K{i + 1}", "+", f"b{i + 1}", on).resistor(f"R{i + 1}", f"b{i + 1}", "0", R)
+        return net
+
+    def topology(self):
+        return len(self.branches)
+
+    def element_values(self):
+        values = {"E": self.U}
+        for i, (on, R) in enumerate(self.branches):
+            values[f"K{i + 1}"], values[f"R{i + 1}"] = on, R
+        return values
+
+    def branch_currents(self):
+        sol = self.solution()
+        return [sol.current(f"R{i + 1}") if sol and on else 0.0 for i, (on, R) in enumerate(self.branches)]
+
+    def total_current(self):
+        return sum(self.branch_currents())
+
+    def true_value(self):
+        I = self.total_current()
+        # Цепь разомкнута — сопротивление бесконечно, для проверки считаем 0
+        return self.U / I if I > 1e-9 else 0.0
+
+
+class InductanceModel(LabModel):
+    """Индуктивность катушки (lab91): импульс тока даёт ЭДС самоиндукции E = -L·ΔI/Δt."""
+    params = ("L",)
+    L = 0.5   # Гн
+    tolerance = Tolerance(absolute=0.05, strict=True)
+
+    def new_task(self, rng):
+        self.L = rng.uniform(0.1, 2.0)
+
+    def emf(self, dI, dt):
+        return -self.L * (dI / dt)
+
+    def true_value(self):
+        return self.L
+
+
+TEMP_COEFFS = (("Медь", 0.0043), ("Алюминий", 0.0042), ("Железо", 0.006), ("Вольфрам", 0.0045))
+
+
+class TempCoeffModel(LabModel):
+    """Температурный коэффициент сопротивления (lab92, lab104): R = R0·(1 + α·(T - 20))."""
+    params = ("material", "R0", "alpha")
+    actions = ("heat_up",)
+    material = "Медь"
+    R0 = 10.0       # Ом при 20 °C
+    alpha = 0.004   # 1/°C
+    T0 = 20.0
+    tolerance = Tolerance(absolute=0.0005, strict=True)
+
+    def reset(self):
+        super().reset()
+        self.T = self.T0
+        self.target_T = self.T0
+
+    def new_task(self, rng):
+        self.material, self.alpha = rng.choice(TEMP_COEFFS)
+        self.R0 = rng.uniform(5.0, 20.0)
+
+    def heat_up(self):
+        self.target_T = self.rng.uniform(80, 95)
+
+    def step(self, dt):
+        super().step(dt)
+        diff = self.target_T - self.T
+        if abs(diff) > 0.1:
+            self.T += diff * ease(dt, 1.5)
+        else:
+            self.T = self.target_T
+
+    def resistance(self):
+        return self.R0 * (1 + self.alpha * (self.T - self.T0))
+
+    def true_value(self):
+        return self.alpha
+
+
+class CoilInductionModel(LabModel):
+    """
+    Магнит пролетает сквозь катушку (lab101). Координаты — в пикселях
+    дорожки: coil_x и end_x задаёт окно по своей ширине.
+    """
+    params = ("N", "speed")
+    actions = ("start", "pause")
+    N = 100
+    speed = 20
+    start_x = 50
+    coil_x = 300.0
+    end_x = 700.0
+    tolerance = Tolerance(rel=0.15)
+
+    def reset(self):
+        super().reset()
+        self.magnet_x = self.start_x
+        self.is_running = False
+        self.voltage = 0.0
+        self.max_voltage = 0.0
+
+    def start(self):
+        self.reset()
+        self.is_running = True
+
+    def pause(self):
+        self.is_running = not self.is_running
+
+    def step(self, dt):
+        if not self.is_running:
+            return
+        super().step(dt)
+        self.magnet_x += self.speed * 31.25 * dt
+        # Поток через катушку ~ e^(-x²); ЭДС — его производная по времени
+        dist = (self.magnet_x - self.coil_x) / 100.0
+        field_change = -2 * dist * math.exp(-(dist ** 2))
+        self.voltage = -self.N * (self.speed / 10.0) * field_change
+        self.max_voltage = max(self.max_voltage, abs(self.voltage))
+        if self.magnet_x > self.end_x:
+            self.is_running = False
+            self.magnet_x = self.end_x
+            self.voltage = 0.0
+
+    def true_value(self):
+        return self.max_voltage
+
+
+class EmfModel(CircuitModel):
+    """ЭДС и внутреннее сопротивление источника (lab102)."""
+    params = ("emf", "r_int", "r_load", "is_closed")
+    emf = 4.5
+    r_int = 1.0     # Ом
+    r_load = 10.0   # Ом, реостат 1..20
+    is_closed = False
+    tolerance = Tolerance(absolute=0.1, strict=True)
+
+    def new_task(self, rng):
+        self.emf = rng.choice([4.5, 6.0, 9.0])
+        self.r_int = rng.uniform(0.5, 2.0)
+        self.r_load = 10.0
+        self.is_closed = False
+
+    def netlist(self):
+        # Вольтметр на зажимах источника: при разомкнутом ключе показывает ЭДС
+        return (Netlist().source("E", "+", "0", self.emf, r=self.r_int).switch("K", "+", "1", self.is_closed)
+                .ammeter("A", "1", "2").rheostat("Rh", "2", "0", self.r_load).voltmeter("V", "+", "0"))
+
+    def topology(self):
+        return self.r_int
+
+    def element_values(self):
+        return {"E": self.emf, "K": self.is_closed, "Rh": self.r_load}
+
+    def readings(self):
+        """Показания (I, U)."""
+        sol = self.solution()
+        return (sol.reading("A"), sol.reading("V")) if sol else (0.0, 0.0)
+
+    def true_value(self):
+        return self.r_int
+
+
+class MagnetCoilModel(LabModel):
+    """Магнит и катушка (lab106): пиковая ЭДС пропорциональна N·v."""
+    params = ("speed", "N")
+    actions = ("start",)
+    speed = 1.0   # м/с (условно)
+    N = 50
+    start_x = -200
+    end_x = 200
+    peak_factor = 0.42888   # максимум 2x·e^(-x²)·0.5
+
+    def reset(self):
+        super().reset()
+        self.magnet_x = -150
+        self.is_moving = False
+        self.emf = 0.0
+        self.max_emf = 0.0
+
+    def start(self):
+        self.magnet_x = self.start_x
+        self.is_moving = True
+        self.max_emf = 0.0
+
+    def step(self, dt):
+        super().step(dt)
+        if not self.is_moving:
+            # Стрелка гальванометра возвращается к нулю
+            self.emf *= 1.0 - ease(dt, 0.19)
+            if abs(self.emf) < 1e-3:
+                self.emf = 0.0
+            return
+        self.magnet_x += self.speed * 250 * dt  # Коэффициент скорости для анимации
+        phys_x = self.magnet_x / 60.0
+        self.emf = -self.N * self.speed * 2 * phys_x * math.exp(-(phys_x ** 2)) * 0.5
+        self.max_emf = max(self.max_emf, abs(self.emf))
+        if self.magnet_x > self.end_x:
+            self.is_moving = False
+
+    def is_settled(self):
+        return not self.is_moving and self.emf == 0.0
+
+    def true_value(self):
+        return self.N * self.speed * self.peak_factor
@@ -0,0 +1,101 @@
+"""
+Маятник без приближения малых углов: полный эллиптический интеграл
+K(m) и функции Якоби sn, cn, dn (метод среднего арифметико-
+геометрического, Абрамовиц–Стиган 17.6 и 16.4), а также таблицы для
+покадрового счёта.
+
+При амплитуде θ0 и k = sin(θ0/2):
+    T = 4·K(k²) / ω0,  ω0 = √(g/l)
+    θ(t) = 2·arcsin(k·sn(K − ω0·t, k²))  (из крайнего положения при t = 0)
+
+Таблицы строятся один раз. Кадр — это поиск в таблице и линейная
+интерполяция, по цене как math.cos. Шаг таблиц выбран так, чтобы
+относительная ошибка была меньше 1e-5, что намного меньше допуска
+проверки.
+"""
+import math
+from functools import lru_cache
+from typing import List, Tuple
+
+MAX_AMPLITUDE_DEG = 170.0   # ближе к 180° период уходит в бесконечность
+K_TABLE_STEP_DEG = 0.25
+SHAPE_SAMPLES = 1024        # точек на четверть периода
+
+
+def ellipk(m: float) -> float:
+    """Полный эллиптический интеграл первого рода K(m), m = k²."""
+    if m >= 1.0:
+        return math.inf
+    a, b = 1.0, math.sqrt(1.0 - m)
+    while abs(a - b) > 1e-15 * a:
+        a, b = (a + b) / 2, math.sqrt(a * b)
+    return math.pi / (2 * a)
+
+
+def ellipj(u: float, m: float) -> Tuple[float, float, float]:
+    """Функции Якоби (sn, cn, dn) аргумента u при параметре m, 0 <= m < 1."""
+    if m < 1e-12:
+        return math.sin(u), math.cos(u), 1.0
+    a, b, c = [1.0], math.sqrt(1.0 - m), [math.sqrt(m)]
+    while abs(c[-1]) > 1e-15:
+        a_prev = a[-1]
+        a.append((a_prev + b) / 2)
+        c.append((a_prev - b) / 2)
+        b = math.sqrt(a_prev * b)
+    n = len(a) - 1
+    phi = 2 ** n * a[n] * u
+    for i in range(n, 0, -1):
+        phi = (phi + math.asin(c[i] / a[i] * math.sin(phi))) / 2
+    sn, cn = math.sin(phi), math.cos(phi)
+    return sn, cn, math.sqrt(1.0 - m * sn * sn)
+
+
+def _interp(table: List[float], x: float) -> float:
+    # x в единицах шага таблицы, 0 <= x <= len(table) - 1
+    i = min(int(x), len(table) - 2)
+    f = x - i
+    return table[i] + (table[i + 1] - table[i]) * f
+
+
+@lru_cache(maxsize=1)
+def _k_table() -> List[float]:
+    n = int(MAX_AMPLITUDE_DEG / K_TABLE_STEP_DEG)
+    return [ellipk(math.sin(math.radians(i * K_TABLE_STEP_DEG) / 2) ** 2) for i in range(n + 1)]
+
+
+def period_factor(amplitude_deg: float) -> float:
+    """T(θ0) / T0 = 2K/π: во сколько раз период больше, чем у малых колебаний."""
+    x = min(abs(amplitude_deg), MAX_AMPLITUDE_DEG) / K_TABLE_STEP_DEG
+    return 2 * _interp(_k_table(), x) / math.pi
+
+
+class PendulumShape:
+    """
+    θ(t) для одной амплитуды на четверти периода. Остальные три четверти
+    получаются по симметрии; angle() принимает фазу в долях периода.
+    """
+
+    def __init__(self, amplitude_deg: float, samples: int = SHAPE_SAMPLES):
+        self.amplitude = math.radians(min(abs(amplitude_deg), MAX_AMPLITUDE_DEG))
+        k = math.sin(self.amplitude / 2)
+        m = k * k
+        big_k = ellipk(m)
+        self.samples = samples
+        # s — доля четверти периода: от крайнего положения (s = 0) до нижней точки (s = 1)
+        self.table = [2 * math.asin(max(-1.0, min(1.0, k * ellipj(big_k * (1 - i / samples), m)[0])))
+                      for i in range(samples + 1)]
+
+    def angle(self, phase: float) -> float:
+        q = (phase % 1.0) * 4
+        quarter = int(q)
+        f = q - quarter
+        if quarter % 2:
+            f = 1 - f
+        value = _interp(self.table, f * self.samples)
+        return value if quarter in (0, 3) else -value
+
+
+@lru_cache(maxsize=32)
+def pendulum_shape(amplitude_deg: float) -> PendulumShape:
+    """Таблица на амплитуду; маятники с одинаковой амплитудой делят её."""
+    return PendulumShape(amplitude_deg)
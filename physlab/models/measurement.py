@@ -0,0 +1,134 @@
+"""
+Измерительные работы 7 класса: мензурка, ряд шариков, объём тела.
+"""
+from physlab.models.base import LabModel
+from physlab.models.checking import Tolerance
+
+
+class MenzurkaModel(LabModel):
+    """Цена деления мензурки и объём налитой жидкости (lab71)."""
+    params = ("total_v", "num_divs", "current_v")
+    answers = ("price", "volume")
+    total_v = 100      # мл, предел шкалы
+    num_divs = 10
+    current_v = 50.0   # мл
+
+    def new_task(self, rng):
+        self.total_v = rng.choice([50, 100, 200, 250, 500, 1000])
+        # Число делений подбирается так, чтобы цена деления была «красивой»
+        options = [n for n in [10, 20, 25, 50, 100] if self.total_v % n == 0] or [10]
+        self.num_divs = rng.choice(options)
+        # Объём кратен половине цены деления, от 10% до 95% шкалы
+        min_v = int(self.total_v * 0.1)
+        max_v = int(self.total_v * 0.95)
+        step = self.price / 2
+        self.current_v = min_v + rng.randint(0, int((max_v - min_v) / step)) * step
+
+    @property
+    def price(self):
+        return self.total_v / self.num_divs
+
+    def true_values(self):
+        return {"price": self.price, "volume": self.current_v}
+
+    def tolerances(self):
+        # Цена деления — строго (1%), объём — с точностью до половины деления
+        return {"price": Tolerance(absolute=self.price * 0.01 + 0.001, strict=True),
+                "volume": Tolerance(absolute=self.price / 2)}
+
+
+class BallsRowModel(LabModel):
+    """Размер малых тел способом ряда (lab72). Шарики — центры в пикселях вдоль линейки."""
+    params = ("xs", "radius", "px_per_mm")
+    answers = ("L", "N", "d")
+    xs = ()
+    radius = 12
+    px_per_mm = 2.5
+    row_left, row_right = 40, 540   # где раскладывается новый ряд, px (задаёт окно)
+
+    def new_task(self, rng):
+        n = rng.randint(6, 15)
+        spacing = (self.row_right - self.row_left) / (n + 1)
+        self.xs = tuple(self.row_left + (i + 1) * spacing + rng.uniform(-10, 10) for i in range(n))
+
+    def snapped(self):
+        """Центры после того, как ряд сдвинут вплотную к крайнему левому шарику."""
+        xs = sorted(self.xs)
+        return tuple(xs[0] + i * 2 * self.radius for i in range(len(xs))) if xs else ()
+
+    def true_values(self):
+        if not self.xs:
+            return {"L": 0.0, "N": 0, "d": 0.0}
+        L = (max(self.xs) - min(self.xs) + 2 * self.radius) / self.px_per_mm
+        n = len(self.xs)
+        return {"L": L, "N": n, "d": L / n}
+
+    def tolerances(self):
+        # L — погрешность глаза и экрана, N — точно
+        return {"L": Tolerance(absolute=1.5), "N": Tolerance(), "d": Tolerance(absolute=0.2)}
+
+
+class DisplacementModel(LabModel):
+    """Объём тела по вытеснению жидкости (lab74): тело опускают в мензурку и поднимают."""
+    params = ("V_total", "divisions", "V_body", "V1")
+    answers = ("V1", "V2", "V")
+    actions = ("start_lower", "start_raise", "toggle")
+    V_total = 300
+    divisions = 20
+    V_body = 40
+    V1 = 150
+    lower_speed = 0.667   # доля хода за секунду
+
+    # Состояние: 0 — вверху, 1 — опускается, 2 — внизу, 3 — поднимается
+    TOP, LOWERING, BOTTOM, RAISING = range(4)
+
+    def reset(self):
+        super().reset()
+        self.state = self.TOP
+        self.depth = 0.0   # 0 — над жидкостью, 1 — полностью погружено
+
+    def new_task(self, rng):
+        self.V_total = rng.randint(200, 500)
+        self.divisions = rng.choice([10, 20, 25])
+        # Тело помещается в мензурку вместе с жидкостью
+        self.V_body = rng.randint(20, int(self.V_total * 0.3))
+        self.V1 = rng.randint(30, self.V_total - self.V_body - 10)
+
+    def start_lower(self):
+        if self.state == self.TOP:
+            self.state = self.LOWERING
+            return True
+        return False
+
+    def start_raise(self):
+        if self.state == self.BOTTOM:
+            self.state = self.RAISING
+            return True
+        return False
+
+    def toggle(self):
+        return self.start_lower() or self.start_raise()
+
+    def is_moving(self):
+        return self.state in (self.LOWERING, self.RAISING)
+
+    def step(self, dt):
+        super().step(dt)
+        if self.state == self.LOWERING:
+            self.depth = min(1.0, self.depth + self.lower_speed * dt)
+            if self.depth == 1.0:
+                self.state = self.BOTTOM
+        elif self.state == self.RAISING:
+            self.depth = max(0.0, self.depth - self.lower_speed * dt)
+            if self.depth == 0.0:
+                self.state = self.TOP
+
+    def current_volume(self):
+        return self.V1 + self.V_body * self.depth
+
+    def true_values(self):
+        return {"V1": self.V1, "V2": self.V1 + self.V_body, "V": self.V_body}
+
+    def tolerances(self):
+        half_div = Tolerance(absolute=self.V_total / self.divisions / 2)
+        return {name: half_div for name in self.answers}
@@ -0,0 +1,380 @@
+"""
+Механика: весы, плотность, пружины, сила Архимеда, рычаг, трение,
+маятники, КПД блока, поверхностное натяжение.
+"""
+import math
+
+from physlab.models.base import LabModel
+from physlab.models.checking import Tolerance
+from physlab.models.elliptic import pendulum_shape, period_factor
+from physlab.models.timestep import FixedStep, TickAccumulator, rk4
+
+G = 9.81
+
+
+def beam_angle(m_left, m_right, grams_per_rad, max_angle):
+    """Угол, к которому стремится коромысло весов: перевес, делённый на чувствительность, с упором."""
+    return max(-max_angle, min(max_angle, (m_right - m_left) / grams_per_rad))
+
+
+class BalanceScalesModel(LabModel):
+    """Масса тела на рычажных весах (lab73): неизвестный груз уравновешивают гирями."""
+    params = ("unknown_mass",)
+    unknown_mass = 45
+    tolerance = Tolerance()  # масса набирается гирями — ответ точный
+    WEIGHTS = (5, 10, 10, 20, 20, 50, 100)
+    UNKNOWN_MASSES = (25, 35, 45, 55, 65, 75, 85, 95, 115, 125)
+    grams_per_rad = 50.0
+    max_angle = math.radians(20)
+
+    def new_task(self, rng):
+        self.unknown_mass = rng.choice(self.UNKNOWN_MASSES)
+
+    def beam_target(self, m_left, m_right):
+        return beam_angle(m_left, m_right, self.grams_per_rad, self.max_angle)
+
+    def true_value(self):
+        return self.unknown_mass
+
+
+DENSITIES = {  # г/мл
+    "дуб": 0.7,
+    "алюминий": 2.7,
+    "железо": 7.8,
+    "медь": 8.9,
+    "свинец": 11.3,
+}
+
+
+class DensityModel(LabModel):
+    """Плотность твёрдого тела (lab75): масса на весах, объём мензуркой."""
+    params = ("material", "volume", "mass", "V1")
+    answers = ("m", "V", "rho")
+    material = "алюминий"
+    volume = 20      # мл
+    mass = 54.0      # г
+    V1 = 100         # мл воды до погружения
+    V_total = 250    # мл, мензурка
+    grams_per_rad = 100.0
+    max_angle = 0.3
+
+    def new_task(self, rng):
+        self.material, rho = rng.choice(list(DENSITIES.items()))
+        # Гирь всего на 205 г, а тело должно спокойно входить в мензурку
+        max_vol = max(10, min(int(200 / rho), 80))
+        self.volume = rng.randint(10, max_vol)
+        self.mass = round(self.volume * rho, 1)
+        # Вода с телом не должна переливаться (запас 20 мл)
+        self.V1 = rng.randint(50, max(50, self.V_total - self.volume - 20))
+
+    def beam_target(self, m_left, m_right):
+        return beam_angle(m_left, m_right, self.grams_per_rad, self.max_angle)
+
+    def true_values(self):
+        return {"m": self.mass, "V": self.volume, "rho": self.mass / self.volume}
+
+    def tolerances(self):
+        return {"m": Tolerance(absolute=5.0), "V": Tolerance(absolute=5.0), "rho": Tolerance(absolute=1.0)}
+
+
+class HookeModel(LabModel):
+    """
+    Закон Гука (lab76, lab93): груз на пружине неизвестной жёсткости.
+    Колебания груза — (m + m_крючка)·x'' = m·g − k·x − c·x', шаг RK4 5 мс
+    по реальному времени; удлинение — в сантиметрах.
+    """
+    params = ("k", "mass")
+    k = 50.0     # Н/м
+    mass = 0.0   # кг
+    hook_mass = 0.02   # кг: крючок, чтобы и пустая пружина колебалась
+    damping = 6.0      # 1/с: груз успокаивается за 2–3 с
+    h = 0.005
+    rest_eps = 5e-3  # см: меньше — груз считается неподвижным
+
+    def reset(self):
+        super().reset()
+        self.extension = 0.0  # см
+        self.velocity = 0.0   # см/с
+        self.stepper = FixedStep(self.h)
+
+    def new_task(self, rng):
+        self.k = rng.randint(20, 100)
+
+    def target_extension(self):
+        # F = k·x = m·g  =>  x = m·g / k
+        return self.mass * G / self.k * 100.0 if self.k > 0 else 0.0
+
+    def derivatives(self, t, y):
+        x, v = y  # см, см/с
+        a = (self.mass * G * 100.0 - self.k * x) / (self.mass + self.hook_mass) - self.damping * v
+        return v, a
+
+    def step(self, dt):
+        t = self.time
+        super().step(dt)
+        y = (self.extension, self.velocity)
+        for i in range(self.stepper.steps(dt)):
+            y = rk4(self.derivatives, t + i * self.h, y, self.h)
+        self.extension, self.velocity = y
+        if self.is_settled():
+            self.extension = self.target_extension()
+            self.velocity = 0.0
+
+    def is_settled(self):
+        return abs(self.velocity) < self.rest_eps * 10 and abs(self.target_extension() - self.extension) < self.rest_eps
+
+    def true_value(self):
+        return self.k
+
+
+class ArchimedesModel(LabModel):
+    """Сила Архимеда (lab77): вес тела в воздухе и в воде."""
+    params = ("mass_g", "vol_ml")
+    answers = ("P0", "P1", "Fa")
+    mass_g = 200
+    vol_ml = 50
+    rho_water = 1000.0
+    tolerance = Tolerance(absolute=0.1, strict=True)
+
+    def new_task(self, rng):
+        self.mass_g = rng.randint(100, 300)
+        self.vol_ml = int(self.mass_g / rng.uniform(2.5, 8.0))
+
+    def weight(self):
+        return self.mass_g / 1000.0 * G
+
+    def buoyancy(self, submerged=1.0):
+        """Выталкивающая сила при погружении на долю submerged объёма."""
+        return self.rho_water * G * self.vol_ml * 1e-6 * submerged
+
+    def dynamometer(self, submerged=0.0):
+        return max(0.0, self.weight() - self.buoyancy(submerged))
+
+    def true_values(self):
+        return {"P0": self.weight(), "P1": self.weight() - self.buoyancy(), "Fa": self.buoyancy()}
+
+
+class LeverModel(LabModel):
+    """Равновесие рычага (lab78). Грузы — пары (масса, номер деления; слева отрицательный)."""
+    params = ("weights",)
+    answers = ("balanced",)
+    weights = ()
+    tilt = math.radians(20)
+
+    def moment(self):
+        return sum(mass * pos for mass, pos in self.weights)
+
+    def target_angle(self):
+        m = self.moment()
+        return 0.0 if m == 0 else math.copysign(self.tilt, m)
+
+    def true_values(self):
+        return {"balanced": self.moment() == 0}
+
+
+FRICTION_MU = (0.3, 0.15, 0.6)  # дерево, пластик, наждачка
+
+
+class FrictionModel(LabModel):
+    """Сила трения скольжения (lab79): брусок с грузами тянут динамометром."""
+    params = ("surface", "weights_count")
+    answers = ("m", "F", "mu")
+    surface = 0
+    weights_count = 0
+    block_mass = 0.100   # кг
+    weight_mass = 0.100
+    max_weights = 4
+
+    @property
+    def mu(self):
+        return FRICTION_MU[self.surface]
+
+    def total_mass(self):
+        return self.block_mass + self.weights_count * self.weight_mass
+
+    def friction_force(self):
+        # F = μ·N = μ·m·g
+        return self.mu * self.total_mass() * G
+
+    def true_values(self):
+        return {"m": self.total_mass(), "F": self.friction_force(), "mu": self.mu}
+
+    def tolerances(self):
+        return {"m": Tolerance(absolute=0.01, strict=True), "F": Tolerance(absolute=0.1, strict=True), "mu": Tolerance(absolute=0.05, strict=True)}
+
+
+class SpringPendulumModel(LabModel):
+    """Пружинный маятник (тренажёр lab811): x = A·cos(ωt), ответ — период."""
+    params = ("m", "k")
+    m = 1.0    # кг
+    k = 10.0   # Н/м
+    tolerance = Tolerance(rel=0.05, zero=0.1, strict_zero=True)
+
+    def omega(self):
+        return math.sqrt(self.k / self.m) if self.m > 0 else 0.0
+
+    def displacement(self, amplitude=1.0):
+        return amplitude * math.cos(self.omega() * self.time)
+
+    def period(self):
+        return 2 * math.pi * math.sqrt(self.m / self.k)
+
+    def true_value(self):
+        return self.period()
+
+
+class SpringFrequencyModel(SpringPendulumModel):
+    """Частота пружинного маятника (lab94)."""
+    tolerance = Tolerance(rel=0.05, zero=0.05)
+
+    def true_value(self):
+        return self.omega() / (2 * math.pi)
+
+
+class PendulumModel(LabModel):
+    """
+    Математический маятник и секундомер (lab111), ответ — частота.
+    exact=False — малые колебания θ0·cos(ω0·t); exact=True — точное
+    решение через функции Якоби (physlab.models.elliptic), период
+    растёт с амплитудой.
+    """
+    params = ("length", "g", "amplitude", "exact")
+    actions = ("start_swing", "toggle_stopwatch", "reset_stopwatch")
+    length = 1.0   # м
+    g = 9.81
+    amplitude = 15.0   # градусы
+    exact = False
+    tolerance = Tolerance(rel=0.08, strict=True)
+
+    @property
+    def max_angle(self):
+        return math.radians(self.amplitude)
+
+    def reset(self):
+        super().reset()
+        self.angle = self.max_angle
+        self.swinging = False
+        self.stopwatch = 0.0
+        self.stopwatch_running = False
+
+    def new_task(self, rng):
+        self.length = rng.uniform(0.5, 1.5)
+        self.g = rng.uniform(3.0, 20.0)  # другая планета
+
+    def start_swing(self):
+        self.swinging = True
+
+    def toggle_stopwatch(self):
+        self.stopwatch_running = not self.stopwatch_running
+
+    def reset_stopwatch(self):
+        self.stopwatch = 0.0
+        self.stopwatch_running = False
+
+    def is_idle(self):
+        return not (self.swinging or self.stopwatch_running)
+
+    def step(self, dt):
+        if self.swinging:
+            super().step(dt)
+            if self.exact:
+                self.angle = pendulum_shape(self.amplitude).angle(self.time / self.period())
+            else:
+                self.angle = self.max_angle * math.cos(math.sqrt(self.g / self.length) * self.time)
+        if self.stopwatch_running:
+            self.stopwatch += dt
+
+    def period(self):
+        t0 = 2 * math.pi * math.sqrt(self.length / self.g)
+        return t0 * period_factor(self.amplitude) if self.exact else t0
+
+    def true_value(self):
+        return 1.0 / self.period()
+
+
+class EfficiencyModel(LabModel):
+    """КПД подвижного блока (lab813), в процентах."""
+    params = ("A_useful", "A_spent")
+    A_useful = 200.0  # Дж
+    A_spent = 250.0
+    tolerance = Tolerance(absolute=2.0)
+
+    def true_value(self):
+        return self.A_useful / self.A_spent * 100.0 if self.A_spent else 0.0
+
+
+LIQUIDS = {"Вода": 0.073, "Спирт": 0.022, "Глицерин": 0.063, "Ацетон": 0.024}  # σ, Н/м
+
+
+class SurfaceTensionModel(LabModel):
+    """
+    Поверхностное натяжение методом отрыва капель (lab103). Капля растёт
+    на кончике трубки и падает в стакан на весах; модель задана на шаг 30 мс.
+    """
+    params = ("liquid", "sigma")
+    actions = ("toggle",)
+    liquid = "Вода"
+    sigma = 0.073   # Н/м
+    d = 0.002       # диаметр трубки, м
+    drops_total = 50
+    tick = 0.03
+    tolerance = Tolerance(absolute=0.005, strict=True)
+
+    def reset(self):
+        super().reset()
+        self.drops_count = 0
+        self.total_mass = 0.0   # кг
+        self.drop_radius = 0.0  # px
+        self.drop_y = 50        # px
+        self.dripping = False
+        self.finished = False
+        self.ticks = TickAccumulator(self.tick)
+
+    def new_task(self, rng):
+        self.liquid, self.sigma = rng.choice(list(LIQUIDS.items()))
+
+    def toggle(self):
+        if self.finished:
+            return
+        self.dripping = not self.dripping
+        if self.dripping and self.drop_radius == 0:
+            self.drop_radius = 2
+            self.drop_y = 50
+
+    def step(self, dt):
+        if not self.dripping:
+            return
+        super().step(dt)
+        for _ in range(self.ticks.steps(dt)):
+            if not self.dripping:
+                break
+            self.step_drop()
+
+    def step_drop(self):
+        if self.drop_y == 50:
+            # Капля растёт, пока не оторвётся
+            if self.drop_radius < 8:
+                self.drop_radius += 0.2
+            else:
+                self.drop_y += 5
+        else:
+            self.drop_y += 10
+            if self.drop_y > 300:
+                self.add_drop()
+                if not self.finished:
+                    self.drop_radius = 2
+                    self.drop_y = 50
+                else:
+                    self.dripping = False
+                    self.drop_radius = 0
+
+    def add_drop(self):
+        # m = π·d·σ / g, с небольшим разбросом от капли к капле
+        self.drops_count += 1
+        self.total_mass += math.pi * self.d * self.sigma / G * self.rng.uniform(0.98, 1.02)
+        if self.drops_count >= self.drops_total:
+            self.finished = True
+            self.dripping = False
+
+    def true_value(self):
+        return self.sigma
@@ -0,0 +1,318 @@
+"""
+Оптика и волны: тонкая линза, преломление, дифракционная решётка,
+спектры, интерференция двух источников.
+"""
+import math
+
+from physlab.models.base import LabModel
+from physlab.models.checking import Tolerance
+
+
+def lens_image_distance(f, do):
+    # Формула тонкой линзы: 1/f = 1/do + 1/di
+    if abs(do) < 1e-9:
+        return None
+    denom = (1.0 / f) - (1.0 / do)
+    if abs(denom) < 1e-12:
+        return float('inf')
+    return 1.0 / denom
+
+
+def magnification(di, do):
+    if do == 0 or di is None:
+        return None
+    return -di / do
+
+
+REAL_IMAGE = "реальное, перевёрнутое"
+VIRTUAL_IMAGE = "виртуальное, прямое"
+
+
+class ThinLensModel(LabModel):
+    """Линзы и изображения (lab810). Расстояния — в пикселях скамьи."""
+    params = ("f", "do", "h_obj")
+    answers = ("di", "m", "type")
+    f = 120.0
+    do = 260.0
+    h_obj = 90.0
+
+    def new_task(self, rng):
+        self.f = rng.choice([80.0, 100.0, 120.0, 140.0])
+        self.do = rng.uniform(0.5 * self.f, 3.0 * self.f)
+
+    def image_distance(self):
+        return lens_image_distance(self.f, self.do)
+
+    def magnification(self):
+        return magnification(self.image_distance(), self.do)
+
+    def image_type(self):
+        di = self.image_distance()
+        return REAL_IMAGE if (di is not None and di > 0) else VIRTUAL_IMAGE
+
+    def classify_case(self):
+        f, do = self.f, self.do
+        if do < f:
+            return "d < F: виртуальное, прямое, увеличенное"
+        if abs(do - f) < 1e-6:
+            return "d = F: изображение на бесконечности"
+        if do < 2 * f:
+            return "F < d < 2F: реальное, перевёрнутое, увеличенное"
+        if abs(do - 2 * f) < 1e-6:
+            return "d = 2F: реальное, перевёрнутое, равного размера"
+        return "d > 2F: реальное, перевёрнутое, уменьшенное"
+
+    def true_values(self):
+        return {"di": self.image_distance(), "m": self.magnification(), "type": self.image_type()}
+
+    def tolerances(self):
+        return {"di": Tolerance(rel=0.03, absolute=1.0), "m": Tolerance(rel=0.05, absolute=0.02)}
+
+
+class FocalLensModel(ThinLensModel):
+    """
+    Фокусное расстояние линзы (lab115). Ученик измеряет di по экрану и
+    считает f; верно, если f посчитано по своим измерениям ("f") и f по
+    этим измерениям близко к f линзы ("f_measured").
+    """
+    answers = ("f",)
+
+    def new_task(self, rng):
+        self.f = rng.choice([80.0, 100.0, 120.0, 140.0])
+        self.do = rng.uniform(0.6 * self.f, 3.0 * self.f)
+
+    def true_values(self):
+        return {"f": self.f, "f_measured": self.f}
+
+    def focal_from(self, do, di):
+        """f по формуле тонкой линзы; None — по таким do и di не посчитать."""
+        if abs(do) < 1e-9 or abs(di) < 1e-9 or abs(1.0 / do + 1.0 / di) < 1e-12:
+            return None
+        return 1.0 / (1.0 / do + 1.0 / di)
+
+    def check(self, answers):
+        """answers: di (измерено), f (ответ ученика), do — если ученик его менял."""
+        f_calc = self.focal_from(answers.get("do", self.do), answers["di"])
+        if f_calc is None:
+            return {"f": False, "f_measured": False}
+        ok_user = abs(answers["f"] - f_calc) <= max(0.03 * abs(f_calc), 1e-2)
+        ok_model = abs(f_calc - self.f) <= max(0.05 * abs(self.f), 1e-2)
+        return {"f": ok_user, "f_measured": ok_model}
+
+
+class RefractionModel(LabModel):
+    """Показатель преломления стекла (lab112)."""
+    params = ("n_glass", "angle_inc")
+    n_glass = 1.5
+    n_air = 1.0
+    angle_inc = 45.0   # градусы
+    tolerance = Tolerance(absolute=0.1, strict=True)
+
+    def new_task(self, rng):
+        self.n_glass = rng.uniform(1.3, 1.8)
+
+    def refracted_angle(self):
+        """Угол преломления в градусах; None — полное отражение."""
+        sin_beta = (self.n_air / self.n_glass) * math.sin(math.radians(self.angle_inc))
+        if abs(sin_beta) > 1.0:
+            return None
+        return math.degrees(math.asin(sin_beta))
+
+    def true_value(self):
+        return self.n_glass
+
+
+class DiffractionModel(LabModel):
+    """Длина световой волны по дифракционной решётке (lab113). λ и d — в нм."""
+    params = ("wavelength", "grating_d")
+    wavelength = 650
+    grating_d = 2000
+    distance_L = 1.0   # м до экрана
+    tolerance = Tolerance(absolute=10, strict=True)
+
+    def new_task(self, rng):
+        self.wavelength = rng.randint(400, 700)
+        self.grating_d = rng.choice([2000, 2500, 3000])
+
+    def maximum_offset(self, k):
+        """Смещение k-го максимума на экране, м; None — максимума нет."""
+        sin_phi = k * self.wavelength / self.grating_d
+        if abs(sin_phi) >= 1.0:
+            return None
+        return self.distance_L * math.tan(math.asin(sin_phi))
+
+    def true_value(self):
+        return self.wavelength
+
+
+LAMPS = {
+    "Накаливания (лампа накаливания)": {
+        "type": "continuous",
+        "info": "Непрерывный спектр (широкий диапазон длин волн)."
+    },
+    "Водород (линейный, Balmer)": {
+        "type": "lines",
+        "lines": [
+            (656.3, "Hα"),
+            (486.1, "Hβ"),
+            (434.0, "Hγ"),
+            (410.2, "Hδ")
+        ],
+        "info": "Линии Бальмера водорода."
+    },
+    "Гелий (линейный)": {
+        "type": "lines",
+        "lines": [
+            (587.6, "He 587.6"),
+            (501.6, "He 501.6"),
+            (447.1, "He 447.1")
+        ],
+        "info": "Некоторые яркие линии гелия."
+    },
+    "Ртуть (линейный)": {
+        "type": "lines",
+        "lines": [
+            (546.1, "Hg 546.1"),
+            (435.8, "Hg 435.8"),
+            (404.7, "Hg 404.7")
+        ],
+        "info": "Яркие линии ртути."
+    }
+}
+
+CONTINUOUS_LABELS = ("", "continuous", "непрерывный", "continuous spectrum")
+
+
+class SpectroscopeModel(LabModel):
+    """Спектроскоп (lab114): длина волны и метка ближайшей линии лампы."""
+    params = ("lamp",)
+    answers = ("wl", "label")
+    lamp = "Накаливания (лампа накаливания)"
+
+    def new_task(self, rng):
+        self.lamp = rng.choice(list(LAMPS))
+
+    def is_continuous(self):
+        return LAMPS[self.lamp]["type"] == "continuous"
+
+    def lines(self):
+        return LAMPS[self.lamp].get("lines", [])
+
+    def nearest_line(self, wl):
+        return min(self.lines(), key=lambda line: abs(wl - line[0]))
+
+    def true_values(self):
+        if self.is_continuous():
+            return {"wl": None, "label": "continuous"}
+        return {"wl": tuple(wl for wl, _ in self.lines()), "label": tuple(lab for _, lab in self.lines())}
+
+    def check(self, answers):
+        """answers: wl (нм) и label. Для непрерывного спектра проверяется только метка."""
+        label = answers.get("label", "").strip()
+        if self.is_continuous():
+            return {"label": label.lower() in CONTINUOUS_LABELS}
+        wl_model, lab = self.nearest_line(answers["wl"])
+        # допуск: 1% или 1 nm минимум
+        ok_wl = abs(answers["wl"] - wl_model) <= max(0.01 * wl_model, 1.0)
+        ok_label = label.lower() == lab.lower() if label else False
+        return {"wl": ok_wl, "label": ok_label}
+
+
+# Длина волны нм, цвет HEX, интенсивность 0.5-3.0 (для ширины линии)
+GAS_SPECTRA = {
+    "Водород": [
+        (656, "#FF0000", 2.5),  # H-alpha
+        (486, "#00FFFF", 1.5),  # H-beta
+        (434, "#0000FF", 1.0),  # H-gamma
+        (410, "#800080", 0.8)   # H-delta
+    ],
+    "Гелий": [
+        (706, "#AA0000", 1.0),
+        (667, "#FF0000", 1.5),
+        (587, "#FFFF00", 3.0),  # Желтая D3
+        (501, "#00FF00", 1.2),
+        (492, "#00E0E0", 1.0),
+        (471, "#0000FF", 0.8),
+        (447, "#000080", 1.5)
+    ],
+    "Неон": [
+        # Неон - лес красных линий
+        (640, "#FF0000", 2.0), (633, "#FF2000", 1.8), (614, "#FF4000", 1.5),
+        (609, "#FF6000", 1.5), (594, "#FFAA00", 1.2), (585, "#FFFF00", 1.5),
+        (540, "#00FF00", 0.5)
+    ],
+    "Ртуть": [
+        (579, "#FFFF00", 1.8),  # Дублет
+        (577, "#FFFF00", 1.8),
+        (546, "#00FF00", 3.0),  # Зеленая
+        (436, "#0000FF", 2.0),  # Синяя
+        (405, "#800080", 1.2)   # Фиолетовая
+    ],
+    "Непрерывный (Солнце)": []
+}
+
+
+class SpectraModel(LabModel):
+    """Изучение спектров (lab116): ученик наводит курсор на линию и вводит λ."""
+    params = ("gas",)
+    gas = "Водород"
+    line_tolerance = 3.0          # нм — есть точный курсор
+    continuous_range = (400, 750)
+
+    def lines(self):
+        return [nm for nm, _, _ in GAS_SPECTRA[self.gas]]
+
+    def target_line(self, val):
+        """Линия, с которой сравнивается ответ; для сплошного спектра — сам ответ."""
+        lines = self.lines()
+        return min(lines, key=lambda line: abs(val - line)) if lines else val
+
+    def true_value(self):
+        """Все линии газа; для сплошного спектра — пусто."""
+        return tuple(self.lines())
+
+    def check(self, answers):
+        val = answers["value"]
+        if not self.lines():
+            lo, hi = self.continuous_range
+            return {"value": lo <= val <= hi}
+        return {"value": abs(val - self.target_line(val)) <= self.line_tolerance}
+
+
+MAXIMUM, MINIMUM, INTERMEDIATE = "Максимум", "Минимум", "Промежуточное"
+
+
+class InterferenceModel(LabModel):
+    """
+    Интерференция волн от двух источников (lab95). Координаты — в см,
+    начало между источниками; detector — выбранная точка P или None.
+    """
+    params = ("dist", "lam", "detector")
+    answers = ("delta", "type")
+    dist = 10.0
+    lam = 2.0
+    detector = None
+    tolerance = Tolerance(absolute=0.1)
+
+    def distances(self):
+        """(d1, d2) от источников до точки P."""
+        if self.detector is None:
+            return 0.0, 0.0
+        x, y = self.detector
+        d1 = math.hypot(x + self.dist / 2, y)
+        d2 = math.hypot(x - self.dist / 2, y)
+        return d1, d2
+
+    def path_difference(self):
+        d1, d2 = self.distances()
+        return abs(d1 - d2)
+
+    def point_type(self):
+        ratio = self.path_difference() / (self.lam / 2.0)
+        closest = round(ratio)
+        if abs(ratio - closest) < 0.2:  # Достаточно близко к целому полуволн
+            return MAXIMUM if closest % 2 == 0 else MINIMUM
+        return INTERMEDIATE
+
+    def true_values(self):
+        return {"delta": self.path_difference(), "type": self.point_type()}
@@ -0,0 +1,56 @@
+"""
+Квантовая физика: фотоэффект и спектр атома водорода.
+"""
+from physlab.models.base import LabModel
+from physlab.models.checking import Tolerance
+
+C_LIGHT = 299792458       # м/с
+E_CHARGE = 1.60218e-19    # Кл
+H_PLANCK = 6.626e-34      # Дж*с
+
+
+class PhotoEffectModel(LabModel):
+    """Постоянная Планка по фотоэффекту (lab105)."""
+    params = ("wavelength_nm", "voltage", "intensity")
+    wavelength_nm = 500.0
+    voltage = 0.0          # В (отрицательное - задерживающее)
+    intensity = 50         # %
+    work_function_ev = 2.2   # Работа выхода (например, Калий), эВ
+    tolerance = Tolerance(rel=0.1)
+
+    def photon_energy(self):
+        return H_PLANCK * C_LIGHT / (self.wavelength_nm * 1e-9)
+
+    def max_kinetic_energy(self):
+        return self.photon_energy() - self.work_function_ev * E_CHARGE
+
+    def is_emitting(self):
+        return self.max_kinetic_energy() > 0 and self.intensity > 0
+
+    def stopping_voltage(self):
+        """Запирающее напряжение (отрицательное), 0 — фотоэффекта нет."""
+        return -max(0.0, self.max_kinetic_energy()) / E_CHARGE
+
+    def true_value(self):
+        return H_PLANCK
+
+
+class PhotoTrainerModel(PhotoEffectModel):
+    """Фотоэффект в тренажёре lab811: частота задаётся в единицах 10^14 Гц, A = 2 эВ."""
+    params = ("nu", "voltage", "intensity")
+    nu = 5.0
+    work_function_ev = 2.0   # примерно цезий
+    tolerance = Tolerance(rel=0.05, zero=0.1, strict_zero=True)
+
+    def photon_energy(self):
+        return H_PLANCK * self.nu * 1e14
+
+
+class HydrogenModel(LabModel):
+    """Спектр атома водорода (lab117): переход с уровня n на уровень 2 (серия Бальмера)."""
+    params = ("n",)
+    n = 3
+    tolerance = Tolerance(absolute=0.05)
+
+    def true_value(self):
+        return 13.6 * (0.25 - 1.0 / self.n ** 2)
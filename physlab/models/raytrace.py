@@ -0,0 +1,451 @@
+"""
+Ход лучей через линзы: веер из сотен лучей считается массивами numpy,
+без цикла по лучам.
+
+Система — ряд преломляющих элементов вдоль оси x (в пикселях скамьи,
+y — высота над осью):
+
+    ThinLens(x, f)                     тонкая линза
+    Surface(x, R, n)                   сферическая поверхность, за ней показатель n
+    thick_lens(x, f, aperture)         двояковыпуклая стеклянная линза с тем же f
+
+Два режима:
+
+    PARAXIAL  матрицы ABCD: y' = y + d·u у каждого элемента, u' = u − y/f
+              у тонкой линзы; толстая линза — две поверхности. Лучи идут
+              через вершины поверхностей, аберраций нет.
+    EXACT     пересечение луча со сферой и закон Снеллиуса в векторной
+              форме. У толстой линзы видна сферическая аберрация: краевые
+              лучи сходятся ближе к линзе. Полное внутреннее отражение и
+              промах мимо оправы обрывают луч.
+
+Тонкая линза в режиме EXACT остаётся идеальной (u' = u − y/f): у неё нет
+поверхностей, на которых считать преломление.
+
+System.image — изображение точки оси по матрице ABCD всей системы
+(для двух линз — итоговое), trace — точки каждого луча на каждом
+элементе: массивы (лучи × точки), которые окну остаётся нарисовать.
+"""
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+PARAXIAL = "paraxial"
+EXACT = "exact"
+
+N_GLASS = 1.5
+EDGE = 4.0            # толщина линзы по краю, px
+APERTURE = 160.0      # полувысота оправы по умолчанию, px
+
+
+class ThinLens:
+    __slots__ = ("x", "f", "aperture")
+
+    def __init__(self, x, f, aperture=APERTURE):
+        self.x, self.f, self.aperture = float(x), float(f), float(aperture)
+
+    def matrix(self, n):
+        return np.array([[1.0, 0.0], [-1.0 / self.f, 1.0]])
+
+
+class Surface:
+    """Сферическая поверхность с вершиной в x; R > 0 — центр справа; math.inf — плоская."""
+    __slots__ = ("x", "R", "n", "aperture")
+
+    def __init__(self, x, R, n, aperture=APERTURE):
+        self.x, self.R, self.n, self.aperture = float(x), float(R), float(n), float(aperture)
+
+    def matrix(self, n):
+        # В приведённых координатах (y, n·u)
+        power = 0.0 if math.isinf(self.R) else (self.n - n) / self.R
+        return np.array([[1.0, 0.0], [-power, 1.0]])
+
+
+def _radius(f, n, t):
+    """R равновыпуклой линзы толщиной t с фокусным расстоянием f (формула линзовых мастеров)."""
+    if t <= 0:
+        return 2.0 * (n - 1.0) * f
+    # (n−1)·(2c − (n−1)·t·c²/n) = 1/f, c = 1/R — меньший корень
+    a = (n - 1.0) ** 2 * t / n
+    b = 2.0 * (n - 1.0)
+    disc = b * b - 4.0 * a / f
+    if disc < 0:
+        raise ValueError("линза слишком толстая для такого f")
+    return 2.0 * a / (b - math.sqrt(disc))
+
+
+def thick_lens(x, f, aperture=APERTURE, n=N_GLASS, edge=EDGE) -> List[Surface]:
+    """
+    Равновыпуклая линза с центром в x и фокусным расстоянием f. Оправа
+    не больше 0.6·R, толщина по центру — чтобы по краю осталось edge.
+    """
+    t, R = edge, _radius(f, n, edge)
+    for _ in range(30):
+        a = min(aperture, 0.6 * R)
+        t_new = 2.0 * (R - math.sqrt(R * R - a * a)) + edge
+        if abs(t_new - t) < 1e-9:
+            break
+        t, R = t_new, _radius(f, n, t_new)
+    a = min(aperture, 0.6 * R)
+    return [Surface(x - t / 2, R, n, a), Surface(x + t / 2, -R, 1.0, a)]
+
+
+class Trace:
+    """
+    Лучи системы: xs, ys — (лучи × точки): старт, каждый элемент, конец.
+    Оборвавшийся луч повторяет последнюю точку; alive — дошёл ли до конца.
+    """
+
+    def __init__(self, xs, ys, alive, dx, dy):
+        self.xs, self.ys, self.alive = xs, ys, alive
+        self.dx, self.dy = dx, dy   # направление на выходе (для продолжения назад)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def segments(self, rows=slice(None)) -> np.ndarray:
+        """Отрезки лучей rows (x0, y0, x1, y1) одним массивом, без нулевых."""
+        xs, ys = self.xs[rows], self.ys[rows]
+        seg = np.stack([xs[..., :-1], ys[..., :-1], xs[..., 1:], ys[..., 1:]], axis=-1).reshape(-1, 4)
+        return seg[(seg[:, 0] != seg[:, 2]) | (seg[:, 1] != seg[:, 3])]
+
+    def at(self, x) -> np.ndarray:
+        """Высота живых лучей в плоскости x за последним элементом (экран)."""
+        x_last, y_last = self.xs[:, -2], self.ys[:, -2]
+        y = y_last + (x - x_last) * self.dy / self.dx
+        return y[self.alive]
+
+    def extensions(self, x) -> np.ndarray:
+        """Продолжения выходящих лучей назад до плоскости x (мнимое изображение)."""
+        x_last, y_last = self.xs[:, -2], self.ys[:, -2]
+        y = y_last + (x - x_last) * self.dy / self.dx
+        seg = np.stack([x_last, y_last, np.full_like(y, x), y], axis=-1)
+        return seg[self.alive]
+
+
+class System:
+    def __init__(self, elements: Sequence = ()):
+        self.elements = sorted(elements, key=lambda el: el.x)
+
+    # --- Параксиальная оптика ---
+    def matrix(self, x_from) -> Tuple[np.ndarray, float]:
+        """Матрица ABCD от плоскости x_from до последнего элемента и x последнего элемента."""
+        M = np.eye(2)
+        x, n = x_from, 1.0
+        for el in self.elements:
+            M = np.array([[1.0, (el.x - x) / n], [0.0, 1.0]]) @ M
+            M = el.matrix(n) @ M
+            x = el.x
+            if isinstance(el, Surface):
+                n = el.n
+        return M, x
+
+    def image(self, x_obj) -> Tuple[Optional[float], Optional[float]]:
+        """(x изображения, увеличение) точки на оси в x_obj; (inf, None) — на бесконечности."""
+        if not self.elements:
+            return None, None
+        (A, B), (C, D) = self.matrix(x_obj)[0]
+        x_last = self.elements[-1].x
+        if abs(D) < 1e-12:
+            return math.inf, None
+        t = -B / D
+        return x_last + t, A + t * C
+
+    def focal_points(self) -> Tuple[Optional[float], Optional[float]]:
+        """(x переднего фокуса, x заднего фокуса) по матрице ABCD; (None, None) — система афокальная."""
+        if not self.elements:
+            return None, None
+        x_first = self.elements[0].x
+        (A, B), (C, D) = self.matrix(x_first)[0]
+        if abs(C) < 1e-12:
+            return None, None
+        return x_first + D / C, self.elements[-1].x - A / C
+
+    # --- Лучи ---
+    def fan(self, x0, y0, count) -> np.ndarray:
+        """Наклоны count лучей из (x0, y0), равномерно по оправе первого элемента."""
+        first = self.elements[0]
+        targets = np.linspace(-first.aperture, first.aperture, count)
+        return (targets - y0) / (first.x - x0)
+
+    def trace(self, x0, y0, slopes, x_end, mode=PARAXIAL, clip=True) -> Trace:
+        """clip=False — оправы тонких линз не ограничивают лучи (построительные лучи чертежа)."""
+        slopes = np.asarray(slopes, dtype=float)
+        count = len(slopes)
+        k = len(self.elements) + 2
+        xs = np.empty((count, k))
+        ys = np.empty((count, k))
+        xs[:, 0], ys[:, 0] = x0, y0
+        x = np.full(count, float(x0))
+        y = np.full(count, float(y0))
+        alive = np.ones(count, dtype=bool)
+        if mode == PARAXIAL:
+            u, n = slopes.copy(), 1.0
+            for j, el in enumerate(self.elements, start=1):
+                y = y + (el.x - x) * u
+                x = np.full(count, el.x)
+                if clip:
+                    alive &= np.abs(y) <= el.aperture
+                if isinstance(el, ThinLens):
+                    u = u - y / el.f
+                else:
+                    nu = n * u
+                    if not math.isinf(el.R):
+                        nu = nu - y * (el.n - n) / el.R
+                    n = el.n
+                    u = nu / n
+                self._store(xs, ys, j, x, y, alive)
+            dx, dy = np.ones(count), u
+        else:
+            norm = np.hypot(1.0, slopes)
+            dx, dy = 1.0 / norm, slopes / norm
+            n = 1.0
+            for j, el in enumerate(self.elements, start=1):
+                if isinstance(el, ThinLens):
+                    t = (el.x - x) / dx
+                    x, y = x + t * dx, y + t * dy
+                    u = dy / dx - y / el.f
+                    norm = np.hypot(1.0, u)
+                    dx, dy = 1.0 / norm, u / norm
+                    ok = np.abs(y) <= el.aperture if clip else np.ones(count, dtype=bool)
+                else:
+                    x, y, dx, dy, ok = self._refract(el, n, x, y, dx, dy)
+                    n = el.n
+                alive &= ok & (dx > 0)
+                self._store(xs, ys, j, x, y, alive)
+        # До плоскости x_end по последнему направлению
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y_end = y + (x_end - x) * dy / dx
+        self._store(xs, ys, k - 1, np.full(count, float(x_end)), y_end, alive)
+        return Trace(xs, ys, alive, dx, dy)
+
+    @staticmethod
+    def _store(xs, ys, j, x, y, alive):
+        # Оборвавшийся луч остаётся в последней живой точке
+        xs[:, j] = np.where(alive, x, xs[:, j - 1])
+        ys[:, j] = np.where(alive, y, ys[:, j - 1])
+
+    @staticmethod
+    def _refract(surface, n1, x, y, dx, dy):
+        n2 = surface.n
+        if math.isinf(surface.R):
+            t = (surface.x - x) / dx
+            hx, hy = x + t * dx, y + t * dy
+            nx, ny = np.full_like(x, -1.0), np.zeros_like(y)
+            ok = np.abs(hy) <= surface.aperture
+        else:
+            R = surface.R
+            cx = surface.x + R
+            # |p + t·d − c|² = R², |d| = 1
+            ox, oy = x - cx, y
+            b = ox * dx + oy * dy
+            disc = b * b - (ox * ox + oy * oy - R * R)
+            ok = disc >= 0
+            root = np.sqrt(np.where(ok, disc, 0.0))
+            # Ближняя к вершине точка сферы: при R > 0 — первое пересечение, при R < 0 — второе
+            t = -b - root if R > 0 else -b + root
+            hx, hy = x + t * dx, y + t * dy
+            ok &= np.abs(hy) <= surface.aperture
+            nx, ny = (hx - cx) / R, hy / R      # нормаль навстречу лучу (против +x)
+        cos_i = -(nx * dx + ny * dy)
+        eta = n1 / n2
+        k = 1.0 - eta * eta * (1.0 - cos_i * cos_i)
+        ok &= k >= 0                              # полное внутреннее отражение
+        root_k = np.sqrt(np.where(k >= 0, k, 0.0))
+        dx2 = eta * dx + (eta * cos_i - root_k) * nx
+        dy2 = eta * dy + (eta * cos_i - root_k) * ny
+        return hx, hy, dx2, dy2, ok
+
+
+def lens_system(lenses: Sequence[Tuple[float, float]], mode=PARAXIAL, aperture=APERTURE) -> System:
+    """Система из линз (x, f): в режиме EXACT — толстые стеклянные, иначе тонкие."""
+    elements = []
+    for x, f in lenses:
+        if mode == EXACT and f > 0:
+            elements.extend(thick_lens(x, f, aperture))
+        else:
+            elements.append(ThinLens(x, f, aperture))
+    return System(elements)
+
+
+# --- Тела на столе: пластина, полуцилиндр, призма ---
+
+MAX_BOUNCES = 8       # преломлений и отражений на луч
+MIN_INTENSITY = 0.01  # более слабые ветви не прослеживаются
+FAR = 2000.0          # длина луча, ушедшего из тела, px
+_EPS = 1e-6
+
+
+def fresnel(cos_i, n1, n2):
+    """
+    Доля отражённой энергии для неполяризованного света (среднее Rs и Rp)
+    и косинус угла преломления; при полном внутреннем отражении R = 1.
+    """
+    cos_i = np.asarray(cos_i, dtype=float)
+    n1 = np.broadcast_to(np.asarray(n1, dtype=float), cos_i.shape)
+    n2 = np.broadcast_to(np.asarray(n2, dtype=float), cos_i.shape)
+    sin_t2 = (n1 / n2) ** 2 * (1.0 - cos_i * cos_i)
+    tir = sin_t2 > 1.0
+    cos_t = np.sqrt(np.where(tir, 0.0, 1.0 - sin_t2))
+    rs = ((n1 * cos_i - n2 * cos_t) / (n1 * cos_i + n2 * cos_t)) ** 2
+    rp = ((n1 * cos_t - n2 * cos_i) / (n1 * cos_t + n2 * cos_i)) ** 2
+    return np.where(tir, 1.0, 0.5 * (rs + rp)), cos_t
+
+
+class Body:
+    """
+    Выпуклое тело из отрезков и дуг (обход против часовой стрелки, y вверх).
+    target — точка, куда направлены лучи; normal — внешняя нормаль в ней,
+    со стороны источника.
+    """
+
+    def __init__(self, segments=(), arcs=(), target=(0.0, 0.0), normal=(0.0, 1.0)):
+        seg = np.asarray(segments, dtype=float).reshape(-1, 4)
+        self.p0, self.e = seg[:, :2], seg[:, 2:] - seg[:, :2]
+        length = np.hypot(self.e[:, 0], self.e[:, 1])
+        self.seg_normal = np.stack([self.e[:, 1], -self.e[:, 0]], axis=1) / length[:, None]
+        self.arcs = [(float(x), float(y), float(R), float(a0), float(a1)) for x, y, R, a0, a1 in arcs]
+        self.target = np.asarray(target, dtype=float)
+        self.normal = np.asarray(normal, dtype=float)
+
+    def outline(self, samples=48) -> np.ndarray:
+        """Точки контура для рисования: отрезки концами, дуги — samples точек."""
+        parts = [np.stack([self.p0, self.p0 + self.e], axis=1).reshape(-1, 2)]
+        for x, y, R, a0, a1 in self.arcs:
+            a = np.linspace(a0, a1, samples)
+            parts.append(np.stack([x + R * np.cos(a), y + R * np.sin(a)], axis=1))
+        points = np.concatenate(parts)
+        centre = points.mean(axis=0)
+        order = np.argsort(np.arctan2(points[:, 1] - centre[1], points[:, 0] - centre[0]))
+        return points[order]
+
+    def hit(self, ox, oy, dx, dy):
+        """Ближайшее пересечение лучей с контуром: t, нормаль (nx, ny); t = inf — мимо."""
+        count = len(ox)
+        best = np.full(count, np.inf)
+        nx, ny = np.zeros(count), np.zeros(count)
+        if len(self.p0):
+            # o + t·d = p0 + s·e
+            px = self.p0[:, 0] - ox[:, None]
+            py = self.p0[:, 1] - oy[:, None]
+            ex, ey = self.e[:, 0], self.e[:, 1]
+            denom = dx[:, None] * ey - dy[:, None] * ex
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = (px * ey - py * ex) / denom
+                s = (px * dy[:, None] - py * dx[:, None]) / denom
+            t = np.where((np.abs(denom) > 1e-12) & (t > _EPS) & (s >= 0) & (s <= 1), t, np.inf)
+            k = np.argmin(t, axis=1)
+            best = t[np.arange(count), k]
+            nx, ny = self.seg_normal[k, 0], self.seg_normal[k, 1]
+        for x, y, R, a0, a1 in self.arcs:
+            ux, uy = ox - x, oy - y
+            b = ux * dx + uy * dy
+            disc = b * b - (ux * ux + uy * uy - R * R)
+            root = np.sqrt(np.where(disc >= 0, disc, 0.0))
+            for t in (-b - root, -b + root):
+                hx, hy = ux + t * dx, uy + t * dy
+                angle = np.mod(np.arctan2(hy, hx) - a0, 2 * math.pi)
+                ok = (disc >= 0) & (t > _EPS) & (angle <= a1 - a0 + 1e-9) & (t < best)
+                best = np.where(ok, t, best)
+                nx = np.where(ok, hx / R, nx)
+                ny = np.where(ok, hy / R, ny)
+        return best, nx, ny
+
+    def rays(self, angles, distance) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Лучи на target под углами падения angles (рад) от нормали, из точек на расстоянии distance."""
+        angles = np.atleast_1d(np.asarray(angles, dtype=float))
+        c, s = np.cos(angles), np.sin(angles)
+        ux = self.normal[0] * c - self.normal[1] * s
+        uy = self.normal[0] * s + self.normal[1] * c
+        return self.target[0] + distance * ux, self.target[1] + distance * uy, -ux, -uy
+
+
+def slab(width=300.0, height=100.0) -> Body:
+    """Плоскопараллельная пластина под осью; лучи падают на середину верхней грани."""
+    w = width / 2
+    corners = [(-w, -height), (w, -height), (w, 0.0), (-w, 0.0)]
+    return Body([(*a, *b) for a, b in zip(corners, corners[1:] + corners[:1])])
+
+
+def semicircle(radius=130.0) -> Body:
+    """
+    Полуцилиндр выпуклостью вверх: лучи входят по радиусу через дугу без
+    преломления и падают на плоскую грань изнутри — там видно полное
+    внутреннее отражение.
+    """
+    return Body([(-radius, 0.0, radius, 0.0)], [(0.0, 0.0, radius, 0.0, math.pi)])
+
+
+def prism(side=240.0, apex=60.0) -> Body:
+    """Равнобедренная призма вершиной вверх; лучи падают на середину левой грани."""
+    half = math.radians(apex) / 2
+    height = side * math.cos(half)
+    top, left, right = (0.0, height / 2), (-side * math.sin(half), -height / 2), (side * math.sin(half), -height / 2)
+    edges = [(*left, *right), (*right, *top), (*top, *left)]
+    target = ((top[0] + left[0]) / 2, (top[1] + left[1]) / 2)
+    normal = (-math.cos(half), math.sin(half))
+    return Body(edges, target=target, normal=normal)
+
+
+class BodyTrace:
+    """Отрезки всех ветвей (x0, y0, x1, y1), их яркость и поколение (0 — падающий луч)."""
+
+    def __init__(self, segments, intensity, depth):
+        self.segments, self.intensity, self.depth = segments, intensity, depth
+
+    def __len__(self):
+        return len(self.segments)
+
+
+def trace_body(body: Body, n, ox, oy, dx, dy, max_bounces=MAX_BOUNCES, min_intensity=MIN_INTENSITY) -> BodyTrace:
+    """
+    Лучи из (ox, oy) по (dx, dy) через тело с показателем n. На каждой
+    границе луч делится на отражённый и преломлённый с долями по Френелю;
+    одна итерация цикла — одна граница для всех лучей сразу.
+    """
+    ox, oy, dx, dy = (np.array(a, dtype=float) for a in np.broadcast_arrays(ox, oy, dx, dy))
+    norm = np.hypot(dx, dy)
+    dx, dy = dx / norm, dy / norm
+    power = np.ones(len(ox))
+    inside = np.zeros(len(ox), dtype=bool)
+    parts, powers, depths = [], [], []
+    for depth in range(max_bounces + 1):
+        if not len(ox):
+            break
+        t, nx, ny = body.hit(ox, oy, dx, dy)
+        gone = ~np.isfinite(t)
+        reach = np.where(gone, FAR, t)
+        if depth == max_bounces:
+            reach = np.where(gone, FAR, 0.0)
+        hx, hy = ox + reach * dx, oy + reach * dy
+        parts.append(np.stack([ox, oy, hx, hy], axis=1))
+        powers.append(power)
+        depths.append(np.full(len(ox), depth))
+        keep = ~gone
+        if depth == max_bounces or not keep.any():
+            break
+        hx, hy, dx, dy, nx, ny = hx[keep], hy[keep], dx[keep], dy[keep], nx[keep], ny[keep]
+        power, inside = power[keep], inside[keep]
+        # Нормаль навстречу лучу
+        cos_i = -(nx * dx + ny * dy)
+        flip = cos_i < 0
+        nx, ny, cos_i = np.where(flip, -nx, nx), np.where(flip, -ny, ny), np.abs(cos_i)
+        n1 = np.where(inside, n, 1.0)
+        n2 = np.where(inside, 1.0, n)
+        R, cos_t = fresnel(cos_i, n1, n2)
+        eta = n1 / n2
+        tx = eta * dx + (eta * cos_i - cos_t) * nx
+        ty = eta * dy + (eta * cos_i - cos_t) * ny
+        rx, ry = dx + 2 * cos_i * nx, dy + 2 * cos_i * ny
+        ox, oy = np.concatenate([hx, hx]), np.concatenate([hy, hy])
+        dx, dy = np.concatenate([tx, rx]), np.concatenate([ty, ry])
+        power = np.concatenate([power * (1.0 - R), power * R])
+        inside = np.concatenate([~inside, inside])
+        alive = power >= min_intensity
+        ox, oy, dx, dy, power, inside = ox[alive], oy[alive], dx[alive], dy[alive], power[alive], inside[alive]
+    segments = np.concatenate(parts) if parts else np.empty((0, 4))
+    intensity = np.concatenate(powers) if powers else np.empty(0)
+    depth = np.concatenate(depths) if depths else np.empty(0, dtype=int)
+    visible = (segments[:, 0] != segments[:, 2]) | (segments[:, 1] != segments[:, 3])
+    return BodyTrace(segments[visible], intensity[visible], depth[visible])
@@ -0,0 +1,367 @@
+"""
+Схема на сетке: детали и провода, которые ученик расставляет сам, и её
+решение через physlab.models.circuit.
+
+Координаты — целые узлы сетки. Деталь занимает SPAN клеток: вывод a в
+(x, y), вывод b — в сторону rot (0 вправо, 1 вниз, 2 влево, 3 вверх).
+У источника a — «+». Провод — отрезок по горизонтали или вертикали.
+
+Соединены точки, которые совпадают: вывод с выводом, конец провода с
+выводом или с концом другого провода, а также конец провода или вывод,
+лежащий на середине провода (Т-образное соединение). Провода, которые
+просто пересекаются, не соединены — как на схеме без точки.
+
+Поиск детали или провода под курсором идёт через GridIndex: объекты
+разложены по крупным клеткам, и проверяются только соседние с точкой,
+а не все объекты схемы. Разбиение на узлы и решение считаются один раз
+после правки; смена только значения (R, ЭДС, ключ) идёт через
+Netlist.set без пересборки цепи.
+"""
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from physlab.models.circuit import GROUND, CircuitError, Netlist, Solution
+
+Point = Tuple[int, int]
+
+SPAN = 3          # длина детали в клетках сетки
+DIRS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+CELL = 4          # клетка GridIndex в клетках сетки
+PART_REACH = 0.6  # деталь ловится курсором шире, чем тонкий провод
+
+# вид детали: (значение по умолчанию, единица, буква в имени)
+PART_KINDS = {
+    "source": (4.5, "В", "E"),
+    "resistor": (10.0, "Ом", "R"),
+    "lamp": (12.0, "Ом", "L"),
+    "switch": (True, "", "K"),
+    "ammeter": (0.0, "А", "A"),
+    "voltmeter": (0.0, "В", "V"),
+}
+
+
+class Part:
+    __slots__ = ("name", "kind", "x", "y", "rot", "value")
+
+    def __init__(self, name, kind, x, y, rot=0, value=None):
+        self.name, self.kind = name, kind
+        self.x, self.y, self.rot = x, y, rot % 4
+        self.value = PART_KINDS[kind][0] if value is None else value
+
+    def pins(self) -> Tuple[Point, Point]:
+        dx, dy = DIRS[self.rot]
+        return (self.x, self.y), (self.x + dx * SPAN, self.y + dy * SPAN)
+
+    def bbox(self):
+        (x0, y0), (x1, y1) = self.pins()
+        return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+
+class Wire:
+    __slots__ = ("name", "a", "b")
+
+    def __init__(self, name, a: Point, b: Point):
+        self.name, self.a, self.b = name, a, b
+
+    def points(self) -> Iterator[Point]:
+        """Все узлы сетки на проводе от a до b."""
+        (x0, y0), (x1, y1) = self.a, self.b
+        n = max(abs(x1 - x0), abs(y1 - y0))
+        sx, sy = (x1 > x0) - (x1 < x0), (y1 > y0) - (y1 < y0)
+        for k in range(n + 1):
+            yield x0 + sx * k, y0 + sy * k
+
+    def bbox(self):
+        (x0, y0), (x1, y1) = self.a, self.b
+        return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+
+class GridIndex:
+    """Пространственный индекс: ключ объекта -> клетки, которые задевает его рамка."""
+
+    def __init__(self, cell=CELL):
+        self.cell = cell
+        self.cells: Dict[Point, Set[str]] = {}
+        self.items: Dict[str, List[Point]] = {}
+
+    def insert(self, key, bbox):
+        self.remove(key)
+        c = self.cell
+        x0, y0, x1, y1 = bbox
+        keys = [(cx, cy) for cx in range(math.floor(x0 / c), math.floor(x1 / c) + 1)
+                for cy in range(math.floor(y0 / c), math.floor(y1 / c) + 1)]
+        for k in keys:
+            self.cells.setdefault(k, set()).add(key)
+        self.items[key] = keys
+
+    def remove(self, key):
+        for k in self.items.pop(key, ()):
+            bucket = self.cells[k]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[k]
+
+    def near(self, x, y, radius) -> Set[str]:
+        c = self.cell
+        found: Set[str] = set()
+        for cx in range(math.floor((x - radius) / c), math.floor((x + radius) / c) + 1):
+            for cy in range(math.floor((y - radius) / c), math.floor((y + radius) / c) + 1):
+                found |= self.cells.get((cx, cy), set())
+        return found
+
+
+def _segment_distance(px, py, a, b):
+    (x0, y0), (x1, y1) = a, b
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx * dx + dy * dy
+    t = 0.0 if length2 == 0 else max(0.0, min(1.0, ((px - x0) * dx + (py - y0) * dy) / length2))
+    return math.hypot(px - x0 - t * dx, py - y0 - t * dy)
+
+
+class Schematic:
+    def __init__(self):
+        self.parts: Dict[str, Part] = {}
+        self.wires: Dict[str, Wire] = {}
+        self.index = GridIndex()
+        self.error: Optional[str] = None
+        self._counts: Dict[str, int] = {}
+        self._topology = None      # (узел каждой точки, участки проводов) до следующей правки
+        self._net: Optional[Netlist] = None
+        self._net_key = None
+        self._solution: Optional[Solution] = None
+        self._solved = False
+
+    # --- Правка ---
+    def _name(self, letter):
+        n = self._counts[letter] = self._counts.get(letter, 0) + 1
+        return f"{letter}{n}"
+
+    def _changed(self, topology=True):
+        if topology:
+            self._topology = None
+        self._solved = False
+
+    def add_part(self, kind, x, y, rot=0, value=None) -> Part:
+        part = Part(self._name(PART_KINDS[kind][2]), kind, x, y, rot, value)
+        self.parts[part.name] = part
+        self.index.insert(part.name, part.bbox())
+        self._changed()
+        return part
+
+    def move_part(self, name, x, y, rot=None):
+        part = self.parts[name]
+        rot = part.rot if rot is None else rot % 4
+        if (part.x, part.y, part.rot) == (x, y, rot):
+            return
+        part.x, part.y, part.rot = x, y, rot
+        self.index.insert(name, part.bbox())
+        self._changed()
+
+    def rotate(self, name):
+        part = self.parts[name]
+        self.move_part(name, part.x, part.y, part.rot + 1)
+
+    def set_value(self, name, value):
+        part = self.parts[name]
+        value = bool(value) if part.kind == "switch" else float(value)
+        if value != part.value:
+            part.value = value
+            self._changed(topology=False)
+
+    def toggle(self, name):
+        self.set_value(name, not self.parts[name].value)
+
+    def add_wire(self, a: Point, b: Point) -> List[Wire]:
+        """Провод от a до b; не по одной линии — уголком через (b.x, a.y)."""
+        corner = (b[0], a[1])
+        added = []
+        for p, q in ((a, corner), (corner, b)):
+            if p == q or any({w.a, w.b} == {p, q} for w in self._wires_near(p)):
+                continue
+            wire = Wire(self._name("W"), p, q)
+            self.wires[wire.name] = wire
+            self.index.insert(wire.name, wire.bbox())
+            added.append(wire)
+        if added:
+            self._changed()
+        return added
+
+    def remove(self, name):
+        if self.parts.pop(name, None) is None and self.wires.pop(name, None) is None:
+            return
+        self.index.remove(name)
+        self._changed()
+
+    def clear(self):
+        for name in list(self.parts) + list(self.wires):
+            self.remove(name)
+        self._counts.clear()
+
+    def _wires_near(self, p) -> List[Wire]:
+        return [self.wires[k] for k in self.index.near(p[0], p[1], 0) if k in self.wires]
+
+    # --- Поиск под курсором ---
+    def hit(self, x: float, y: float, radius=0.4):
+        """
+        Что под точкой (x, y) в клетках сетки: ("pin", деталь, 0|1),
+        ("part", деталь), ("wire", провод) или None. Выводы важнее деталей,
+        детали — проводов.
+        """
+        best = None
+        for key in self.index.near(x, y, max(radius, PART_REACH)):
+            part = self.parts.get(key)
+            if part is not None:
+                for i, (px, py) in enumerate(part.pins()):
+                    d = math.hypot(x - px, y - py)
+                    if d <= radius and (best is None or (0, d) < best[0]):
+                        best = (0, d), ("pin", part, i)
+                d = _segment_distance(x, y, *part.pins())
+                if d <= max(radius, PART_REACH) and (best is None or (1, d) < best[0]):
+                    best = (1, d), ("part", part)
+                continue
+            wire = self.wires[key]
+            d = _segment_distance(x, y, wire.a, wire.b)
+            if d <= radius and (best is None or (2, d) < best[0]):
+                best = (2, d), ("wire", wire)
+        return best[1] if best else None
+
+    # --- Узлы ---
+    def topology(self):
+        """
+        (узел каждой точки соединения, участки проводов). Участок — часть
+        провода между соседними точками соединения на нём: (a, b, провод).
+        """
+        if self._topology is not None:
+            return self._topology
+        joints: Set[Point] = set()
+        for part in self.parts.values():
+            joints.update(part.pins())
+        for wire in self.wires.values():
+            joints.update((wire.a, wire.b))
+
+        parent = {p: p for p in joints}
+
+        def find(p):
+            while parent[p] != p:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            return p
+
+        segments = []
+        for wire in self.wires.values():
+            cuts = [p for p in wire.points() if p in joints]
+            for p, q in zip(cuts, cuts[1:]):
+                segments.append((p, q, wire.name))
+                parent[find(p)] = find(q)
+        node_of = {p: find(p) for p in joints}
+        self._topology = node_of, segments
+        return self._topology
+
+    def node_names(self) -> Dict[Point, str]:
+        """Имя узла Netlist для каждой точки соединения; минус первого источника — земля."""
+        node_of, _ = self.topology()
+        ground = None
+        for part in self.parts.values():
+            if part.kind == "source":
+                ground = node_of[part.pins()[1]]
+                break
+        names: Dict[Point, str] = {}
+        roots: Dict[Point, str] = {}
+        for p, root in node_of.items():
+            if root not in roots:
+                roots[root] = GROUND if root == ground else f"n{len(roots) + 1}"
+            names[p] = roots[root]
+        return names
+
+    # --- Решение ---
+    def netlist(self) -> Netlist:
+        names = self.node_names()
+        net = Netlist()
+        for part in self.parts.values():
+            a, b = (names[p] for p in part.pins())
+            if part.kind == "source":
+                net.source(part.name, a, b, part.value)
+            elif part.kind == "switch":
+                net.switch(part.name, a, b, part.value)
+            elif part.kind in ("ammeter", "voltmeter"):
+                getattr(net, part.kind)(part.name, a, b)
+            else:
+                getattr(net, part.kind)(part.name, a, b, part.value)
+        return net
+
+    def solve(self) -> Optional[Solution]:
+        """Решение после последней правки; None — нет источника или цепь не решается (error)."""
+        if self._solved:
+            return self._solution
+        self._solved = True
+        self._solution, self.error = None, None
+        if not any(p.kind == "source" for p in self.parts.values()):
+            return None
+        names = self.node_names()
+        key = tuple((p.name, p.kind, names[p.pins()[0]], names[p.pins()[1]]) for p in self.parts.values())
+        if self._net is None or key != self._net_key:
+            self._net, self._net_key = self.netlist(), key
+        else:
+            for part in self.parts.values():
+                if part.kind not in ("ammeter", "voltmeter"):
+                    self._net.set(part.name, part.value)
+        try:
+            self._solution = self._net.solve()
+        except CircuitError:
+            self.error = "Короткое замыкание источника"
+        return self._solution
+
+    def flows(self) -> List[Tuple[Point, Point, float]]:
+        """
+        Ток по каждой детали и участку провода: (откуда, куда, I ≥ 0 по
+        направлению откуда -> куда). Токи проводов — из закона Кирхгофа для
+        узлов по остовному дереву проводов узла; в кольце из одних
+        проводов ток замыкающего участка считается нулевым.
+        """
+        sol = self.solve()
+        if sol is None:
+            return []
+        node_of, segments = self.topology()
+        inject: Dict[Point, float] = {}
+        result = []
+        for part in self.parts.values():
+            a, b = part.pins()
+            i = sol.current(part.name)
+            if part.kind == "source":
+                i = -i    # Solution даёт ток, отдаваемый из «+»; внутри источника он идёт от b к a
+            inject[a] = inject.get(a, 0.0) - i    # ток уходит из узла в деталь у вывода a
+            inject[b] = inject.get(b, 0.0) + i
+            result.append((a, b, i) if i >= 0 else (b, a, -i))
+
+        adjacent: Dict[Point, List[Point]] = {}
+        for p, q, _ in segments:
+            adjacent.setdefault(p, []).append(q)
+            adjacent.setdefault(q, []).append(p)
+        seen: Set[Point] = set()
+        for start in adjacent:
+            if start in seen:
+                continue
+            seen.add(start)
+            order, parent = [start], {start: None}
+            for p in order:
+                for q in adjacent[p]:
+                    if q not in seen:
+                        seen.add(q)
+                        parent[q] = p
+                        order.append(q)
+            # С листьев к корню: ток к родителю — всё, что втекает в поддерево
+            total = {p: inject.get(p, 0.0) for p in order}
+            for p in reversed(order[1:]):
+                up = parent[p]
+                total[up] += total[p]
+                i = total[p]
+                result.append((p, up, i) if i >= 0 else (up, p, -i))
+        return result
+
+    def reading(self, name) -> Optional[float]:
+        sol = self.solve()
+        return sol.reading(name) if sol is not None else None
+
+    def power(self, name) -> float:
+        sol = self.solve()
+        return sol.power(name) if sol is not None else 0.0
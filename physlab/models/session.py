@@ -0,0 +1,215 @@
+"""
+Повтор сессии: зерно случайности для каждой модели и запись действий с
+ней, чтобы задание ученика и ход опыта можно было воспроизвести.
+
+Каждая LabModel получает свой random.Random(seed). Зерно выводится из
+зерна сессии SEED (PHYSLAB_SEED или случайное), имени модели и номера
+экземпляра. Задание (randomize) берётся только из model.rng, поэтому
+зерна и списка действий достаточно, чтобы повторить всё без окна.
+
+Когда запись включена (recording — её включает physlab.journal), модель
+при создании получает Recorder. Recorder пишет компактные события
+[t, вид, ...], где t — секунды от создания модели:
+
+    [t, "p", {params}]       set_params — ползунки, поля ввода, перетаскивание
+    [t, "a", имя, значение]  присваивание полю модели снаружи (drag, флажки)
+    [t, "r"]                 randomize — новое задание из model.rng
+    [t, "z"]                 reset
+    [t, "m", имя, [args]]    действие по кнопке из LabModel.actions (heat_up, start…)
+    [t, "s", сумма_dt, n]    n шагов step подряд (слиты в одно событие)
+    [t, "c", {ответы}, {вердикт}]  check
+
+Подряд идущие шаги сливаются, одинаковые присваивания подряд — тоже.
+Время модели при повторе совпадает точно, траектория — с точностью до
+разбиения на кадры. Пачка событий уходит в sink (журнал работы) при
+каждой проверке и по достижении MAX_EVENTS.
+"""
+import os
+import random
+import time
+import zlib
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAX_EVENTS = 2000       # событий в пачке: больше — пачка уходит в sink без проверки
+MAX_BUFFER = 50000      # без sink (окно не подключено к журналу) — дальше не пишем
+
+recording = False
+SEED = 0
+_counts: Dict[str, int] = {}
+
+
+def set_seed(seed: Optional[int] = None):
+    """Зерно сессии; None — PHYSLAB_SEED или случайное. Нумерация экземпляров начинается заново."""
+    global SEED
+    env = os.environ.get("PHYSLAB_SEED")
+    if seed is None:
+        seed = int(env) if env else random.SystemRandom().getrandbits(32)
+    SEED = seed
+    _counts.clear()
+
+
+def next_seed(name: str) -> int:
+    n = _counts[name] = _counts.get(name, 0) + 1
+    return zlib.crc32(f"{SEED}:{name}:{n}".encode())
+
+
+class Recorder:
+    def __init__(self, model):
+        self.model = type(model).__name__
+        self.seed = model.seed
+        self.init = model.get_params()
+        self.start = time.time()
+        self.events: List[list] = []
+        self.depth = 0          # >0 — идёт вызов метода модели, его присваивания не пишем
+        self.part = 0
+        self.full = False
+        self.sink: Optional[Callable[[Dict[str, Any]], None]] = None
+
+    def add(self, kind: str, *args):
+        if self.full:
+            return
+        events = self.events
+        if events:
+            last = events[-1]
+            if kind == "s" and last[1] == "s":
+                last[2] += args[0]
+                last[3] += 1
+                return
+            if kind == "a" and last[1] == "a" and last[2] == args[0]:
+                last[3] = args[1]
+                return
+            if kind == "p" and last[1] == "p" and last[2].keys() == args[0].keys():
+                last[2] = args[0]
+                return
+        events.append([round(time.time() - self.start, 3), kind, *args])
+        if len(events) >= MAX_EVENTS:
+            if self.sink is not None:
+                self.flush()
+            elif len(events) >= MAX_BUFFER:
+                self.full = True
+                events.clear()
+
+    def flush(self):
+        if self.sink is None or not self.events or self.full:
+            return
+        chunk = {"kind": "events", "model": self.model, "seed": self.seed, "init": self.init,
+                 "start": self.start, "part": self.part, "events": self.events}
+        self.events = []
+        self.part += 1
+        self.sink(chunk)
+
+
+_recording_classes: Dict[type, type] = {}
+
+
+def _recording_class(cls):
+    """Наследник модели, который сообщает Recorder о вызовах снаружи."""
+    sub = _recording_classes.get(cls)
+    if sub is not None:
+        return sub
+
+    class Recording(cls):
+        def __setattr__(self, name, value):
+            rec = self.__dict__.get("recorder")
+            if rec is not None and not rec.depth and name[0] != "_" and name != "rng":
+                rec.add("a", name, value)
+            super().__setattr__(name, value)
+
+        def _call(self, kind, call, *event):
+            rec = self.recorder
+            if rec.depth:
+                return call()
+            rec.depth += 1
+            try:
+                result = call()
+            finally:
+                rec.depth -= 1
+            rec.add(kind, *event)
+            return result
+
+        def set_params(self, **params):
+            return self._call("p", partial(super().set_params, **params), params)
+
+        def randomize(self):
+            return self._call("r", super().randomize)
+
+        def reset(self):
+            return self._call("z", super().reset)
+
+        def step(self, dt):
+            return self._call("s", partial(super().step, dt), dt, 1)
+
+        def check(self, answers):
+            rec = self.recorder
+            if rec.depth:
+                return super().check(answers)
+            rec.depth += 1
+            try:
+                verdict = super().check(answers)
+            finally:
+                rec.depth -= 1
+            rec.add("c", dict(answers), dict(verdict))
+            rec.flush()
+            return verdict
+
+    for name in cls.actions:
+        setattr(Recording, name, _action(name, getattr(cls, name)))
+    Recording.__name__ = cls.__name__
+    Recording.__qualname__ = cls.__qualname__
+    Recording.__module__ = cls.__module__
+    _recording_classes[cls] = Recording
+    return Recording
+
+
+def _action(name, method):
+    def action(self, *args):
+        return self._call("m", partial(method, self, *args), name, list(args))
+    return action
+
+
+def record(model) -> Recorder:
+    """Начать запись действий с моделью (вызывает LabModel.__init__, если recording)."""
+    rec = Recorder(model)
+    model.__dict__["recorder"] = rec
+    model.__class__ = _recording_class(type(model))
+    return rec
+
+
+# --- Повтор ---
+def _tuples(value):
+    # JSON не различает кортежи и списки; в моделях последовательности — кортежи
+    if isinstance(value, list):
+        return tuple(_tuples(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _tuples(v) for k, v in value.items()}
+    return value
+
+
+def replay(cls, seed: int, init: Dict[str, Any], events: Iterable[list]) -> Iterator[Tuple[list, Any, Dict[str, bool]]]:
+    """
+    Повторить события на новой модели без окна и без ожидания.
+    Для каждой проверки — (событие "c", модель в этот момент, вердикт повтора).
+    """
+    model = cls(seed=seed, **_tuples(init))
+    for event in events:
+        kind = event[1]
+        if kind == "s":
+            total, n = event[2], event[3]
+            for _ in range(n):
+                model.step(total / n)
+        elif kind == "p":
+            model.set_params(**_tuples(event[2]))
+        elif kind == "a":
+            setattr(model, event[2], _tuples(event[3]))
+        elif kind == "r":
+            model.randomize()
+        elif kind == "z":
+            model.reset()
+        elif kind == "m":
+            getattr(model, event[2])(*_tuples(event[3]))
+        elif kind == "c":
+            yield event, model, model.check(event[2])
+
+
+set_seed()
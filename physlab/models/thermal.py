@@ -0,0 +1,169 @@
+"""
+Тепловые явления: смешивание воды, удельная теплоёмкость, закон Джоуля–Ленца.
+"""
+from physlab.models.base import LabModel
+from physlab.models.checking import Tolerance
+from physlab.models.timestep import ease
+
+
+class MixingModel(LabModel):
+    """Тепловой баланс (lab81): горячую и холодную воду наливают в калориметр и смешивают."""
+    params = ("m1", "t1", "m2", "t2")
+    actions = ("pour_hot", "pour_cold", "mix")
+    m1, t1 = 100, 80   # горячая вода: г, °C
+    m2, t2 = 100, 20   # холодная
+    tolerance = Tolerance(absolute=0.5, strict=True)
+
+    def reset(self):
+        super().reset()
+        self.volume = 0.0          # мл в калориметре (показ)
+        self.target_volume = 0.0
+        self.temp = 20.0           # показание термометра
+        self.target_temp = 20.0
+        self.is_mixed = False
+
+    def new_task(self, rng):
+        self.m1 = rng.randint(50, 200)
+        self.t1 = rng.randint(60, 90)
+        self.m2 = rng.randint(50, 200)
+        self.t2 = rng.randint(10, 30)
+
+    def pour_hot(self):
+        self.target_volume, self.target_temp = self.m1, self.t1
+        self.is_mixed = False
+
+    def pour_cold(self):
+        self.target_volume, self.target_temp = self.m2, self.t2
+        self.is_mixed = False
+
+    def mix(self):
+        if self.m1 + self.m2 == 0:
+            return
+        self.target_volume = self.m1 + self.m2
+        self.target_temp = self.final_temp()
+        self.is_mixed = True
+
+    def final_temp(self):
+        # Q отданное = Q полученное  =>  T = (m1·t1 + m2·t2) / (m1 + m2)
+        return (self.m1 * self.t1 + self.m2 * self.t2) / (self.m1 + self.m2)
+
+    def step(self, dt):
+        super().step(dt)
+        diff_v = self.target_volume - self.volume
+        if abs(diff_v) > 0.5:
+            self.volume += diff_v * ease(dt, 0.285)
+        else:
+            self.volume = self.target_volume
+        diff_t = self.target_temp - self.temp
+        if abs(diff_t) > 0.1:
+            self.temp += diff_t * ease(dt, 0.585)
+        else:
+            self.temp = self.target_temp
+
+    def is_settled(self):
+        return self.volume == self.target_volume and self.temp == self.target_temp
+
+    def true_value(self):
+        return self.final_temp()
+
+
+SPECIFIC_HEATS = {"Алюминий": 0.92, "Медь": 0.38, "Железо": 0.46, "Латунь": 0.38}  # кДж/(кг·°C)
+
+
+class SpecificHeatModel(LabModel):
+    """Удельная теплоёмкость (lab82): нагретый цилиндр опускают в калориметр с водой."""
+    params = ("m1", "t1", "m2", "t2", "material")
+    actions = ("submerge",)
+    m1, t1 = 100, 20   # вода: г, °C
+    m2, t2 = 100, 90   # цилиндр
+    material = "Алюминий"
+    c1 = 4.2           # вода
+    cyl_top, cyl_bottom = 50, 350   # положение цилиндра над и в калориметре, px
+    tolerance = Tolerance(absolute=0.1, strict=True)
+
+    def reset(self):
+        super().reset()
+        self.temp = self.t1
+        self.cyl_y = self.cyl_top
+        self.is_submerged = False
+
+    def new_task(self, rng):
+        self.m1 = rng.randint(100, 200)
+        self.t1 = rng.randint(15, 25)
+        self.m2 = rng.randint(50, 150)
+        self.t2 = rng.randint(80, 95)
+        self.material = rng.choice(list(SPECIFIC_HEATS))
+
+    @property
+    def c2(self):
+        return SPECIFIC_HEATS[self.material]
+
+    def submerge(self):
+        self.is_submerged = True
+
+    def final_temp(self):
+        # c1·m1·(T - t1) = c2·m2·(t2 - T)
+        numerator = self.c1 * self.m1 * self.t1 + self.c2 * self.m2 * self.t2
+        return numerator / (self.c1 * self.m1 + self.c2 * self.m2)
+
+    def step(self, dt):
+        super().step(dt)
+        target_y = self.cyl_top
+        if self.is_submerged:
+            target_y = self.cyl_bottom
+            diff_t = self.final_temp() - self.temp
+            if abs(diff_t) > 0.1:
+                self.temp += diff_t * ease(dt, 0.585)
+            else:
+                self.temp = self.final_temp()
+        diff_y = target_y - self.cyl_y
+        if abs(diff_y) > 1:
+            self.cyl_y += diff_y * ease(dt, 0.285)
+        else:
+            self.cyl_y = target_y
+
+    def is_settled(self):
+        target_y = self.cyl_bottom if self.is_submerged else self.cyl_top
+        return self.cyl_y == target_y and (not self.is_submerged or self.temp == self.final_temp())
+
+    def true_value(self):
+        return self.c2
+
+
+class JouleHeatingModel(LabModel):
+    """
+    Закон Джоуля–Ленца (lab812): Q = I²·R·t. Нагрев воды в стакане —
+    heat_level от 0 (холодная) до 1, растёт пропорционально мощности.
+    """
+    params = ("I", "R", "t")
+    I = 0.0    # А
+    R = 0.0    # Ом
+    t = 0.0    # с
+    heat_rate = 0.05   # прирост heat_level в секунду на 1 Вт
+    cool_rate = 0.25   # остывание в секунду без тока
+    tolerance = Tolerance(rel=0.02)
+
+    def reset(self):
+        super().reset()
+        self.heat_level = 0.0
+
+    def power(self):
+        return self.I ** 2 * self.R
+
+    def step(self, dt):
+        super().step(dt)
+        power = self.power()
+        if power > 0:
+            self.heat_level = min(1.0, self.heat_level + self.heat_rate * power * dt)
+        else:
+            self.heat_level = max(0.0, self.heat_level - self.cool_rate * dt)
+
+    def true_value(self):
+        return self.power() * self.t
+
+
+class JouleTrainerModel(JouleHeatingModel):
+    """Тот же закон в тренажёре lab811: нагрев медленнее, допуск 5%."""
+    heat_rate = 1.667 / 255
+    cool_rate = 66.7 / 255
+    tolerance = Tolerance(rel=0.05, zero=0.1, strict_zero=True)
@@ -0,0 +1,72 @@
+"""
+Время в моделях: экспоненциальное сглаживание, перевод реального dt
+в фиксированные шаги и шаг Рунге–Кутты. Без Qt — работает и в окне, и в
+пакетной проверке.
+
+Колебательные модели не привязаны к частоте кадров: реальное время
+копится в FixedStep и тратится целыми шагами h (или, если решение
+известно в явном виде, time просто растёт на dt). Поэтому период,
+который ученик замеряет секундомером, не зависит от подвисаний окна.
+"""
+import math
+
+
+def ease(dt, tau):
+    """Доля пути к цели за dt при экспоненциальном сглаживании с постоянной tau (с)."""
+    return 1.0 - math.exp(-dt / tau)
+
+
+class TickAccumulator:
+    """
+    Переводит реальный dt в целое число шагов фиксированной длины — для
+    моделей, написанных «на один тик таймера» (затухание, столкновения).
+    """
+    def __init__(self, step, max_steps=5):
+        self.step = step
+        self.max_steps = max_steps
+        self.acc = 0.0
+
+    def steps(self, dt):
+        self.acc += dt
+        n = int(self.acc / self.step)
+        self.acc -= n * self.step
+        if n > self.max_steps:
+            n = self.max_steps
+            self.acc = 0.0
+        return n
+
+
+class FixedStep:
+    """
+    Фиксированный шаг h для интегратора: steps(dt) — сколько шагов сделать
+    за кадр, остаток копится до следующего. Цена кадра ограничена
+    max_steps; время сверх этого не догоняется, а учитывается в dropped.
+    alpha — недошагнутая доля шага (для интерполяции отрисовки).
+    """
+    def __init__(self, h, max_steps=200):
+        self.h = h
+        self.max_steps = max_steps
+        self.acc = 0.0
+        self.dropped = 0.0
+
+    def steps(self, dt):
+        self.acc += dt
+        n = int(self.acc / self.h + 1e-9)
+        self.acc = max(0.0, self.acc - n * self.h)
+        if n > self.max_steps:
+            self.dropped += (n - self.max_steps) * self.h
+            n = self.max_steps
+        return n
+
+    @property
+    def alpha(self):
+        return self.acc / self.h
+
+
+def rk4(f, t, y, h):
+    """Шаг Рунге–Кутты 4-го порядка для y' = f(t, y); y — кортеж чисел."""
+    k1 = f(t, y)
+    k2 = f(t + h / 2, tuple(a + h / 2 * b for a, b in zip(y, k1)))
+    k3 = f(t + h / 2, tuple(a + h / 2 * b for a, b in zip(y, k2)))
+    k4 = f(t + h, tuple(a + h * b for a, b in zip(y, k3)))
+    return tuple(a + h / 6 * (b1 + 2 * b2 + 2 * b3 + b4) for a, b1, b2, b3, b4 in zip(y, k1, k2, k3, k4))
@@ -0,0 +1,100 @@
+"""
+Реестр лабораторных работ.
+
+Лаунчер знает о работах только по этому списку: модуль лабораторной
+импортируется лишь в момент первого открытия (см. load_lab).
+"""
+import importlib
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class LabInfo:
+    lab_id: str   # имя папки, например "lab94"
+    grade: int    # класс
+    title: str    # название для меню
+    window: str   # класс главного окна внутри labNN/main.py
+
+    @property
+    def module(self) -> str:
+        return f"{self.lab_id}.main"
+
+    @property
+    def key(self) -> str:
+        # lab811 содержит сразу три работы, поэтому ключ включает класс окна
+        return f"{self.lab_id}:{self.window}"
+
+
+LABS: List[LabInfo] = [
+    # --- 7 КЛАСС ---
+    LabInfo("lab71", 7, "Цена деления мензурки", "Lab01App"),
+    LabInfo("lab72", 7, "Измерение размеров малых тел", "Lab02App"),
+    LabInfo("lab73", 7, "Масса тела на рычажных весах", "Lab03App"),
+    LabInfo("lab74", 7, "Объём тела по вытеснению жидкости", "Lab04App"),
+    LabInfo("lab75", 7, "Плотность твёрдых тел", "LabDensityApp"),
+    LabInfo("lab76", 7, "Закон Гука (пружина и динамометр)", "LabSpringApp"),
+    LabInfo("lab77", 7, "Закон Архимеда", "LabArchimedesApp"),
+    LabInfo("lab78", 7, "Условие равновесия рычага", "LabLeverApp"),
+    LabInfo("lab79", 7, "Сила трения", "LabFrictionApp"),
+    # --- 8 КЛАСС ---
+    LabInfo("lab81", 8, "Смешивание горячей и холодной воды", "LabMixApp"),
+    LabInfo("lab82", 8, "Удельная теплоёмкость твёрдого тела", "LabSpecificHeatApp"),
+    LabInfo("lab83", 8, "Сила тока в последовательной цепи", "LabCurrentImprovedApp"),
+    LabInfo("lab84", 8, "Регулирование силы тока реостатом", "LabRheostatApp"),
+    LabInfo("lab85", 8, "Измерение сопротивления проводника", "LabResistanceApp"),
+    LabInfo("lab86", 8, "Мощность и работа тока в лампе", "LabPowerApp"),
+    LabInfo("lab87", 8, "Электромагнит", "LabElectromagnetApp"),
+    LabInfo("lab88", 8, "Электромагнит (вариант 2)", "LabElectromagnetApp"),
+    LabInfo("lab89", 8, "Модель электродвигателя", "LabMotorApp"),
+    LabInfo("lab810", 8, "Линзы и изображения", "LabLensAnimatedApp"),
+    LabInfo("lab811", 8, "Закон Джоуля–Ленца (тренажёр)", "JouleLenzLab"),
+    LabInfo("lab812", 8, "Закон Джоуля–Ленца", "JouleLenzLab"),
+    LabInfo("lab813", 8, "Определение КПД", "EfficiencyLab"),
+    LabInfo("lab814", 8, "Сопротивление проводника", "ResistanceLab"),
+    LabInfo("lab815", 8, "Параллельное соединение", "ParallelLab"),
+    # --- 9 КЛАСС ---
+    LabInfo("lab91", 9, "Индуктивность катушки", "LabInductanceApp"),
+    LabInfo("lab92", 9, "Температурный коэффициент сопротивления", "LabTempCoeffApp"),
+    LabInfo("lab93", 9, "Закон Гука (деформация пружины)", "LabSpringApp"),
+    LabInfo("lab94", 9, "Частота пружинного маятника", "PendulumFreqLab"),
+    LabInfo("lab811", 9, "Период пружинного маятника (тренажёр)", "SpringPendulumLab"),
+    LabInfo("lab95", 9, "Интерференция волн", "InterferenceLab"),
+    # --- 10 КЛАСС ---
+    LabInfo("lab101", 10, "Электромагнитная индукция", "LabInductionApp"),
+    LabInfo("lab102", 10, "ЭДС и внутреннее сопротивление источника", "Lab17App"),
+    LabInfo("lab103", 10, "Поверхностное натяжение", "LabSurfaceTensionApp"),
+    LabInfo("lab104", 10, "Температурный коэффициент меди", "LabTempCoeffApp"),
+    LabInfo("lab105", 10, "Постоянная Планка (фотоэффект)", "PhotoEffectLab"),
+    LabInfo("lab811", 10, "Фотоэффект (тренажёр)", "PhotoEffectLab"),
+    LabInfo("lab106", 10, "Электромагнитная индукция (магнит и катушка)", "InductionLab"),
+    # --- 11 КЛАСС ---
+    LabInfo("lab111", 11, "Маятник и ускорение свободного падения", "LabFrequencyApp"),
+    LabInfo("lab112", 11, "Показатель преломления стекла", "LabRefractionApp"),
+    LabInfo("lab113", 11, "Дифракция и длина световой волны", "LabDiffractionApp"),
+    LabInfo("lab114", 11, "Спектры (линейные и непрерывные)", "LabSpectraApp"),
+    LabInfo("lab115", 11, "Фокусное расстояние линзы", "LabFocalApp"),
+    LabInfo("lab116", 11, "Изучение спектров", "SpectraLab"),
+    LabInfo("lab117", 11, "Спектр атома водорода", "HydrogenLab"),
+]
+
+
+def labs_by_grade() -> Dict[int, List[LabInfo]]:
+    groups: Dict[int, List[LabInfo]] = {}
+    for info in LABS:
+        groups.setdefault(info.grade, []).append(info)
+    return dict(sorted(groups.items()))
+
+
+def find_lab(name: str) -> LabInfo:
+    # Принимаем и "lab94", и полный ключ "lab811:PhotoEffectLab"
+    for info in LABS:
+        if name in (info.key, info.lab_id):
+            return info
+    raise KeyError(f"Неизвестная лабораторная: {name}")
+
+
+def load_lab(info: LabInfo):
+    # Импорт модуля происходит только здесь; повторные вызовы берут его из sys.modules
+    module = importlib.import_module(info.module)
+    return getattr(module, info.window)()
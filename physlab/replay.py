@@ -0,0 +1,100 @@
+"""
+Повтор записанных сессий без окна: python3 -m physlab.replay <журналы>
+[--student ivanov] [--lab lab94] [--session 3f2a…] [--json].
+
+Журнал работы хранит зерно модели и все действия ученика до каждой
+проверки (kind "events", см. physlab.models.session). Повтор создаёт
+ту же модель с тем же зерном и прогоняет действия без ожидания, так
+что час работы проверяется за доли секунды. Для каждой проверки
+печатаются параметры задания, ответ ученика, эталон и два вердикта:
+записанный тогда и полученный сейчас. Расхождение — код выхода 1.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Tuple
+
+from physlab import models
+from physlab.grading import _plain
+from physlab.journal import read_journal
+from physlab.merge import journal_files
+from physlab.models import session
+
+
+def sessions(path: str, student=None, lab=None, session_id=None) -> Iterator[Tuple[Dict[str, Any], List[list]]]:
+    """Записанные сессии файла: (первая пачка, все события по порядку)."""
+    groups: Dict[Tuple, Tuple[Dict[str, Any], List[list]]] = {}
+    for rec in read_journal(path):
+        if not isinstance(rec, dict) or rec.get("kind") != "events":
+            continue
+        if student and rec.get("student") != student:
+            continue
+        if lab and not str(rec.get("lab", "")).startswith(lab):
+            continue
+        if session_id and not str(rec.get("session", "")).startswith(session_id):
+            continue
+        key = rec.get("session"), rec.get("lab"), rec.get("model"), rec.get("seed")
+        groups.setdefault(key, (rec, []))[1].extend(rec.get("events", []))
+    yield from groups.values()
+
+
+def replay_session(head: Dict[str, Any], events: List[list]) -> Iterator[Dict[str, Any]]:
+    cls = getattr(models, head["model"])
+    for event, model, verdict in session.replay(cls, head["seed"], head.get("init", {}), events):
+        true = model.true_values()
+        yield {
+            "time": head.get("start", 0.0) + event[0],
+            "params": _plain(model.get_params()),
+            "answers": event[2],
+            "true": {name: _plain(true.get(name)) for name in verdict},
+            "recorded": event[3],
+            "replayed": verdict,
+            "match": verdict == event[3],
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m physlab.replay",
+                                     description="Повтор записанных сессий без окна.")
+    parser.add_argument("paths", nargs="+", help="файлы журнала .jsonl и каталоги")
+    parser.add_argument("--student", help="только этот ученик")
+    parser.add_argument("--lab", help="только эта работа (lab94 или lab811:PhotoEffectLab)")
+    parser.add_argument("--session", help="только эта сессия (начало идентификатора)")
+    parser.add_argument("--json", action="store_true", help="вывод JSON Lines вместо текста")
+    args = parser.parse_args(argv)
+
+    checks = mismatches = 0
+    model_time = 0.0
+    start = time.perf_counter()
+    for path in journal_files(args.paths):
+        for head, events in sessions(path, args.student, args.lab, args.session):
+            model_time += sum(e[2] for e in events if e[1] == "s")
+            if not args.json:
+                print(f"{head.get('lab')}  {head.get('student')}@{head.get('machine')}  "
+                      f"сессия {head.get('session')}  {head['model']} seed={head['seed']}")
+            try:
+                results = list(replay_session(head, events))
+            except Exception as exc:
+                print(f"  не удалось повторить: {type(exc).__name__}: {exc}", file=sys.stderr)
+                mismatches += 1
+                continue
+            for res in results:
+                checks += 1
+                mismatches += not res["match"]
+                if args.json:
+                    print(json.dumps({"lab": head.get("lab"), "student": head.get("student"),
+                                      "session": head.get("session"), **res}, ensure_ascii=False, default=str))
+                    continue
+                mark = "совпало" if res["match"] else "РАСХОЖДЕНИЕ"
+                print(f"  {time.strftime('%H:%M:%S', time.localtime(res['time']))}  {res['params']}\n"
+                      f"    ответ {res['answers']}  эталон {res['true']}\n"
+                      f"    тогда {res['recorded']}  сейчас {res['replayed']}  — {mark}")
+    elapsed = time.perf_counter() - start
+    print(f"Проверок: {checks}, расхождений: {mismatches}; "
+          f"{model_time:.0f} с опытов за {elapsed:.2f} с", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Отправка записей журнала на сборщик класса (physlab.collector).
+
+Адрес берётся из PHYSLAB_COLLECTOR (http://192.168.1.10:8765). Записи
+копятся в очереди в памяти, фоновый поток отправляет их пачками
+POST /records. Если сборщик недоступен, поток повторяет отправку с
+растущей паузой до RETRY_MAX секунд; очередь при этом не теряется.
+Записи, которые не ушли до закрытия программы, остаются в журнале на
+диске; их можно слить позже (physlab.merge).
+"""
+import atexit
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from typing import Dict, Optional
+
+BATCH = 500           # записей в одном запросе
+LINGER = 0.2          # с: ждём, пока наберётся пачка
+RETRY_MIN, RETRY_MAX = 0.5, 30.0
+TIMEOUT = 5.0
+MAX_QUEUE = 50000     # больше — самые старые уходят только в журнал
+
+
+class Uplink:
+    def __init__(self, url: str):
+        self.url = url.rstrip("/") + "/records"
+        self._pending = deque(maxlen=MAX_QUEUE)   # (номер, строка)
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stop = False
+        self.sent = 0
+        self._thread = threading.Thread(target=self._run, name="physlab-uplink", daemon=True)
+        self._thread.start()
+
+    def send(self, line: str):
+        """line — запись журнала одной строкой JSON (с переводом строки)."""
+        with self._cond:
+            self._seq += 1
+            self._pending.append((self._seq, line))
+            self._cond.notify()
+
+    def close(self, timeout=2.0):
+        # Последняя попытка отправить остаток; не вышло — записи есть в журнале
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _post(self, lines) -> bool:
+        body = "".join(lines).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, method="POST",
+                                         headers={"Content-Type": "application/x-ndjson"})
+        try:
+            with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+                return response.status == 200
+        except (OSError, urllib.error.URLError):
+            return False
+
+    def _run(self):
+        delay = RETRY_MIN
+        while True:
+            with self._cond:
+                while not self._pending and not self._stop:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                stopping = self._stop
+            if not stopping:
+                time.sleep(LINGER)
+            with self._cond:
+                batch = [self._pending[i] for i in range(min(BATCH, len(self._pending)))]
+            if self._post([line for _, line in batch]):
+                last = batch[-1][0]
+                with self._cond:
+                    # Убираем только отправленное: пока шёл запрос, очередь могла сдвинуться
+                    while self._pending and self._pending[0][0] <= last:
+                        self._pending.popleft()
+                self.sent += len(batch)
+                delay = RETRY_MIN
+                continue
+            if stopping:
+                print(f"physlab: сборщик {self.url} недоступен, записи остались в журнале", file=sys.stderr)
+                return
+            with self._cond:
+                self._cond.wait_for(lambda: self._stop, timeout=delay)
+            delay = min(delay * 2, RETRY_MAX)
+
+
+_uplinks: Dict[str, Uplink] = {}
+
+
+def uplink(url: str) -> Uplink:
+    link = _uplinks.get(url)
+    if link is None:
+        link = _uplinks[url] = Uplink(url)
+        atexit.register(link.close)
+    return link
+
+
+def collector_url() -> Optional[str]:
+    return os.environ.get("PHYSLAB_COLLECTOR") or None
@@ -0,0 +1,41 @@
+import json
+
+from physlab import journal
+
+
+def _line(cells):
+    record = {"kind": "check", "timestamp": 0.0, "lab": "lab94:PendulumFreqLab",
+              "machine": journal.machine_name(), "student": journal.student_name(), "cells": cells}
+    return json.dumps(record) + "\n"
+
+
+def test_append_after_torn_tail_keeps_new_records(tmp_path, monkeypatch):
+    # Прошлый запуск упал посреди записи: в файле строка a и обрывок
+    monkeypatch.setenv("PHYSLAB_JOURNAL_DIR", str(tmp_path))
+    monkeypatch.setenv("PHYSLAB_JOURNAL", "1")
+    key = "lab94:PendulumFreqLab"
+    path = journal.journal_path(key)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_line(["a"]) + '{"kind":"check","timest')
+
+    writer = journal.JournalWriter()
+    writer.write(path, _line(["b"]))
+    writer.write(path, _line(["c"]))
+    writer.close()
+
+    assert [rec["cells"] for rec in journal.restore(key)] == [["a"], ["b"], ["c"]]
+
+
+def test_append_to_complete_file_adds_no_blank_line(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHYSLAB_JOURNAL_DIR", str(tmp_path))
+    key = "lab94:PendulumFreqLab"
+    path = journal.journal_path(key)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_line(["a"]))
+
+    writer = journal.JournalWriter()
+    writer.write(path, _line(["b"]))
+    writer.close()
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == _line(["a"]) + _line(["b"])